@@ -0,0 +1,181 @@
+"""
+Supreme DAG Executor
+Concurrent execution of dependency graphs with timeouts, retries and failure isolation.
+"""
+
+import logging
+import asyncio
+import contextlib
+from collections import defaultdict, deque
+from typing import Dict, List, Any, Optional, Callable, Awaitable
+from dataclasses import dataclass, field
+from datetime import datetime
+
+
+@dataclass
+class DAGTask:
+    """A unit of work and the tasks whose outputs it needs"""
+    task_id: str
+    run: Callable[[Dict[str, Any]], Awaitable[Any]]
+    depends_on: List[str] = field(default_factory=list)
+    timeout: Optional[float] = None
+    max_retries: Optional[int] = None
+
+
+@dataclass
+class DAGTaskResult:
+    """Outcome of one task: completed, failed or skipped"""
+    task_id: str
+    status: str
+    result: Any = None
+    error: Optional[str] = None
+    attempts: int = 0
+    started_at: Optional[datetime] = None
+    completed_at: Optional[datetime] = None
+
+    @property
+    def success(self) -> bool:
+        return self.status == "completed"
+
+    @property
+    def duration(self) -> float:
+        if self.started_at and self.completed_at:
+            return (self.completed_at - self.started_at).total_seconds()
+        return 0.0
+
+
+class DAGExecutor:
+    """
+    Runs a task graph with as much parallelism as the dependencies allow.
+
+    A task starts the moment its last dependency completes, subject to the
+    concurrency cap. Each task gets its own timeout and retries with exponential
+    backoff; a task that still fails marks every task downstream of it as skipped
+    while independent branches keep running. Task callables receive the outputs
+    of completed tasks keyed by task_id (dependencies are guaranteed present).
+    """
+
+    def __init__(self, max_concurrency: Optional[int] = None, default_timeout: Optional[float] = None,
+                 max_retries: int = 0, retry_backoff: float = 0.5, backoff_multiplier: float = 2.0,
+                 logger: Optional[logging.Logger] = None):
+        self.max_concurrency = max_concurrency
+        self.default_timeout = default_timeout
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.backoff_multiplier = backoff_multiplier
+        self.logger = logger or logging.getLogger(__name__)
+
+    @staticmethod
+    def topological_order(tasks: List[Any], key: Callable[[Any], str] = lambda task: task.task_id,
+                          dependencies: Callable[[Any], List[str]] = lambda task: task.depends_on) -> List[Any]:
+        """Kahn's algorithm; raises ValueError on unknown dependencies or cycles"""
+        task_map = {key(task): task for task in tasks}
+        dependents = defaultdict(list)
+        in_degree = {task_id: 0 for task_id in task_map}
+
+        for task_id, task in task_map.items():
+            for dependency in set(dependencies(task)):
+                if dependency not in task_map:
+                    raise ValueError(f"Task {task_id} depends on unknown task {dependency}")
+                dependents[dependency].append(task_id)
+                in_degree[task_id] += 1
+
+        queue = deque(task_id for task_id, degree in in_degree.items() if degree == 0)
+        ordered = []
+        while queue:
+            current = queue.popleft()
+            ordered.append(task_map[current])
+            for dependent in dependents[current]:
+                in_degree[dependent] -= 1
+                if in_degree[dependent] == 0:
+                    queue.append(dependent)
+
+        if len(ordered) != len(task_map):
+            raise ValueError("Task graph has circular dependencies")
+        return ordered
+
+    async def run(self, tasks: List[DAGTask]) -> Dict[str, DAGTaskResult]:
+        """Execute the graph and return results in topological order"""
+        ordered = self.topological_order(tasks)
+        task_map = {task.task_id: task for task in ordered}
+        dependents = defaultdict(list)
+        pending_dependencies = {}
+        for task in ordered:
+            pending_dependencies[task.task_id] = len(set(task.depends_on))
+            for dependency in set(task.depends_on):
+                dependents[dependency].append(task.task_id)
+
+        semaphore = asyncio.Semaphore(self.max_concurrency) if self.max_concurrency else None
+        outputs: Dict[str, Any] = {}
+        results: Dict[str, DAGTaskResult] = {}
+        running: Dict[asyncio.Task, str] = {}
+
+        def launch(task_id: str):
+            running[asyncio.create_task(self._run_task(task_map[task_id], outputs, semaphore))] = task_id
+
+        def skip_downstream(task_id: str):
+            stack = list(dependents[task_id])
+            while stack:
+                dependent = stack.pop()
+                if dependent in results:
+                    continue
+                results[dependent] = DAGTaskResult(
+                    task_id=dependent, status="skipped", error=f"Upstream task {task_id} did not complete"
+                )
+                stack.extend(dependents[dependent])
+
+        for task_id, count in pending_dependencies.items():
+            if count == 0:
+                launch(task_id)
+
+        try:
+            while running:
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for finished in done:
+                    task_id = running.pop(finished)
+                    result = finished.result()
+                    results[task_id] = result
+
+                    if not result.success:
+                        skip_downstream(task_id)
+                        continue
+
+                    outputs[task_id] = result.result
+                    for dependent in dependents[task_id]:
+                        pending_dependencies[dependent] -= 1
+                        if pending_dependencies[dependent] == 0 and dependent not in results:
+                            launch(dependent)
+        finally:
+            for task in running:
+                task.cancel()
+
+        return {task_id: results[task_id] for task_id in task_map}
+
+    async def _run_task(self, task: DAGTask, outputs: Dict[str, Any],
+                        semaphore: Optional[asyncio.Semaphore]) -> DAGTaskResult:
+        """Run one task with timeout and retry, never raising"""
+        timeout = task.timeout if task.timeout is not None else self.default_timeout
+        max_retries = task.max_retries if task.max_retries is not None else self.max_retries
+        result = DAGTaskResult(task_id=task.task_id, status="failed", started_at=datetime.now())
+
+        for attempt in range(max_retries + 1):
+            if attempt:
+                # Back off without holding a concurrency slot
+                await asyncio.sleep(self.retry_backoff * self.backoff_multiplier ** (attempt - 1))
+
+            result.attempts = attempt + 1
+            async with semaphore or contextlib.nullcontext():
+                try:
+                    result.result = await asyncio.wait_for(task.run(outputs), timeout)
+                    result.status = "completed"
+                    result.error = None
+                    break
+                except asyncio.TimeoutError:
+                    result.error = f"Timed out after {timeout}s"
+                except Exception as e:
+                    result.error = str(e)
+
+            self.logger.warning(f"Task {task.task_id} attempt {attempt + 1} failed: {result.error}")
+
+        result.completed_at = datetime.now()
+        return result
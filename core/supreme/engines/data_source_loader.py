@@ -0,0 +1,221 @@
+"""
+Supreme Data Source Loader
+Columnar file loading with projection, predicate pushdown and a shared frame cache.
+"""
+
+import logging
+import asyncio
+import importlib.util
+import operator
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Any, Optional, Tuple
+
+import pandas as pd
+
+# Filters use the pyarrow/pandas DNF-style triple: (column, operator, value)
+Filter = Tuple[str, str, Any]
+
+FILTER_OPERATORS = {
+    "==": operator.eq,
+    "=": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "in": lambda series, value: series.isin(value),
+    "not in": lambda series, value: ~series.isin(value),
+}
+
+FILE_FORMATS = {
+    ".csv": "csv",
+    ".tsv": "csv",
+    ".parquet": "parquet",
+    ".pq": "parquet",
+    ".jsonl": "jsonl",
+    ".ndjson": "jsonl",
+}
+
+
+class DataSourceLoader:
+    """
+    Loads CSV, Parquet and JSONL data sources into DataFrames.
+
+    Only the requested columns (plus those needed by filters) are read, and
+    filters are applied chunk by chunk, or handed to the Parquet reader, so
+    rows that fail them never reach the final frame. Loaded frames are
+    cached by (path, mtime, size, columns, filters) in an LRU bounded by
+    memory, so a changed file is re-read automatically. A cached full
+    table also answers projected or filtered requests without any I/O.
+    Every caller gets its own copy of the cached frame. Parquet needs pyarrow
+    or fastparquet; without one, Parquet sources are rejected up front.
+    """
+
+    def __init__(self, memory_budget: int = 256 * 1024 * 1024, chunk_size: int = 100_000):
+        self.memory_budget = memory_budget
+        self.chunk_size = chunk_size
+        self.logger = logging.getLogger(__name__)
+        self._frames: "OrderedDict[tuple, Tuple[pd.DataFrame, int]]" = OrderedDict()
+        self._memory_used = 0
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    @staticmethod
+    def _normalize_filters(filters: Optional[List[Filter]]) -> Tuple[Filter, ...]:
+        """Validate filters and make them hashable"""
+        normalized = []
+        for column, op, value in filters or []:
+            if op not in FILTER_OPERATORS:
+                raise ValueError(f"Unsupported filter operator '{op}'")
+            if op in ("in", "not in"):
+                value = tuple(value)
+            normalized.append((column, op, value))
+        return tuple(normalized)
+
+    @staticmethod
+    def _resolve(data_source: str) -> Tuple[str, str]:
+        """Map a data source to an absolute path and file format"""
+        path = data_source[len("file://"):] if data_source.startswith("file://") else data_source
+        path = os.path.abspath(os.path.expanduser(path))
+        file_format = FILE_FORMATS.get(os.path.splitext(path)[1].lower())
+        if file_format is None:
+            raise ValueError(f"Unsupported data source format: {data_source}")
+        if file_format == "parquet" and not any(
+                importlib.util.find_spec(engine) for engine in ("pyarrow", "fastparquet")):
+            raise ImportError(f"Reading Parquet data source {data_source} requires pyarrow or fastparquet")
+        if not os.path.isfile(path):
+            raise FileNotFoundError(f"Data source not found: {data_source}")
+        return path, file_format
+
+    @staticmethod
+    def _apply(frame: pd.DataFrame, columns: Optional[Tuple[str, ...]],
+               filters: Tuple[Filter, ...]) -> pd.DataFrame:
+        """Filter rows, then project columns"""
+        if filters:
+            mask = pd.Series(True, index=frame.index)
+            for column, op, value in filters:
+                mask &= FILTER_OPERATORS[op](frame[column], value)
+            frame = frame[mask.to_numpy()]
+        if columns:
+            frame = frame.loc[:, list(columns)]
+        return frame.reset_index(drop=True) if filters else frame
+
+    def load(self, data_source: str, columns: Optional[List[str]] = None,
+             filters: Optional[List[Filter]] = None) -> pd.DataFrame:
+        """
+        Load a data source, serving it from cache when the file is unchanged.
+        Callers get their own copy, so mutating it never alters the cache.
+        """
+        path, file_format = self._resolve(data_source)
+        stat = os.stat(path)
+        version = (path, stat.st_mtime_ns, stat.st_size)
+        columns_key = tuple(columns) if columns else None
+        filters_key = self._normalize_filters(filters)
+        key = (version, columns_key, filters_key)
+
+        with self._lock:
+            cached = self._frames.get(key)
+            if cached is not None:
+                self._frames.move_to_end(key)
+                self.stats["hits"] += 1
+                return cached[0].copy()
+
+            full = self._frames.get((version, None, ()))
+            if full is not None:
+                self._frames.move_to_end((version, None, ()))
+                self.stats["hits"] += 1
+                return self._apply(full[0], columns_key, filters_key).copy()
+
+            self.stats["misses"] += 1
+
+        frame = self._read(path, file_format, columns_key, filters_key)
+        self._store(key, frame)
+        return frame.copy()
+
+    async def load_async(self, data_source: str, columns: Optional[List[str]] = None,
+                         filters: Optional[List[Filter]] = None) -> pd.DataFrame:
+        """Load without blocking the event loop"""
+        return await asyncio.to_thread(self.load, data_source, columns, filters)
+
+    def _read(self, path: str, file_format: str, columns: Optional[Tuple[str, ...]],
+              filters: Tuple[Filter, ...]) -> pd.DataFrame:
+        """Read only the needed columns and rows from disk"""
+        read_columns = None
+        if columns:
+            read_columns = list(dict.fromkeys(list(columns) + [column for column, _, _ in filters]))
+
+        if file_format == "parquet":
+            # Set operators take a list of values in the Parquet readers' filter syntax
+            parquet_filters = [
+                (column, op, list(value) if op in ("in", "not in") else value) for column, op, value in filters
+            ]
+            frame = pd.read_parquet(path, columns=read_columns, filters=parquet_filters or None)
+            return self._apply(frame, columns, filters)
+
+        if file_format == "csv":
+            sep = "\t" if path.lower().endswith(".tsv") else ","
+            if not filters:
+                return pd.read_csv(path, sep=sep, usecols=read_columns)
+            chunks = pd.read_csv(path, sep=sep, usecols=read_columns, chunksize=self.chunk_size)
+        else:
+            chunks = pd.read_json(path, lines=True, chunksize=self.chunk_size)
+
+        parts = []
+        for chunk in chunks:
+            if read_columns:
+                chunk = chunk.reindex(columns=read_columns)
+            parts.append(self._apply(chunk, columns, filters))
+
+        if not parts:
+            return pd.DataFrame(columns=list(columns) if columns else None)
+        return pd.concat(parts, ignore_index=True)
+
+    def _store(self, key: tuple, frame: pd.DataFrame):
+        """Cache a frame, dropping older versions of the file and evicting LRU frames"""
+        size = int(frame.memory_usage(deep=True).sum())
+        if size > self.memory_budget:
+            return
+
+        with self._lock:
+            for stale_key in [k for k in self._frames if k[0][0] == key[0][0] and k[0] != key[0]]:
+                self._memory_used -= self._frames.pop(stale_key)[1]
+
+            if key in self._frames:
+                self._memory_used -= self._frames.pop(key)[1]
+            self._frames[key] = (frame, size)
+            self._memory_used += size
+
+            while self._memory_used > self.memory_budget:
+                _, (_, evicted_size) = self._frames.popitem(last=False)
+                self._memory_used -= evicted_size
+                self.stats["evictions"] += 1
+
+    def clear(self):
+        """Drop every cached frame"""
+        with self._lock:
+            self._frames.clear()
+            self._memory_used = 0
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Cache counters for status reporting"""
+        lookups = self.stats["hits"] + self.stats["misses"]
+        return {
+            **self.stats,
+            "cached_frames": len(self._frames),
+            "memory_used": self._memory_used,
+            "memory_budget": self.memory_budget,
+            "hit_ratio": self.stats["hits"] / lookups if lookups else 0.0
+        }
+
+
+_shared_loader: Optional[DataSourceLoader] = None
+
+
+def get_shared_loader() -> DataSourceLoader:
+    """Process-wide loader shared by the insight and visualization engines"""
+    global _shared_loader
+    if _shared_loader is None:
+        _shared_loader = DataSourceLoader()
+    return _shared_loader
@@ -12,9 +12,13 @@ from dataclasses import dataclass, asdict
 from enum import Enum
 from datetime import datetime, timedelta
 import os
+import csv
 import copy
+import functools
+import time
 
 from ..base_supreme_engine import BaseSupremeEngine, SupremeRequest, SupremeResponse
+from .job_scheduler import JobScheduler, validate_schedule
 
 class SyncDirection(Enum):
     ONE_WAY = "one_way"
@@ -99,6 +103,9 @@ class SyncConfiguration:
     schedule: Optional[Dict[str, Any]] = None
     created_at: datetime = None
     updated_at: datetime = None
+    incremental: bool = False
+    watermark_field: Optional[str] = None  # e.g. updated_at or a sequence number
+    key_field: Optional[str] = None  # row identity for the content-hash index
     
     def __post_init__(self):
         if self.created_at is None:
@@ -106,6 +113,21 @@ class SyncConfiguration:
         if self.updated_at is None:
             self.updated_at = datetime.now()
 
+@dataclass
+class SyncState:
+    """Change-data-capture state of an incremental synchronization"""
+    sync_id: str
+    watermark: Any = None
+    row_hashes: Dict[str, str] = None  # key -> content hash of the last synced row
+    updated_at: datetime = None
+    source_version: Any = None  # file fingerprint of the source at the last complete sync
+    
+    def __post_init__(self):
+        if self.row_hashes is None:
+            self.row_hashes = {}
+        if self.updated_at is None:
+            self.updated_at = datetime.now()
+
 @dataclass
 class SyncExecution:
     """Represents a synchronization execution"""
@@ -120,10 +142,14 @@ class SyncExecution:
     conflicts_detected: int = 0
     execution_details: Dict[str, Any] = None
     error_details: Optional[str] = None
+    checkpoint_offset: int = 0  # source records committed to every target
+    target_offsets: Dict[str, int] = None  # source records committed to each target
     
     def __post_init__(self):
         if self.execution_details is None:
             self.execution_details = {}
+        if self.target_offsets is None:
+            self.target_offsets = {}
 
 @dataclass
 class DataConflict:
@@ -143,6 +169,9 @@ class DataConflict:
         if self.created_at is None:
             self.created_at = datetime.now()
 
+# Marker for values whose transformation raised
+_TRANSFORM_FAILED = object()
+
 class SupremeDataSynchronizer(BaseSupremeEngine):
     """
     Supreme data synchronizer with advanced synchronization and consistency management.
@@ -180,6 +209,16 @@ class SupremeDataSynchronizer(BaseSupremeEngine):
         # Synchronization scheduler
         self.scheduler_running = False
         self.scheduled_syncs: Dict[str, Dict[str, Any]] = {}
+        self.sync_scheduler = JobScheduler(logger=self.logger)
+        
+        # Chunked ETL settings and executions interrupted before completion
+        self.etl_chunk_size = 1000
+        self.etl_max_in_flight = 4
+        self.interrupted_executions: Dict[str, SyncExecution] = {}
+        self.max_interrupted_executions = 100
+        self.checkpoint_interval = 1.0  # seconds between checkpoint writes while an execution runs
+        self._checkpoints_saved_at = 0.0
+        self.sync_states: Dict[str, SyncState] = {}
     
     async def _initialize_engine(self) -> bool:
         """Initialize the supreme data synchronizer"""
@@ -248,9 +287,12 @@ class SupremeDataSynchronizer(BaseSupremeEngine):
             sync_strategy = parameters.get("strategy", "overwrite")
             sync_rules_config = parameters.get("rules", [])
             schedule_config = parameters.get("schedule")
+            incremental = parameters.get("incremental", False)
+            watermark_field = parameters.get("watermark_field")
+            key_field = parameters.get("key_field")
             
-            if not sync_name or len(sources_config) < 2:
-                return {"error": "name and at least 2 sources are required", "operation": "create_sync"}
+            if not sync_name:
+                return {"error": "name is required", "operation": "create_sync"}
             
             # Generate sync ID
             sync_id = self._generate_sync_id(sync_name)
@@ -304,7 +346,10 @@ class SupremeDataSynchronizer(BaseSupremeEngine):
                 sync_direction=SyncDirection(sync_direction),
                 sync_strategy=SyncStrategy(sync_strategy),
                 sync_rules=sync_rules,
-                schedule=schedule_config
+                schedule=schedule_config,
+                incremental=incremental,
+                watermark_field=watermark_field,
+                key_field=key_field
             )
             
             # Validate sync configuration
@@ -326,6 +371,7 @@ class SupremeDataSynchronizer(BaseSupremeEngine):
                 "rules": len(sync_rules),
                 "direction": sync_direction,
                 "strategy": sync_strategy,
+                "incremental": incremental,
                 "validation": validation_result,
                 "created_at": sync_config.created_at.isoformat()
             }
@@ -345,6 +391,16 @@ class SupremeDataSynchronizer(BaseSupremeEngine):
             sync_id = parameters.get("sync_id")
             force_sync = parameters.get("force", False)
             dry_run = parameters.get("dry_run", False)
+            resume_execution_id = parameters.get("resume_execution_id")
+            
+            if resume_execution_id:
+                execution = self._find_resumable_execution(resume_execution_id)
+                if execution is None:
+                    return {
+                        "error": f"No resumable execution {resume_execution_id}",
+                        "operation": "execute_sync"
+                    }
+                sync_id = execution.sync_id
             
             if not sync_id:
                 return {"error": "sync_id is required", "operation": "execute_sync"}
@@ -357,20 +413,31 @@ class SupremeDataSynchronizer(BaseSupremeEngine):
             
             sync_config = self.sync_configurations[sync_id]
             
-            # Create execution instance
-            execution_id = self._generate_execution_id()
-            execution = SyncExecution(
-                execution_id=execution_id,
-                sync_id=sync_id,
-                status=SyncStatus.IN_PROGRESS,
-                started_at=datetime.now()
-            )
+            if resume_execution_id:
+                # Continue from the last committed checkpoint
+                execution.status = SyncStatus.IN_PROGRESS
+                execution.completed_at = None
+                execution.error_details = None
+                execution_id = execution.execution_id
+            else:
+                # Create execution instance
+                execution_id = self._generate_execution_id()
+                execution = SyncExecution(
+                    execution_id=execution_id,
+                    sync_id=sync_id,
+                    status=SyncStatus.IN_PROGRESS,
+                    started_at=datetime.now()
+                )
             
             # Store active execution
             self.active_executions[execution_id] = execution
             
             # Execute synchronization
-            sync_result = await self._perform_synchronization(sync_config, execution, dry_run)
+            sync_result = await self._perform_synchronization(
+                sync_config, execution, dry_run,
+                chunk_size=parameters.get("chunk_size"),
+                max_in_flight=parameters.get("max_in_flight")
+            )
             
             # Update execution status
             execution.completed_at = datetime.now()
@@ -383,9 +450,15 @@ class SupremeDataSynchronizer(BaseSupremeEngine):
             execution.error_details = sync_result.get("error")
             
             # Move to history
-            self.execution_history.append(execution)
+            if execution not in self.execution_history:
+                self.execution_history.append(execution)
             if execution_id in self.active_executions:
                 del self.active_executions[execution_id]
+            if execution.error_details and not dry_run:
+                # Keep the checkpoint so the execution can be resumed
+                self.interrupted_executions[execution_id] = execution
+            self._prune_interrupted_executions(sync_id if sync_result["success"] and not dry_run else None)
+            self._save_checkpoints(force=True)
             
             # Limit history size
             if len(self.execution_history) > 1000:
@@ -398,6 +471,8 @@ class SupremeDataSynchronizer(BaseSupremeEngine):
                 "sync_name": sync_config.name,
                 "success": sync_result["success"],
                 "dry_run": dry_run,
+                "resumed": bool(resume_execution_id),
+                "checkpoint_offset": execution.checkpoint_offset,
                 "records_processed": sync_result["records_processed"],
                 "records_synced": sync_result["records_synced"],
                 "records_failed": sync_result["records_failed"],
@@ -452,6 +527,7 @@ class SupremeDataSynchronizer(BaseSupremeEngine):
             
             # Store schedule
             self.scheduled_syncs[schedule_id] = schedule_info
+            next_execution = self._register_schedule(schedule_info)
             
             result = {
                 "operation": "schedule_sync",
@@ -460,6 +536,7 @@ class SupremeDataSynchronizer(BaseSupremeEngine):
                 "schedule_type": schedule_type,
                 "schedule_config": schedule_config,
                 "validation": validation_result,
+                "next_execution": next_execution.isoformat() if next_execution else None,
                 "created_at": schedule_info["created_at"].isoformat()
             }
             
@@ -586,6 +663,7 @@ class SupremeDataSynchronizer(BaseSupremeEngine):
                 "sync_stats": sync_stats,
                 "active_syncs": len(self.sync_configurations),
                 "scheduled_syncs": len(self.scheduled_syncs),
+                "scheduler": self.sync_scheduler.get_statistics(),
                 "unresolved_conflicts": len([c for c in self.data_conflicts.values() if not c.resolved])
             }
             
@@ -1116,7 +1194,10 @@ class SupremeDataSynchronizer(BaseSupremeEngine):
                             sync_rules=sync_rules,
                             schedule=sync_data['schedule'],
                             created_at=datetime.fromisoformat(sync_data['created_at']),
-                            updated_at=datetime.fromisoformat(sync_data['updated_at'])
+                            updated_at=datetime.fromisoformat(sync_data['updated_at']),
+                            incremental=sync_data.get('incremental', False),
+                            watermark_field=sync_data.get('watermark_field'),
+                            key_field=sync_data.get('key_field')
                         )
                         self.sync_configurations[sync_id] = sync_config
             
@@ -1130,6 +1211,7 @@ class SupremeDataSynchronizer(BaseSupremeEngine):
                         if schedule_data['last_executed']:
                             schedule_data['last_executed'] = datetime.fromisoformat(schedule_data['last_executed'])
                         self.scheduled_syncs[schedule_id] = schedule_data
+                        self._register_schedule(schedule_data)
             
             # Load conflicts
             conflicts_file = os.path.join(self.data_dir, "data_conflicts.json")
@@ -1150,6 +1232,23 @@ class SupremeDataSynchronizer(BaseSupremeEngine):
                             created_at=datetime.fromisoformat(conflict_data['created_at'])
                         )
                         self.data_conflicts[conflict_id] = conflict
+            
+            # Executions that were still running when the process stopped
+            checkpoints_file = os.path.join(self.data_dir, "sync_checkpoints.json")
+            if os.path.exists(checkpoints_file):
+                with open(checkpoints_file, 'r') as f:
+                    checkpoints_data = json.load(f)
+                    for execution_id, checkpoint_data in checkpoints_data.items():
+                        self.interrupted_executions[execution_id] = SyncExecution(
+                            execution_id=execution_id,
+                            sync_id=checkpoint_data['sync_id'],
+                            status=SyncStatus.FAILED,
+                            started_at=datetime.fromisoformat(checkpoint_data['started_at']),
+                            execution_details=checkpoint_data['execution_details'],
+                            error_details="Interrupted before completion",
+                            checkpoint_offset=checkpoint_data['checkpoint_offset'],
+                            target_offsets=checkpoint_data.get('target_offsets', {})
+                        )
                         
         except Exception as e:
             self.logger.warning(f"Could not load sync data: {e}")
@@ -1203,7 +1302,10 @@ class SupremeDataSynchronizer(BaseSupremeEngine):
                     ],
                     'schedule': sync_config.schedule,
                     'created_at': sync_config.created_at.isoformat(),
-                    'updated_at': sync_config.updated_at.isoformat()
+                    'updated_at': sync_config.updated_at.isoformat(),
+                    'incremental': sync_config.incremental,
+                    'watermark_field': sync_config.watermark_field,
+                    'key_field': sync_config.key_field
                 }
             
             syncs_file = os.path.join(self.data_dir, "sync_configurations.json")
@@ -1314,20 +1416,7 @@ class SupremeDataSynchronizer(BaseSupremeEngine):
         try:
             errors = []
             
-            if schedule_type == "interval":
-                if "interval" not in schedule_config:
-                    errors.append("Interval schedule missing 'interval' parameter")
-                elif not isinstance(schedule_config["interval"], (int, float)) or schedule_config["interval"] <= 0:
-                    errors.append("Interval must be a positive number")
-            
-            elif schedule_type == "cron":
-                if "cron" not in schedule_config:
-                    errors.append("Cron schedule missing 'cron' parameter")
-                else:
-                    # Basic cron validation
-                    cron_parts = schedule_config["cron"].split()
-                    if len(cron_parts) != 5:
-                        errors.append("Cron expression must have 5 parts")
+            errors = validate_schedule(schedule_type, schedule_config)
             
             return {
                 "valid": len(errors) == 0,
@@ -1342,62 +1431,58 @@ class SupremeDataSynchronizer(BaseSupremeEngine):
                 "errors": [str(e)]
             }
     
+    def _register_schedule(self, schedule: Dict[str, Any]) -> Optional[datetime]:
+        """Add a schedule to the job scheduler and return its next execution time"""
+        if not schedule["enabled"]:
+            self.sync_scheduler.remove_job(schedule["schedule_id"])
+            return None
+        
+        try:
+            return self.sync_scheduler.add_job(
+                schedule["schedule_id"],
+                functools.partial(self._run_scheduled_sync, schedule["schedule_id"]),
+                schedule["schedule_type"],
+                schedule["schedule_config"],
+                last_executed=schedule["last_executed"]
+            )
+        except ValueError as e:
+            self.logger.error(f"Invalid schedule {schedule['schedule_id']}: {e}")
+            return None
+    
     async def _run_sync_scheduler(self):
         """Run the synchronization scheduler"""
-        while self.scheduler_running:
-            try:
-                await asyncio.sleep(60)  # Check every minute
-                
-                current_time = datetime.now()
-                
-                for schedule_id, schedule in list(self.scheduled_syncs.items()):
-                    if not schedule["enabled"]:
-                        continue
-                    
-                    should_execute = False
-                    
-                    if schedule["schedule_type"] == "interval":
-                        interval = schedule["schedule_config"]["interval"]
-                        if schedule["last_executed"]:
-                            next_execution = schedule["last_executed"] + timedelta(seconds=interval)
-                            should_execute = current_time >= next_execution
-                        else:
-                            should_execute = True
-                    
-                    elif schedule["schedule_type"] == "cron":
-                        # Basic cron implementation
-                        should_execute = self._should_execute_cron(
-                            schedule["schedule_config"]["cron"], current_time, schedule["last_executed"]
-                        )
-                    
-                    if should_execute:
-                        # Execute synchronization
-                        sync_id = schedule["sync_id"]
-                        if sync_id in self.sync_configurations:
-                            try:
-                                await self._execute_synchronization({
-                                    "sync_id": sync_id,
-                                    "scheduled": True,
-                                    "schedule_id": schedule_id
-                                })
-                                
-                                # Update schedule
-                                schedule["last_executed"] = current_time
-                                schedule["execution_count"] += 1
-                                
-                            except Exception as e:
-                                self.logger.error(f"Error executing scheduled sync {sync_id}: {e}")
-                
-            except Exception as e:
-                self.logger.error(f"Error in sync scheduler: {e}")
+        try:
+            await self.sync_scheduler.run()
+        except Exception as e:
+            self.logger.error(f"Error in sync scheduler: {e}")
     
-    def _should_execute_cron(self, cron_expression: str, current_time: datetime, last_executed: Optional[datetime]) -> bool:
-        """Basic cron evaluation (simplified)"""
-        if not last_executed:
-            return True
+    async def _run_scheduled_sync(self, schedule_id: str):
+        """Execute the synchronization behind a due schedule"""
+        schedule = self.scheduled_syncs.get(schedule_id)
+        if not schedule or not schedule["enabled"]:
+            return
+        
+        sync_id = schedule["sync_id"]
+        if sync_id not in self.sync_configurations:
+            return
         
-        # For now, just check if it's been at least an hour since last execution
-        return (current_time - last_executed).total_seconds() >= 3600
+        schedule["last_executed"] = datetime.now()
+        schedule["execution_count"] += 1
+        
+        try:
+            await self._execute_synchronization({
+                "sync_id": sync_id,
+                "scheduled": True,
+                "schedule_id": schedule_id
+            })
+        except Exception as e:
+            self.logger.error(f"Error executing scheduled sync {sync_id}: {e}")
+    
+    async def _shutdown_engine(self):
+        """Stop the scheduler and let running scheduled syncs finish"""
+        self.scheduler_running = False
+        self.sync_scheduler.stop()
+        await self.sync_scheduler.drain()
     
     async def _monitor_data_conflicts(self):
         """Monitor and auto-resolve data conflicts"""
@@ -1422,77 +1507,455 @@ class SupremeDataSynchronizer(BaseSupremeEngine):
     
     # Placeholder methods for complex operations (would be implemented based on specific requirements)
     
-    async def _perform_synchronization(self, sync_config: SyncConfiguration, execution: SyncExecution, dry_run: bool = False) -> Dict[str, Any]:
-        """Perform the actual data synchronization"""
+    async def _perform_synchronization(self, sync_config: SyncConfiguration, execution: SyncExecution, dry_run: bool = False,
+                                       chunk_size: Optional[int] = None, max_in_flight: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Stream records from the first source to every other source in chunks.
+        Extraction is an async generator, field mappings are applied column by
+        column per chunk, and each target has a bounded queue of in-flight
+        batches so a slow target applies backpressure to extraction. The
+        execution checkpoint advances once a chunk is written to every target;
+        on resume each target only receives the rows it has not committed yet.
+        """
         start_time = datetime.now()
+        chunk_size = chunk_size or self.etl_chunk_size
+        max_in_flight = max_in_flight or self.etl_max_in_flight
+        source, targets = sync_config.sources[0], sync_config.sources[1:]
+        details = execution.execution_details
+        for target in targets:
+            details.setdefault(f"source_{target.source_id}", {
+                "records_processed": 0, "records_synced": 0, "records_failed": 0, "conflicts": 0
+            })
         
+        # Incremental syncs only pass rows from the watermark on whose content hash changed
+        state = self._get_sync_state(sync_config) if sync_config.incremental else None
+        start_watermark = state.watermark if state else None
+        source_version = self._source_version(source) if state else None
+        pending_changes: List[Tuple[int, Dict[str, str], Any]] = []  # (end_offset, hashes, max watermark)
+        if state is not None:
+            details.setdefault("records_unchanged", 0)
+        
+        error = None
         try:
-            # This is a simplified implementation
-            # In a real system, this would involve complex data extraction, transformation, and loading
-            
-            records_processed = 0
-            records_synced = 0
-            records_failed = 0
-            conflicts_detected = 0
-            details = {}
-            
-            # Simulate synchronization process
-            for i, source in enumerate(sync_config.sources):
-                if i == 0:
-                    continue  # Skip first source (it's the source)
-                
-                # Simulate data processing
-                await asyncio.sleep(0.1)  # Simulate processing time
-                
-                # Mock data
-                mock_records = 100
-                mock_synced = 95
-                mock_failed = 3
-                mock_conflicts = 2
+            mappings = self._compile_field_mappings(sync_config)
+            queues = {target.source_id: asyncio.Queue(maxsize=max_in_flight) for target in targets}
+            resume_offsets = {
+                target.source_id: max(execution.checkpoint_offset, execution.target_offsets.get(target.source_id, 0))
+                for target in targets
+            }
+            committed = dict(resume_offsets)
+            writers = [
+                asyncio.ensure_future(self._load_target(target, queues[target.source_id], committed, execution, dry_run))
+                for target in targets
+            ]
+            
+            try:
+                async for end_offset, chunk in self._extract_records(source, execution.checkpoint_offset, chunk_size):
+                    # Split at the targets' resume offsets so a piece is either new or already committed per target
+                    for end_offset, records in self._split_at_offsets(end_offset, chunk, resume_offsets.values()):
+                        if state is not None:
+                            changed, changes, max_watermark = self._detect_changes(records, sync_config, state,
+                                                                                   start_watermark)
+                            details["records_unchanged"] += len(records) - len(changed)
+                            records = changed
+                        rows, failed = self._transform_chunk(records, mappings)
+                        if state is not None:
+                            # Rows that failed mapping were not written, so they must not enter the index
+                            hashes, max_watermark = self._committed_changes(changes, failed, max_watermark)
+                            pending_changes.append((end_offset, hashes, max_watermark))
+                        for target in targets:
+                            if end_offset <= resume_offsets[target.source_id]:
+                                continue
+                            target_details = details[f"source_{target.source_id}"]
+                            target_details["records_processed"] += len(records)
+                            target_details["records_failed"] += len(failed)
+                            # Blocks while the target already has max_in_flight batches queued
+                            await self._put_batch(queues[target.source_id], (end_offset, rows), writers)
                 
-                records_processed += mock_records
-                records_synced += mock_synced
-                records_failed += mock_failed
-                conflicts_detected += mock_conflicts
+                for target in targets:
+                    await self._put_batch(queues[target.source_id], None, writers)
+                await asyncio.gather(*writers)
+            finally:
+                for writer in writers:
+                    writer.cancel()
+            
+            # Update source statistics
+            if not dry_run:
+                source.last_sync = datetime.now()
+                source.sync_count += 1
+                for target in targets:
+                    target.last_sync = datetime.now()
+                    target.sync_count += 1
+                    if details[f"source_{target.source_id}"]["records_failed"] > 0:
+                        target.error_count += 1
                 
-                details[f"source_{source.source_id}"] = {
-                    "records_processed": mock_records,
-                    "records_synced": mock_synced,
-                    "records_failed": mock_failed,
-                    "conflicts": mock_conflicts
-                }
-                
-                # Update source statistics
-                if not dry_run:
-                    source.last_sync = datetime.now()
-                    source.sync_count += 1
-                    if mock_failed > 0:
-                        source.error_count += 1
-            
-            execution_time = (datetime.now() - start_time).total_seconds()
-            
-            return {
-                "success": records_failed == 0,
-                "records_processed": records_processed,
-                "records_synced": records_synced,
-                "records_failed": records_failed,
-                "conflicts_detected": conflicts_detected,
-                "execution_time": execution_time,
-                "details": details
-            }
+        except Exception as e:
+            self.logger.error(f"Error synchronizing {sync_config.sync_id}: {e}")
+            error = str(e)
+        
+        execution_time = (datetime.now() - start_time).total_seconds()
+        target_details = [details[f"source_{target.source_id}"] for target in targets]
+        records_failed = sum(d["records_failed"] for d in target_details)
+        
+        if state is not None and not dry_run:
+            # Failed rows sit below the new watermark, so it only advances once they all went through
+            complete = error is None and records_failed == 0
+            self._commit_sync_state(state, pending_changes, execution.checkpoint_offset, complete,
+                                    source_version)
+            details["watermark"] = state.watermark
+        
+        result = {
+            "success": error is None and records_failed == 0,
+            "records_processed": sum(d["records_processed"] for d in target_details),
+            "records_synced": sum(d["records_synced"] for d in target_details),
+            "records_failed": records_failed,
+            "conflicts_detected": sum(d["conflicts"] for d in target_details),
+            "execution_time": execution_time,
+            "details": details
+        }
+        if error is not None:
+            result["error"] = error
+        return result
+    
+    def _split_at_offsets(self, end_offset: int, records: List[Dict[str, Any]], offsets):
+        """Split a (end_offset, records) chunk at the given source offsets"""
+        start = end_offset - len(records)
+        cuts = sorted(offset for offset in set(offsets) if start < offset < end_offset)
+        for cut in cuts + [end_offset]:
+            yield cut, records[:cut - start]
+            records, start = records[cut - start:], cut
+    
+    async def _put_batch(self, queue: asyncio.Queue, batch: Optional[Tuple[int, List[Dict[str, Any]]]],
+                         writers: List[asyncio.Future]):
+        """Queue a batch for a target, failing fast if any writer has died"""
+        put = asyncio.ensure_future(queue.put(batch))
+        while not put.done():
+            running = [writer for writer in writers if not writer.done()]
+            await asyncio.wait([put, *running], return_when=asyncio.FIRST_COMPLETED)
+            for writer in writers:
+                if writer.done() and writer.exception() is not None:
+                    put.cancel()
+                    raise writer.exception()
+    
+    async def _extract_records(self, source: DataSource, start_offset: int, chunk_size: int):
+        """Yield (end_offset, records) chunks from a source, starting after start_offset records"""
+        config = source.connection_config
+        
+        if "records" in config:
+            records = config["records"]
+            for start in range(start_offset, len(records), chunk_size):
+                chunk = records[start:start + chunk_size]
+                yield start + len(chunk), chunk
+                await asyncio.sleep(0)
+            return
+        
+        path = config.get("path")
+        if source.source_type != "file" or not path:
+            raise ValueError(
+                f"No connector for {source.source_type} source {source.source_id}; "
+                "configure inline 'records' or a file 'path'"
+            )
+        
+        file_format = config.get("format") or os.path.splitext(path)[1].lstrip(".").lower()
+        if file_format not in ("jsonl", "csv"):
+            raise ValueError(f"Unsupported file format for source {source.source_id}: {file_format}")
+        
+        with open(path, 'r', newline='') as f:
+            reader = csv.DictReader(f) if file_format == "csv" else (json.loads(line) for line in f if line.strip())
+            offset = 0
+            while True:
+                chunk = await asyncio.to_thread(self._read_chunk, reader, chunk_size)
+                if not chunk:
+                    break
+                offset += len(chunk)
+                if offset <= start_offset:
+                    continue
+                if offset - len(chunk) < start_offset:
+                    chunk = chunk[start_offset - (offset - len(chunk)):]
+                yield offset, chunk
+    
+    def _read_chunk(self, reader, chunk_size: int) -> List[Dict[str, Any]]:
+        """Read up to chunk_size records from a file reader"""
+        chunk = []
+        for record in reader:
+            chunk.append(record)
+            if len(chunk) >= chunk_size:
+                break
+        return chunk
+    
+    def _compile_field_mappings(self, sync_config: SyncConfiguration) -> List[Tuple[str, str, Optional[Callable], bool]]:
+        """Resolve the field mappings of all enabled rules to transformation functions once per sync"""
+        mappings = []
+        for rule in sync_config.sync_rules:
+            if not rule.enabled:
+                continue
+            for mapping in rule.field_mappings:
+                function = None
+                if mapping.transformation:
+                    if mapping.transformation not in self.transformation_functions:
+                        raise ValueError(f"Unknown transformation: {mapping.transformation}")
+                    function = self.transformation_functions[mapping.transformation]
+                mappings.append((mapping.source_field, mapping.target_field, function, mapping.required))
+        return mappings
+    
+    def _transform_chunk(self, records: List[Dict[str, Any]],
+                         mappings: List[Tuple[str, str, Optional[Callable], bool]]) -> Tuple[List[Dict[str, Any]], List[int]]:
+        """Apply field mappings column by column; returns the mapped rows and the indices of failed records"""
+        if not mappings:
+            return [dict(record) for record in records], []
+        
+        failed = [False] * len(records)
+        columns = []
+        for source_field, target_field, function, required in mappings:
+            values = [record.get(source_field) for record in records]
+            if function is not None:
+                try:
+                    values = list(map(function, values))
+                except Exception:
+                    values = [self._apply_transformation(function, value) for value in values]
+                    for i, value in enumerate(values):
+                        if value is _TRANSFORM_FAILED:
+                            failed[i] = True
+            if required:
+                for i, value in enumerate(values):
+                    if value is None:
+                        failed[i] = True
+            columns.append((target_field, values))
+        
+        rows = [
+            {target_field: values[i] for target_field, values in columns}
+            for i in range(len(records))
+            if not failed[i]
+        ]
+        return rows, [i for i, record_failed in enumerate(failed) if record_failed]
+    
+    def _apply_transformation(self, function: Callable, value: Any) -> Any:
+        """Apply a transformation to one value, marking failures"""
+        try:
+            return function(value)
+        except Exception:
+            return _TRANSFORM_FAILED
+    
+    async def _load_target(self, target: DataSource, queue: asyncio.Queue, committed: Dict[str, int],
+                           execution: SyncExecution, dry_run: bool):
+        """Write queued batches to a target and advance the execution checkpoint"""
+        details = execution.execution_details[f"source_{target.source_id}"]
+        key_index = None
+        
+        while True:
+            batch = await queue.get()
+            if batch is None:
+                return
+            end_offset, rows = batch
+            
+            if not dry_run and rows:
+                config = target.connection_config
+                if "records" in config:
+                    key_field = config.get("key")
+                    if key_field and key_index is None:
+                        key_index = {record.get(key_field): i for i, record in enumerate(config["records"])}
+                    self._write_inline_records(config["records"], rows, key_field, key_index)
+                elif target.source_type == "file" and config.get("path"):
+                    await asyncio.to_thread(self._append_file_records, config["path"], config.get("format"), rows)
+                else:
+                    raise ValueError(
+                        f"No connector for {target.source_type} target {target.source_id}; "
+                        "configure inline 'records' or a file 'path'"
+                    )
             
+            details["records_synced"] += len(rows)
+            committed[target.source_id] = end_offset
+            if not dry_run:
+                execution.target_offsets[target.source_id] = end_offset
+                execution.checkpoint_offset = max(execution.checkpoint_offset, min(committed.values()))
+                self._save_checkpoints()
+    
+    def _write_inline_records(self, records: List[Dict[str, Any]], rows: List[Dict[str, Any]],
+                              key_field: Optional[str], key_index: Optional[Dict[Any, int]]):
+        """Upsert rows into an in-memory record list by key, or append without a key"""
+        for row in rows:
+            if key_field and row.get(key_field) in key_index:
+                records[key_index[row[key_field]]] = row
+            else:
+                if key_field:
+                    key_index[row.get(key_field)] = len(records)
+                records.append(row)
+    
+    def _append_file_records(self, path: str, file_format: Optional[str], rows: List[Dict[str, Any]]):
+        """Append rows to a JSON Lines or CSV file"""
+        file_format = file_format or os.path.splitext(path)[1].lstrip(".").lower()
+        if file_format == "csv":
+            write_header = not os.path.exists(path) or os.path.getsize(path) == 0
+            with open(path, 'a', newline='') as f:
+                writer = csv.DictWriter(f, fieldnames=list(rows[0].keys()))
+                if write_header:
+                    writer.writeheader()
+                writer.writerows(rows)
+        else:
+            with open(path, 'a') as f:
+                f.writelines(json.dumps(row, default=str) + "\n" for row in rows)
+    
+    def _row_hash(self, record: Dict[str, Any]) -> str:
+        """Compact content hash of a source row"""
+        payload = json.dumps(record, sort_keys=True, default=str).encode()
+        return hashlib.blake2b(payload, digest_size=8).hexdigest()
+    
+    def _detect_changes(self, records: List[Dict[str, Any]], sync_config: SyncConfiguration, state: SyncState,
+                        watermark: Any) -> Tuple[List[Dict[str, Any]], List[Tuple[Optional[str], Optional[str], Any]], Any]:
+        """
+        Filter a chunk to rows at or past the watermark whose content differs from
+        the hash index. Rows equal to the watermark are kept because later rows can
+        share its value; the hash index drops the ones already synced. Returns the
+        changed rows, their (key, hash, watermark value) and the largest watermark
+        of the unchanged rows.
+        """
+        watermark_field, key_field = sync_config.watermark_field, sync_config.key_field
+        changed, changes, max_watermark = [], [], None
+        
+        for record in records:
+            value = record.get(watermark_field) if watermark_field else None
+            if value is not None and watermark is not None and value < watermark:
+                continue
+            
+            key = row_hash = None
+            if key_field:
+                key = str(record.get(key_field))
+                row_hash = self._row_hash(record)
+                if state.row_hashes.get(key) == row_hash:
+                    if value is not None and (max_watermark is None or value > max_watermark):
+                        max_watermark = value
+                    continue
+            changed.append(record)
+            changes.append((key, row_hash, value))
+        
+        return changed, changes, max_watermark
+    
+    def _committed_changes(self, changes: List[Tuple[Optional[str], Optional[str], Any]], failed: List[int],
+                           max_watermark: Any) -> Tuple[Dict[str, str], Any]:
+        """Hashes and largest watermark of the changed rows that were written"""
+        failed = set(failed)
+        hashes = {}
+        for i, (key, row_hash, value) in enumerate(changes):
+            if i in failed:
+                continue
+            if key is not None:
+                hashes[key] = row_hash
+            if value is not None and (max_watermark is None or value > max_watermark):
+                max_watermark = value
+        return hashes, max_watermark
+    
+    def _commit_sync_state(self, state: SyncState, pending_changes: List[Tuple[int, Dict[str, str], Any]],
+                           checkpoint_offset: int, complete: bool, source_version: Any = None):
+        """Record hashes of committed chunks; the watermark only advances after a complete run"""
+        max_watermark = state.watermark
+        for end_offset, hashes, chunk_watermark in pending_changes:
+            if end_offset <= checkpoint_offset:
+                state.row_hashes.update(hashes)
+            if chunk_watermark is not None and (max_watermark is None or chunk_watermark > max_watermark):
+                max_watermark = chunk_watermark
+        if complete:
+            state.watermark = max_watermark
+            state.source_version = source_version
+        else:
+            state.source_version = None
+        state.updated_at = datetime.now()
+        self._save_sync_state(state)
+    
+    def _source_version(self, source: DataSource) -> Any:
+        """Fingerprint of a file source, or None when its changes cannot be detected cheaply"""
+        path = source.connection_config.get("path")
+        if source.source_type != "file" or not path or not os.path.exists(path):
+            return None
+        stat = os.stat(path)
+        return [stat.st_mtime_ns, stat.st_size]
+    
+    def _get_sync_state(self, sync_config: SyncConfiguration) -> SyncState:
+        """Get the change-data-capture state of a sync, loading it from disk on first use"""
+        sync_id = sync_config.sync_id
+        if sync_id not in self.sync_states:
+            state = SyncState(sync_id=sync_id)
+            state_file = os.path.join(self.data_dir, f"sync_state_{sync_id}.json")
+            if os.path.exists(state_file):
+                try:
+                    with open(state_file, 'r') as f:
+                        state_data = json.load(f)
+                    watermark = state_data['watermark']
+                    if state_data.get('watermark_type') == 'datetime':
+                        watermark = datetime.fromisoformat(watermark)
+                    state = SyncState(
+                        sync_id=sync_id,
+                        watermark=watermark,
+                        row_hashes=state_data['row_hashes'],
+                        updated_at=datetime.fromisoformat(state_data['updated_at']),
+                        source_version=state_data.get('source_version')
+                    )
+                except Exception as e:
+                    self.logger.warning(f"Could not load sync state for {sync_id}: {e}")
+            self.sync_states[sync_id] = state
+        return self.sync_states[sync_id]
+    
+    def _save_sync_state(self, state: SyncState):
+        """Persist the watermark and row-hash index of an incremental sync"""
+        try:
+            state_file = os.path.join(self.data_dir, f"sync_state_{state.sync_id}.json")
+            watermark, watermark_type = state.watermark, None
+            if isinstance(watermark, datetime):
+                # Stored as ISO text and parsed back so it still compares against datetime rows
+                watermark, watermark_type = watermark.isoformat(), 'datetime'
+            with open(state_file, 'w') as f:
+                json.dump({
+                    'watermark': watermark,
+                    'watermark_type': watermark_type,
+                    'row_hashes': state.row_hashes,
+                    'updated_at': state.updated_at.isoformat(),
+                    'source_version': state.source_version
+                }, f, default=str)
         except Exception as e:
-            execution_time = (datetime.now() - start_time).total_seconds()
-            return {
-                "success": False,
-                "records_processed": 0,
-                "records_synced": 0,
-                "records_failed": 0,
-                "conflicts_detected": 0,
-                "execution_time": execution_time,
-                "details": {},
-                "error": str(e)
+            self.logger.error(f"Could not save sync state for {state.sync_id}: {e}")
+    
+    def _find_resumable_execution(self, execution_id: str) -> Optional[SyncExecution]:
+        """Take an interrupted or failed execution that can continue from its checkpoint"""
+        return self.interrupted_executions.pop(execution_id, None)
+    
+    def _prune_interrupted_executions(self, completed_sync_id: Optional[str] = None):
+        """Drop interrupted executions superseded by a completed run and cap how many are kept"""
+        if completed_sync_id:
+            for execution_id, execution in list(self.interrupted_executions.items()):
+                if execution.sync_id == completed_sync_id:
+                    del self.interrupted_executions[execution_id]
+        
+        excess = len(self.interrupted_executions) - self.max_interrupted_executions
+        if excess > 0:
+            oldest = sorted(self.interrupted_executions.values(), key=lambda execution: execution.started_at)[:excess]
+            for execution in oldest:
+                del self.interrupted_executions[execution.execution_id]
+    
+    def _save_checkpoints(self, force: bool = False):
+        """Persist checkpoints of unfinished executions so they can resume after a crash"""
+        # Progress writes are throttled; a crash re-sends at most checkpoint_interval worth of rows
+        now = time.monotonic()
+        if not force and now - self._checkpoints_saved_at < self.checkpoint_interval:
+            return
+        self._checkpoints_saved_at = now
+        try:
+            checkpoints = {
+                execution.execution_id: {
+                    'sync_id': execution.sync_id,
+                    'started_at': execution.started_at.isoformat(),
+                    'checkpoint_offset': execution.checkpoint_offset,
+                    'target_offsets': execution.target_offsets,
+                    'execution_details': execution.execution_details
+                }
+                for execution in list(self.active_executions.values()) + list(self.interrupted_executions.values())
             }
+            checkpoints_file = os.path.join(self.data_dir, "sync_checkpoints.json")
+            # Write aside and rename so a crash mid-write never leaves a truncated file
+            temp_file = f"{checkpoints_file}.tmp"
+            with open(temp_file, 'w') as f:
+                json.dump(checkpoints, f)
+            os.replace(temp_file, checkpoints_file)
+        except Exception as e:
+            self.logger.error(f"Could not save sync checkpoints: {e}")
     
     async def _auto_resolve_conflict(self, conflict: DataConflict) -> Dict[str, Any]:
         """Auto-resolve a data conflict"""
@@ -1543,6 +2006,9 @@ class SupremeDataSynchronizer(BaseSupremeEngine):
     
     async def _perform_data_validation(self, sync_config: SyncConfiguration, validation_rules: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Perform data consistency validation"""
+        if sync_config.incremental and sync_config.key_field:
+            return await self._validate_against_hash_index(sync_config, validation_rules)
+        
         try:
             # Mock validation results
             total_records = 1000
@@ -1580,6 +2046,56 @@ class SupremeDataSynchronizer(BaseSupremeEngine):
                 "details": {"error": str(e)}
             }
     
+    async def _validate_against_hash_index(self, sync_config: SyncConfiguration,
+                                           validation_rules: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Compare source rows from the watermark on with the row-hash index; rows that
+        are new or whose content changed since the last sync are inconsistencies.
+        A file source unchanged since the last complete sync is not scanned at all.
+        """
+        start_time = datetime.now()
+        try:
+            state = self._get_sync_state(sync_config)
+            inconsistencies = []
+            rows_checked = 0
+            
+            source = sync_config.sources[0]
+            source_version = self._source_version(source)
+            if source_version is None or source_version != state.source_version:
+                async for _, records in self._extract_records(source, 0, self.etl_chunk_size):
+                    _, changes, _ = self._detect_changes(records, sync_config, state, state.watermark)
+                    rows_checked += len(records)
+                    for key, _, _ in changes:
+                        inconsistencies.append({
+                            "record_id": key,
+                            "change": "updated" if key in state.row_hashes else "inserted",
+                            "severity": "medium"
+                        })
+            
+            total_records = max(len(state.row_hashes), len(inconsistencies))
+            return {
+                "passed": len(inconsistencies) == 0,
+                "total_records": total_records,
+                "inconsistencies": inconsistencies,
+                "consistency_score": 1.0 - len(inconsistencies) / total_records if total_records else 1.0,
+                "details": {
+                    "validation_rules_applied": len(validation_rules),
+                    "validation_method": "row_hash_index",
+                    "source_rows_scanned": rows_checked,
+                    "watermark": state.watermark,
+                    "validation_time": (datetime.now() - start_time).total_seconds()
+                }
+            }
+            
+        except Exception as e:
+            return {
+                "passed": False,
+                "total_records": 0,
+                "inconsistencies": [],
+                "consistency_score": 0.0,
+                "details": {"error": str(e)}
+            }
+    
     async def _fix_data_inconsistencies(self, sync_config: SyncConfiguration, inconsistencies: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Fix data inconsistencies"""
         try:
@@ -0,0 +1,158 @@
+"""
+Supreme HTTP Response Cache
+Conditional-revalidation cache for idempotent integration GET requests.
+"""
+
+import asyncio
+import copy
+import hashlib
+import json
+import re
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple, Callable, Awaitable
+from dataclasses import dataclass
+
+
+@dataclass
+class CachedResponse:
+    status: int
+    headers: Dict[str, str]
+    data: Any
+    expires_at: float
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+
+class HTTPResponseCache:
+    """
+    Cache for idempotent GET responses with conditional revalidation.
+
+    Fresh entries are served locally. Expired entries that carry an ETag or
+    Last-Modified are kept and revalidated with If-None-Match/If-Modified-Since, so
+    an unchanged resource costs a 304 instead of a full body. Identical concurrent
+    fetches share a single request. TTLs come from Cache-Control max-age, then the
+    per-endpoint table (matched by longest "service_id:endpoint" prefix), then the default.
+    Entries are keyed by service, URL and request headers (see ``key_for``), and every
+    caller gets its own copy of the response body.
+    """
+
+    MAX_AGE_PATTERN = re.compile(r"max-age=(\d+)")
+
+    def __init__(self, default_ttl: float = 30.0, max_entries: int = 1000,
+                 endpoint_ttls: Optional[Dict[str, float]] = None):
+        self.default_ttl = default_ttl
+        self.max_entries = max_entries
+        self.endpoint_ttls = dict(endpoint_ttls or {})
+        self.entries: "OrderedDict[str, CachedResponse]" = OrderedDict()
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self.stats = {"hits": 0, "misses": 0, "revalidated": 0, "coalesced": 0, "uncacheable": 0}
+
+    @staticmethod
+    def key_for(service_id: str, url: str, headers: Optional[Dict[str, str]] = None) -> str:
+        """Cache key of a GET; responses can vary with any request header (auth, Accept, ...)"""
+        vary = ""
+        if headers:
+            normalized = sorted((name.lower(), str(value)) for name, value in headers.items())
+            vary = hashlib.blake2b(json.dumps(normalized).encode(), digest_size=8).hexdigest()
+        return f"{service_id} GET {url} {vary}"
+
+    def ttl_for(self, service_id: str, endpoint: str) -> float:
+        """Configured TTL for an endpoint, falling back to the service and then the default"""
+        path = f"{service_id}:{endpoint}"
+        matches = [prefix for prefix in self.endpoint_ttls
+                   if prefix == service_id or (":" in prefix and path.startswith(prefix))]
+        return self.endpoint_ttls[max(matches, key=len)] if matches else self.default_ttl
+
+    async def fetch(self, key: str, ttl: float,
+                    send: Callable[[Dict[str, str]], Awaitable[Tuple[int, Dict[str, str], Any]]]
+                    ) -> Tuple[int, Dict[str, str], Any, str]:
+        """Return (status, headers, data, cache_status) for a GET, calling send(conditional_headers) if needed"""
+        entry = self.entries.get(key)
+        if entry is not None and entry.expires_at > time.monotonic():
+            self.entries.move_to_end(key)
+            self.stats["hits"] += 1
+            return entry.status, dict(entry.headers), copy.deepcopy(entry.data), "hit"
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self.stats["coalesced"] += 1
+            status, headers, data, _ = await asyncio.shield(inflight)
+            return status, dict(headers), copy.deepcopy(data), "coalesced"
+
+        request = asyncio.ensure_future(self._revalidate(key, ttl, entry, send))
+        self._inflight[key] = request
+        request.add_done_callback(lambda _: self._inflight.pop(key, None))
+        status, headers, data, cache_status = await asyncio.shield(request)
+        return status, dict(headers), copy.deepcopy(data), cache_status
+
+    async def _revalidate(self, key: str, ttl: float, entry: Optional[CachedResponse],
+                          send: Callable[[Dict[str, str]], Awaitable[Tuple[int, Dict[str, str], Any]]]
+                          ) -> Tuple[int, Dict[str, str], Any, str]:
+        """Fetch from origin, conditionally when the stale entry has validators"""
+        conditional_headers = {}
+        if entry is not None:
+            if entry.etag:
+                conditional_headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                conditional_headers["If-Modified-Since"] = entry.last_modified
+
+        status, headers, data = await send(conditional_headers)
+
+        if status == 304 and entry is not None:
+            entry.expires_at = time.monotonic() + self._response_ttl(headers, ttl)
+            self.entries.move_to_end(key)
+            self.stats["revalidated"] += 1
+            return entry.status, entry.headers, entry.data, "revalidated"
+
+        self.stats["misses"] += 1
+        self._store(key, ttl, status, headers, data)
+        return status, headers, data, "miss"
+
+    def _response_ttl(self, headers: Dict[str, str], ttl: float) -> float:
+        """Honor the origin's max-age when present"""
+        match = self.MAX_AGE_PATTERN.search(headers.get("Cache-Control", ""))
+        return float(match.group(1)) if match else ttl
+
+    def _store(self, key: str, ttl: float, status: int, headers: Dict[str, str], data: Any):
+        """Keep a private copy of a 200 response unless the origin forbids it"""
+        cache_control = headers.get("Cache-Control", "").lower()
+        if status != 200 or "no-store" in cache_control or "private" in cache_control:
+            self.stats["uncacheable"] += 1
+            self.entries.pop(key, None)
+            return
+
+        self.entries[key] = CachedResponse(
+            status=status,
+            headers=dict(headers),
+            data=copy.deepcopy(data),
+            expires_at=time.monotonic() + (0.0 if "no-cache" in cache_control else self._response_ttl(headers, ttl)),
+            etag=headers.get("ETag"),
+            last_modified=headers.get("Last-Modified")
+        )
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+    def invalidate(self, prefix: str = "") -> int:
+        """Drop entries whose key starts with prefix (all entries by default)"""
+        keys = [key for key in self.entries if key.startswith(prefix)]
+        for key in keys:
+            del self.entries[key]
+        return len(keys)
+
+    def invalidate_service(self, service_id: str) -> int:
+        """Drop every cached response of a service, e.g. after a write to it"""
+        return self.invalidate(f"{service_id} ")
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Hit ratios for status reporting"""
+        lookups = self.stats["hits"] + self.stats["misses"] + self.stats["revalidated"] + self.stats["coalesced"]
+        return {
+            **self.stats,
+            "entries": len(self.entries),
+            "hit_ratio": (self.stats["hits"] + self.stats["coalesced"]) / lookups if lookups else 0.0,
+            "body_reuse_ratio": (
+                (self.stats["hits"] + self.stats["coalesced"] + self.stats["revalidated"]) / lookups if lookups else 0.0
+            )
+        }
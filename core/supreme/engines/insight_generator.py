@@ -18,6 +18,7 @@ import statistics
 from collections import Counter
 
 from ..base_supreme_engine import BaseSupremeEngine, SupremeRequest, SupremeResponse
+from .data_source_loader import get_shared_loader
 
 class InsightType(Enum):
     TREND = "trend"
@@ -88,6 +89,101 @@ class BusinessMetric:
         if self.historical_values is None:
             self.historical_values = []
 
+class IncrementalCorrelation:
+    """
+    Running pairwise Pearson correlation over a growing table.
+    
+    Keeps k x k sums over pairwise-complete observations (counts, sums, sums of
+    squares and cross products), so folding in a batch of b rows costs O(b*k^2)
+    and never revisits history. Values are shifted by a per-column reference to
+    keep the raw-moment formula numerically stable. Columns first seen in a later
+    batch are added with no prior observations, matching pandas' pairwise NaN handling.
+    """
+    
+    def __init__(self):
+        self.columns: List[str] = []
+        self.shift = np.zeros(0)
+        self.counts = np.zeros((0, 0))
+        self.sums = np.zeros((0, 0))
+        self.squares = np.zeros((0, 0))
+        self.products = np.zeros((0, 0))
+        self.rows = 0
+    
+    def _add_columns(self, columns: List[str], values: np.ndarray):
+        """Grow the moment matrices for newly seen columns"""
+        new_columns = [column for column in columns if column not in self.columns]
+        if not new_columns:
+            return
+        
+        old_k, new_k = len(self.columns), len(self.columns) + len(new_columns)
+        for name in ("counts", "sums", "squares", "products"):
+            grown = np.zeros((new_k, new_k))
+            grown[:old_k, :old_k] = getattr(self, name)
+            setattr(self, name, grown)
+        
+        positions = [columns.index(column) for column in new_columns]
+        with np.errstate(all="ignore"):
+            references = np.nanmean(values[:, positions], axis=0) if len(values) else np.zeros(len(positions))
+        self.shift = np.concatenate([self.shift, np.nan_to_num(references)])
+        self.columns.extend(new_columns)
+    
+    def update(self, numeric_df: pd.DataFrame):
+        """Fold a batch of rows into the running sums"""
+        columns = [str(column) for column in numeric_df.columns]
+        values = numeric_df.to_numpy(dtype=float, na_value=np.nan)
+        self._add_columns(columns, values)
+        if not len(values):
+            return
+        
+        # Reorder the batch into state order; columns absent from the batch are all-NaN
+        batch = np.full((len(values), len(self.columns)), np.nan)
+        batch[:, [self.columns.index(column) for column in columns]] = values
+        batch -= self.shift
+        
+        present = ~np.isnan(batch)
+        mask = present.astype(float)
+        filled = np.where(present, batch, 0.0)
+        
+        self.counts += mask.T @ mask
+        self.sums += filled.T @ mask
+        self.squares += (filled * filled).T @ mask
+        self.products += filled.T @ filled
+        self.rows += len(values)
+    
+    def matrix(self, min_periods: int = 2) -> np.ndarray:
+        """Current correlation matrix (NaN where undefined)"""
+        n = self.counts
+        with np.errstate(divide="ignore", invalid="ignore"):
+            covariance = n * self.products - self.sums * self.sums.T
+            variance_row = n * self.squares - self.sums ** 2
+            variance_col = variance_row.T
+            denominator = np.sqrt(variance_row * variance_col)
+            correlation = covariance / denominator
+        
+        # Treat variance lost to rounding as zero variance
+        tolerance = 1e-12 * np.maximum(n * self.squares, n * self.squares.T)
+        undefined = (n < min_periods) | (variance_row <= tolerance) | (variance_col <= tolerance.T)
+        correlation[undefined] = np.nan
+        np.fill_diagonal(correlation, np.where(np.isnan(np.diag(correlation)), np.nan, 1.0))
+        return np.clip(correlation, -1.0, 1.0)
+    
+    @staticmethod
+    def significant_pairs(columns: List[str], correlation: np.ndarray, min_correlation: float,
+                          top_k: Optional[int] = None) -> List[Tuple[str, str, float]]:
+        """Upper-triangle pairs with |r| >= min_correlation, strongest first"""
+        rows, cols = np.triu_indices(len(columns), k=1)
+        values = correlation[rows, cols]
+        defined = ~np.isnan(values)
+        keep = defined & (np.abs(np.where(defined, values, 0.0)) >= min_correlation)
+        rows, cols, values = rows[keep], cols[keep], values[keep]
+        
+        order = np.argsort(-np.abs(values), kind="stable")
+        if top_k is not None and top_k < len(order):
+            partition = np.argpartition(-np.abs(values), top_k - 1)[:top_k]
+            order = partition[np.argsort(-np.abs(values[partition]), kind="stable")]
+        
+        return [(columns[rows[i]], columns[cols[i]], float(values[i])) for i in order]
+
 class SupremeInsightGenerator(BaseSupremeEngine):
     """
     Supreme insight generator with intelligent analysis capabilities.
@@ -116,6 +212,12 @@ class SupremeInsightGenerator(BaseSupremeEngine):
         # Built-in insight rules
         self.builtin_rules = self._initialize_builtin_rules()
         
+        # Shared columnar loader and frame cache for data sources
+        self.data_loader = get_shared_loader()
+        
+        # Running correlation state per data source for incremental updates
+        self.correlation_states: Dict[str, IncrementalCorrelation] = {}
+        
         # Data persistence
         self.data_dir = "data/insights"
         os.makedirs(self.data_dir, exist_ok=True)
@@ -178,12 +280,14 @@ class SupremeInsightGenerator(BaseSupremeEngine):
             insight_types = parameters.get("insight_types", ["trend", "anomaly", "correlation"])
             min_confidence = parameters.get("min_confidence", 0.7)
             
-            if not data and not data_source:
+            if data is None and not data_source:
                 return {"error": "data or data_source is required", "operation": "generate_insights"}
             
             # Load data if needed
-            if data_source and not data:
-                data = await self._load_data_from_source(data_source)
+            if data_source and data is None:
+                data = await self._load_data_from_source(
+                    data_source, columns=parameters.get("columns"), filters=parameters.get("filters")
+                )
             
             # Convert to DataFrame
             if isinstance(data, list):
@@ -269,12 +373,14 @@ class SupremeInsightGenerator(BaseSupremeEngine):
             time_column = parameters.get("time_column", "timestamp")
             value_columns = parameters.get("value_columns")
             
-            if not data and not data_source:
+            if data is None and not data_source:
                 return {"error": "data or data_source is required", "operation": "analyze_trends"}
             
             # Load data if needed
-            if data_source and not data:
-                data = await self._load_data_from_source(data_source)
+            if data_source and data is None:
+                data = await self._load_data_from_source(
+                    data_source, columns=parameters.get("columns"), filters=parameters.get("filters")
+                )
             
             # Convert to DataFrame
             if isinstance(data, list):
@@ -322,12 +428,14 @@ class SupremeInsightGenerator(BaseSupremeEngine):
             method = parameters.get("method", "statistical")
             sensitivity = parameters.get("sensitivity", 2.0)
             
-            if not data and not data_source:
+            if data is None and not data_source:
                 return {"error": "data or data_source is required", "operation": "detect_anomalies"}
             
             # Load data if needed
-            if data_source and not data:
-                data = await self._load_data_from_source(data_source)
+            if data_source and data is None:
+                data = await self._load_data_from_source(
+                    data_source, columns=parameters.get("columns"), filters=parameters.get("filters")
+                )
             
             # Convert to DataFrame
             if isinstance(data, list):
@@ -367,13 +475,26 @@ class SupremeInsightGenerator(BaseSupremeEngine):
             data = parameters.get("data")
             min_correlation = parameters.get("min_correlation", 0.5)
             method = parameters.get("method", "pearson")
+            top_k = parameters.get("top_k")
+            incremental = parameters.get("incremental", False)
+            reset = parameters.get("reset", False)
             
-            if not data and not data_source:
+            if data is None and not data_source:
                 return {"error": "data or data_source is required", "operation": "find_correlations"}
             
+            # Incremental calls fold in new rows only; data_source just names the running state,
+            # reloading the whole source would count its rows again
+            if incremental and (not data_source or data is None):
+                return {
+                    "error": "data (the new rows) and data_source are required for incremental correlations",
+                    "operation": "find_correlations"
+                }
+            
             # Load data if needed
-            if data_source and not data:
-                data = await self._load_data_from_source(data_source)
+            if data_source and data is None:
+                data = await self._load_data_from_source(
+                    data_source, columns=parameters.get("columns"), filters=parameters.get("filters")
+                )
             
             # Convert to DataFrame
             if isinstance(data, list):
@@ -384,44 +505,61 @@ class SupremeInsightGenerator(BaseSupremeEngine):
             # Calculate correlation matrix for numeric columns
             numeric_df = df.select_dtypes(include=[np.number])
             
-            if numeric_df.empty:
+            if numeric_df.empty and not (incremental and data_source in self.correlation_states):
                 return {
                     "operation": "find_correlations",
                     "error": "No numeric columns found for correlation analysis"
                 }
             
-            correlation_matrix = numeric_df.corr(method=method)
+            if method == "pearson":
+                # Fold rows into the running state; one-shot calls use a fresh state
+                if incremental:
+                    if reset or data_source not in self.correlation_states:
+                        self.correlation_states[data_source] = IncrementalCorrelation()
+                    state = self.correlation_states[data_source]
+                else:
+                    state = IncrementalCorrelation()
+                state.update(numeric_df)
+                columns = list(state.columns)
+                correlation = state.matrix()
+                rows_analyzed = state.rows
+            else:
+                # Rank correlations need the whole table
+                columns = [str(column) for column in numeric_df.columns]
+                correlation = numeric_df.corr(method=method).to_numpy()
+                rows_analyzed = len(numeric_df)
             
             # Find significant correlations
-            significant_correlations = []
-            
-            for i, col1 in enumerate(correlation_matrix.columns):
-                for j, col2 in enumerate(correlation_matrix.columns):
-                    if i < j:  # Avoid duplicates and self-correlation
-                        corr_value = correlation_matrix.loc[col1, col2]
-                        if abs(corr_value) >= min_correlation:
-                            significant_correlations.append({
-                                "variable1": col1,
-                                "variable2": col2,
-                                "correlation": float(corr_value),
-                                "strength": self._correlation_strength(abs(corr_value)),
-                                "direction": "positive" if corr_value > 0 else "negative"
-                            })
-            
-            # Sort by correlation strength
-            significant_correlations.sort(key=lambda x: abs(x["correlation"]), reverse=True)
+            significant_correlations = [
+                {
+                    "variable1": col1,
+                    "variable2": col2,
+                    "correlation": corr_value,
+                    "strength": self._correlation_strength(abs(corr_value)),
+                    "direction": "positive" if corr_value > 0 else "negative"
+                }
+                for col1, col2, corr_value in IncrementalCorrelation.significant_pairs(
+                    columns, correlation, min_correlation, top_k
+                )
+            ]
             
             result = {
                 "operation": "find_correlations",
                 "data_source": data_source or "provided_data",
                 "method": method,
                 "min_correlation": min_correlation,
-                "variables_analyzed": len(numeric_df.columns),
+                "variables_analyzed": len(columns),
+                "rows_analyzed": rows_analyzed,
                 "significant_correlations": len(significant_correlations),
-                "correlations": significant_correlations,
-                "correlation_matrix": correlation_matrix.to_dict()
+                "correlations": significant_correlations
             }
             
+            # Sparse top-K results skip the dense matrix
+            if top_k is None:
+                result["correlation_matrix"] = pd.DataFrame(correlation, index=columns, columns=columns).to_dict()
+            else:
+                result["top_k"] = top_k
+            
             return result
             
         except Exception as e:
@@ -569,6 +707,7 @@ class SupremeInsightGenerator(BaseSupremeEngine):
                 "monitored_metrics": len(self.business_metrics),
                 "insights_by_type": insights_by_type,
                 "insights_by_severity": insights_by_severity,
+                "data_source_cache": self.data_loader.get_statistics(),
                 "recent_insights_details": [
                     {
                         "insight_id": insight.insight_id,
@@ -670,15 +809,10 @@ class SupremeInsightGenerator(BaseSupremeEngine):
         timestamp = datetime.now().isoformat()
         return hashlib.md5(f"insight_{timestamp}".encode()).hexdigest()[:16]
     
-    async def _load_data_from_source(self, data_source: str) -> pd.DataFrame:
-        """Load data from various sources"""
-        # This would implement actual data loading logic
-        # For now, return mock data
-        return pd.DataFrame([
-            {"value": 10, "category": "A", "timestamp": "2024-01-01"},
-            {"value": 15, "category": "B", "timestamp": "2024-01-02"},
-            {"value": 12, "category": "A", "timestamp": "2024-01-03"}
-        ])
+    async def _load_data_from_source(self, data_source: str, columns: Optional[List[str]] = None,
+                                     filters: Optional[List[Tuple[str, str, Any]]] = None) -> pd.DataFrame:
+        """Load a CSV, Parquet or JSONL data source through the shared frame cache"""
+        return await self.data_loader.load_async(data_source, columns=columns, filters=filters)
     
     async def _generate_trend_insights(self, df: pd.DataFrame, data_source: str) -> List[Insight]:
         """Generate trend-based insights"""
@@ -765,32 +899,28 @@ class SupremeInsightGenerator(BaseSupremeEngine):
             numeric_df = df.select_dtypes(include=[np.number])
             
             if len(numeric_df.columns) >= 2:
-                correlation_matrix = numeric_df.corr()
+                state = IncrementalCorrelation()
+                state.update(numeric_df)
                 
                 # Find strong correlations
-                for i, col1 in enumerate(correlation_matrix.columns):
-                    for j, col2 in enumerate(correlation_matrix.columns):
-                        if i < j:  # Avoid duplicates
-                            corr_value = correlation_matrix.loc[col1, col2]
-                            
-                            if abs(corr_value) >= 0.7:  # Strong correlation threshold
-                                direction = "positive" if corr_value > 0 else "negative"
-                                
-                                insight = Insight(
-                                    insight_id=self._generate_insight_id(),
-                                    insight_type=InsightType.CORRELATION,
-                                    title=f"Strong {direction} correlation between {col1} and {col2}",
-                                    description=f"'{col1}' and '{col2}' show a strong {direction} correlation (r={corr_value:.3f})",
-                                    severity=InsightSeverity.MEDIUM,
-                                    confidence_score=abs(corr_value),
-                                    data_source=data_source,
-                                    affected_metrics=[col1, col2],
-                                    supporting_data={
-                                        "correlation_coefficient": corr_value,
-                                        "correlation_strength": self._correlation_strength(abs(corr_value))
-                                    }
-                                )
-                                insights.append(insight)
+                for col1, col2, corr_value in IncrementalCorrelation.significant_pairs(state.columns, state.matrix(), 0.7):
+                    direction = "positive" if corr_value > 0 else "negative"
+                    
+                    insight = Insight(
+                        insight_id=self._generate_insight_id(),
+                        insight_type=InsightType.CORRELATION,
+                        title=f"Strong {direction} correlation between {col1} and {col2}",
+                        description=f"'{col1}' and '{col2}' show a strong {direction} correlation (r={corr_value:.3f})",
+                        severity=InsightSeverity.MEDIUM,
+                        confidence_score=abs(corr_value),
+                        data_source=data_source,
+                        affected_metrics=[col1, col2],
+                        supporting_data={
+                            "correlation_coefficient": corr_value,
+                            "correlation_strength": self._correlation_strength(abs(corr_value))
+                        }
+                    )
+                    insights.append(insight)
             
         except Exception as e:
             self.logger.error(f"Error generating correlation insights: {e}")
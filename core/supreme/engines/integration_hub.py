@@ -11,9 +11,13 @@ from typing import Dict, List, Any, Optional
 from dataclasses import dataclass
 from enum import Enum
 from datetime import datetime
+from urllib.parse import urlencode
 import os
 
 from ..base_supreme_engine import BaseSupremeEngine, SupremeRequest, SupremeResponse
+from .dag_executor import DAGExecutor, DAGTask
+from .http_response_cache import HTTPResponseCache
+from .service_connections import ServiceConnectionPool
 
 class ConnectionStatus(Enum):
     DISCONNECTED = "disconnected"
@@ -47,6 +51,18 @@ class UniversalIntegrator(BaseSupremeEngine):
         self.automation_workflows: Dict[str, AutomationWorkflow] = {}
         self.data_dir = "data/integrations"
         os.makedirs(self.data_dir, exist_ok=True)
+        
+        # Workflow DAG execution limits (overridable per workflow/step)
+        self.workflow_max_concurrency = 8
+        self.workflow_step_timeout = 30.0
+        self.workflow_step_retries = 2
+        self.workflow_retry_backoff = 0.5
+        
+        # Pooled HTTP sessions, auth headers and rate limits per service
+        self.connection_pool = ServiceConnectionPool()
+        
+        # Conditional-request cache for idempotent GETs
+        self.response_cache = HTTPResponseCache()
     
     async def _initialize_engine(self) -> bool:
         """Initialize the universal integrator"""
@@ -137,8 +153,23 @@ class UniversalIntegrator(BaseSupremeEngine):
             service = self.integrated_services[service_id]
             full_url = f"{service.base_url.rstrip('/')}/{endpoint.lstrip('/')}"
             
-            # Execute API call
-            api_result = await self._make_api_request(method, full_url, data)
+            # Execute API call; idempotent GETs go through the response cache
+            cache_status = None
+            if method.upper() == "GET" and parameters.get("use_cache", True):
+                async def send(conditional_headers: Dict[str, str]):
+                    result = await self._make_api_request(method, full_url, data, headers=conditional_headers)
+                    return result.get("status_code", 200 if result["success"] else 500), result.get("headers", {}), result
+                
+                # The query payload selects the response, so it is part of the key
+                cache_url = f"{full_url}?{urlencode(sorted(data.items()), doseq=True)}" if data else full_url
+                ttl = parameters.get("cache_ttl") or self.response_cache.ttl_for(service_id, endpoint)
+                _, _, api_result, cache_status = await self.response_cache.fetch(
+                    self.response_cache.key_for(service_id, cache_url), ttl, send
+                )
+            else:
+                api_result = await self._make_api_request(method, full_url, data)
+                if method.upper() != "GET":
+                    self.response_cache.invalidate_service(service_id)
             
             return {
                 "operation": "api_call",
@@ -147,7 +178,8 @@ class UniversalIntegrator(BaseSupremeEngine):
                 "endpoint": endpoint,
                 "success": api_result["success"],
                 "response_data": api_result.get("data"),
-                "status_code": api_result.get("status_code")
+                "status_code": api_result.get("status_code"),
+                "cache": cache_status
             }
             
         except Exception as e:
@@ -313,15 +345,18 @@ class UniversalIntegrator(BaseSupremeEngine):
                 "operation": "integration_status",
                 "timestamp": datetime.now().isoformat(),
                 "service_status": service_status,
-                "workflow_status": workflow_status
+                "workflow_status": workflow_status,
+                "connection_pool": self.connection_pool.get_statistics(),
+                "response_cache": self.response_cache.get_statistics()
             }
             
         except Exception as e:
             self.logger.error(f"Error getting integration status: {e}")
             return {"error": str(e), "operation": "integration_status"}
     
-    async def _make_api_request(self, method: str, url: str, data: Dict[str, Any]) -> Dict[str, Any]:
-        """Make API request"""
+    async def _make_api_request(self, method: str, url: str, data: Dict[str, Any],
+                                headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        """Make API request; headers carry e.g. If-None-Match for cache revalidation"""
         try:
             # Simplified API request
             return {
@@ -379,6 +414,10 @@ class UniversalIntegrator(BaseSupremeEngine):
         except Exception as e:
             self.logger.error(f"Error saving integration data: {e}")
     
+    async def _shutdown_engine(self):
+        """Close pooled HTTP sessions"""
+        await self.connection_pool.close()
+    
     async def _connection_monitor(self):
         """Monitor connections"""
         while self.status.value != "shutdown":
@@ -621,49 +660,30 @@ class UniversalIntegrator(BaseSupremeEngine):
     
     async def _test_service_connection(self, connection: ServiceConnection) -> Dict[str, Any]:
         """Test connection to a service"""
+        start_time = datetime.now()
         try:
-            start_time = datetime.now()
-            
-            # Create session if needed
-            if not connection.session or connection.session.closed:
-                connection.session = aiohttp.ClientSession(
-                    timeout=aiohttp.ClientTimeout(total=connection.config.timeout)
-                )
-            
-            # Prepare headers
-            headers = connection.config.headers.copy()
-            
-            # Add authentication
-            if connection.config.auth_type == AuthType.BEARER_TOKEN:
-                token = connection.config.auth_config.get("token")
-                if token:
-                    headers["Authorization"] = f"Bearer {token}"
-            elif connection.config.auth_type == AuthType.API_KEY:
-                api_key = connection.config.auth_config.get("api_key")
-                if api_key:
-                    headers["X-API-Key"] = api_key
-            
             # Make test request (usually to root or health endpoint)
             test_endpoint = connection.config.auth_config.get("test_endpoint", "/")
             url = f"{connection.config.base_url.rstrip('/')}{test_endpoint}"
             
-            async with connection.session.get(url, headers=headers) as response:
-                response_time = (datetime.now() - start_time).total_seconds()
-                
-                if response.status < 400:
-                    return {
-                        "success": True,
-                        "status_code": response.status,
-                        "response_time": response_time,
-                        "message": "Connection test successful"
-                    }
-                else:
-                    return {
-                        "success": False,
-                        "status_code": response.status,
-                        "response_time": response_time,
-                        "error": f"HTTP {response.status}: {await response.text()}"
-                    }
+            status, _, response_data = await self.connection_pool.request(connection, "GET", url)
+            connection.session = self.connection_pool.session_for(connection.config.service_id)
+            response_time = (datetime.now() - start_time).total_seconds()
+            
+            if status < 400:
+                return {
+                    "success": True,
+                    "status_code": status,
+                    "response_time": response_time,
+                    "message": "Connection test successful"
+                }
+            else:
+                return {
+                    "success": False,
+                    "status_code": status,
+                    "response_time": response_time,
+                    "error": f"HTTP {status}: {response_data}"
+                }
                     
         except Exception as e:
             return {
@@ -672,66 +692,52 @@ class UniversalIntegrator(BaseSupremeEngine):
                 "response_time": (datetime.now() - start_time).total_seconds()
             }
     
-    async def _execute_service_request(self, connection: ServiceConnection, request: IntegrationRequest) -> IntegrationResponse:
-        """Execute a request to a service"""
+    async def _execute_service_request(self, connection: ServiceConnection, request: IntegrationRequest,
+                                       use_cache: bool = True, cache_ttl: Optional[float] = None) -> IntegrationResponse:
+        """Execute a request to a service; GETs go through the response cache unless use_cache is False"""
         start_time = datetime.now()
         
         try:
-            # Create session if needed
-            if not connection.session or connection.session.closed:
-                connection.session = aiohttp.ClientSession(
-                    timeout=aiohttp.ClientTimeout(total=request.timeout or connection.config.timeout)
-                )
-            
             # Prepare URL
             url = f"{connection.config.base_url.rstrip('/')}{request.endpoint}"
             if request.params:
                 url += "?" + urlencode(request.params)
             
-            # Prepare headers
-            headers = connection.config.headers.copy()
-            if request.headers:
-                headers.update(request.headers)
-            
-            # Add authentication
-            if connection.config.auth_type == AuthType.BEARER_TOKEN:
-                token = connection.config.auth_config.get("token")
-                if token:
-                    headers["Authorization"] = f"Bearer {token}"
-            elif connection.config.auth_type == AuthType.API_KEY:
-                api_key = connection.config.auth_config.get("api_key")
-                if api_key:
-                    headers["X-API-Key"] = api_key
-            elif connection.config.auth_type == AuthType.BASIC_AUTH:
-                username = connection.config.auth_config.get("username")
-                password = connection.config.auth_config.get("password")
-                if username and password:
-                    credentials = base64.b64encode(f"{username}:{password}".encode()).decode()
-                    headers["Authorization"] = f"Basic {credentials}"
-            
-            # Make request
-            async with connection.session.request(
-                request.method,
-                url,
-                headers=headers,
-                json=request.data if request.data else None
-            ) as response:
-                response_time = (datetime.now() - start_time).total_seconds()
-                
-                try:
-                    response_data = await response.json()
-                except:
-                    response_data = await response.text()
-                
-                return IntegrationResponse(
-                    request_id=request.request_id,
-                    service_id=request.service_id,
-                    success=response.status < 400,
-                    status_code=response.status,
-                    data=response_data,
-                    response_time=response_time,
-                    headers=dict(response.headers)
+            # Pooled session, precomputed auth headers, rate limiting and 429 retries
+            async def send(conditional_headers: Dict[str, str]):
+                return await self.connection_pool.request(
+                    connection,
+                    request.method,
+                    url,
+                    headers={**(request.headers or {}), **conditional_headers},
+                    json_data=request.data if request.data else None,
+                    timeout=request.timeout
+                )
+            
+            if request.method.upper() == "GET" and use_cache:
+                ttl = cache_ttl or self.response_cache.ttl_for(request.service_id, request.endpoint)
+                # Auth headers are part of the key so connections with different credentials never share entries
+                cache_key = self.response_cache.key_for(
+                    request.service_id, url, {**self.connection_pool.headers_for(connection), **(request.headers or {})}
                 )
+                status, response_headers, response_data, _ = await self.response_cache.fetch(cache_key, ttl, send)
+            else:
+                status, response_headers, response_data = await send({})
+                if request.method.upper() != "GET":
+                    # A write may change anything this service returns
+                    self.response_cache.invalidate_service(request.service_id)
+            connection.session = self.connection_pool.session_for(connection.config.service_id)
+            response_time = (datetime.now() - start_time).total_seconds()
+            
+            return IntegrationResponse(
+                request_id=request.request_id,
+                service_id=request.service_id,
+                success=status < 400,
+                status_code=status,
+                data=response_data,
+                response_time=response_time,
+                headers=response_headers
+            )
                 
         except Exception as e:
             response_time = (datetime.now() - start_time).total_seconds()
@@ -810,59 +816,54 @@ class UniversalIntegrator(BaseSupremeEngine):
         return False
     
     async def _execute_workflow_steps(self, workflow: IntegrationWorkflow, parameters: Dict[str, Any]) -> Dict[str, Any]:
-        """Execute workflow steps in dependency order"""
+        """Execute workflow steps concurrently as their dependencies complete"""
+        start_time = datetime.now()
         try:
-            start_time = datetime.now()
+            executor = DAGExecutor(
+                max_concurrency=getattr(workflow, "max_concurrency", None) or self.workflow_max_concurrency,
+                default_timeout=self.workflow_step_timeout,
+                retry_backoff=self.workflow_retry_backoff,
+                logger=self.logger
+            )
             
-            # Sort steps by dependencies
-            sorted_steps = self._topological_sort(workflow.steps)
+            tasks = []
+            for step in workflow.steps:
+                max_retries = getattr(step, "max_retries", None)
+                if max_retries is None:
+                    max_retries = self.workflow_step_retries if getattr(step, "retry_on_failure", False) else 0
+                tasks.append(DAGTask(
+                    task_id=step.step_id,
+                    run=self._workflow_step_runner(step, parameters),
+                    depends_on=list(step.depends_on),
+                    timeout=getattr(step, "timeout", None),
+                    max_retries=max_retries
+                ))
+            
+            dag_results = await executor.run(tasks)
             
-            executed_steps = []
-            failed_steps = []
             step_results = {}
-            
-            for step in sorted_steps:
-                try:
-                    # Check if dependencies completed successfully
-                    dependencies_met = all(
-                        dep_id in step_results and step_results[dep_id]["success"]
-                        for dep_id in step.depends_on
-                    )
-                    
-                    if not dependencies_met:
-                        failed_steps.append(step.step_id)
-                        step_results[step.step_id] = {
-                            "success": False,
-                            "error": "Dependencies not met"
-                        }
-                        continue
-                    
-                    # Execute step
-                    step_result = await self._execute_workflow_step(step, parameters, step_results)
-                    step_results[step.step_id] = step_result
-                    
-                    if step_result["success"]:
-                        executed_steps.append(step.step_id)
-                    else:
-                        failed_steps.append(step.step_id)
-                        
-                        # Stop execution if step failed and no retry
-                        if not step.retry_on_failure:
-                            break
-                            
-                except Exception as e:
-                    failed_steps.append(step.step_id)
-                    step_results[step.step_id] = {
+            executed_steps, failed_steps, skipped_steps = [], [], []
+            for step_id, dag_result in dag_results.items():
+                if dag_result.success:
+                    executed_steps.append(step_id)
+                    step_results[step_id] = dag_result.result
+                else:
+                    (skipped_steps if dag_result.status == "skipped" else failed_steps).append(step_id)
+                    step_results[step_id] = {
                         "success": False,
-                        "error": str(e)
+                        "status": dag_result.status,
+                        "error": dag_result.error
                     }
+                step_results[step_id]["attempts"] = dag_result.attempts
+                step_results[step_id]["duration"] = dag_result.duration
             
             execution_time = (datetime.now() - start_time).total_seconds()
             
             return {
-                "success": len(failed_steps) == 0,
+                "success": not failed_steps and not skipped_steps,
                 "steps_executed": len(executed_steps),
                 "steps_failed": len(failed_steps),
+                "steps_skipped": len(skipped_steps),
                 "execution_time": execution_time,
                 "results": step_results,
                 "error": f"Failed steps: {failed_steps}" if failed_steps else None
@@ -878,33 +879,20 @@ class UniversalIntegrator(BaseSupremeEngine):
                 "error": str(e)
             }
     
+    def _workflow_step_runner(self, step: WorkflowStep, workflow_params: Dict[str, Any]):
+        """Wrap a step so a reported failure raises and can be retried"""
+        async def run(previous_results: Dict[str, Any]) -> Dict[str, Any]:
+            step_result = await self._execute_workflow_step(step, workflow_params, previous_results)
+            if not step_result.get("success"):
+                raise RuntimeError(step_result.get("error") or f"Step {step.step_id} failed")
+            return step_result
+        return run
+    
     def _topological_sort(self, steps: List[WorkflowStep]) -> List[WorkflowStep]:
         """Sort steps in dependency order using topological sort"""
-        # Build adjacency list and in-degree count
-        graph = {step.step_id: [] for step in steps}
-        in_degree = {step.step_id: 0 for step in steps}
-        step_map = {step.step_id: step for step in steps}
-        
-        for step in steps:
-            for dependency in step.depends_on:
-                if dependency in graph:
-                    graph[dependency].append(step.step_id)
-                    in_degree[step.step_id] += 1
-        
-        # Kahn's algorithm
-        queue = [step_id for step_id, degree in in_degree.items() if degree == 0]
-        sorted_steps = []
-        
-        while queue:
-            current = queue.pop(0)
-            sorted_steps.append(step_map[current])
-            
-            for neighbor in graph[current]:
-                in_degree[neighbor] -= 1
-                if in_degree[neighbor] == 0:
-                    queue.append(neighbor)
-        
-        return sorted_steps
+        return DAGExecutor.topological_order(
+            steps, key=lambda step: step.step_id, dependencies=lambda step: step.depends_on
+        )
     
     async def _execute_workflow_step(self, step: WorkflowStep, workflow_params: Dict[str, Any], previous_results: Dict[str, Any]) -> Dict[str, Any]:
         """Execute a single workflow step"""
@@ -980,7 +968,10 @@ class UniversalIntegrator(BaseSupremeEngine):
             )
             
             source_connection = self.service_connections[source_service]
-            source_response = await self._execute_service_request(source_connection, source_request)
+            source_response = await self._execute_service_request(
+                source_connection, source_request,
+                use_cache=data_mapping.get("use_cache", True), cache_ttl=data_mapping.get("cache_ttl")
+            )
             
             if not source_response.success:
                 return {
@@ -1187,10 +1178,9 @@ class UniversalIntegrator(BaseSupremeEngine):
                 if service_filter and service_filter.lower() not in service_id.lower():
                     continue
                 
-                # Close existing session
-                if connection.session and not connection.session.closed:
-                    await connection.session.close()
-                    connection.session = None
+                # Close existing pooled session and cached auth headers
+                await self.connection_pool.close(service_id)
+                connection.session = None
                 
                 # Test connection
                 test_result = await self._test_service_connection(connection)
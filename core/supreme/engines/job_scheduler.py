@@ -0,0 +1,416 @@
+"""
+Supreme Job Scheduler
+Cron parsing and heap-based scheduling shared by the synchronization and workflow engines.
+"""
+
+import logging
+import asyncio
+import heapq
+import itertools
+from bisect import bisect_left
+from typing import Dict, List, Any, Optional, Callable, Awaitable, Set, Tuple
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+OVERLAP_POLICIES = ("skip", "queue", "allow")
+
+CRON_MACROS = {
+    "@yearly": "0 0 0 1 1 *",
+    "@annually": "0 0 0 1 1 *",
+    "@monthly": "0 0 0 1 * *",
+    "@weekly": "0 0 0 * * 0",
+    "@daily": "0 0 0 * * *",
+    "@midnight": "0 0 0 * * *",
+    "@hourly": "0 0 * * * *",
+}
+
+MONTH_NAMES = {name: index + 1 for index, name in enumerate(
+    ["jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"]
+)}
+WEEKDAY_NAMES = {name: index for index, name in enumerate(["sun", "mon", "tue", "wed", "thu", "fri", "sat"])}
+
+
+class CronExpression:
+    """
+    Parsed cron expression with next-fire computation.
+
+    Accepts the classic five fields (minute hour day month weekday), an optional leading
+    seconds field, and the usual @macros. Fields support lists, ranges, steps and
+    month/weekday names. As in Vixie cron, when both day-of-month and day-of-week are
+    restricted a day matches if either does.
+    """
+
+    # (name, minimum, maximum, names)
+    FIELDS = (
+        ("second", 0, 59, None),
+        ("minute", 0, 59, None),
+        ("hour", 0, 23, None),
+        ("day", 1, 31, None),
+        ("month", 1, 12, MONTH_NAMES),
+        ("weekday", 0, 7, WEEKDAY_NAMES),
+    )
+
+    # Furthest we search before declaring an expression unsatisfiable (e.g. "0 0 30 2 *");
+    # leap days can be eight years apart
+    SEARCH_YEARS = 8
+
+    def __init__(self, expression: str):
+        self.expression = expression
+        text = CRON_MACROS.get(expression.strip().lower(), expression)
+        parts = text.split()
+        if len(parts) == 5:
+            parts = ["0"] + parts
+        if len(parts) != 6:
+            raise ValueError("Cron expression must have 5 parts (6 with a leading seconds field)")
+
+        values = [self._parse_field(part, *field) for part, field in zip(parts, self.FIELDS)]
+        self.seconds, self.minutes, self.hours, self.days, self.months, weekdays = values
+        self.weekdays = sorted({day % 7 for day in weekdays})
+        # "?" (Quartz's "no specific value") leaves a field unrestricted just like "*"
+        self.day_restricted = not parts[3].startswith(("*", "?"))
+        self.weekday_restricted = not parts[5].startswith(("*", "?"))
+
+        # Reject expressions that can never fire
+        self.next_after(datetime(2000, 1, 1))
+
+    def __repr__(self) -> str:
+        return f"CronExpression({self.expression!r})"
+
+    @staticmethod
+    def _parse_field(text: str, name: str, minimum: int, maximum: int,
+                     names: Optional[Dict[str, int]]) -> List[int]:
+        """Expand one cron field into its sorted allowed values"""
+        def parse_value(token: str) -> int:
+            token = token.lower()
+            if names and token in names:
+                return names[token]
+            if not token.isdigit():
+                raise ValueError(f"Invalid {name} value '{token}'")
+            value = int(token)
+            if not minimum <= value <= maximum:
+                raise ValueError(f"{name} value {value} outside {minimum}-{maximum}")
+            return value
+
+        allowed = set()
+        for item in text.split(","):
+            base, _, step_text = item.partition("/")
+            step = 1
+            if step_text:
+                if not step_text.isdigit() or int(step_text) == 0:
+                    raise ValueError(f"Invalid {name} step '{step_text}'")
+                step = int(step_text)
+
+            if base in ("*", "?"):
+                start, end = minimum, maximum
+            elif "-" in base:
+                start_text, _, end_text = base.partition("-")
+                start, end = parse_value(start_text), parse_value(end_text)
+                if start > end:
+                    raise ValueError(f"Invalid {name} range '{base}'")
+            else:
+                start = parse_value(base)
+                end = maximum if step_text else start
+
+            allowed.update(range(start, end + 1, step))
+
+        return sorted(allowed)
+
+    def _day_matches(self, moment: datetime) -> bool:
+        """Check day-of-month and day-of-week with cron's OR semantics"""
+        day_match = moment.day in self.days
+        weekday_match = (moment.isoweekday() % 7) in self.weekdays
+        if self.day_restricted and self.weekday_restricted:
+            return day_match or weekday_match
+        return day_match and weekday_match
+
+    def next_after(self, after: datetime) -> datetime:
+        """Return the first fire time strictly after the given moment"""
+        candidate = after.replace(microsecond=0) + timedelta(seconds=1)
+        last_year = candidate.year + self.SEARCH_YEARS
+
+        while candidate.year <= last_year:
+            if candidate.month not in self.months:
+                index = bisect_left(self.months, candidate.month)
+                if index < len(self.months):
+                    candidate = candidate.replace(month=self.months[index], day=1, hour=0, minute=0, second=0)
+                else:
+                    candidate = candidate.replace(year=candidate.year + 1, month=self.months[0],
+                                                  day=1, hour=0, minute=0, second=0)
+                continue
+
+            if not self._day_matches(candidate):
+                candidate = (candidate + timedelta(days=1)).replace(hour=0, minute=0, second=0)
+                continue
+
+            index = bisect_left(self.hours, candidate.hour)
+            if index == len(self.hours):
+                candidate = (candidate + timedelta(days=1)).replace(hour=0, minute=0, second=0)
+                continue
+            if self.hours[index] != candidate.hour:
+                candidate = candidate.replace(hour=self.hours[index], minute=0, second=0)
+
+            index = bisect_left(self.minutes, candidate.minute)
+            if index == len(self.minutes):
+                candidate = candidate.replace(minute=0, second=0) + timedelta(hours=1)
+                continue
+            if self.minutes[index] != candidate.minute:
+                candidate = candidate.replace(minute=self.minutes[index], second=0)
+
+            index = bisect_left(self.seconds, candidate.second)
+            if index == len(self.seconds):
+                candidate = candidate.replace(second=0) + timedelta(minutes=1)
+                continue
+            return candidate.replace(second=self.seconds[index])
+
+        raise ValueError(f"Cron expression '{self.expression}' never fires")
+
+
+def validate_schedule(schedule_type: str, schedule_config: Dict[str, Any]) -> List[str]:
+    """Return the list of problems with a schedule definition"""
+    errors = []
+
+    if schedule_type == "interval":
+        if "interval" not in schedule_config:
+            errors.append("Interval schedule missing 'interval' parameter")
+        elif not isinstance(schedule_config["interval"], (int, float)) or schedule_config["interval"] <= 0:
+            errors.append("Interval must be a positive number")
+
+    elif schedule_type == "cron":
+        if "cron" not in schedule_config:
+            errors.append("Cron schedule missing 'cron' parameter")
+        else:
+            try:
+                CronExpression(str(schedule_config["cron"]))
+            except ValueError as e:
+                errors.append(f"Invalid cron expression: {e}")
+
+    elif schedule_type == "once":
+        try:
+            datetime.fromisoformat(str(schedule_config.get("run_at")))
+        except ValueError:
+            errors.append("Once schedule requires an ISO 'run_at' timestamp")
+
+    else:
+        errors.append(f"Unknown schedule type '{schedule_type}'")
+
+    overlap_policy = schedule_config.get("overlap_policy", "skip")
+    if overlap_policy not in OVERLAP_POLICIES:
+        errors.append(f"Overlap policy must be one of {', '.join(OVERLAP_POLICIES)}")
+
+    return errors
+
+
+@dataclass
+class ScheduledJob:
+    """A registered job and its dispatch state"""
+    job_id: str
+    callback: Callable[[], Awaitable[Any]]
+    schedule_type: str
+    interval: Optional[float] = None
+    cron: Optional[CronExpression] = None
+    run_at: Optional[datetime] = None
+    overlap_policy: str = "skip"
+    next_fire: Optional[datetime] = None
+    version: int = 0
+    running: int = 0
+    queued: int = 0
+    fire_count: int = 0
+    skipped_count: int = 0
+
+
+class JobScheduler:
+    """
+    Heap-ordered scheduler for interval, cron and one-shot jobs.
+
+    Each job has exactly one live heap entry keyed by its next fire time; re-registering
+    or removing a job bumps its version so stale entries are dropped when popped. The run
+    loop sleeps until the earliest fire time (or until a new job is added), then dispatches
+    every due job as its own task, honouring the job's overlap policy:
+
+    - skip: drop the fire if the previous run is still going
+    - queue: run once more as soon as the previous run finishes
+    - allow: run concurrently
+    """
+
+    def __init__(self, logger: Optional[logging.Logger] = None,
+                 clock: Callable[[], datetime] = datetime.now, max_sleep: float = 3600.0):
+        self.logger = logger or logging.getLogger(__name__)
+        self.clock = clock
+        self.max_sleep = max_sleep
+        self.jobs: Dict[str, ScheduledJob] = {}
+        self._heap: List[Tuple[datetime, int, str, int]] = []
+        self._sequence = itertools.count()
+        self._tasks: Set[asyncio.Task] = set()
+        self._wakeup = asyncio.Event()
+        self._running = False
+        self.dispatched_count = 0
+
+    def __len__(self) -> int:
+        return len(self.jobs)
+
+    def __contains__(self, job_id: str) -> bool:
+        return job_id in self.jobs
+
+    def add_job(self, job_id: str, callback: Callable[[], Awaitable[Any]], schedule_type: str,
+                schedule_config: Dict[str, Any], last_executed: Optional[datetime] = None) -> Optional[datetime]:
+        """Register (or replace) a job and return its first fire time"""
+        errors = validate_schedule(schedule_type, schedule_config)
+        if errors:
+            raise ValueError("; ".join(errors))
+
+        # Replace in place so runs already in flight keep counting against the job
+        job = self.jobs.get(job_id)
+        if job is None:
+            job = ScheduledJob(job_id=job_id, callback=callback, schedule_type=schedule_type)
+            self.jobs[job_id] = job
+        else:
+            job.version += 1
+            job.callback = callback
+            job.schedule_type = schedule_type
+            job.interval = job.cron = job.run_at = None
+        job.overlap_policy = schedule_config.get("overlap_policy", "skip")
+        now = self.clock()
+
+        if schedule_type == "interval":
+            job.interval = float(schedule_config["interval"])
+            job.next_fire = last_executed + timedelta(seconds=job.interval) if last_executed else now
+        elif schedule_type == "cron":
+            job.cron = CronExpression(str(schedule_config["cron"]))
+            job.next_fire = job.cron.next_after(max(now, last_executed) if last_executed else now)
+        else:
+            job.run_at = datetime.fromisoformat(str(schedule_config["run_at"]))
+            job.next_fire = None if last_executed else job.run_at
+
+        self._push(job)
+        return job.next_fire
+
+    def remove_job(self, job_id: str) -> bool:
+        """Unregister a job; its stale heap entry is dropped lazily"""
+        return self.jobs.pop(job_id, None) is not None
+
+    def next_fire_time(self, job_id: Optional[str] = None) -> Optional[datetime]:
+        """Next fire time of one job, or of the whole scheduler"""
+        if job_id is not None:
+            job = self.jobs.get(job_id)
+            return job.next_fire if job else None
+        self._drop_stale()
+        return self._heap[0][0] if self._heap else None
+
+    def _push(self, job: ScheduledJob):
+        """Add the job's current fire time to the heap and wake the loop"""
+        if job.next_fire is None:
+            return
+        if len(self._heap) > 2 * len(self.jobs) + 64:
+            self._heap = [entry for entry in self._heap if self._is_live(entry)]
+            heapq.heapify(self._heap)
+        heapq.heappush(self._heap, (job.next_fire, next(self._sequence), job.job_id, job.version))
+        self._wakeup.set()
+
+    def _is_live(self, entry: Tuple[datetime, int, str, int]) -> bool:
+        """Check whether a heap entry still belongs to a registered job"""
+        job = self.jobs.get(entry[2])
+        return job is not None and job.version == entry[3] and job.next_fire == entry[0]
+
+    def _drop_stale(self):
+        """Pop superseded entries off the top of the heap"""
+        while self._heap and not self._is_live(self._heap[0]):
+            heapq.heappop(self._heap)
+
+    def run_pending(self, now: Optional[datetime] = None) -> List[str]:
+        """Dispatch every job due at or before now and reschedule it"""
+        now = now or self.clock()
+        dispatched = []
+
+        while self._heap and self._heap[0][0] <= now:
+            entry = heapq.heappop(self._heap)
+            if not self._is_live(entry):
+                continue
+
+            job = self.jobs[entry[2]]
+            self._dispatch(job)
+            dispatched.append(job.job_id)
+
+            if job.interval is not None:
+                # Fall back to now when we are more than one interval behind, rather than bursting
+                next_fire = job.next_fire + timedelta(seconds=job.interval)
+                job.next_fire = next_fire if next_fire > now else now + timedelta(seconds=job.interval)
+            elif job.cron is not None:
+                job.next_fire = job.cron.next_after(now)
+            else:
+                job.next_fire = None
+            self._push(job)
+
+        return dispatched
+
+    def _dispatch(self, job: ScheduledJob):
+        """Start the job's callback according to its overlap policy"""
+        if job.running and job.overlap_policy == "skip":
+            job.skipped_count += 1
+            return
+        if job.running and job.overlap_policy == "queue":
+            # At most one follow-up run is kept; further fires coalesce into it
+            if job.queued:
+                job.skipped_count += 1
+            job.queued = 1
+            return
+        self._start(job)
+
+    def _start(self, job: ScheduledJob):
+        """Run the job's callback in its own task"""
+        job.running += 1
+        job.fire_count += 1
+        self.dispatched_count += 1
+        task = asyncio.create_task(self._run_job(job))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run_job(self, job: ScheduledJob):
+        """Await one run of a job and start any queued follow-up"""
+        try:
+            await job.callback()
+        except Exception as e:
+            self.logger.error(f"Scheduled job {job.job_id} failed: {e}")
+        finally:
+            job.running -= 1
+            if job.queued and self.jobs.get(job.job_id) is job:
+                job.queued -= 1
+                self._start(job)
+
+    async def run(self):
+        """Sleep until the next due job, dispatch, repeat until stopped"""
+        self._running = True
+        while self._running:
+            self._wakeup.clear()
+            self.run_pending()
+
+            delay = self.max_sleep
+            next_fire = self.next_fire_time()
+            if next_fire is not None:
+                delay = min(delay, max(0.0, (next_fire - self.clock()).total_seconds()))
+
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
+
+    def stop(self):
+        """Stop the run loop after its current wait"""
+        self._running = False
+        self._wakeup.set()
+
+    async def drain(self):
+        """Wait for all in-flight job runs to finish"""
+        while self._tasks:
+            await asyncio.gather(*list(self._tasks), return_exceptions=True)
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Scheduler counters for status reporting"""
+        next_fire = self.next_fire_time()
+        return {
+            "scheduled_jobs": len(self.jobs),
+            "running_jobs": sum(1 for job in self.jobs.values() if job.running),
+            "queued_runs": sum(job.queued for job in self.jobs.values()),
+            "skipped_runs": sum(job.skipped_count for job in self.jobs.values()),
+            "dispatched_runs": self.dispatched_count,
+            "next_fire": next_fire.isoformat() if next_fire else None
+        }
@@ -12,8 +12,11 @@ from enum import Enum
 from datetime import datetime, timedelta
 import os
 import re
+import time
+import bisect
+import pickle
 import hashlib
-from collections import defaultdict
+from collections import defaultdict, OrderedDict
 
 from ..base_supreme_engine import BaseSupremeEngine, SupremeRequest, SupremeResponse
 from .expert_system import ExpertSystem, FactChecker, ExpertDomain, FactStatus
@@ -80,18 +83,237 @@ class SynthesisResult:
         if self.created_at is None:
             self.created_at = datetime.now()
 
+class LatencyHistogram:
+    """Fixed-bucket latency histogram for one knowledge source"""
+    
+    BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+    
+    def __init__(self):
+        self.counts = [0] * (len(self.BUCKETS_MS) + 1)
+        self.total = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.timeouts = 0
+        self.errors = 0
+    
+    def record(self, latency_ms: float):
+        """Record one completed source search"""
+        self.counts[bisect.bisect_left(self.BUCKETS_MS, latency_ms)] += 1
+        self.total += 1
+        self.total_ms += latency_ms
+        self.max_ms = max(self.max_ms, latency_ms)
+    
+    def percentile(self, fraction: float) -> float:
+        """Upper bucket bound containing the given fraction of samples"""
+        if not self.total:
+            return 0.0
+        threshold = fraction * self.total
+        cumulative = 0
+        for index, count in enumerate(self.counts):
+            cumulative += count
+            if cumulative >= threshold:
+                return float(self.BUCKETS_MS[index]) if index < len(self.BUCKETS_MS) else self.max_ms
+        return self.max_ms
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize histogram and summary statistics"""
+        labels = [f"le_{bound}ms" for bound in self.BUCKETS_MS] + ["overflow"]
+        return {
+            "buckets": dict(zip(labels, self.counts)),
+            "count": self.total,
+            "timeouts": self.timeouts,
+            "errors": self.errors,
+            "mean_ms": self.total_ms / self.total if self.total else 0.0,
+            "p50_ms": self.percentile(0.5),
+            "p95_ms": self.percentile(0.95),
+            "max_ms": self.max_ms
+        }
+
+class SearchResultCache:
+    """
+    Byte-bounded LRU cache of ranked search results.
+    Entries expire after the shortest TTL of the sources they were drawn
+    from; empty results are cached briefly as negative entries. Entries
+    evicted from memory can optionally spill to disk until they expire.
+    """
+    
+    SOURCE_TTLS = {
+        KnowledgeSource.NEWS: 300.0,
+        KnowledgeSource.SOCIAL_MEDIA: 120.0,
+        KnowledgeSource.WEB_SEARCH: 3600.0,
+        KnowledgeSource.DATABASES: 3600.0,
+        KnowledgeSource.WIKIPEDIA: 86400.0,
+        KnowledgeSource.ACADEMIC: 7 * 86400.0
+    }
+    
+    def __init__(self, max_bytes: int = 32 * 1024 * 1024, source_ttls: Dict[str, float] = None,
+                 negative_ttl: float = 60.0, spill_dir: Optional[str] = None,
+                 spill_max_bytes: int = 256 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.negative_ttl = negative_ttl
+        self.source_ttls = {source: (source_ttls or {}).get(source.value, ttl)
+                            for source, ttl in self.SOURCE_TTLS.items()}
+        self.spill_dir = spill_dir
+        self.spill_max_bytes = spill_max_bytes
+        if spill_dir:
+            os.makedirs(spill_dir, exist_ok=True)
+        
+        # key -> (expires_at, max_results, items, size)
+        self._entries: "OrderedDict[str, Tuple[float, int, List[KnowledgeItem], int]]" = OrderedDict()
+        self._spilled: "OrderedDict[str, int]" = OrderedDict()
+        self.current_bytes = 0
+        self.spilled_bytes = 0
+        self.hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+    
+    def __len__(self) -> int:
+        return len(self._entries) + len(self._spilled)
+    
+    def ttl_for(self, sources: List[KnowledgeSource], items: List[KnowledgeItem]) -> float:
+        """Lifetime of a result set drawn from the given sources"""
+        if not items:
+            return self.negative_ttl
+        return min(self.source_ttls.get(source, self.negative_ttl) for source in sources)
+    
+    def get(self, key: str, max_results: int) -> Optional[List[KnowledgeItem]]:
+        """Get unexpired results covering max_results, or None on a miss"""
+        entry = self._entries.get(key)
+        if entry is None and key in self._spilled:
+            entry = self._load_spilled(key)
+        
+        if entry is not None and entry[0] <= time.time():
+            self._discard(key)
+            self.expirations += 1
+            entry = None
+        
+        # Entries that were truncated to fewer results than requested cannot serve it
+        if entry is None or (entry[1] < max_results and len(entry[2]) >= entry[1]):
+            self.misses += 1
+            return None
+        
+        self._entries.move_to_end(key)
+        self.hits += 1
+        if not entry[2]:
+            self.negative_hits += 1
+        return entry[2]
+    
+    def put(self, key: str, items: List[KnowledgeItem], sources: List[KnowledgeSource], max_results: int):
+        """Cache results for their source TTL and evict beyond the byte bound"""
+        expires_at = time.time() + self.ttl_for(sources, items)
+        size = len(pickle.dumps(items, protocol=pickle.HIGHEST_PROTOCOL))
+        if size > self.max_bytes:
+            return
+        self._discard(key)
+        self._entries[key] = (expires_at, max_results, items, size)
+        self.current_bytes += size
+        self._evict()
+    
+    def _evict(self):
+        """Evict least recently used entries beyond the byte bound"""
+        while self.current_bytes > self.max_bytes and len(self._entries) > 1:
+            evicted_key, evicted = self._entries.popitem(last=False)
+            self.current_bytes -= evicted[3]
+            self.evictions += 1
+            if self.spill_dir and evicted[0] > time.time():
+                self._spill(evicted_key, evicted)
+    
+    def clear(self):
+        """Drop all memory and disk entries"""
+        for key in list(self._entries) + list(self._spilled):
+            self._discard(key)
+    
+    def _discard(self, key: str):
+        """Remove a key from memory and disk"""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.current_bytes -= entry[3]
+        size = self._spilled.pop(key, None)
+        if size is not None:
+            self.spilled_bytes -= size
+            try:
+                os.remove(self._spill_path(key))
+            except OSError:
+                pass
+    
+    def _spill_path(self, key: str) -> str:
+        return os.path.join(self.spill_dir, f"{key}.pkl")
+    
+    def _spill(self, key: str, entry: Tuple[float, int, List[KnowledgeItem], int]):
+        """Write an evicted entry to disk, dropping the oldest spilled entries over budget"""
+        try:
+            payload = pickle.dumps(entry[:3], protocol=pickle.HIGHEST_PROTOCOL)
+            with open(self._spill_path(key), 'wb') as f:
+                f.write(payload)
+        except Exception:
+            return
+        self._spilled[key] = len(payload)
+        self.spilled_bytes += len(payload)
+        while self.spilled_bytes > self.spill_max_bytes and self._spilled:
+            self._discard(next(iter(self._spilled)))
+    
+    def _load_spilled(self, key: str) -> Optional[Tuple[float, int, List[KnowledgeItem], int]]:
+        """Promote a spilled entry back into memory"""
+        try:
+            with open(self._spill_path(key), 'rb') as f:
+                expires_at, max_results, items = pickle.loads(f.read())
+        except Exception:
+            self._discard(key)
+            return None
+        
+        size = self._spilled[key]
+        self._discard(key)
+        entry = (expires_at, max_results, items, size)
+        self._entries[key] = entry
+        self.current_bytes += size
+        self._evict()
+        return entry
+    
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get hit ratio and memory usage"""
+        lookups = self.hits + self.misses
+        return {
+            "cache_entries": len(self._entries),
+            "cache_bytes": self.current_bytes,
+            "cache_max_bytes": self.max_bytes,
+            "cache_spilled_entries": len(self._spilled),
+            "cache_spilled_bytes": self.spilled_bytes,
+            "cache_hit_ratio": self.hits / lookups if lookups else 0.0,
+            "cache_negative_hits": self.negative_hits,
+            "cache_misses": self.misses,
+            "cache_evictions": self.evictions,
+            "cache_expirations": self.expirations
+        }
+
 class UniversalSearcher:
     """Multi-source information gathering system"""
     
     def __init__(self, config: Dict[str, Any]):
         self.config = config
         self.logger = logging.getLogger(__name__)
-        self.search_cache: Dict[str, List[KnowledgeItem]] = {}
+        self.search_cache = SearchResultCache(
+            max_bytes=config.get("cache_max_bytes", 32 * 1024 * 1024),
+            source_ttls=config.get("cache_ttls"),
+            negative_ttl=config.get("negative_cache_ttl", 60.0),
+            spill_dir=config.get("cache_spill_dir")
+        )
+        self._inflight_searches: Dict[str, Tuple[asyncio.Future, int]] = {}  # key -> (search, max_results)
         self.metrics = {
             "total_searches": 0,
             "successful_searches": 0,
-            "cache_hits": 0
+            "cache_hits": 0,
+            "coalesced_searches": 0,
+            "partial_searches": 0,
+            "source_timeouts": 0
         }
+        self.metrics.update(self.search_cache.get_statistics())
+        
+        # Per-source deadlines (seconds), overridable by source value
+        self.source_timeout = config.get("source_timeout", 2.0)
+        self.source_timeouts: Dict[str, float] = config.get("source_timeouts", {})
+        self.source_latency: Dict[str, LatencyHistogram] = defaultdict(LatencyHistogram)
     
     async def search(self, query: str, sources: List[KnowledgeSource] = None, 
                     max_results: int = 10) -> List[KnowledgeItem]:
@@ -102,30 +324,66 @@ class UniversalSearcher:
             
             # Check cache first
             cache_key = self._generate_cache_key(query, sources)
-            if cache_key in self.search_cache:
+            cached = self.search_cache.get(cache_key, max_results)
+            if cached is not None:
                 self.metrics["cache_hits"] += 1
-                return self.search_cache[cache_key][:max_results]
+                self.metrics.update(self.search_cache.get_statistics())
+                return cached[:max_results]
             
-            # Perform searches across all sources
-            all_results = []
+            # Share the result of an identical search already in flight, unless it
+            # was started for fewer results than this request needs
+            inflight = self._inflight_searches.get(cache_key)
+            if inflight is not None and inflight[1] >= max_results:
+                self.metrics["coalesced_searches"] += 1
+                return (await asyncio.shield(inflight[0]))[:max_results]
             
-            for source in sources:
-                try:
-                    source_results = await self._search_source(source, query, max_results)
-                    all_results.extend(source_results)
-                except Exception as e:
-                    self.logger.warning(f"Error searching {source.value}: {e}")
+            search = asyncio.ensure_future(self._search_sources(cache_key, query, sources, max_results))
+            entry = (search, max_results)
+            self._inflight_searches[cache_key] = entry
+            search.add_done_callback(lambda _: self._release_inflight(cache_key, entry))
+            return await asyncio.shield(search)
+            
+        except Exception as e:
+            self.logger.error(f"Error performing universal search: {e}")
+            return []
+    
+    def _release_inflight(self, cache_key: str, entry: Tuple[asyncio.Future, int]):
+        """Forget a finished search unless a larger one has replaced it"""
+        if self._inflight_searches.get(cache_key) is entry:
+            del self._inflight_searches[cache_key]
+    
+    async def _search_sources(self, cache_key: str, query: str, sources: List[KnowledgeSource],
+                              max_results: int) -> List[KnowledgeItem]:
+        """Search all sources and cache the ranked results"""
+        try:
+            # Fan out to all sources concurrently, ranking results as they arrive
+            ranked_results: List[KnowledgeItem] = []
+            tasks = [
+                asyncio.ensure_future(self._timed_search_source(source, query, max_results))
+                for source in sources
+            ]
+            complete = True
+            
+            for next_done in asyncio.as_completed(tasks):
+                source_results = await next_done
+                if source_results is None:
+                    complete = False
+                    continue
+                for item in source_results:
+                    bisect.insort(ranked_results, item, key=lambda ranked: -self._ranking_score(ranked))
             
-            # Rank and filter results
-            ranked_results = await self._rank_results(all_results, query)
             final_results = ranked_results[:max_results]
             
-            # Cache results
-            self.search_cache[cache_key] = final_results
+            # Cache results; partial results are not cached so the next search retries
+            if complete:
+                self.search_cache.put(cache_key, final_results, sources, max_results)
+            else:
+                self.metrics["partial_searches"] += 1
             
             # Update metrics
             self.metrics["total_searches"] += 1
             self.metrics["successful_searches"] += 1
+            self.metrics.update(self.search_cache.get_statistics())
             
             return final_results
             
@@ -133,6 +391,30 @@ class UniversalSearcher:
             self.logger.error(f"Error performing universal search: {e}")
             return []
     
+    async def _timed_search_source(self, source: KnowledgeSource, query: str,
+                                   max_results: int) -> Optional[List[KnowledgeItem]]:
+        """Search one source within its deadline; returns None if it missed or failed"""
+        histogram = self.source_latency[source.value]
+        timeout = self.source_timeouts.get(source.value, self.source_timeout)
+        start_time = time.perf_counter()
+        try:
+            results = await asyncio.wait_for(self._search_source(source, query, max_results), timeout)
+        except asyncio.TimeoutError:
+            histogram.timeouts += 1
+            self.metrics["source_timeouts"] += 1
+            self.logger.warning(f"Search of {source.value} missed its {timeout}s deadline")
+            return None
+        except Exception as e:
+            histogram.errors += 1
+            self.logger.warning(f"Error searching {source.value}: {e}")
+            return None
+        histogram.record((time.perf_counter() - start_time) * 1000)
+        return results
+    
+    def get_latency_histograms(self) -> Dict[str, Dict[str, Any]]:
+        """Get per-source search latency histograms"""
+        return {source: histogram.to_dict() for source, histogram in self.source_latency.items()}
+    
     async def _search_source(self, source: KnowledgeSource, query: str, max_results: int) -> List[KnowledgeItem]:
         """Search a specific source"""
         results = []
@@ -239,23 +521,28 @@ class UniversalSearcher:
     
     async def _rank_results(self, results: List[KnowledgeItem], query: str) -> List[KnowledgeItem]:
         """Rank search results by relevance"""
-        def ranking_score(item: KnowledgeItem) -> float:
-            confidence_weight = {
-                ConfidenceLevel.VERY_HIGH: 1.0,
-                ConfidenceLevel.HIGH: 0.8,
-                ConfidenceLevel.MEDIUM: 0.6,
-                ConfidenceLevel.LOW: 0.4,
-                ConfidenceLevel.VERY_LOW: 0.2
-            }
-            return item.relevance_score * confidence_weight[item.confidence_level]
-        
-        return sorted(results, key=ranking_score, reverse=True)
+        return sorted(results, key=self._ranking_score, reverse=True)
+    
+    def _ranking_score(self, item: KnowledgeItem) -> float:
+        """Relevance weighted by source confidence"""
+        confidence_weight = {
+            ConfidenceLevel.VERY_HIGH: 1.0,
+            ConfidenceLevel.HIGH: 0.8,
+            ConfidenceLevel.MEDIUM: 0.6,
+            ConfidenceLevel.LOW: 0.4,
+            ConfidenceLevel.VERY_LOW: 0.2
+        }
+        return item.relevance_score * confidence_weight[item.confidence_level]
     
     def _generate_cache_key(self, query: str, sources: List[KnowledgeSource]) -> str:
         """Generate cache key for search results"""
-        key_data = f"{query}_{[s.value for s in sources]}"
+        key_data = f"{self._normalize_query(query)}_{sorted(set(s.value for s in sources))}"
         return hashlib.md5(key_data.encode()).hexdigest()
     
+    def _normalize_query(self, query: str) -> str:
+        """Case-fold and collapse whitespace so equivalent queries share a key; punctuation is kept (C++ is not C)"""
+        return " ".join(query.casefold().split())
+    
     def _generate_item_id(self) -> str:
         """Generate unique item ID"""
         timestamp = int(datetime.now().timestamp())
@@ -451,6 +738,7 @@ class KnowledgeOracle:
             analytics = {
                 "performance_metrics": self.metrics,
                 "searcher_metrics": self.searcher.metrics,
+                "source_latency": self.searcher.get_latency_histograms(),
                 "knowledge_base_stats": {
                     "total_items": len(self.knowledge_base),
                     "by_source": self._count_by_source(),
@@ -8,13 +8,21 @@ import asyncio
 import json
 import numpy as np
 import pandas as pd
-from typing import Dict, List, Any, Optional, Tuple, Callable, Union
+from typing import Dict, List, Any, Optional, Tuple, Callable, Union, Set
 from dataclasses import dataclass, asdict
 from enum import Enum
 from datetime import datetime, timedelta
 import os
 import hashlib
+import heapq
+import itertools
+import multiprocessing
 import pickle
+import queue
+import time
+from collections import defaultdict, deque, OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from sklearn.model_selection import train_test_split
 from sklearn.preprocessing import StandardScaler, LabelEncoder
 from sklearn.linear_model import LinearRegression, LogisticRegression
@@ -33,10 +41,12 @@ class ModelCategory(Enum):
 
 class ModelStatus(Enum):
     CREATED = "created"
+    QUEUED = "queued"
     TRAINING = "training"
     TRAINED = "trained"
     DEPLOYED = "deployed"
     FAILED = "failed"
+    CANCELLED = "cancelled"
 
 @dataclass
 class ModelConfig:
@@ -71,6 +81,9 @@ class ModelTrainingJob:
     training_metrics: Dict[str, float] = None
     validation_metrics: Dict[str, float] = None
     error_message: Optional[str] = None
+    priority: int = 5  # 1-10 scale, higher runs first
+    progress: float = 0.0
+    stage: str = "queued"
     
     def __post_init__(self):
         if self.training_metrics is None:
@@ -104,6 +117,443 @@ class PredictionResult:
         if self.created_at is None:
             self.created_at = datetime.now()
 
+ALGORITHMS = {
+    "linear_regression": LinearRegression,
+    "logistic_regression": LogisticRegression,
+    "random_forest_regressor": RandomForestRegressor,
+    "random_forest_classifier": RandomForestClassifier
+}
+
+# Progress queue of the current training worker process (set by the pool initializer)
+_training_progress_queue = None
+
+def _init_training_worker(progress_queue):
+    """Process pool initializer for training workers"""
+    global _training_progress_queue
+    _training_progress_queue = progress_queue
+
+def _report_training_progress(job_id: str, stage: str, progress: float):
+    if _training_progress_queue is not None:
+        try:
+            _training_progress_queue.put_nowait((job_id, stage, progress))
+        except Exception:
+            pass
+
+class FeaturePipeline:
+    """
+    Frozen, precompiled preprocessing for one trained model.
+    Holds the training-time fill values, sorted category lookup tables
+    (the LabelEncoder classes) and the scaler mean/scale vectors, and maps
+    a list of dicts, a 2-D array in feature order or a DataFrame straight
+    to the model's feature matrix without building a DataFrame.
+    """
+    
+    __slots__ = ("feature_names", "fill_values", "categories", "mean", "scale")
+    
+    def __init__(self, feature_names: List[str], fill_values: np.ndarray,
+                 categories: Dict[int, np.ndarray], mean: Optional[np.ndarray] = None,
+                 scale: Optional[np.ndarray] = None):
+        self.feature_names = tuple(feature_names)
+        self.fill_values = fill_values
+        self.categories = categories
+        self.mean = mean
+        self.scale = scale
+        for array in [fill_values, mean, scale, *categories.values()]:
+            if array is not None:
+                array.setflags(write=False)
+    
+    def __getstate__(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+    
+    def __setstate__(self, state):
+        for name, value in state.items():
+            setattr(self, name, value)
+    
+    @classmethod
+    def from_fitted(cls, X: pd.DataFrame, encoders: Dict[str, LabelEncoder],
+                    scaler: Optional[StandardScaler]) -> "FeaturePipeline":
+        """Compile a pipeline from fitted training-time preprocessing"""
+        feature_names = list(X.columns)
+        means = X.mean(numeric_only=True)
+        fill_values = np.array([means.get(name, np.nan) for name in feature_names], dtype=np.float64)
+        categories = {
+            index: np.asarray(encoders[name].classes_).astype(str)
+            for index, name in enumerate(feature_names)
+            if name in encoders
+        }
+        mean = scale = None
+        if scaler is not None:
+            mean = np.asarray(scaler.mean_, dtype=np.float64)
+            scale = np.asarray(scaler.scale_, dtype=np.float64)
+        return cls(feature_names, fill_values, categories, mean, scale)
+    
+    def transform(self, data: Union[Dict[str, Any], List[Dict[str, Any]], np.ndarray, pd.DataFrame]) -> np.ndarray:
+        """Map raw input rows to the feature matrix the model was trained on"""
+        if isinstance(data, dict):
+            data = [data]
+        rows = len(data)
+        matrix = np.empty((rows, len(self.feature_names)), dtype=np.float64)
+        
+        for index, name in enumerate(self.feature_names):
+            if isinstance(data, pd.DataFrame):
+                column = data[name].to_numpy() if name in data.columns else [None] * rows
+            elif isinstance(data, np.ndarray):
+                column = data[:, index]
+            else:
+                column = [row.get(name) for row in data]
+            
+            if index in self.categories:
+                matrix[:, index] = self._encode(name, self.categories[index], column)
+            else:
+                values = np.asarray(column, dtype=np.float64)
+                missing = np.isnan(values)
+                if missing.any():
+                    values = np.where(missing, self.fill_values[index], values)
+                matrix[:, index] = values
+        
+        if self.mean is not None:
+            matrix -= self.mean
+            matrix /= self.scale
+        return matrix
+    
+    @staticmethod
+    def _encode(name: str, classes: np.ndarray, column) -> np.ndarray:
+        labels = np.array([
+            "nan" if value is None or (isinstance(value, float) and value != value) else str(value)
+            for value in column
+        ])
+        codes = np.searchsorted(classes, labels)
+        codes = np.minimum(codes, len(classes) - 1)
+        unseen = classes[codes] != labels
+        if unseen.any():
+            raise ValueError(f"Column {name} contains previously unseen labels: {sorted(set(labels[unseen]))[:5]}")
+        return codes
+
+def _pipeline_path(model_path: str) -> str:
+    """Path of the feature pipeline stored next to a model artifact"""
+    return model_path[:-len(".joblib")] + ".pipeline.joblib"
+
+def _fit_preprocessing(X: pd.DataFrame, y: pd.Series, model_category: ModelCategory,
+                       preprocessing_steps: List[str]) -> Tuple[Any, np.ndarray, Dict[str, LabelEncoder], Optional[StandardScaler], FeaturePipeline]:
+    """Fit encoders/scaler on training data and return the transformed data"""
+    X_processed = X.copy()
+    y_processed = y.copy()
+    encoders = {}
+    scaler = None
+    
+    # Handle missing values
+    X_processed = X_processed.fillna(X_processed.mean(numeric_only=True))
+    
+    # Encode categorical variables
+    categorical_columns = X_processed.select_dtypes(include=['object']).columns
+    for col in categorical_columns:
+        encoder = LabelEncoder()
+        X_processed[col] = encoder.fit_transform(X_processed[col].astype(str))
+        encoders[col] = encoder
+    
+    # Scale features if specified
+    if "standardize" in preprocessing_steps:
+        scaler = StandardScaler()
+        X_processed = scaler.fit_transform(X_processed)
+    
+    # Encode target variable for classification
+    if model_category == ModelCategory.CLASSIFICATION and y_processed.dtype == 'object':
+        target_encoder = LabelEncoder()
+        y_processed = pd.Series(target_encoder.fit_transform(y_processed))
+        encoders['target'] = target_encoder
+    
+    pipeline = FeaturePipeline.from_fitted(X, encoders, scaler)
+    return X_processed, y_processed.values, encoders, scaler, pipeline
+
+def _compute_metrics(y_true, y_pred, model_category: ModelCategory) -> Dict[str, float]:
+    """Calculate performance metrics"""
+    metrics = {}
+    
+    if model_category == ModelCategory.REGRESSION:
+        metrics['mse'] = float(mean_squared_error(y_true, y_pred))
+        metrics['rmse'] = float(np.sqrt(metrics['mse']))
+        metrics['mae'] = float(np.mean(np.abs(y_true - y_pred)))
+        
+        # R-squared
+        ss_res = np.sum((y_true - y_pred) ** 2)
+        ss_tot = np.sum((y_true - np.mean(y_true)) ** 2)
+        metrics['r2'] = float(1 - (ss_res / ss_tot)) if ss_tot != 0 else 0.0
+        
+    elif model_category == ModelCategory.CLASSIFICATION:
+        metrics['accuracy'] = float(accuracy_score(y_true, y_pred))
+        
+        # Precision, recall, F1 for binary classification
+        try:
+            from sklearn.metrics import precision_score, recall_score, f1_score
+            metrics['precision'] = float(precision_score(y_true, y_pred, average='weighted'))
+            metrics['recall'] = float(recall_score(y_true, y_pred, average='weighted'))
+            metrics['f1'] = float(f1_score(y_true, y_pred, average='weighted'))
+        except:
+            pass
+    
+    return metrics
+
+def _run_training_job(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Train a model end to end. Runs in a worker process, so it only
+    touches its payload and its job-specific artifact path; the engine
+    moves the artifacts into place once the job is known to be kept.
+    """
+    job_id = payload["job_id"]
+    model_category = ModelCategory(payload["model_category"])
+    
+    try:
+        # Load and prepare data
+        _report_training_progress(job_id, "loading_data", 0.1)
+        training_data = payload["training_data"]
+        if isinstance(training_data, str):
+            # Load from file path
+            df = pd.read_csv(training_data)
+        elif isinstance(training_data, list):
+            df = pd.DataFrame(training_data)
+        else:
+            df = training_data
+        
+        # Prepare features and target
+        if payload["feature_columns"]:
+            X = df[payload["feature_columns"]]
+        else:
+            X = df.drop(columns=[payload["target_column"]])
+        y = df[payload["target_column"]]
+        
+        # Preprocessing
+        _report_training_progress(job_id, "preprocessing", 0.25)
+        X_processed, y_processed, encoders, scaler, pipeline = _fit_preprocessing(
+            X, y, model_category, payload["preprocessing_steps"]
+        )
+        
+        # Split data
+        X_train, X_val, y_train, y_val = train_test_split(
+            X_processed, y_processed, test_size=payload["validation_split"], random_state=42
+        )
+        
+        # Create and train model
+        _report_training_progress(job_id, "fitting", 0.4)
+        model = ALGORITHMS[payload["algorithm"]](**payload["hyperparameters"])
+        start_time = datetime.now()
+        model.fit(X_train, y_train)
+        training_time = (datetime.now() - start_time).total_seconds()
+        
+        # Evaluate on training and validation sets
+        _report_training_progress(job_id, "evaluating", 0.8)
+        training_metrics = _compute_metrics(y_train, model.predict(X_train), model_category)
+        validation_metrics = _compute_metrics(y_val, model.predict(X_val), model_category)
+        
+        # Save model to disk
+        _report_training_progress(job_id, "saving", 0.9)
+        joblib.dump(model, payload["artifact_path"])
+        joblib.dump(pipeline, _pipeline_path(payload["artifact_path"]))
+        
+        return {
+            "model": model,
+            "encoders": encoders,
+            "scaler": scaler,
+            "pipeline": pipeline,
+            "training_samples": len(X_train),
+            "validation_samples": len(X_val),
+            "training_time": training_time,
+            "training_metrics": training_metrics,
+            "validation_metrics": validation_metrics
+        }
+        
+    except Exception as e:
+        return {"error": str(e)}
+
+@dataclass
+class _PendingPrediction:
+    """A predict request waiting to be coalesced into a batch"""
+    rows: List[Dict[str, Any]]
+    future: asyncio.Future
+    submitted_at: float
+
+class PredictionBatcher:
+    """
+    Coalesces concurrent predict requests for the same model.
+    Requests are held until ``max_batch_rows`` rows are pending or
+    ``max_wait`` seconds have passed, then ``run_batch`` is awaited once
+    for the combined rows and each caller gets its own slice back. If a
+    combined batch fails, its requests are retried one by one so a bad
+    row only fails its own request.
+    """
+
+    def __init__(self, run_batch: Callable, max_batch_rows: int = 64, max_wait: float = 0.002,
+                 latency_window: int = 10000):
+        self.run_batch = run_batch
+        self.max_batch_rows = max_batch_rows
+        self.max_wait = max_wait
+        self._pending: Dict[str, List[_PendingPrediction]] = defaultdict(list)
+        self._pending_rows: Dict[str, int] = defaultdict(int)
+        self._timers: Dict[str, asyncio.TimerHandle] = {}
+        self._tasks: Set[asyncio.Future] = set()  # running batches, referenced until done
+        self._latencies: deque = deque(maxlen=latency_window)
+        self._completions: deque = deque(maxlen=latency_window)  # (completed_at, rows)
+        self.total_requests = 0
+        self.total_batches = 0
+        self.total_rows = 0
+
+    async def submit(self, model_id: str, rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Queue rows for prediction and wait for this request's slice of the batch"""
+        loop = asyncio.get_running_loop()
+        pending = _PendingPrediction(rows=rows, future=loop.create_future(), submitted_at=time.perf_counter())
+        self._pending[model_id].append(pending)
+        self._pending_rows[model_id] += len(rows)
+
+        if self._pending_rows[model_id] >= self.max_batch_rows:
+            self._flush(model_id)
+        elif model_id not in self._timers:
+            self._timers[model_id] = loop.call_later(self.max_wait, self._flush, model_id)
+
+        return await pending.future
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Throughput and latency of recently served requests"""
+        now = time.perf_counter()
+        recent_rows = sum(rows for completed_at, rows in self._completions if now - completed_at <= 60)
+        latencies = np.array(self._latencies) * 1000 if self._latencies else None
+        return {
+            "total_requests": self.total_requests,
+            "total_batches": self.total_batches,
+            "average_batch_rows": self.total_rows / self.total_batches if self.total_batches else 0.0,
+            "throughput_rows_per_second": recent_rows / 60,
+            "p50_latency_ms": float(np.percentile(latencies, 50)) if latencies is not None else None,
+            "p99_latency_ms": float(np.percentile(latencies, 99)) if latencies is not None else None,
+            "max_batch_rows": self.max_batch_rows,
+            "max_wait_ms": self.max_wait * 1000
+        }
+
+    def _flush(self, model_id: str):
+        timer = self._timers.pop(model_id, None)
+        if timer is not None:
+            timer.cancel()
+        batch = self._pending.pop(model_id, [])
+        self._pending_rows.pop(model_id, None)
+        if batch:
+            task = asyncio.ensure_future(self._process(model_id, batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _process(self, model_id: str, batch: List[_PendingPrediction]):
+        rows = [row for pending in batch for row in pending.rows]
+        try:
+            output = await self.run_batch(model_id, rows)
+        except Exception as e:
+            if len(batch) == 1:
+                self._complete(batch[0], exception=e)
+            else:
+                for pending in batch:
+                    await self._process(model_id, [pending])
+            return
+
+        self.total_batches += 1
+        self.total_rows += len(rows)
+        offset = 0
+        for pending in batch:
+            end = offset + len(pending.rows)
+            self._complete(pending, result={
+                key: value[offset:end] if isinstance(value, (np.ndarray, list)) else value
+                for key, value in output.items()
+            }, batch_rows=len(rows))
+            offset = end
+
+    def _complete(self, pending: _PendingPrediction, result: Optional[Dict[str, Any]] = None,
+                  exception: Optional[Exception] = None, batch_rows: int = 0):
+        now = time.perf_counter()
+        self.total_requests += 1
+        self._latencies.append(now - pending.submitted_at)
+        if pending.future.done():
+            return
+        if exception is not None:
+            pending.future.set_exception(exception)
+        else:
+            self._completions.append((now, len(pending.rows)))
+            pending.future.set_result({**result, "batch_rows": batch_rows})
+
+class ModelStore:
+    """
+    Lazily loaded trained models with LRU eviction under a memory budget.
+    Only artifact paths are kept for registered models; a model is loaded on
+    first access with its NumPy arrays memory-mapped, and the least recently
+    used models are dropped once their artifact sizes exceed the budget.
+    """
+    
+    def __init__(self, memory_budget: int = 512 * 1024 * 1024, mmap_mode: Optional[str] = "r"):
+        self.memory_budget = memory_budget
+        self.mmap_mode = mmap_mode
+        self._artifacts: Dict[str, str] = {}
+        self._resident: "OrderedDict[str, Tuple[Any, int]]" = OrderedDict()
+        self._resident_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def register(self, model_id: str, model_path: str):
+        """Record a model artifact without loading it"""
+        self._artifacts[model_id] = model_path
+    
+    def __contains__(self, model_id: str) -> bool:
+        return model_id in self._resident or model_id in self._artifacts
+    
+    def __len__(self) -> int:
+        return len(self._artifacts.keys() | self._resident.keys())
+    
+    def __getitem__(self, model_id: str) -> Any:
+        if model_id in self._resident:
+            self.hits += 1
+            self._resident.move_to_end(model_id)
+            return self._resident[model_id][0]
+        
+        if model_id not in self._artifacts:
+            raise KeyError(model_id)
+        
+        self.misses += 1
+        model_path = self._artifacts[model_id]
+        model = joblib.load(model_path, mmap_mode=self.mmap_mode)
+        self._insert(model_id, model, os.path.getsize(model_path))
+        return model
+    
+    def __setitem__(self, model_id: str, model: Any):
+        model_path = self._artifacts.get(model_id)
+        size = os.path.getsize(model_path) if model_path and os.path.exists(model_path) else 0
+        self._insert(model_id, model, size)
+    
+    def get(self, model_id: str, default: Any = None) -> Any:
+        return self[model_id] if model_id in self else default
+    
+    def _insert(self, model_id: str, model: Any, size: int):
+        """Make a model resident and evict cold models over the budget"""
+        if model_id in self._resident:
+            self._resident_bytes -= self._resident.pop(model_id)[1]
+        self._resident[model_id] = (model, size)
+        self._resident_bytes += size
+        
+        for candidate in list(self._resident):
+            if self._resident_bytes <= self.memory_budget:
+                break
+            # Keep the newest model and anything that could not be reloaded
+            if candidate == model_id or candidate not in self._artifacts:
+                continue
+            self._resident_bytes -= self._resident.pop(candidate)[1]
+            self.evictions += 1
+    
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get cache counters for sizing the memory budget"""
+        lookups = self.hits + self.misses
+        return {
+            "registered_models": len(self),
+            "resident_models": len(self._resident),
+            "resident_bytes": self._resident_bytes,
+            "memory_budget_bytes": self.memory_budget,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0
+        }
+
 class SupremePredictiveModeler(BaseSupremeEngine):
     """
     Supreme predictive modeler with advanced ML capabilities.
@@ -115,12 +565,31 @@ class SupremePredictiveModeler(BaseSupremeEngine):
         
         # Model storage
         self.model_configs: Dict[str, ModelConfig] = {}
-        self.trained_models: Dict[str, Any] = {}
+        self.trained_models = ModelStore(
+            memory_budget=int(self.config.custom_params.get("model_memory_budget_mb", 512) * 1024 * 1024)
+        )
         self.model_scalers: Dict[str, StandardScaler] = {}
         self.model_encoders: Dict[str, Dict[str, LabelEncoder]] = {}
+        self.model_pipelines: Dict[str, FeaturePipeline] = {}
         self.training_jobs: Dict[str, ModelTrainingJob] = {}
         self.prediction_history: List[PredictionResult] = []
         
+        # Training scheduler
+        self.max_concurrent_training = self.config.max_resources or min(2, os.cpu_count() or 1)
+        self.max_queued_training_jobs = 100
+        self._training_queue: List[Tuple[int, int, str]] = []  # (-priority, sequence, job_id)
+        self._training_sequence = itertools.count()
+        self._training_payloads: Dict[str, Dict[str, Any]] = {}
+        self._running_training: Dict[str, asyncio.Task] = {}
+        self._training_waiters: Dict[str, asyncio.Future] = {}
+        self._training_executor: Optional[ProcessPoolExecutor] = None
+        self._training_progress_queue = None
+        
+        # Prediction micro-batching
+        self.prediction_batcher = PredictionBatcher(
+            self._run_prediction_batch, max_batch_rows=64, max_wait=0.002
+        )
+        
         # Modeling capabilities
         self.modeling_capabilities = {
             "create_model": self._create_model,
@@ -129,16 +598,12 @@ class SupremePredictiveModeler(BaseSupremeEngine):
             "evaluate_model": self._evaluate_model,
             "tune_hyperparameters": self._tune_hyperparameters,
             "deploy_model": self._deploy_model,
-            "get_model_info": self._get_model_info
+            "get_model_info": self._get_model_info,
+            "cancel_training": self._cancel_training_job
         }
         
         # Supported algorithms
-        self.algorithms = {
-            "linear_regression": LinearRegression,
-            "logistic_regression": LogisticRegression,
-            "random_forest_regressor": RandomForestRegressor,
-            "random_forest_classifier": RandomForestClassifier
-        }
+        self.algorithms = ALGORITHMS
         
         # Data persistence
         self.data_dir = "data/models"
@@ -172,6 +637,8 @@ class SupremePredictiveModeler(BaseSupremeEngine):
         # Route to appropriate modeling capability
         if "create" in operation and "model" in operation:
             return await self._create_model(parameters)
+        elif "cancel" in operation:
+            return await self._cancel_training_job(parameters)
         elif "train" in operation:
             return await self._train_model(parameters)
         elif "predict" in operation:
@@ -191,7 +658,8 @@ class SupremePredictiveModeler(BaseSupremeEngine):
         """Get supported predictive modeling operations"""
         return [
             "create_model", "train_model", "predict", "evaluate_model",
-            "tune_hyperparameters", "deploy_model", "get_model_info", "modeler_status"
+            "tune_hyperparameters", "deploy_model", "get_model_info", "cancel_training",
+            "modeler_status"
         ]
     
     async def _create_model(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
@@ -253,13 +721,15 @@ class SupremePredictiveModeler(BaseSupremeEngine):
             return {"error": str(e), "operation": "create_model"}
     
     async def _train_model(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
-        """Train a predictive model"""
+        """Queue a model training job on the training process pool"""
         try:
             model_id = parameters.get("model_id")
             training_data = parameters.get("training_data")
             validation_split = parameters.get("validation_split", 0.2)
+            priority = parameters.get("priority", 5)
+            wait = parameters.get("wait", False)
             
-            if not model_id or not training_data:
+            if not model_id or training_data is None or (isinstance(training_data, (str, list)) and not training_data):
                 return {"error": "model_id and training_data are required", "operation": "train_model"}
             
             if model_id not in self.model_configs:
@@ -267,114 +737,103 @@ class SupremePredictiveModeler(BaseSupremeEngine):
             
             model_config = self.model_configs[model_id]
             
+            if not model_config.target_column:
+                return {"error": "target_column is required for supervised learning", "operation": "train_model"}
+            
+            if len(self._training_queue) >= self.max_queued_training_jobs:
+                return {"error": "Training queue is full", "operation": "train_model"}
+            
             # Create training job
             job_id = self._generate_job_id()
             training_job = ModelTrainingJob(
                 job_id=job_id,
                 model_id=model_id,
-                training_data_path=str(training_data),
+                training_data_path=training_data if isinstance(training_data, str) else f"<in-memory:{type(training_data).__name__}>",
                 validation_split=validation_split,
-                status=ModelStatus.TRAINING,
-                started_at=datetime.now()
+                status=ModelStatus.QUEUED,
+                started_at=datetime.now(),
+                priority=priority
             )
             
             self.training_jobs[job_id] = training_job
+            self._training_payloads[job_id] = {
+                "job_id": job_id,
+                "training_data": training_data,
+                "validation_split": validation_split,
+                "model_category": model_config.model_category.value,
+                "algorithm": model_config.algorithm,
+                "hyperparameters": dict(model_config.hyperparameters),
+                "feature_columns": list(model_config.feature_columns),
+                "target_column": model_config.target_column,
+                "preprocessing_steps": list(model_config.preprocessing_steps),
+                "artifact_path": self._artifact_path(model_id, job_id)
+            }
             
-            try:
-                # Load and prepare data
-                if isinstance(training_data, str):
-                    # Load from file path
-                    df = pd.read_csv(training_data)
-                elif isinstance(training_data, list):
-                    df = pd.DataFrame(training_data)
-                else:
-                    df = training_data
-                
-                # Prepare features and target
-                if model_config.feature_columns:
-                    X = df[model_config.feature_columns]
-                else:
-                    X = df.drop(columns=[model_config.target_column] if model_config.target_column else [])
-                
-                if model_config.target_column:
-                    y = df[model_config.target_column]
-                else:
-                    return {"error": "target_column is required for supervised learning", "operation": "train_model"}
-                
-                # Preprocessing
-                X_processed, y_processed = await self._preprocess_data(X, y, model_config)
-                
-                # Split data
-                X_train, X_val, y_train, y_val = train_test_split(
-                    X_processed, y_processed, test_size=validation_split, random_state=42
-                )
-                
-                # Create and train model
-                model_class = self.algorithms[model_config.algorithm]
-                model = model_class(**model_config.hyperparameters)
-                
-                # Train the model
-                start_time = datetime.now()
-                model.fit(X_train, y_train)
-                training_time = (datetime.now() - start_time).total_seconds()
-                
-                # Evaluate on training and validation sets
-                train_predictions = model.predict(X_train)
-                val_predictions = model.predict(X_val)
-                
-                # Calculate metrics
-                training_metrics = await self._calculate_metrics(y_train, train_predictions, model_config.model_category)
-                validation_metrics = await self._calculate_metrics(y_val, val_predictions, model_config.model_category)
-                
-                # Store trained model
-                self.trained_models[model_id] = model
-                
-                # Update training job
-                training_job.status = ModelStatus.TRAINED
-                training_job.completed_at = datetime.now()
-                training_job.training_metrics = training_metrics
-                training_job.validation_metrics = validation_metrics
-                
-                # Save model to disk
-                model_path = os.path.join(self.models_dir, f"{model_id}.joblib")
-                joblib.dump(model, model_path)
-                
-                result = {
-                    "operation": "train_model",
-                    "job_id": job_id,
-                    "model_id": model_id,
-                    "model_name": model_config.model_name,
-                    "training_samples": len(X_train),
-                    "validation_samples": len(X_val),
-                    "training_time": training_time,
-                    "training_metrics": training_metrics,
-                    "validation_metrics": validation_metrics,
-                    "status": "completed"
-                }
-                
-                # Save model data
-                await self._save_model_data()
-                
-                return result
-                
-            except Exception as e:
-                # Update training job with error
-                training_job.status = ModelStatus.FAILED
-                training_job.completed_at = datetime.now()
-                training_job.error_message = str(e)
-                
-                return {
-                    "operation": "train_model",
-                    "job_id": job_id,
-                    "model_id": model_id,
-                    "status": "failed",
-                    "error": str(e)
-                }
+            waiter = asyncio.get_running_loop().create_future()
+            self._training_waiters[job_id] = waiter
+            heapq.heappush(self._training_queue, (-priority, next(self._training_sequence), job_id))
+            self._dispatch_training_jobs()
+            
+            if wait:
+                return await asyncio.shield(waiter)
+            
+            return {
+                "operation": "train_model",
+                "job_id": job_id,
+                "model_id": model_id,
+                "model_name": model_config.model_name,
+                "priority": priority,
+                "status": training_job.status.value,
+                "queue_position": self._queue_position(job_id)
+            }
                 
         except Exception as e:
             self.logger.error(f"Error training model: {e}")
             return {"error": str(e), "operation": "train_model"}
     
+    async def _cancel_training_job(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
+        """Cancel a queued or running training job"""
+        try:
+            job_id = parameters.get("job_id")
+            
+            if not job_id:
+                return {"error": "job_id is required", "operation": "cancel_training"}
+            
+            if job_id not in self.training_jobs:
+                return {"error": f"Training job {job_id} not found", "operation": "cancel_training"}
+            
+            training_job = self.training_jobs[job_id]
+            if training_job.status not in (ModelStatus.QUEUED, ModelStatus.TRAINING):
+                return {
+                    "error": f"Training job {job_id} is already {training_job.status.value}",
+                    "operation": "cancel_training"
+                }
+            
+            # Queued jobs are skipped by the dispatcher; a running fit cannot be
+            # interrupted inside its worker, so its result is discarded instead
+            was_running = training_job.status == ModelStatus.TRAINING
+            training_job.status = ModelStatus.CANCELLED
+            training_job.stage = "cancelled"
+            training_job.completed_at = datetime.now()
+            self._training_payloads.pop(job_id, None)
+            
+            if not was_running:
+                self._resolve_training_waiter(job_id, self._training_job_result(training_job))
+            
+            await self._save_model_data()
+            
+            return {
+                "operation": "cancel_training",
+                "job_id": job_id,
+                "model_id": training_job.model_id,
+                "was_running": was_running,
+                "status": training_job.status.value
+            }
+            
+        except Exception as e:
+            self.logger.error(f"Error cancelling training job: {e}")
+            return {"error": str(e), "operation": "cancel_training"}
+    
     async def _make_prediction(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
         """Make predictions using a trained model"""
         try:
@@ -383,47 +842,50 @@ class SupremePredictiveModeler(BaseSupremeEngine):
             return_probabilities = parameters.get("return_probabilities", False)
             return_explanations = parameters.get("return_explanations", False)
             
-            if not model_id or not input_data:
+            if not model_id or input_data is None or (isinstance(input_data, (dict, list)) and not input_data):
                 return {"error": "model_id and input_data are required", "operation": "predict"}
             
             if model_id not in self.trained_models:
                 return {"error": f"Trained model {model_id} not found", "operation": "predict"}
             
-            model = self.trained_models[model_id]
             model_config = self.model_configs[model_id]
             
-            # Prepare input data
+            # Prepare input data; dict rows are coalesced with concurrent requests
             if isinstance(input_data, dict):
-                input_df = pd.DataFrame([input_data])
-            elif isinstance(input_data, list):
-                if isinstance(input_data[0], dict):
-                    input_df = pd.DataFrame(input_data)
-                else:
-                    input_df = pd.DataFrame([input_data])
+                rows = [input_data]
+            elif isinstance(input_data, list) and isinstance(input_data[0], dict):
+                rows = input_data
             else:
-                input_df = input_data
+                rows = None
             
-            # Select features
-            if model_config.feature_columns:
-                X = input_df[model_config.feature_columns]
+            if rows is not None and parameters.get("batching", True):
+                batch = await self.prediction_batcher.submit(model_id, rows)
+                input_samples = len(rows)
             else:
-                X = input_df
+                if rows is not None:
+                    input_rows = rows
+                elif isinstance(input_data, list):
+                    # A single positional row
+                    input_rows = np.array([input_data], dtype=object)
+                else:
+                    input_rows = input_data
+                batch = await self._run_prediction_batch(model_id, input_rows)
+                input_samples = len(input_rows)
             
-            # Preprocess input data
-            X_processed = await self._preprocess_input_data(X, model_config)
-            
-            # Make predictions
-            start_time = datetime.now()
-            predictions = model.predict(X_processed)
-            prediction_time = (datetime.now() - start_time).total_seconds()
+            model = batch["model"]
+            X_processed = batch["features"]
+            predictions = batch["predictions"]
+            prediction_time = batch["prediction_time"]
             
             # Get probabilities if requested and supported
             probabilities = None
-            if return_probabilities and hasattr(model, 'predict_proba'):
-                probabilities = model.predict_proba(X_processed).tolist()
+            if return_probabilities and batch["probabilities"] is not None:
+                probabilities = batch["probabilities"].tolist()
             
             # Calculate confidence scores
-            confidence_scores = await self._calculate_confidence_scores(model, X_processed, predictions)
+            confidence_scores = await self._calculate_confidence_scores(
+                model, X_processed, predictions, batch["probabilities"]
+            )
             
             # Generate explanations if requested
             explanations = None
@@ -458,13 +920,39 @@ class SupremePredictiveModeler(BaseSupremeEngine):
                 "confidence_scores": result.confidence_scores,
                 "explanations": result.explanations,
                 "prediction_time": result.prediction_time,
-                "input_samples": len(input_df)
+                "input_samples": input_samples,
+                "batch_rows": batch.get("batch_rows", input_samples)
             }
             
         except Exception as e:
             self.logger.error(f"Error making prediction: {e}")
             return {"error": str(e), "operation": "predict"}
     
+    async def _run_prediction_batch(self, model_id: str, input_data: Union[List[Dict[str, Any]], np.ndarray, pd.DataFrame]) -> Dict[str, Any]:
+        """Preprocess and predict a batch of rows in one vectorized call"""
+        model = self.trained_models[model_id]
+        model_config = self.model_configs[model_id]
+        
+        # Select features (compiled pipelines pick their own columns)
+        if isinstance(input_data, pd.DataFrame) and model_config.feature_columns and model_id not in self.model_pipelines:
+            input_data = input_data[model_config.feature_columns]
+        
+        # Preprocess input data
+        X_processed = await self._preprocess_input_data(input_data, model_config)
+        
+        # Make predictions
+        start_time = time.perf_counter()
+        predictions = model.predict(X_processed)
+        probabilities = model.predict_proba(X_processed) if hasattr(model, 'predict_proba') else None
+        
+        return {
+            "model": model,
+            "features": np.asarray(X_processed),
+            "predictions": np.asarray(predictions),
+            "probabilities": probabilities,
+            "prediction_time": time.perf_counter() - start_time
+        }
+    
     async def _evaluate_model(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
         """Evaluate a trained model on test data"""
         try:
@@ -628,12 +1116,16 @@ class SupremePredictiveModeler(BaseSupremeEngine):
             model_config = self.model_configs[model_id]
             is_trained = model_id in self.trained_models
             
-            # Get training job info
-            training_job = None
-            for job in self.training_jobs.values():
-                if job.model_id == model_id:
-                    training_job = job
-                    break
+            # Get training job info (a specific job, or the model's latest one)
+            self._drain_training_progress()
+            job_id = parameters.get("job_id")
+            if job_id:
+                training_job = self.training_jobs.get(job_id)
+                if not training_job or training_job.model_id != model_id:
+                    return {"error": f"Training job {job_id} not found for model {model_id}", "operation": "get_model_info"}
+            else:
+                model_jobs = [job for job in self.training_jobs.values() if job.model_id == model_id]
+                training_job = max(model_jobs, key=lambda job: job.started_at) if model_jobs else None
             
             # Get recent predictions
             recent_predictions = [
@@ -658,15 +1150,7 @@ class SupremePredictiveModeler(BaseSupremeEngine):
                 "target_column": model_config.target_column,
                 "preprocessing_steps": model_config.preprocessing_steps,
                 "is_trained": is_trained,
-                "training_job": {
-                    "job_id": training_job.job_id,
-                    "status": training_job.status.value,
-                    "started_at": training_job.started_at.isoformat(),
-                    "completed_at": training_job.completed_at.isoformat() if training_job.completed_at else None,
-                    "training_metrics": training_job.training_metrics,
-                    "validation_metrics": training_job.validation_metrics,
-                    "error_message": training_job.error_message
-                } if training_job else None,
+                "training_job": self._training_job_info(training_job) if training_job else None,
                 "recent_predictions": recent_predictions
             }
             
@@ -679,9 +1163,11 @@ class SupremePredictiveModeler(BaseSupremeEngine):
     async def _get_modeler_status(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
         """Get overall modeler status"""
         try:
+            self._drain_training_progress()
             total_models = len(self.model_configs)
             trained_models = len(self.trained_models)
             active_jobs = len([job for job in self.training_jobs.values() if job.status == ModelStatus.TRAINING])
+            queued_jobs = len([job for job in self.training_jobs.values() if job.status == ModelStatus.QUEUED])
             total_predictions = len(self.prediction_history)
             
             # Model statistics by category
@@ -709,7 +1195,11 @@ class SupremePredictiveModeler(BaseSupremeEngine):
                 "total_models": total_models,
                 "trained_models": trained_models,
                 "active_training_jobs": active_jobs,
+                "queued_training_jobs": queued_jobs,
+                "max_concurrent_training": self.max_concurrent_training,
                 "total_predictions": total_predictions,
+                "prediction_server": self.prediction_batcher.get_statistics(),
+                "model_store": self.trained_models.get_statistics(),
                 "category_statistics": category_stats,
                 "algorithm_statistics": algorithm_stats,
                 "models": {
@@ -746,6 +1236,190 @@ class SupremePredictiveModeler(BaseSupremeEngine):
         timestamp = datetime.now().isoformat()
         return hashlib.md5(f"pred_{timestamp}".encode()).hexdigest()[:16]
     
+    def _get_training_executor(self) -> ProcessPoolExecutor:
+        """Create the training process pool on first use"""
+        if self._training_executor is None:
+            context = multiprocessing.get_context()
+            self._training_progress_queue = context.Queue()
+            self._training_executor = ProcessPoolExecutor(
+                max_workers=self.max_concurrent_training,
+                mp_context=context,
+                initializer=_init_training_worker,
+                initargs=(self._training_progress_queue,)
+            )
+        return self._training_executor
+    
+    def _dispatch_training_jobs(self):
+        """Start queued jobs in priority order while worker slots are free"""
+        # Jobs for a model that is already training wait for it to finish,
+        # so two fits never race to publish the same model's artifacts
+        busy_models = {self.training_jobs[running].model_id for running in self._running_training}
+        deferred = []
+        while self._training_queue and len(self._running_training) < self.max_concurrent_training:
+            entry = heapq.heappop(self._training_queue)
+            job_id = entry[2]
+            training_job = self.training_jobs.get(job_id)
+            if training_job is None or training_job.status != ModelStatus.QUEUED:
+                continue  # cancelled while queued
+            if training_job.model_id in busy_models:
+                deferred.append(entry)
+                continue
+            
+            busy_models.add(training_job.model_id)
+            training_job.status = ModelStatus.TRAINING
+            training_job.stage = "starting"
+            training_job.started_at = datetime.now()
+            payload = self._training_payloads.pop(job_id)
+            self._running_training[job_id] = asyncio.create_task(self._run_training_job(job_id, payload))
+        
+        for entry in deferred:
+            heapq.heappush(self._training_queue, entry)
+    
+    async def _run_training_job(self, job_id: str, payload: Dict[str, Any]):
+        """Run one training job in the process pool and record its outcome"""
+        training_job = self.training_jobs[job_id]
+        
+        try:
+            loop = asyncio.get_running_loop()
+            outcome = await loop.run_in_executor(self._get_training_executor(), _run_training_job, payload)
+        except BrokenProcessPool as e:
+            # A worker died (e.g. out of memory); start a fresh pool for later jobs
+            self._training_executor = None
+            outcome = {"error": f"Training worker crashed: {e}"}
+        except Exception as e:
+            outcome = {"error": str(e)}
+        
+        try:
+            self._drain_training_progress()
+            training_job.completed_at = datetime.now()
+            
+            if training_job.status == ModelStatus.CANCELLED:
+                pass  # result discarded, the previous model stays active
+            elif "error" in outcome:
+                training_job.status = ModelStatus.FAILED
+                training_job.stage = "failed"
+                training_job.error_message = outcome["error"]
+            else:
+                model_id = training_job.model_id
+                model_path = self._model_path(model_id)
+                os.replace(_pipeline_path(payload["artifact_path"]), _pipeline_path(model_path))
+                os.replace(payload["artifact_path"], model_path)
+                self.trained_models.register(model_id, model_path)
+                self.trained_models[model_id] = outcome["model"]
+                self.model_pipelines[model_id] = outcome["pipeline"]
+                self.model_encoders[model_id] = outcome["encoders"]
+                if outcome["scaler"] is not None:
+                    self.model_scalers[model_id] = outcome["scaler"]
+                else:
+                    self.model_scalers.pop(model_id, None)
+                
+                training_job.status = ModelStatus.TRAINED
+                training_job.stage = "completed"
+                training_job.progress = 1.0
+                training_job.training_metrics = outcome["training_metrics"]
+                training_job.validation_metrics = outcome["validation_metrics"]
+            
+            await self._save_model_data()
+            self._resolve_training_waiter(job_id, self._training_job_result(training_job, outcome))
+            
+        finally:
+            self._discard_artifacts(payload["artifact_path"])
+            self._running_training.pop(job_id, None)
+            self._dispatch_training_jobs()
+    
+    def _drain_training_progress(self):
+        """Apply progress messages reported by training workers"""
+        if self._training_progress_queue is None:
+            return
+        while True:
+            try:
+                job_id, stage, progress = self._training_progress_queue.get_nowait()
+            except (queue.Empty, OSError, ValueError):
+                break
+            training_job = self.training_jobs.get(job_id)
+            if training_job and training_job.status == ModelStatus.TRAINING:
+                training_job.stage = stage
+                training_job.progress = progress
+    
+    def _queue_position(self, job_id: str) -> Optional[int]:
+        """1-based position of a queued job in dispatch order"""
+        queued = [
+            entry for entry in sorted(self._training_queue)
+            if self.training_jobs[entry[2]].status == ModelStatus.QUEUED
+        ]
+        for position, (_, _, queued_job_id) in enumerate(queued, start=1):
+            if queued_job_id == job_id:
+                return position
+        return None
+    
+    def _training_job_result(self, training_job: ModelTrainingJob, outcome: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Build the train_model response for a finished job"""
+        model_config = self.model_configs.get(training_job.model_id)
+        result = {
+            "operation": "train_model",
+            "job_id": training_job.job_id,
+            "model_id": training_job.model_id,
+            "model_name": model_config.model_name if model_config else None,
+            "status": {
+                ModelStatus.TRAINED: "completed",
+                ModelStatus.FAILED: "failed"
+            }.get(training_job.status, training_job.status.value)
+        }
+        
+        if training_job.status == ModelStatus.TRAINED and outcome:
+            result.update({
+                "training_samples": outcome["training_samples"],
+                "validation_samples": outcome["validation_samples"],
+                "training_time": outcome["training_time"],
+                "training_metrics": training_job.training_metrics,
+                "validation_metrics": training_job.validation_metrics
+            })
+        elif training_job.error_message:
+            result["error"] = training_job.error_message
+        
+        return result
+    
+    def _resolve_training_waiter(self, job_id: str, result: Dict[str, Any]):
+        waiter = self._training_waiters.pop(job_id, None)
+        if waiter is not None and not waiter.done():
+            waiter.set_result(result)
+    
+    def _training_job_info(self, training_job: ModelTrainingJob) -> Dict[str, Any]:
+        """Serializable view of a training job for status polling"""
+        return {
+            "job_id": training_job.job_id,
+            "status": training_job.status.value,
+            "stage": training_job.stage,
+            "progress": training_job.progress,
+            "priority": training_job.priority,
+            "queue_position": self._queue_position(training_job.job_id) if training_job.status == ModelStatus.QUEUED else None,
+            "started_at": training_job.started_at.isoformat(),
+            "completed_at": training_job.completed_at.isoformat() if training_job.completed_at else None,
+            "training_metrics": training_job.training_metrics,
+            "validation_metrics": training_job.validation_metrics,
+            "error_message": training_job.error_message
+        }
+    
+    async def _shutdown_engine(self):
+        """Stop accepting training work and release the process pool"""
+        for _, _, job_id in self._training_queue:
+            training_job = self.training_jobs.get(job_id)
+            if training_job and training_job.status == ModelStatus.QUEUED:
+                training_job.status = ModelStatus.CANCELLED
+                training_job.completed_at = datetime.now()
+                self._resolve_training_waiter(job_id, self._training_job_result(training_job))
+        self._training_queue.clear()
+        self._training_payloads.clear()
+        
+        if self._running_training:
+            await asyncio.gather(*self._running_training.values(), return_exceptions=True)
+        
+        if self._training_executor is not None:
+            self._training_executor.shutdown(wait=True)
+            self._training_executor = None
+        
+        await self._save_model_data()
+    
     async def _load_model_data(self):
         """Load model configurations from storage"""
         try:
@@ -782,8 +1456,18 @@ class SupremePredictiveModeler(BaseSupremeEngine):
                             completed_at=datetime.fromisoformat(job_data['completed_at']) if job_data['completed_at'] else None,
                             training_metrics=job_data['training_metrics'],
                             validation_metrics=job_data['validation_metrics'],
-                            error_message=job_data['error_message']
+                            error_message=job_data['error_message'],
+                            priority=job_data.get('priority', 5),
+                            progress=job_data.get('progress', 0.0),
+                            stage=job_data.get('stage', job_data['status'])
                         )
+                        
+                        # Jobs that were queued or running when the process stopped never finished
+                        if job.status in (ModelStatus.QUEUED, ModelStatus.TRAINING):
+                            job.status = ModelStatus.FAILED
+                            job.stage = "failed"
+                            job.error_message = "Interrupted by engine restart"
+                        
                         self.training_jobs[job_id] = job
                         
         except Exception as e:
@@ -821,7 +1505,10 @@ class SupremePredictiveModeler(BaseSupremeEngine):
                     'completed_at': job.completed_at.isoformat() if job.completed_at else None,
                     'training_metrics': job.training_metrics,
                     'validation_metrics': job.validation_metrics,
-                    'error_message': job.error_message
+                    'error_message': job.error_message,
+                    'priority': job.priority,
+                    'progress': job.progress,
+                    'stage': job.stage
                 }
             
             jobs_file = os.path.join(self.data_dir, "training_jobs.json")
@@ -831,15 +1518,34 @@ class SupremePredictiveModeler(BaseSupremeEngine):
         except Exception as e:
             self.logger.error(f"Could not save model data: {e}")
     
+    def _model_path(self, model_id: str) -> str:
+        """Path of a trained model artifact"""
+        return os.path.join(self.models_dir, f"{model_id}.joblib")
+    
+    def _artifact_path(self, model_id: str, job_id: str) -> str:
+        """Job-specific path a training worker writes its artifacts to"""
+        return os.path.join(self.models_dir, f"{model_id}.{job_id}.tmp.joblib")
+    
+    @staticmethod
+    def _discard_artifacts(artifact_path: str):
+        """Remove leftover artifacts of a cancelled or failed training job"""
+        for path in (artifact_path, _pipeline_path(artifact_path)):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+    
     async def _load_trained_models(self):
-        """Load trained models from disk"""
+        """Register trained model artifacts; models are loaded on first use"""
         try:
             for model_id in self.model_configs.keys():
-                model_path = os.path.join(self.models_dir, f"{model_id}.joblib")
+                model_path = self._model_path(model_id)
                 if os.path.exists(model_path):
                     try:
-                        model = joblib.load(model_path)
-                        self.trained_models[model_id] = model
+                        self.trained_models.register(model_id, model_path)
+                        pipeline_path = _pipeline_path(model_path)
+                        if os.path.exists(pipeline_path):
+                            self.model_pipelines[model_id] = joblib.load(pipeline_path)
                     except Exception as e:
                         self.logger.warning(f"Could not load model {model_id}: {e}")
                         
@@ -849,46 +1555,33 @@ class SupremePredictiveModeler(BaseSupremeEngine):
     async def _preprocess_data(self, X: pd.DataFrame, y: pd.Series, config: ModelConfig) -> Tuple[np.ndarray, np.ndarray]:
         """Preprocess training data"""
         try:
-            X_processed = X.copy()
-            y_processed = y.copy()
-            
-            # Handle missing values
-            X_processed = X_processed.fillna(X_processed.mean(numeric_only=True))
-            
-            # Encode categorical variables
-            categorical_columns = X_processed.select_dtypes(include=['object']).columns
-            if len(categorical_columns) > 0:
-                encoders = {}
-                for col in categorical_columns:
-                    encoder = LabelEncoder()
-                    X_processed[col] = encoder.fit_transform(X_processed[col].astype(str))
-                    encoders[col] = encoder
+            X_processed, y_processed, encoders, scaler, pipeline = _fit_preprocessing(
+                X, y, config.model_category, config.preprocessing_steps
+            )
+            self.model_pipelines[config.model_id] = pipeline
+            if encoders:
                 self.model_encoders[config.model_id] = encoders
-            
-            # Scale features if specified
-            if "standardize" in config.preprocessing_steps:
-                scaler = StandardScaler()
-                X_processed = scaler.fit_transform(X_processed)
+            if scaler is not None:
                 self.model_scalers[config.model_id] = scaler
             
-            # Encode target variable for classification
-            if config.model_category == ModelCategory.CLASSIFICATION:
-                if y_processed.dtype == 'object':
-                    target_encoder = LabelEncoder()
-                    y_processed = target_encoder.fit_transform(y_processed)
-                    if config.model_id not in self.model_encoders:
-                        self.model_encoders[config.model_id] = {}
-                    self.model_encoders[config.model_id]['target'] = target_encoder
-            
-            return X_processed, y_processed.values
+            return X_processed, y_processed
             
         except Exception as e:
             self.logger.error(f"Error preprocessing data: {e}")
             raise
     
-    async def _preprocess_input_data(self, X: pd.DataFrame, config: ModelConfig) -> np.ndarray:
+    async def _preprocess_input_data(self, X: Union[pd.DataFrame, List[Dict[str, Any]], np.ndarray], config: ModelConfig) -> np.ndarray:
         """Preprocess input data for prediction"""
         try:
+            # Compiled pipeline from training
+            if config.model_id in self.model_pipelines:
+                return self.model_pipelines[config.model_id].transform(X)
+            
+            # Models without a stored pipeline fall back to the fitted encoders/scaler
+            if not isinstance(X, pd.DataFrame):
+                X = pd.DataFrame(X)
+                if config.feature_columns:
+                    X = X[config.feature_columns]
             X_processed = X.copy()
             
             # Handle missing values
@@ -915,43 +1608,21 @@ class SupremePredictiveModeler(BaseSupremeEngine):
     async def _calculate_metrics(self, y_true, y_pred, model_category: ModelCategory) -> Dict[str, float]:
         """Calculate performance metrics"""
         try:
-            metrics = {}
-            
-            if model_category == ModelCategory.REGRESSION:
-                metrics['mse'] = float(mean_squared_error(y_true, y_pred))
-                metrics['rmse'] = float(np.sqrt(metrics['mse']))
-                metrics['mae'] = float(np.mean(np.abs(y_true - y_pred)))
-                
-                # R-squared
-                ss_res = np.sum((y_true - y_pred) ** 2)
-                ss_tot = np.sum((y_true - np.mean(y_true)) ** 2)
-                metrics['r2'] = float(1 - (ss_res / ss_tot)) if ss_tot != 0 else 0.0
-                
-            elif model_category == ModelCategory.CLASSIFICATION:
-                metrics['accuracy'] = float(accuracy_score(y_true, y_pred))
-                
-                # Precision, recall, F1 for binary classification
-                try:
-                    from sklearn.metrics import precision_score, recall_score, f1_score
-                    metrics['precision'] = float(precision_score(y_true, y_pred, average='weighted'))
-                    metrics['recall'] = float(recall_score(y_true, y_pred, average='weighted'))
-                    metrics['f1'] = float(f1_score(y_true, y_pred, average='weighted'))
-                except:
-                    pass
-            
-            return metrics
+            return _compute_metrics(y_true, y_pred, model_category)
             
         except Exception as e:
             self.logger.error(f"Error calculating metrics: {e}")
             return {}
     
-    async def _calculate_confidence_scores(self, model, X: np.ndarray, predictions) -> List[float]:
+    async def _calculate_confidence_scores(self, model, X: np.ndarray, predictions,
+                                           probabilities: Optional[np.ndarray] = None) -> List[float]:
         """Calculate confidence scores for predictions"""
         try:
             # For models with predict_proba, use max probability as confidence
-            if hasattr(model, 'predict_proba'):
-                probabilities = model.predict_proba(X)
-                confidence_scores = [float(max(probs)) for probs in probabilities]
+            if probabilities is not None or hasattr(model, 'predict_proba'):
+                if probabilities is None:
+                    probabilities = model.predict_proba(X)
+                confidence_scores = np.max(probabilities, axis=1).astype(float).tolist()
             else:
                 # For regression or models without probabilities, use a simple heuristic
                 confidence_scores = [0.8] * len(predictions)  # Mock confidence
@@ -13,8 +13,14 @@ from dataclasses import dataclass, asdict
 from enum import Enum
 from datetime import datetime, timedelta
 import os
+import time
 import hashlib
-from collections import defaultdict, deque
+import heapq
+import bisect
+import mmap
+import struct
+import zlib
+from collections import defaultdict, deque, OrderedDict
 import statistics
 import math
 
@@ -62,6 +68,7 @@ class StreamingWindow:
     end_time: datetime
     data_points: List[Dict[str, Any]]
     aggregated_results: Dict[str, float] = None
+    point_count: int = 0
     
     def __post_init__(self):
         if self.aggregated_results is None:
@@ -80,6 +87,493 @@ class StreamAlert:
     timestamp: datetime
     resolved: bool = False
 
+def _to_epoch(timestamp: Any) -> float:
+    """Convert an ISO string, datetime or number into epoch seconds"""
+    if timestamp is None:
+        return time.time()
+    if isinstance(timestamp, (int, float)):
+        return float(timestamp)
+    if isinstance(timestamp, datetime):
+        return timestamp.timestamp()
+    return datetime.fromisoformat(str(timestamp)).timestamp()
+
+class StreamRingBuffer:
+    """
+    Preallocated columnar ring buffer for a single stream.
+    Timestamps (epoch seconds) and values live in NumPy arrays; points
+    without a value are stored as NaN. Every slot is written twice
+    (at ``i`` and ``i + capacity``) so the live contents are always one
+    contiguous slice and reads never copy. Points are kept in timestamp
+    order: in-order appends are O(1), late points are merged in place.
+    """
+
+    def __init__(self, capacity: int = 10000):
+        self.capacity = capacity
+        self._timestamps = np.zeros(2 * capacity, dtype=np.float64)
+        self._values = np.full(2 * capacity, np.nan, dtype=np.float64)
+        self._start = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, timestamp: float, value: float = np.nan):
+        """Append a single point, overwriting the oldest when full"""
+        if self._size and timestamp < self._timestamps[self._start + self._size - 1]:
+            self._merge(np.array([timestamp], dtype=np.float64), np.array([value], dtype=np.float64))
+            return
+        if self._size < self.capacity:
+            pos = (self._start + self._size) % self.capacity
+            self._size += 1
+        else:
+            pos = self._start
+            self._start = (self._start + 1) % self.capacity
+        self._timestamps[pos] = self._timestamps[pos + self.capacity] = timestamp
+        self._values[pos] = self._values[pos + self.capacity] = value
+
+    def extend(self, timestamps: np.ndarray, values: np.ndarray):
+        """Append many points at once"""
+        timestamps = np.asarray(timestamps, dtype=np.float64)
+        values = np.asarray(values, dtype=np.float64)
+        if not len(timestamps):
+            return
+        if (self._size and timestamps[0] < self._timestamps[self._start + self._size - 1]) or \
+                (np.diff(timestamps) < 0).any():
+            self._merge(timestamps, values)
+            return
+        self._extend_ordered(timestamps, values)
+
+    def _extend_ordered(self, timestamps: np.ndarray, values: np.ndarray):
+        """Append points that are already sorted and not older than the buffer"""
+        if len(timestamps) > self.capacity:
+            timestamps = timestamps[-self.capacity:]
+            values = values[-self.capacity:]
+
+        count = len(timestamps)
+        if count == 0:
+            return
+
+        positions = (self._start + self._size + np.arange(count)) % self.capacity
+        for column, data in ((self._timestamps, timestamps), (self._values, values)):
+            column[positions] = data
+            column[positions + self.capacity] = data
+
+        overflow = max(0, self._size + count - self.capacity)
+        self._start = (self._start + overflow) % self.capacity
+        self._size = min(self.capacity, self._size + count)
+
+    def _merge(self, timestamps: np.ndarray, values: np.ndarray):
+        """Merge late points into timestamp order, keeping the newest ``capacity`` points"""
+        # Stable sort: buffered points stay ahead of new points with the same timestamp
+        merged_timestamps = np.concatenate([self.timestamps(), timestamps])
+        order = np.argsort(merged_timestamps, kind="stable")
+        merged_values = np.concatenate([self.values(), values])[order]
+        merged_timestamps = merged_timestamps[order]
+        self.clear()
+        self._extend_ordered(merged_timestamps, merged_values)
+
+    def timestamps(self) -> np.ndarray:
+        """Ordered view of all buffered timestamps"""
+        return self._timestamps[self._start:self._start + self._size]
+
+    def values(self) -> np.ndarray:
+        """Ordered view of all buffered values"""
+        return self._values[self._start:self._start + self._size]
+
+    def tail(self, count: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Views of the most recent ``count`` points"""
+        count = max(0, min(count, self._size))
+        begin = self._start + self._size - count
+        end = self._start + self._size
+        return self._timestamps[begin:end], self._values[begin:end]
+
+    def since(self, start_time: float) -> Tuple[np.ndarray, np.ndarray]:
+        """Views of points at or after ``start_time`` (binary search)"""
+        timestamps = self.timestamps()
+        offset = int(np.searchsorted(timestamps, start_time, side="left"))
+        return timestamps[offset:], self.values()[offset:]
+
+    def clear(self):
+        """Drop all buffered points"""
+        self._start = 0
+        self._size = 0
+
+class SlidingWindowAggregator:
+    """
+    Incrementally maintained aggregates over a sliding window.
+    The window is bounded by point count, by age in seconds, or both.
+    Sum/mean/variance use Welford updates with removal, min/max use
+    monotonic deques and the median uses two heaps with lazy deletion,
+    so each push or eviction is O(1) amortized (O(log n) for the median).
+    The window is kept in timestamp order; a late point rebuilds it in O(n log n).
+    """
+
+    def __init__(self, max_points: Optional[int] = None, max_age: Optional[float] = None):
+        self.max_points = max_points
+        self.max_age = max_age
+        self._window: deque = deque()  # (seq, timestamp, value)
+        self._seq = 0
+        self._reset()
+        self.latest_value: Optional[float] = None
+
+    def _reset(self):
+        """Clear the window and every derived structure"""
+        self._window.clear()
+        self._count = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._min_deque: deque = deque()  # (seq, value), increasing values
+        self._max_deque: deque = deque()  # (seq, value), decreasing values
+        self._low: List[Tuple[float, int]] = []  # max-heap as (-value, -seq)
+        self._high: List[Tuple[float, int]] = []  # min-heap as (value, seq)
+        self._low_size = 0
+        self._high_size = 0
+        self._deleted: set = set()
+        self._evictions_since_resync = 0
+
+    def __len__(self) -> int:
+        return len(self._window)
+
+    @property
+    def count(self) -> int:
+        """Number of numeric values in the window"""
+        return self._count
+
+    def push(self, timestamp: float, value: float):
+        """Add a point and evict whatever falls out of the window"""
+        if self._window and timestamp < self._window[-1][1]:
+            self._insert_late(timestamp, value)
+        else:
+            self._append(timestamp, value)
+
+        if self.max_points is not None:
+            while len(self._window) > self.max_points:
+                self._evict_oldest()
+        if self.max_age is not None:
+            self.evict_before(self._window[-1][1] - self.max_age)
+
+    def _append(self, timestamp: float, value: float):
+        seq = self._seq
+        self._seq += 1
+        self._window.append((seq, timestamp, value))
+
+        if not math.isnan(value):
+            self._add_value(seq, value)
+            self.latest_value = value
+
+    def _insert_late(self, timestamp: float, value: float):
+        """Re-sequence the window with a point older than its newest one"""
+        points = [(point_timestamp, point_value) for _, point_timestamp, point_value in self._window]
+        index = bisect.bisect_right([point[0] for point in points], timestamp)
+        points.insert(index, (timestamp, value))
+        latest_value = self.latest_value
+        self._reset()
+        for point_timestamp, point_value in points:
+            self._append(point_timestamp, point_value)
+        self.latest_value = latest_value  # the newest point is unchanged
+
+    def extend(self, timestamps: np.ndarray, values: np.ndarray):
+        """Push a batch of points, skipping those that would be evicted within the batch"""
+        if (np.diff(timestamps) < 0).any():
+            order = np.argsort(timestamps, kind="stable")
+            timestamps, values = timestamps[order], values[order]
+        begin = 0
+        if self.max_points is not None:
+            begin = max(begin, len(timestamps) - self.max_points)
+        if self.max_age is not None and len(timestamps):
+            begin = max(begin, int(np.searchsorted(timestamps, timestamps[-1] - self.max_age, side="left")))
+        for timestamp, value in zip(timestamps[begin:].tolist(), values[begin:].tolist()):
+            self.push(timestamp, value)
+
+    def evict_before(self, cutoff: float):
+        """Evict points with timestamps older than ``cutoff``"""
+        while self._window and self._window[0][1] < cutoff:
+            self._evict_oldest()
+
+    def snapshot(self) -> Dict[str, float]:
+        """Current aggregates for the numeric values in the window"""
+        if not self._count:
+            return {}
+        return {
+            "count": self._count,
+            "sum": self._mean * self._count,
+            "average": self._mean,
+            "min": self._min_deque[0][1],
+            "max": self._max_deque[0][1],
+            "median": self.median(),
+            "std_dev": self.std_dev()
+        }
+
+    def std_dev(self) -> float:
+        """Sample standard deviation of the window"""
+        if self._count < 2:
+            return 0
+        return math.sqrt(max(self._m2, 0.0) / (self._count - 1))
+
+    def mean(self) -> float:
+        return self._mean
+
+    def median(self) -> Optional[float]:
+        if not self._count:
+            return None
+        if self._low_size > self._high_size:
+            return -self._low[0][0]
+        return (-self._low[0][0] + self._high[0][0]) / 2
+
+    def _add_value(self, seq: int, value: float):
+        # Welford update
+        self._count += 1
+        delta = value - self._mean
+        self._mean += delta / self._count
+        self._m2 += delta * (value - self._mean)
+
+        # Monotonic deques
+        while self._min_deque and self._min_deque[-1][1] >= value:
+            self._min_deque.pop()
+        self._min_deque.append((seq, value))
+        while self._max_deque and self._max_deque[-1][1] <= value:
+            self._max_deque.pop()
+        self._max_deque.append((seq, value))
+
+        # Two-heap median
+        if not self._low_size or (value, seq) <= self._low_top():
+            heapq.heappush(self._low, (-value, -seq))
+            self._low_size += 1
+        else:
+            heapq.heappush(self._high, (value, seq))
+            self._high_size += 1
+        self._rebalance()
+
+    def _evict_oldest(self):
+        seq, _, value = self._window.popleft()
+        if math.isnan(value):
+            return
+
+        # Welford removal
+        if self._count == 1:
+            self._count = 0
+            self._mean = 0.0
+            self._m2 = 0.0
+        else:
+            self._count -= 1
+            delta = value - self._mean
+            self._mean -= delta / self._count
+            self._m2 -= delta * (value - self._mean)
+
+        if self._min_deque and self._min_deque[0][0] == seq:
+            self._min_deque.popleft()
+        if self._max_deque and self._max_deque[0][0] == seq:
+            self._max_deque.popleft()
+
+        in_low = (value, seq) <= self._low_top()
+        self._deleted.add(seq)
+        if in_low:
+            self._low_size -= 1
+        else:
+            self._high_size -= 1
+        self._prune()
+        self._rebalance()
+
+        if len(self._low) + len(self._high) > 2 * self._count + 64:
+            self._rebuild_heaps()
+
+        # Periodically recompute mean/variance to stop floating point drift
+        self._evictions_since_resync += 1
+        if self._evictions_since_resync >= max(len(self._window), 64):
+            self._resync_moments()
+
+    def _low_top(self) -> Tuple[float, int]:
+        value, neg_seq = self._low[0]
+        return -value, -neg_seq
+
+    def _prune(self):
+        while self._low and -self._low[0][1] in self._deleted:
+            self._deleted.discard(-heapq.heappop(self._low)[1])
+        while self._high and self._high[0][1] in self._deleted:
+            self._deleted.discard(heapq.heappop(self._high)[1])
+
+    def _rebalance(self):
+        if self._low_size > self._high_size + 1:
+            value, seq = self._low_top()
+            heapq.heappop(self._low)
+            heapq.heappush(self._high, (value, seq))
+            self._low_size -= 1
+            self._high_size += 1
+        elif self._low_size < self._high_size:
+            value, seq = heapq.heappop(self._high)
+            heapq.heappush(self._low, (-value, -seq))
+            self._high_size -= 1
+            self._low_size += 1
+        self._prune()
+
+    def _resync_moments(self):
+        values = [value for _, _, value in self._window if not math.isnan(value)]
+        self._count = len(values)
+        self._mean = math.fsum(values) / self._count if values else 0.0
+        self._m2 = math.fsum((value - self._mean) ** 2 for value in values)
+        self._evictions_since_resync = 0
+
+    def _rebuild_heaps(self):
+        """Drop lazily deleted heap entries"""
+        live = sorted((value, seq) for seq, _, value in self._window if not math.isnan(value))
+        split = (len(live) + 1) // 2
+        self._low = [(-value, -seq) for value, seq in live[:split]]
+        self._high = live[split:]
+        heapq.heapify(self._low)
+        heapq.heapify(self._high)
+        self._low_size = split
+        self._high_size = len(live) - split
+        self._deleted.clear()
+
+class StreamSegmentStore:
+    """
+    Log-structured on-disk store for stream configs and buffered points.
+    Records are appended to numbered segment files; the active segment is
+    rotated once it grows past ``segment_max_bytes``. Compaction writes a
+    checkpoint segment holding the current state and drops everything
+    before it. Replay memory-maps each segment and resumes from the most
+    recent checkpoint, stopping cleanly at a torn tail record.
+    """
+
+    RECORD_CONFIG = 1
+    RECORD_POINTS = 2
+    RECORD_CHECKPOINT = 3
+
+    HEADER = struct.Struct("<B16sII")  # record type, stream id, payload length, crc32
+    COUNT = struct.Struct("<I")
+
+    def __init__(self, directory: str, segment_max_bytes: int = 16 * 1024 * 1024,
+                 max_segments: int = 8):
+        self.directory = directory
+        self.segment_max_bytes = segment_max_bytes
+        self.max_segments = max_segments
+        os.makedirs(self.directory, exist_ok=True)
+
+        self._active_file = None
+        self._active_sequence = max(self._segment_sequences(), default=0)
+
+    def append_config(self, stream_id: str, config_data: Dict[str, Any]):
+        """Append a stream configuration record"""
+        payload = json.dumps(config_data, separators=(",", ":")).encode("utf-8")
+        self._append(self.RECORD_CONFIG, stream_id, payload)
+
+    def append_points(self, stream_id: str, timestamps: np.ndarray, values: np.ndarray):
+        """Append a block of points as two little-endian float64 columns"""
+        if not len(timestamps):
+            return
+        payload = (
+            self.COUNT.pack(len(timestamps))
+            + np.ascontiguousarray(timestamps, dtype="<f8").tobytes()
+            + np.ascontiguousarray(values, dtype="<f8").tobytes()
+        )
+        self._append(self.RECORD_POINTS, stream_id, payload)
+
+    def needs_compaction(self) -> bool:
+        return len(self._segment_sequences()) > self.max_segments
+
+    def compact(self, configs: Dict[str, Dict[str, Any]],
+                points: Dict[str, Tuple[np.ndarray, np.ndarray]]):
+        """Replace all segments with a single checkpoint of the given state"""
+        self.close()
+        old_sequences = self._segment_sequences()
+        self._active_sequence += 1
+
+        path = self._segment_path(self._active_sequence)
+        with open(path + ".tmp", "wb") as f:
+            f.write(self._encode(self.RECORD_CHECKPOINT, "", b""))
+            for stream_id, config_data in configs.items():
+                payload = json.dumps(config_data, separators=(",", ":")).encode("utf-8")
+                f.write(self._encode(self.RECORD_CONFIG, stream_id, payload))
+            for stream_id, (timestamps, values) in points.items():
+                if len(timestamps):
+                    payload = (
+                        self.COUNT.pack(len(timestamps))
+                        + np.ascontiguousarray(timestamps, dtype="<f8").tobytes()
+                        + np.ascontiguousarray(values, dtype="<f8").tobytes()
+                    )
+                    f.write(self._encode(self.RECORD_POINTS, stream_id, payload))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(path + ".tmp", path)
+
+        for sequence in old_sequences:
+            os.remove(self._segment_path(sequence))
+
+        # New writes go to a fresh segment after the checkpoint
+        self._active_sequence += 1
+
+    def replay(self, on_config: Callable[[str, Dict[str, Any]], None],
+               on_points: Callable[[str, np.ndarray, np.ndarray], None]):
+        """Replay records from the latest checkpoint onwards"""
+        sequences = self._segment_sequences()
+        start = 0
+        for index, sequence in enumerate(sequences):
+            if self._starts_with_checkpoint(sequence):
+                start = index
+
+        for sequence in sequences[start:]:
+            path = self._segment_path(sequence)
+            if os.path.getsize(path) == 0:
+                continue
+            with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                for record_type, stream_id, start, length in self._iter_records(mm):
+                    if record_type == self.RECORD_CONFIG:
+                        on_config(stream_id, json.loads(mm[start:start + length].decode("utf-8")))
+                    elif record_type == self.RECORD_POINTS:
+                        count = self.COUNT.unpack_from(mm, start)[0]
+                        offset = start + self.COUNT.size
+                        timestamps = np.frombuffer(mm, dtype="<f8", count=count, offset=offset).copy()
+                        values = np.frombuffer(mm, dtype="<f8", count=count, offset=offset + 8 * count).copy()
+                        on_points(stream_id, timestamps, values)
+
+    def close(self):
+        if self._active_file is not None:
+            self._active_file.close()
+            self._active_file = None
+
+    def _append(self, record_type: int, stream_id: str, payload: bytes):
+        if self._active_file is None or self._active_file.tell() >= self.segment_max_bytes:
+            self.close()
+            if self._active_sequence == 0 or os.path.exists(self._segment_path(self._active_sequence)):
+                self._active_sequence += 1
+            self._active_file = open(self._segment_path(self._active_sequence), "ab")
+        self._active_file.write(self._encode(record_type, stream_id, payload))
+        self._active_file.flush()
+
+    def _encode(self, record_type: int, stream_id: str, payload: bytes) -> bytes:
+        header = self.HEADER.pack(record_type, stream_id.encode("ascii")[:16], len(payload), zlib.crc32(payload))
+        return header + payload
+
+    def _iter_records(self, buffer: mmap.mmap):
+        """Yield (type, stream_id, payload offset, payload length) for every intact record"""
+        offset = 0
+        while offset + self.HEADER.size <= len(buffer):
+            record_type, raw_id, length, checksum = self.HEADER.unpack_from(buffer, offset)
+            start = offset + self.HEADER.size
+            if start + length > len(buffer):
+                break  # torn tail
+            with memoryview(buffer)[start:start + length] as payload:
+                intact = zlib.crc32(payload) == checksum
+            if not intact:
+                break  # corrupt tail
+            yield record_type, raw_id.rstrip(b"\0").decode("ascii"), start, length
+            offset = start + length
+
+    def _starts_with_checkpoint(self, sequence: int) -> bool:
+        with open(self._segment_path(sequence), "rb") as f:
+            header = f.read(self.HEADER.size)
+        return len(header) == self.HEADER.size and header[0] == self.RECORD_CHECKPOINT
+
+    def _segment_sequences(self) -> List[int]:
+        sequences = []
+        for name in os.listdir(self.directory):
+            if name.startswith("segment_") and name.endswith(".log"):
+                sequences.append(int(name[len("segment_"):-len(".log")]))
+        return sorted(sequences)
+
+    def _segment_path(self, sequence: int) -> str:
+        return os.path.join(self.directory, f"segment_{sequence:08d}.log")
+
 class SupremeRealTimeProcessor(BaseSupremeEngine):
     """
     Supreme real-time processor for streaming data analysis.
@@ -92,7 +586,11 @@ class SupremeRealTimeProcessor(BaseSupremeEngine):
         # Streaming storage
         self.stream_configs: Dict[str, StreamConfig] = {}
         self.active_windows: Dict[str, List[StreamingWindow]] = defaultdict(list)
-        self.stream_buffers: Dict[str, deque] = defaultdict(lambda: deque(maxlen=10000))
+        self.buffer_capacity = 10000
+        self.stream_buffers: Dict[str, StreamRingBuffer] = defaultdict(lambda: StreamRingBuffer(self.buffer_capacity))
+        self.stream_aggregators: Dict[str, OrderedDict] = defaultdict(OrderedDict)
+        self.max_aggregators_per_stream = 16
+        self.current_stats_points = 100
         self.stream_alerts: List[StreamAlert] = []
         
         # Processing capabilities
@@ -111,6 +609,8 @@ class SupremeRealTimeProcessor(BaseSupremeEngine):
         # Data persistence
         self.data_dir = "data/streaming"
         os.makedirs(self.data_dir, exist_ok=True)
+        self.segment_store = StreamSegmentStore(os.path.join(self.data_dir, "segments"))
+        self.replay_window = 15 * 60  # seconds of buffered points recovered on restart
         
         # Processing control
         self.processor_running = False
@@ -194,7 +694,8 @@ class SupremeRealTimeProcessor(BaseSupremeEngine):
             self.stream_configs[stream_id] = stream_config
             
             # Initialize stream buffer
-            self.stream_buffers[stream_id] = deque(maxlen=10000)
+            self.stream_buffers[stream_id] = StreamRingBuffer(self.buffer_capacity)
+            self.stream_aggregators[stream_id] = OrderedDict()
             
             result = {
                 "operation": "create_stream",
@@ -207,7 +708,7 @@ class SupremeRealTimeProcessor(BaseSupremeEngine):
             }
             
             # Save stream data
-            await self._save_stream_data()
+            await self._save_stream_data(stream_id)
             
             return result
             
@@ -221,6 +722,10 @@ class SupremeRealTimeProcessor(BaseSupremeEngine):
             stream_id = parameters.get("stream_id")
             data_points = parameters.get("data_points", [])
             
+            # Columnar batches take the vectorized ingest path
+            if parameters.get("values") is not None:
+                return await self._process_streaming_batch(parameters)
+            
             if not stream_id or not data_points:
                 return {"error": "stream_id and data_points are required", "operation": "process_stream"}
             
@@ -230,6 +735,8 @@ class SupremeRealTimeProcessor(BaseSupremeEngine):
             stream_config = self.stream_configs[stream_id]
             processed_count = 0
             alerts_generated = []
+            ingested_timestamps = []
+            ingested_values = []
             
             # Process each data point
             for data_point in data_points:
@@ -238,7 +745,12 @@ class SupremeRealTimeProcessor(BaseSupremeEngine):
                     data_point["timestamp"] = datetime.now().isoformat()
                 
                 # Add to stream buffer
-                self.stream_buffers[stream_id].append(data_point)
+                value = float(data_point["value"]) if "value" in data_point else np.nan
+                timestamp = _to_epoch(data_point["timestamp"])
+                self.stream_buffers[stream_id].append(timestamp, value)
+                self._update_stream_aggregators(stream_id, timestamp, value)
+                ingested_timestamps.append(timestamp)
+                ingested_values.append(value)
                 processed_count += 1
                 
                 # Check for alerts
@@ -252,6 +764,9 @@ class SupremeRealTimeProcessor(BaseSupremeEngine):
                 elif stream_config.processing_mode == StreamingMode.BATCH:
                     await self._process_batch_data(stream_id, data_point, stream_config)
             
+            # Persist the ingested points as one segment record
+            self._persist_points(stream_id, np.array(ingested_timestamps), np.array(ingested_values))
+            
             # Calculate current statistics
             current_stats = await self._calculate_current_stream_stats(stream_id)
             
@@ -271,6 +786,63 @@ class SupremeRealTimeProcessor(BaseSupremeEngine):
             self.logger.error(f"Error processing streaming data: {e}")
             return {"error": str(e), "operation": "process_stream"}
     
+    async def _process_streaming_batch(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
+        """Process a columnar batch of streaming data in one vectorized pass"""
+        try:
+            stream_id = parameters.get("stream_id")
+            values = np.asarray(parameters.get("values"), dtype=np.float64).ravel()
+            timestamps = parameters.get("timestamps")
+            
+            if not stream_id or not len(values):
+                return {"error": "stream_id and values are required", "operation": "process_stream"}
+            
+            if stream_id not in self.stream_configs:
+                return {"error": f"Stream {stream_id} not found", "operation": "process_stream"}
+            
+            if timestamps is None:
+                timestamps = np.full(len(values), time.time())
+            else:
+                timestamps = self._timestamps_to_epoch(timestamps)
+            
+            if len(timestamps) != len(values):
+                return {"error": "timestamps and values must have the same length", "operation": "process_stream"}
+            
+            stream_config = self.stream_configs[stream_id]
+            if (np.diff(timestamps) < 0).any():
+                order = np.argsort(timestamps, kind="stable")
+                timestamps, values = timestamps[order], values[order]
+            
+            # Alerts are evaluated against the history that precedes each point in time
+            history, positions = self._spike_history(stream_id, timestamps, values)
+            alerts_generated = self._check_batch_alerts(stream_id, values, history, positions, stream_config)
+            
+            # Add to stream buffer, segment log and running aggregates
+            self.stream_buffers[stream_id].extend(timestamps, values)
+            self._persist_points(stream_id, timestamps, values)
+            for aggregator in self.stream_aggregators[stream_id].values():
+                aggregator.extend(timestamps, values)
+            
+            # One window update per batch
+            if stream_config.processing_mode == StreamingMode.WINDOWED:
+                await self._process_windowed_batch(stream_id, len(values), stream_config)
+            
+            # Calculate current statistics
+            current_stats = await self._calculate_current_stream_stats(stream_id)
+            
+            return {
+                "operation": "process_stream",
+                "stream_id": stream_id,
+                "processed_count": len(values),
+                "alerts_generated": len(alerts_generated),
+                "current_stats": current_stats,
+                "alerts": alerts_generated,
+                "buffer_size": len(self.stream_buffers[stream_id])
+            }
+            
+        except Exception as e:
+            self.logger.error(f"Error processing streaming batch: {e}")
+            return {"error": str(e), "operation": "process_stream"}
+    
     async def _aggregate_window_data(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
         """Aggregate data within time windows"""
         try:
@@ -288,14 +860,11 @@ class SupremeRealTimeProcessor(BaseSupremeEngine):
             now = datetime.now()
             window_start = now - timedelta(seconds=window_size)
             
-            # Filter data points in window
-            window_data = []
-            for data_point in self.stream_buffers[stream_id]:
-                point_time = datetime.fromisoformat(data_point["timestamp"])
-                if point_time >= window_start:
-                    window_data.append(data_point)
+            # Incrementally maintained aggregates for this window length
+            aggregator = self._get_stream_aggregator(stream_id, max_points=self.buffer_capacity, max_age=window_size)
+            aggregator.evict_before(window_start.timestamp())
             
-            if not window_data:
+            if len(aggregator) == 0:
                 return {
                     "operation": "aggregate_window",
                     "stream_id": stream_id,
@@ -305,25 +874,12 @@ class SupremeRealTimeProcessor(BaseSupremeEngine):
                 }
             
             # Perform aggregations
-            aggregations = {}
-            values = [float(dp.get("value", 0)) for dp in window_data if "value" in dp]
-            
-            if values:
-                for agg_type in aggregation_types:
-                    if agg_type == "sum":
-                        aggregations[agg_type] = sum(values)
-                    elif agg_type == "average":
-                        aggregations[agg_type] = statistics.mean(values)
-                    elif agg_type == "count":
-                        aggregations[agg_type] = len(values)
-                    elif agg_type == "min":
-                        aggregations[agg_type] = min(values)
-                    elif agg_type == "max":
-                        aggregations[agg_type] = max(values)
-                    elif agg_type == "median":
-                        aggregations[agg_type] = statistics.median(values)
-                    elif agg_type == "std_dev":
-                        aggregations[agg_type] = statistics.stdev(values) if len(values) > 1 else 0
+            snapshot = aggregator.snapshot()
+            aggregations = {
+                agg_type: snapshot[agg_type]
+                for agg_type in aggregation_types
+                if agg_type in snapshot
+            }
             
             # Create window object
             window = StreamingWindow(
@@ -331,8 +887,9 @@ class SupremeRealTimeProcessor(BaseSupremeEngine):
                 stream_id=stream_id,
                 start_time=window_start,
                 end_time=now,
-                data_points=window_data,
-                aggregated_results=aggregations
+                data_points=[],
+                aggregated_results=aggregations,
+                point_count=len(aggregator)
             )
             
             # Store window
@@ -347,7 +904,7 @@ class SupremeRealTimeProcessor(BaseSupremeEngine):
                 "stream_id": stream_id,
                 "window_id": window.window_id,
                 "window_size": window_size,
-                "data_points": len(window_data),
+                "data_points": len(aggregator),
                 "aggregations": aggregations,
                 "window_start": window_start.isoformat(),
                 "window_end": now.isoformat()
@@ -374,9 +931,9 @@ class SupremeRealTimeProcessor(BaseSupremeEngine):
                 return {"error": f"Stream {stream_id} not found", "operation": "detect_anomalies"}
             
             # Get recent data points
-            recent_data = list(self.stream_buffers[stream_id])[-window_size:]
+            recent_timestamps, recent_values = self.stream_buffers[stream_id].tail(window_size)
             
-            if len(recent_data) < 10:
+            if len(recent_timestamps) < 10:
                 return {
                     "operation": "detect_anomalies",
                     "stream_id": stream_id,
@@ -385,9 +942,11 @@ class SupremeRealTimeProcessor(BaseSupremeEngine):
                 }
             
             # Extract values
-            values = [float(dp.get("value", 0)) for dp in recent_data if "value" in dp]
+            has_value = ~np.isnan(recent_values)
+            values = recent_values[has_value]
+            timestamps = recent_timestamps[has_value]
             
-            if not values:
+            if not len(values):
                 return {
                     "operation": "detect_anomalies",
                     "stream_id": stream_id,
@@ -399,18 +958,21 @@ class SupremeRealTimeProcessor(BaseSupremeEngine):
             anomalies = []
             
             if detection_method == "statistical":
-                anomalies = await self._detect_statistical_anomalies(values, recent_data, sensitivity)
+                aggregator = self._get_stream_aggregator(stream_id, max_points=window_size)
+                anomalies = await self._detect_statistical_anomalies(
+                    values, timestamps, sensitivity, aggregator.mean(), aggregator.std_dev()
+                )
             elif detection_method == "moving_average":
-                anomalies = await self._detect_moving_average_anomalies(values, recent_data, sensitivity)
+                anomalies = await self._detect_moving_average_anomalies(values, timestamps, sensitivity)
             elif detection_method == "percentile":
-                anomalies = await self._detect_percentile_anomalies(values, recent_data, sensitivity)
+                anomalies = await self._detect_percentile_anomalies(values, timestamps, sensitivity)
             
             result = {
                 "operation": "detect_anomalies",
                 "stream_id": stream_id,
                 "detection_method": detection_method,
                 "sensitivity": sensitivity,
-                "window_size": len(recent_data),
+                "window_size": len(recent_timestamps),
                 "anomalies_detected": len(anomalies),
                 "anomalies": anomalies
             }
@@ -499,36 +1061,18 @@ class SupremeRealTimeProcessor(BaseSupremeEngine):
                 start_time = now - timedelta(hours=1)
             
             if stream_id:
-                # Statistics for specific stream
-                stream_data = list(self.stream_buffers[stream_id])
-                
-                # Filter by time range
-                filtered_data = []
-                for dp in stream_data:
-                    point_time = datetime.fromisoformat(dp["timestamp"])
-                    if point_time >= start_time:
-                        filtered_data.append(dp)
-                
-                values = [float(dp.get("value", 0)) for dp in filtered_data if "value" in dp]
+                # Statistics for specific stream, filtered by time range
+                aggregator = self._get_stream_aggregator(stream_id, max_points=self.buffer_capacity,
+                                                         max_age=(now - start_time).total_seconds())
+                aggregator.evict_before(start_time.timestamp())
                 
                 stats = {
                     "stream_id": stream_id,
-                    "data_points": len(filtered_data),
+                    "data_points": len(aggregator),
                     "time_range": time_range,
-                    "statistics": {}
+                    "statistics": aggregator.snapshot()
                 }
                 
-                if values:
-                    stats["statistics"] = {
-                        "count": len(values),
-                        "sum": sum(values),
-                        "average": statistics.mean(values),
-                        "min": min(values),
-                        "max": max(values),
-                        "median": statistics.median(values),
-                        "std_dev": statistics.stdev(values) if len(values) > 1 else 0
-                    }
-                
                 return {
                     "operation": "get_stream_stats",
                     "stream_statistics": stats
@@ -576,48 +1120,84 @@ class SupremeRealTimeProcessor(BaseSupremeEngine):
         }
     
     async def _load_stream_data(self):
-        """Load existing stream configurations"""
+        """Load stream configurations and recent points from the segment log"""
         try:
+            # Configurations written by older versions as a single JSON file
             streams_file = os.path.join(self.data_dir, "streams.json")
             if os.path.exists(streams_file):
                 with open(streams_file, 'r') as f:
                     streams_data = json.load(f)
                     for stream_id, stream_data in streams_data.items():
-                        config = StreamConfig(
-                            stream_id=stream_id,
-                            stream_name=stream_data['stream_name'],
-                            source_type=stream_data['source_type'],
-                            processing_mode=StreamingMode(stream_data['processing_mode']),
-                            window_size=stream_data['window_size'],
-                            aggregations=[AggregationType(agg) for agg in stream_data['aggregations']],
-                            alert_thresholds=stream_data['alert_thresholds']
-                        )
-                        self.stream_configs[stream_id] = config
+                        self.stream_configs[stream_id] = self._config_from_dict(stream_id, stream_data)
+            
+            replay_start = time.time() - self.replay_window
+            
+            def on_config(stream_id: str, stream_data: Dict[str, Any]):
+                self.stream_configs[stream_id] = self._config_from_dict(stream_id, stream_data)
+            
+            def on_points(stream_id: str, timestamps: np.ndarray, values: np.ndarray):
+                recent = timestamps >= replay_start
+                if recent.any():
+                    self.stream_buffers[stream_id].extend(timestamps[recent], values[recent])
+            
+            self.segment_store.replay(on_config, on_points)
                         
         except Exception as e:
             self.logger.warning(f"Could not load stream data: {e}")
     
-    async def _save_stream_data(self):
-        """Save stream configurations"""
+    async def _save_stream_data(self, stream_id: str):
+        """Append a stream configuration to the segment log"""
         try:
-            streams_data = {}
-            for stream_id, config in self.stream_configs.items():
-                streams_data[stream_id] = {
-                    'stream_name': config.stream_name,
-                    'source_type': config.source_type,
-                    'processing_mode': config.processing_mode.value,
-                    'window_size': config.window_size,
-                    'aggregations': [agg.value for agg in config.aggregations],
-                    'alert_thresholds': config.alert_thresholds
-                }
-            
-            streams_file = os.path.join(self.data_dir, "streams.json")
-            with open(streams_file, 'w') as f:
-                json.dump(streams_data, f, indent=2)
+            self.segment_store.append_config(stream_id, self._config_to_dict(self.stream_configs[stream_id]))
                 
         except Exception as e:
             self.logger.error(f"Could not save stream data: {e}")
     
+    def _persist_points(self, stream_id: str, timestamps: np.ndarray, values: np.ndarray):
+        """Append ingested points to the segment log"""
+        try:
+            self.segment_store.append_points(stream_id, timestamps, values)
+        except Exception as e:
+            self.logger.error(f"Could not persist stream points: {e}")
+    
+    async def _compact_stream_data(self):
+        """Rewrite the segment log as a checkpoint of configs and the replay window"""
+        try:
+            replay_start = time.time() - self.replay_window
+            configs = {
+                stream_id: self._config_to_dict(config)
+                for stream_id, config in self.stream_configs.items()
+            }
+            points = {
+                stream_id: buffer.since(replay_start)
+                for stream_id, buffer in self.stream_buffers.items()
+            }
+            self.segment_store.compact(configs, points)
+            
+        except Exception as e:
+            self.logger.error(f"Could not compact stream data: {e}")
+    
+    def _config_to_dict(self, config: StreamConfig) -> Dict[str, Any]:
+        return {
+            'stream_name': config.stream_name,
+            'source_type': config.source_type,
+            'processing_mode': config.processing_mode.value,
+            'window_size': config.window_size,
+            'aggregations': [agg.value for agg in config.aggregations],
+            'alert_thresholds': config.alert_thresholds
+        }
+    
+    def _config_from_dict(self, stream_id: str, stream_data: Dict[str, Any]) -> StreamConfig:
+        return StreamConfig(
+            stream_id=stream_id,
+            stream_name=stream_data['stream_name'],
+            source_type=stream_data['source_type'],
+            processing_mode=StreamingMode(stream_data['processing_mode']),
+            window_size=stream_data['window_size'],
+            aggregations=[AggregationType(agg) for agg in stream_data['aggregations']],
+            alert_thresholds=stream_data['alert_thresholds']
+        )
+    
     def _generate_stream_id(self, stream_name: str) -> str:
         """Generate unique stream ID"""
         timestamp = datetime.now().isoformat()
@@ -633,6 +1213,45 @@ class SupremeRealTimeProcessor(BaseSupremeEngine):
         timestamp = datetime.now().isoformat()
         return hashlib.md5(f"alert_{timestamp}".encode()).hexdigest()[:16]
     
+    def _get_stream_aggregator(self, stream_id: str, max_points: Optional[int] = None,
+                               max_age: Optional[float] = None) -> SlidingWindowAggregator:
+        """
+        Get (or create and backfill) the running aggregator for a window shape.
+        Time windows should also pass max_points (the buffer capacity), or a
+        burst of points inside the window grows them without bound.
+        """
+        aggregators = self.stream_aggregators[stream_id]
+        key = (max_points, max_age)
+        
+        if key in aggregators:
+            aggregators.move_to_end(key)
+            return aggregators[key]
+        
+        aggregator = SlidingWindowAggregator(max_points=max_points, max_age=max_age)
+        buffer = self.stream_buffers[stream_id]
+        if max_age is not None:
+            timestamps, values = buffer.since(time.time() - max_age)
+            if max_points is not None:
+                timestamps, values = timestamps[-max_points:], values[-max_points:]
+        else:
+            timestamps, values = buffer.tail(max_points)
+        for timestamp, value in zip(timestamps.tolist(), values.tolist()):
+            aggregator.push(timestamp, value)
+        
+        aggregators[key] = aggregator
+        if len(aggregators) > self.max_aggregators_per_stream:
+            aggregators.popitem(last=False)
+        return aggregator
+    
+    def _update_stream_aggregators(self, stream_id: str, timestamp: float, value: float):
+        """Push a new point into every running aggregator of a stream"""
+        for aggregator in self.stream_aggregators[stream_id].values():
+            aggregator.push(timestamp, value)
+    
+    def _format_epoch(self, timestamp: float) -> str:
+        """Format an epoch timestamp from a stream buffer as ISO string"""
+        return datetime.fromtimestamp(float(timestamp)).isoformat()
+    
     async def _check_stream_alerts(self, stream_id: str, data_point: Dict[str, Any], config: StreamConfig) -> Optional[StreamAlert]:
         """Check if data point triggers any alerts"""
         try:
@@ -651,7 +1270,8 @@ class SupremeRealTimeProcessor(BaseSupremeEngine):
                 elif threshold_type == "min" and value < threshold_value:
                     alert_triggered = True
                     severity = "high"
-                elif threshold_type == "spike" and self._is_spike(stream_id, value, threshold_value):
+                elif threshold_type == "spike" and self._is_spike(stream_id, value, threshold_value,
+                                                                  _to_epoch(data_point.get("timestamp"))):
                     alert_triggered = True
                     severity = "medium"
                 
@@ -681,15 +1301,104 @@ class SupremeRealTimeProcessor(BaseSupremeEngine):
             self.logger.error(f"Error checking stream alerts: {e}")
             return None
     
-    def _is_spike(self, stream_id: str, current_value: float, spike_threshold: float) -> bool:
-        """Check if current value is a spike compared to recent values"""
+    def _spike_history(self, stream_id: str, timestamps: np.ndarray,
+                       values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Time-ordered values around a sorted batch and the positions of the batch points in them"""
+        buffer = self.stream_buffers[stream_id]
+        if not len(buffer) or timestamps[0] >= buffer.timestamps()[-1]:
+            previous_values = buffer.tail(9)[1]
+            return np.concatenate([previous_values, values]), len(previous_values) + np.arange(len(values))
+        
+        # Late batch: interleave it with the buffered points it overlaps
+        merged_timestamps = np.concatenate([buffer.timestamps(), timestamps])
+        order = np.argsort(merged_timestamps, kind="stable")
+        history = np.concatenate([buffer.values(), values])[order]
+        positions = np.empty(len(order), dtype=np.int64)
+        positions[order] = np.arange(len(order))
+        return history, positions[len(buffer):]
+    
+    def _check_batch_alerts(self, stream_id: str, values: np.ndarray, history: np.ndarray,
+                            positions: np.ndarray, config: StreamConfig) -> List[StreamAlert]:
+        """Vectorized equivalent of _check_stream_alerts for a whole batch"""
+        if not config.alert_thresholds:
+            return []
+        
+        values = np.nan_to_num(values, nan=0.0)
+        triggered = np.zeros(len(values), dtype=bool)
+        alerts_by_index = {}
+        
+        # Thresholds are checked in order; each point raises at most one alert
+        for threshold_type, threshold_value in config.alert_thresholds.items():
+            if threshold_type == "max":
+                mask, severity = values > threshold_value, "high"
+            elif threshold_type == "min":
+                mask, severity = values < threshold_value, "high"
+            elif threshold_type == "spike":
+                mask, severity = self._batch_spikes(history, positions, threshold_value), "medium"
+            else:
+                continue
+            
+            mask &= ~triggered
+            triggered |= mask
+            for i in np.flatnonzero(mask):
+                value = float(values[i])
+                alerts_by_index[int(i)] = StreamAlert(
+                    alert_id=self._generate_alert_id(),
+                    stream_id=stream_id,
+                    alert_type=threshold_type,
+                    message=f"Stream {stream_id} {threshold_type} threshold exceeded: {value} > {threshold_value}",
+                    severity=severity,
+                    value=value,
+                    threshold=threshold_value,
+                    timestamp=datetime.now()
+                )
+        
+        alerts = [alerts_by_index[i] for i in sorted(alerts_by_index)]
+        self.stream_alerts.extend(alerts)
+        
+        # Limit alert history
+        if len(self.stream_alerts) > 1000:
+            self.stream_alerts = self.stream_alerts[-1000:]
+        
+        return alerts
+    
+    def _batch_spikes(self, history: np.ndarray, positions: np.ndarray, spike_threshold: float) -> np.ndarray:
+        """Vectorized _is_spike: compare each point against the mean of up to 9 points preceding it in time"""
+        history = np.nan_to_num(history, nan=0.0)
+        cumulative = np.concatenate([[0.0], np.cumsum(history)])
+        
+        values = history[positions]
+        starts = np.maximum(positions - 9, 0)
+        counts = positions - starts
+        means = (cumulative[positions] - cumulative[starts]) / np.maximum(counts, 1)
+        
+        deviation = np.abs(values - means) / np.maximum(means, 1)
+        return (counts >= 4) & (deviation > spike_threshold)
+    
+    def _timestamps_to_epoch(self, timestamps: Any) -> np.ndarray:
+        """Convert a column of timestamps into epoch seconds"""
+        timestamps = np.asarray(timestamps).ravel()
+        if timestamps.dtype.kind == "M":
+            return timestamps.astype("datetime64[ns]").astype(np.int64) / 1e9
+        if timestamps.dtype.kind in "iuf":
+            return timestamps.astype(np.float64)
+        return np.array([_to_epoch(timestamp) for timestamp in timestamps.tolist()], dtype=np.float64)
+    
+    def _is_spike(self, stream_id: str, current_value: float, spike_threshold: float,
+                  timestamp: Optional[float] = None) -> bool:
+        """Check if current value is a spike compared to the points preceding it in time"""
         try:
-            recent_data = list(self.stream_buffers[stream_id])[-10:]  # Last 10 points
-            if len(recent_data) < 5:
+            buffer = self.stream_buffers[stream_id]
+            end = len(buffer)
+            if timestamp is not None:
+                # Late points were inserted after any points with the same timestamp
+                end = int(np.searchsorted(buffer.timestamps(), timestamp, side="right"))
+            recent_values = buffer.values()[max(end - 10, 0):end]  # Last 10 points
+            if len(recent_values) < 5:
                 return False
             
-            recent_values = [float(dp.get("value", 0)) for dp in recent_data[:-1]]  # Exclude current
-            avg_recent = statistics.mean(recent_values)
+            recent_values = np.nan_to_num(recent_values[:-1], nan=0.0)  # Exclude current
+            avg_recent = float(recent_values.mean())
             
             # Check if current value deviates significantly from recent average
             deviation = abs(current_value - avg_recent) / max(avg_recent, 1)
@@ -715,6 +1424,7 @@ class SupremeRealTimeProcessor(BaseSupremeEngine):
                 if window_duration < config.window_size:
                     # Add to existing window
                     latest_window.data_points.append(data_point)
+                    latest_window.point_count += 1
                     latest_window.end_time = current_time
                 else:
                     # Create new window
@@ -734,7 +1444,8 @@ class SupremeRealTimeProcessor(BaseSupremeEngine):
                 stream_id=stream_id,
                 start_time=datetime.now(),
                 end_time=datetime.now(),
-                data_points=[data_point]
+                data_points=[data_point],
+                point_count=1
             )
             
             self.active_windows[stream_id].append(window)
@@ -746,6 +1457,37 @@ class SupremeRealTimeProcessor(BaseSupremeEngine):
         except Exception as e:
             self.logger.error(f"Error creating new window: {e}")
     
+    async def _process_windowed_batch(self, stream_id: str, point_count: int, config: StreamConfig):
+        """Process a columnar batch in windowed mode with a single window update"""
+        try:
+            if not config.window_size:
+                return
+            
+            current_time = datetime.now()
+            windows = self.active_windows[stream_id]
+            
+            if windows and (current_time - windows[-1].start_time).total_seconds() < config.window_size:
+                # Add to existing window
+                windows[-1].point_count += point_count
+                windows[-1].end_time = current_time
+            else:
+                # Batch points stay in the columnar buffer rather than the window
+                windows.append(StreamingWindow(
+                    window_id=self._generate_window_id(stream_id),
+                    stream_id=stream_id,
+                    start_time=current_time,
+                    end_time=current_time,
+                    data_points=[],
+                    point_count=point_count
+                ))
+                
+                # Limit window history
+                if len(windows) > 100:
+                    self.active_windows[stream_id] = windows[-100:]
+                    
+        except Exception as e:
+            self.logger.error(f"Error processing windowed batch: {e}")
+    
     async def _process_batch_data(self, stream_id: str, data_point: Dict[str, Any], config: StreamConfig):
         """Process data in batch mode"""
         try:
@@ -762,50 +1504,53 @@ class SupremeRealTimeProcessor(BaseSupremeEngine):
             if stream_id not in self.stream_buffers:
                 return {}
             
-            recent_data = list(self.stream_buffers[stream_id])[-100:]  # Last 100 points
-            if not recent_data:
+            aggregator = self._get_stream_aggregator(stream_id, max_points=self.current_stats_points)
+            if not len(aggregator):
                 return {}
             
-            values = [float(dp.get("value", 0)) for dp in recent_data if "value" in dp]
-            
-            if not values:
-                return {"data_points": len(recent_data)}
+            if not aggregator.count:
+                return {"data_points": len(aggregator)}
             
+            snapshot = aggregator.snapshot()
             return {
-                "data_points": len(recent_data),
-                "latest_value": values[-1],
-                "average": statistics.mean(values),
-                "min": min(values),
-                "max": max(values),
-                "std_dev": statistics.stdev(values) if len(values) > 1 else 0
+                "data_points": len(aggregator),
+                "latest_value": aggregator.latest_value,
+                "average": snapshot["average"],
+                "min": snapshot["min"],
+                "max": snapshot["max"],
+                "std_dev": snapshot["std_dev"]
             }
             
         except Exception as e:
             self.logger.error(f"Error calculating stream stats: {e}")
             return {}
     
-    async def _detect_statistical_anomalies(self, values: List[float], data_points: List[Dict], sensitivity: float) -> List[Dict[str, Any]]:
+    async def _detect_statistical_anomalies(self, values: np.ndarray, timestamps: np.ndarray, sensitivity: float,
+                                            mean_val: Optional[float] = None, std_val: Optional[float] = None) -> List[Dict[str, Any]]:
         """Detect anomalies using statistical methods"""
         try:
             if len(values) < 10:
                 return []
             
-            mean_val = statistics.mean(values)
-            std_val = statistics.stdev(values)
+            # Running aggregates are passed in by the caller when available
+            if mean_val is None:
+                mean_val = float(values.mean())
+            if std_val is None:
+                std_val = float(values.std(ddof=1))
             threshold = sensitivity * std_val
+            deviations = np.abs(values - mean_val)
             
             anomalies = []
-            for i, (value, data_point) in enumerate(zip(values, data_points)):
-                if abs(value - mean_val) > threshold:
-                    anomalies.append({
-                        "index": i,
-                        "value": value,
-                        "expected": mean_val,
-                        "deviation": abs(value - mean_val),
-                        "threshold": threshold,
-                        "timestamp": data_point.get("timestamp"),
-                        "severity": "high" if abs(value - mean_val) > 2 * threshold else "medium"
-                    })
+            for i in np.flatnonzero(deviations > threshold):
+                anomalies.append({
+                    "index": int(i),
+                    "value": float(values[i]),
+                    "expected": mean_val,
+                    "deviation": float(deviations[i]),
+                    "threshold": threshold,
+                    "timestamp": self._format_epoch(timestamps[i]),
+                    "severity": "high" if deviations[i] > 2 * threshold else "medium"
+                })
             
             return anomalies
             
@@ -813,33 +1558,33 @@ class SupremeRealTimeProcessor(BaseSupremeEngine):
             self.logger.error(f"Error detecting statistical anomalies: {e}")
             return []
     
-    async def _detect_moving_average_anomalies(self, values: List[float], data_points: List[Dict], sensitivity: float) -> List[Dict[str, Any]]:
+    async def _detect_moving_average_anomalies(self, values: np.ndarray, timestamps: np.ndarray, sensitivity: float) -> List[Dict[str, Any]]:
         """Detect anomalies using moving average"""
         try:
             window_size = min(20, len(values) // 4)
             if window_size < 3:
                 return []
             
-            anomalies = []
+            # Trailing windows values[i-window_size:i] for every i >= window_size
+            windows = np.lib.stride_tricks.sliding_window_view(values, window_size)[:-1]
+            moving_avgs = windows.mean(axis=1)
+            moving_stds = windows.std(axis=1, ddof=1)
+            current_values = values[window_size:]
+            deviations = np.abs(current_values - moving_avgs)
+            thresholds = sensitivity * moving_stds
             
-            for i in range(window_size, len(values)):
-                window_values = values[i-window_size:i]
-                moving_avg = statistics.mean(window_values)
-                moving_std = statistics.stdev(window_values) if len(window_values) > 1 else 0
-                
-                current_value = values[i]
-                threshold = sensitivity * moving_std
-                
-                if abs(current_value - moving_avg) > threshold:
-                    anomalies.append({
-                        "index": i,
-                        "value": current_value,
-                        "expected": moving_avg,
-                        "deviation": abs(current_value - moving_avg),
-                        "threshold": threshold,
-                        "timestamp": data_points[i].get("timestamp"),
-                        "severity": "high" if abs(current_value - moving_avg) > 2 * threshold else "medium"
-                    })
+            anomalies = []
+            for j in np.flatnonzero(deviations > thresholds):
+                i = int(j) + window_size
+                anomalies.append({
+                    "index": i,
+                    "value": float(current_values[j]),
+                    "expected": float(moving_avgs[j]),
+                    "deviation": float(deviations[j]),
+                    "threshold": float(thresholds[j]),
+                    "timestamp": self._format_epoch(timestamps[i]),
+                    "severity": "high" if deviations[j] > 2 * thresholds[j] else "medium"
+                })
             
             return anomalies
             
@@ -847,7 +1592,7 @@ class SupremeRealTimeProcessor(BaseSupremeEngine):
             self.logger.error(f"Error detecting moving average anomalies: {e}")
             return []
     
-    async def _detect_percentile_anomalies(self, values: List[float], data_points: List[Dict], sensitivity: float) -> List[Dict[str, Any]]:
+    async def _detect_percentile_anomalies(self, values: np.ndarray, timestamps: np.ndarray, sensitivity: float) -> List[Dict[str, Any]]:
         """Detect anomalies using percentile-based method"""
         try:
             # Calculate percentiles
@@ -860,16 +1605,16 @@ class SupremeRealTimeProcessor(BaseSupremeEngine):
             upper_bound = p75 + sensitivity * iqr
             
             anomalies = []
-            for i, (value, data_point) in enumerate(zip(values, data_points)):
-                if value < lower_bound or value > upper_bound:
-                    anomalies.append({
-                        "index": i,
-                        "value": value,
-                        "lower_bound": lower_bound,
-                        "upper_bound": upper_bound,
-                        "timestamp": data_point.get("timestamp"),
-                        "severity": "high" if value < lower_bound - iqr or value > upper_bound + iqr else "medium"
-                    })
+            for i in np.flatnonzero((values < lower_bound) | (values > upper_bound)):
+                value = float(values[i])
+                anomalies.append({
+                    "index": int(i),
+                    "value": value,
+                    "lower_bound": float(lower_bound),
+                    "upper_bound": float(upper_bound),
+                    "timestamp": self._format_epoch(timestamps[i]),
+                    "severity": "high" if value < lower_bound - iqr or value > upper_bound + iqr else "medium"
+                })
             
             return anomalies
             
@@ -946,6 +1691,10 @@ class SupremeRealTimeProcessor(BaseSupremeEngine):
                     if window.end_time > cutoff_time
                 ]
             
+            # Compact the segment log once enough segments have accumulated
+            if self.segment_store.needs_compaction():
+                await self._compact_stream_data()
+            
         except Exception as e:
             self.logger.error(f"Error cleaning up old data: {e}")
     
@@ -0,0 +1,229 @@
+"""
+Supreme Service Connections
+Pooled, rate-limited HTTP sessions for integration services.
+"""
+
+import asyncio
+import aiohttp
+import base64
+import json
+import time
+from collections import defaultdict, deque
+from email.utils import parsedate_to_datetime
+from typing import Dict, Any, Optional, Tuple
+from datetime import datetime, timezone
+
+
+class TokenBucket:
+    """Async token bucket refilling at `rate` requests per second; rate None means unlimited"""
+    
+    def __init__(self, rate: Optional[float] = None, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity or max(1.0, rate or 1.0)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self) -> float:
+        """Wait for a token (first come, first served) and return the seconds waited"""
+        waited = 0.0
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self.blocked_until:
+                    delay = self.blocked_until - now
+                elif self.rate is None:
+                    return waited
+                else:
+                    self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                    self.updated = now
+                    if self.tokens >= 1:
+                        self.tokens -= 1
+                        return waited
+                    delay = (1 - self.tokens) / self.rate
+                await asyncio.sleep(delay)
+                waited += delay
+    
+    def block_for(self, seconds: float):
+        """Hold every caller back, e.g. for a server's Retry-After"""
+        self.blocked_until = max(self.blocked_until, time.monotonic() + seconds)
+        self.tokens = 0.0
+        self.updated = self.blocked_until
+
+
+class ServiceConnectionPool:
+    """
+    Shared HTTP connection management for integration services.
+    
+    Keeps one keep-alive aiohttp session per service with bounded, DNS-cached
+    connectors, precomputes each connection's auth headers, applies a per-service
+    token-bucket rate limit and retries 429/503 responses after Retry-After.
+    """
+    
+    RETRY_STATUSES = (429, 503)
+    
+    def __init__(self, limit: int = 100, limit_per_host: int = 20, keepalive_timeout: float = 30.0,
+                 dns_cache_ttl: int = 300, max_retries: int = 3, retry_backoff: float = 0.5,
+                 max_retry_after: float = 60.0):
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.dns_cache_ttl = dns_cache_ttl
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.max_retry_after = max_retry_after
+        
+        self.sessions: Dict[str, aiohttp.ClientSession] = {}
+        self.auth_headers: Dict[str, Tuple[Tuple[str, str], Dict[str, str]]] = {}
+        self.rate_limiters: Dict[str, TokenBucket] = {}
+        self.latencies: Dict[str, deque] = defaultdict(lambda: deque(maxlen=1000))
+        self.counters: Dict[str, Dict[str, float]] = defaultdict(lambda: {
+            "requests": 0, "retries": 0, "throttled": 0, "errors": 0,
+            "in_flight": 0, "peak_in_flight": 0, "rate_limit_wait": 0.0
+        })
+    
+    def session_for(self, service_id: str) -> aiohttp.ClientSession:
+        """Return the service's pooled session, creating it on first use"""
+        session = self.sessions.get(service_id)
+        if session is None or session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                keepalive_timeout=self.keepalive_timeout,
+                use_dns_cache=True,
+                ttl_dns_cache=self.dns_cache_ttl,
+                enable_cleanup_closed=True
+            )
+            session = aiohttp.ClientSession(connector=connector)
+            self.sessions[service_id] = session
+        return session
+    
+    def headers_for(self, connection: Any) -> Dict[str, str]:
+        """Static and auth headers for a connection, rebuilt only when its auth settings change"""
+        service_id = connection.config.service_id
+        config = connection.config
+        auth_type = getattr(config.auth_type, "value", config.auth_type)
+        cache_key = (connection.connection_id, json.dumps(
+            [auth_type, config.auth_config, config.headers], sort_keys=True, default=str
+        ))
+        cached = self.auth_headers.get(service_id)
+        if cached and cached[0] == cache_key:
+            return cached[1]
+        
+        headers = dict(config.headers or {})
+        if auth_type == "bearer_token":
+            token = config.auth_config.get("token")
+            if token:
+                headers["Authorization"] = f"Bearer {token}"
+        elif auth_type == "api_key":
+            api_key = config.auth_config.get("api_key")
+            if api_key:
+                headers["X-API-Key"] = api_key
+        elif auth_type == "basic_auth":
+            username = config.auth_config.get("username")
+            password = config.auth_config.get("password")
+            if username and password:
+                credentials = base64.b64encode(f"{username}:{password}".encode()).decode()
+                headers["Authorization"] = f"Basic {credentials}"
+        
+        self.auth_headers[service_id] = (cache_key, headers)
+        return headers
+    
+    def limiter_for(self, connection: Any) -> TokenBucket:
+        """Per-service rate limiter; the config's rate_limit is requests per minute"""
+        service_id = connection.config.service_id
+        limiter = self.rate_limiters.get(service_id)
+        if limiter is None:
+            rate_limit = getattr(connection.config, "rate_limit", None)
+            limiter = TokenBucket(rate=rate_limit / 60.0 if rate_limit else None)
+            self.rate_limiters[service_id] = limiter
+        return limiter
+    
+    def _retry_delay(self, headers: Dict[str, str], attempt: int) -> float:
+        """Seconds to wait before retrying, from Retry-After or exponential backoff"""
+        retry_after = headers.get("Retry-After")
+        delay = None
+        if retry_after:
+            try:
+                delay = float(retry_after)
+            except ValueError:
+                try:
+                    delay = (parsedate_to_datetime(retry_after) - datetime.now(timezone.utc)).total_seconds()
+                except (TypeError, ValueError):
+                    delay = None
+        if delay is None:
+            delay = self.retry_backoff * (2 ** attempt)
+        return min(max(delay, 0.0), self.max_retry_after)
+    
+    async def request(self, connection: Any, method: str, url: str,
+                      headers: Optional[Dict[str, str]] = None, json_data: Any = None,
+                      timeout: Optional[float] = None) -> Tuple[int, Dict[str, str], Any]:
+        """Send a rate-limited request with throttling-aware retries"""
+        service_id = connection.config.service_id
+        session = self.session_for(service_id)
+        limiter = self.limiter_for(connection)
+        counters = self.counters[service_id]
+        request_headers = self.headers_for(connection)
+        if headers:
+            request_headers = {**request_headers, **headers}
+        client_timeout = aiohttp.ClientTimeout(total=timeout or connection.config.timeout)
+        
+        for attempt in range(self.max_retries + 1):
+            counters["rate_limit_wait"] += await limiter.acquire()
+            counters["requests"] += 1
+            counters["in_flight"] += 1
+            counters["peak_in_flight"] = max(counters["peak_in_flight"], counters["in_flight"])
+            start_time = time.perf_counter()
+            try:
+                async with session.request(method, url, headers=request_headers, json=json_data,
+                                           timeout=client_timeout) as response:
+                    body = await response.text()
+                    status = response.status
+                    response_headers = dict(response.headers)
+            except Exception:
+                counters["errors"] += 1
+                raise
+            finally:
+                counters["in_flight"] -= 1
+                self.latencies[service_id].append(time.perf_counter() - start_time)
+            
+            if status in self.RETRY_STATUSES and attempt < self.max_retries:
+                counters["retries"] += 1
+                if status == 429:
+                    counters["throttled"] += 1
+                limiter.block_for(self._retry_delay(response_headers, attempt))
+                continue
+            
+            try:
+                data = json.loads(body) if body else None
+            except ValueError:
+                data = body
+            return status, response_headers, data
+    
+    async def close(self, service_id: Optional[str] = None):
+        """Close one service's session, or all of them"""
+        service_ids = [service_id] if service_id else list(self.sessions)
+        for sid in service_ids:
+            session = self.sessions.pop(sid, None)
+            self.auth_headers.pop(sid, None)
+            if session and not session.closed:
+                await session.close()
+    
+    def get_statistics(self) -> Dict[str, Any]:
+        """Pool utilization and latency per service"""
+        services = {}
+        for service_id, counters in self.counters.items():
+            latencies = sorted(self.latencies[service_id])
+            services[service_id] = {
+                **counters,
+                "utilization": counters["in_flight"] / self.limit_per_host,
+                "p50_latency": latencies[len(latencies) // 2] if latencies else 0.0,
+                "p95_latency": latencies[int(len(latencies) * 0.95)] if latencies else 0.0
+            }
+        return {
+            "open_sessions": len([s for s in self.sessions.values() if not s.closed]),
+            "connection_limit": self.limit,
+            "connection_limit_per_host": self.limit_per_host,
+            "services": services
+        }
@@ -267,37 +267,28 @@ class TranslatorHelpers:
         """Check translation memory for existing translations"""
         try:
             # Look for exact matches first
-            for entry in self.translation_memory:
-                if (entry.source_text == text and 
-                    entry.source_language == source_lang and 
-                    entry.target_language == target_lang and
-                    entry.domain.value == domain):
-                    
-                    # Update usage count
-                    entry.usage_count += 1
-                    
-                    return {
-                        "translation": entry.target_text,
-                        "quality_score": entry.quality_score,
-                        "usage_count": entry.usage_count
-                    }
+            entry = self.translation_memory.find_exact(text, source_lang, target_lang, domain)
+            if entry is not None:
+                # Update usage count
+                entry.usage_count += 1
+                
+                return {
+                    "translation": entry.target_text,
+                    "quality_score": entry.quality_score,
+                    "usage_count": entry.usage_count
+                }
             
-            # Look for fuzzy matches (similar text)
-            for entry in self.translation_memory:
-                if (entry.source_language == source_lang and 
-                    entry.target_language == target_lang and
-                    entry.domain.value == domain):
-                    
-                    # Simple similarity check
-                    similarity = self._calculate_text_similarity(text, entry.source_text)
-                    if similarity > 0.9:  # Very high similarity threshold
-                        entry.usage_count += 1
-                        return {
-                            "translation": entry.target_text,
-                            "quality_score": entry.quality_score * similarity,  # Reduce quality for fuzzy match
-                            "usage_count": entry.usage_count,
-                            "similarity": similarity
-                        }
+            # Look for fuzzy matches (similar text) among indexed candidates
+            match = self.translation_memory.find_similar(text, source_lang, target_lang, domain)
+            if match is not None:
+                entry, similarity = match
+                entry.usage_count += 1
+                return {
+                    "translation": entry.target_text,
+                    "quality_score": entry.quality_score * similarity,  # Reduce quality for fuzzy match
+                    "usage_count": entry.usage_count,
+                    "similarity": similarity
+                }
             
             return None
             
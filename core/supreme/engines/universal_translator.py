@@ -12,7 +12,10 @@ from enum import Enum
 from datetime import datetime
 import os
 import hashlib
+import math
 import re
+import zlib
+from collections import OrderedDict, defaultdict
 
 from ..base_supreme_engine import BaseSupremeEngine, SupremeRequest, SupremeResponse
 
@@ -48,6 +51,131 @@ class TranslationMemory:
         if self.created_at is None:
             self.created_at = datetime.now()
 
+class TranslationMemoryIndex:
+    """
+    Bounded translation memory indexed per (source_language, target_language, domain).
+    Exact matches come from a hash map of source texts. Fuzzy candidates come
+    from an inverted word index with prefix filtering, which finds every entry
+    whose word-set Jaccard similarity reaches the threshold without scanning
+    the memory. Behaves like a list of TranslationMemory entries in insertion
+    order, dropping the oldest once max_entries is reached.
+    """
+    
+    def __init__(self, max_entries: int = 10000, fuzzy_threshold: float = 0.9):
+        self.max_entries = max_entries
+        self.fuzzy_threshold = fuzzy_threshold
+        self._entries: "OrderedDict[int, TranslationMemory]" = OrderedDict()
+        self._tokens: Dict[int, frozenset] = {}
+        self._exact: Dict[Tuple[str, str, str], Dict[str, int]] = defaultdict(dict)
+        self._postings: Dict[Tuple[str, str, str], Dict[str, set]] = defaultdict(lambda: defaultdict(set))
+        self._next_id = 0
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def __iter__(self):
+        return iter(list(self._entries.values()))
+    
+    def __getitem__(self, index):
+        return list(self._entries.values())[index]
+    
+    def __bool__(self) -> bool:
+        return bool(self._entries)
+    
+    def append(self, entry: TranslationMemory):
+        """Add an entry, evicting the oldest beyond max_entries"""
+        entry_id = self._next_id
+        self._next_id += 1
+        key = self._key(entry.source_language, entry.target_language, entry.domain.value)
+        tokens = self._tokenize(entry.source_text)
+        
+        self._entries[entry_id] = entry
+        self._tokens[entry_id] = tokens
+        self._exact[key][entry.source_text] = entry_id
+        for token in self._prefix(tokens):
+            self._postings[key][token].add(entry_id)
+        
+        while len(self._entries) > self.max_entries:
+            self._remove(next(iter(self._entries)))
+    
+    def extend(self, entries: List[TranslationMemory]):
+        for entry in entries:
+            self.append(entry)
+    
+    def find_exact(self, text: str, source_lang: str, target_lang: str, domain: str) -> Optional[TranslationMemory]:
+        """Look up an entry with exactly this source text"""
+        entry_id = self._exact.get(self._key(source_lang, target_lang, domain), {}).get(text)
+        return self._entries[entry_id] if entry_id is not None else None
+    
+    def find_similar(self, text: str, source_lang: str, target_lang: str,
+                     domain: str) -> Optional[Tuple[TranslationMemory, float]]:
+        """Find the most similar entry whose word-set Jaccard similarity exceeds fuzzy_threshold"""
+        threshold = self.fuzzy_threshold
+        key = self._key(source_lang, target_lang, domain)
+        postings = self._postings.get(key)
+        if not postings:
+            return None
+        
+        tokens = self._tokenize(text)
+        candidates = set()
+        for token in self._prefix(tokens):
+            candidates.update(postings.get(token, ()))
+        
+        # Length filter: Jaccard >= t implies t*|A| <= |B| <= |A|/t
+        low, high = threshold * len(tokens), len(tokens) / threshold
+        best_id, best_similarity = None, threshold
+        for entry_id in sorted(candidates):
+            candidate_tokens = self._tokens[entry_id]
+            if not low <= len(candidate_tokens) <= high:
+                continue
+            similarity = self._jaccard(tokens, candidate_tokens)
+            if similarity > best_similarity:
+                best_id, best_similarity = entry_id, similarity
+        
+        if best_id is None:
+            return None
+        return self._entries[best_id], best_similarity
+    
+    def _remove(self, entry_id: int):
+        """Drop an entry from the store and its indexes"""
+        entry = self._entries.pop(entry_id)
+        tokens = self._tokens.pop(entry_id)
+        key = self._key(entry.source_language, entry.target_language, entry.domain.value)
+        if self._exact[key].get(entry.source_text) == entry_id:
+            del self._exact[key][entry.source_text]
+        postings = self._postings[key]
+        for token in self._prefix(tokens):
+            postings[token].discard(entry_id)
+            if not postings[token]:
+                del postings[token]
+    
+    def _prefix(self, tokens: frozenset) -> List[str]:
+        """
+        Prefix filter tokens: under a fixed global token order, two sets with
+        Jaccard >= t always share a token among the first |S| - ceil(t|S|) + 1
+        tokens of each.
+        """
+        if not tokens:
+            return [""]
+        ordered = sorted(tokens, key=lambda token: (zlib.crc32(token.encode()), token))
+        return ordered[:len(ordered) - math.ceil(self.fuzzy_threshold * len(ordered)) + 1]
+    
+    @staticmethod
+    def _key(source_lang: str, target_lang: str, domain: str) -> Tuple[str, str, str]:
+        return (source_lang, target_lang, domain)
+    
+    @staticmethod
+    def _tokenize(text: str) -> frozenset:
+        return frozenset(text.lower().split())
+    
+    @staticmethod
+    def _jaccard(tokens1: frozenset, tokens2: frozenset) -> float:
+        if not tokens1 and not tokens2:
+            return 1.0
+        if not tokens1 or not tokens2:
+            return 0.0
+        return len(tokens1 & tokens2) / len(tokens1 | tokens2)
+
 @dataclass
 class LanguagePair:
     """Language pair configuration"""
@@ -78,7 +206,7 @@ class SupremeUniversalTranslator(BaseSupremeEngine):
         super().__init__(engine_name, config)
         
         # Translation storage
-        self.translation_memory: List[TranslationMemory] = []
+        self.translation_memory = TranslationMemoryIndex(max_entries=10000)
         self.language_pairs: Dict[str, LanguagePair] = {}
         self.localization_rules: Dict[str, LocalizationRule] = {}
         
@@ -102,6 +230,10 @@ class SupremeUniversalTranslator(BaseSupremeEngine):
         # Built-in localization rules
         self.builtin_localization_rules = self._initialize_localization_rules()
         
+        # Batch translation
+        self.batch_max_concurrency = 32
+        self.batch_detection_confidence = 0.5
+        
         # Data persistence
         self.data_dir = "data/translation"
         os.makedirs(self.data_dir, exist_ok=True)
@@ -237,14 +369,61 @@ class SupremeUniversalTranslator(BaseSupremeEngine):
             target_language = parameters.get("target_language")
             domain = parameters.get("domain", "general")
             quality_level = parameters.get("quality_level", "good")
+            max_concurrency = parameters.get("max_concurrency", self.batch_max_concurrency)
             
             if not texts or not target_language:
                 return {"error": "texts and target_language are required", "operation": "batch_translate"}
             
             start_time = datetime.now()
-            translation_results = []
             
-            # Process each text
+            # Deduplicate: each distinct non-blank text is translated once
+            unique_texts = list(dict.fromkeys(text for text in texts if text.strip()))
+            
+            # Detect each distinct text's language, so mixed-language batches are not forced to one source
+            semaphore = asyncio.Semaphore(max(1, max_concurrency))
+            text_languages = {text: source_language for text in unique_texts}
+            if source_language == "auto":
+                async def detect(text: str) -> Dict[str, Any]:
+                    async with semaphore:
+                        return await self._detect_language({"text": text})
+                
+                detections = await asyncio.gather(*[detect(text) for text in unique_texts])
+                for text, detection_result in zip(unique_texts, detections):
+                    if detection_result.get("confidence", 0.0) >= self.batch_detection_confidence:
+                        text_languages[text] = detection_result["detected_language"]
+            
+            # Resolve translation memory hits before fanning out
+            translated: Dict[str, Dict[str, Any]] = {}
+            memory_hits = 0
+            for text in unique_texts:
+                if text_languages[text] == "auto":
+                    continue
+                memory_result = await self._check_translation_memory(text, text_languages[text], target_language, domain)
+                if memory_result:
+                    memory_hits += 1
+                    translated[text] = {
+                        "translated_text": memory_result["translation"],
+                        "quality_score": memory_result["quality_score"],
+                        "source_language": text_languages[text]
+                    }
+            
+            # Translate the remaining texts concurrently
+            async def translate(text: str) -> Dict[str, Any]:
+                async with semaphore:
+                    return await self._translate_text({
+                        "text": text,
+                        "source_language": text_languages[text],
+                        "target_language": target_language,
+                        "domain": domain,
+                        "quality_level": quality_level
+                    })
+            
+            pending = [text for text in unique_texts if text not in translated]
+            for text, translation_result in zip(pending, await asyncio.gather(*[translate(text) for text in pending])):
+                translated[text] = translation_result
+            
+            # Assemble results in input order
+            translation_results = []
             for i, text in enumerate(texts):
                 if not text.strip():
                     translation_results.append({
@@ -257,23 +436,13 @@ class SupremeUniversalTranslator(BaseSupremeEngine):
                     })
                     continue
                 
-                # Translate individual text
-                translate_params = {
-                    "text": text,
-                    "source_language": source_language,
-                    "target_language": target_language,
-                    "domain": domain,
-                    "quality_level": quality_level
-                }
-                
-                translation_result = await self._translate_text(translate_params)
-                
+                translation_result = translated[text]
                 translation_results.append({
                     "index": i,
                     "original_text": text,
                     "translated_text": translation_result.get("translated_text", text),
                     "quality_score": translation_result.get("quality_score", 0.5),
-                    "source_language": translation_result.get("source_language", source_language),
+                    "source_language": translation_result.get("source_language", text_languages[text]),
                     "target_language": target_language,
                     "error": translation_result.get("error")
                 })
@@ -287,6 +456,10 @@ class SupremeUniversalTranslator(BaseSupremeEngine):
             result = {
                 "operation": "batch_translate",
                 "total_texts": len(texts),
+                "unique_texts": len(unique_texts),
+                "translation_memory_hits": memory_hits,
+                "source_language": source_language,
+                "detected_languages": sorted(set(text_languages.values())),
                 "successful_translations": successful_translations,
                 "failed_translations": len(texts) - successful_translations,
                 "average_quality_score": average_quality,
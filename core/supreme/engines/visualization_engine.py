@@ -16,6 +16,7 @@ import os
 import hashlib
 
 from ..base_supreme_engine import BaseSupremeEngine, SupremeRequest, SupremeResponse
+from .data_source_loader import get_shared_loader
 
 class ChartType(Enum):
     LINE = "line"
@@ -117,6 +118,9 @@ class SupremeVisualizationEngine(BaseSupremeEngine):
         # Chart type recommendations
         self.chart_recommendations = self._initialize_chart_recommendations()
         
+        # Shared columnar loader and frame cache for data sources
+        self.data_loader = get_shared_loader()
+        
         # Data persistence
         self.data_dir = "data/visualizations"
         os.makedirs(self.data_dir, exist_ok=True)
@@ -178,12 +182,17 @@ class SupremeVisualizationEngine(BaseSupremeEngine):
             color_by = parameters.get("color_by")
             theme = parameters.get("theme", "light")
             
-            if not data_source and not data:
+            if not data_source and data is None:
                 return {"error": "data_source or data is required", "operation": "create_visualization"}
             
-            # Load data if needed
-            if data_source and not data:
-                data = await self._load_data_from_source(data_source)
+            # Load data if needed, reading only the plotted columns when they are known
+            if data_source and data is None:
+                columns = parameters.get("columns")
+                if columns is None and x_axis and y_axis:
+                    columns = list(dict.fromkeys(c for c in (x_axis, y_axis, color_by) if c))
+                data = await self._load_data_from_source(
+                    data_source, columns=columns, filters=parameters.get("filters")
+                )
             
             # Convert to DataFrame
             if isinstance(data, list):
@@ -312,12 +321,14 @@ class SupremeVisualizationEngine(BaseSupremeEngine):
             data = parameters.get("data")
             max_visualizations = parameters.get("max_visualizations", 5)
             
-            if not data_source and not data:
+            if not data_source and data is None:
                 return {"error": "data_source or data is required", "operation": "auto_visualize"}
             
             # Load data if needed
-            if data_source and not data:
-                data = await self._load_data_from_source(data_source)
+            if data_source and data is None:
+                data = await self._load_data_from_source(
+                    data_source, columns=parameters.get("columns"), filters=parameters.get("filters")
+                )
             
             # Convert to DataFrame
             if isinstance(data, list):
@@ -393,9 +404,14 @@ class SupremeVisualizationEngine(BaseSupremeEngine):
                 viz_config.theme = VisualizationTheme(updates["theme"])
             
             # Regenerate chart data if needed
+            data = None
             if any(key in updates for key in ["chart_type", "x_axis", "y_axis", "color_by"]):
-                # Load original data and regenerate
-                data = await self._load_data_from_source(viz_config.data_source)
+                # Reload the original source, or use data passed with the update
+                data = parameters.get("data")
+                if data is None and viz_config.data_source != "provided_data":
+                    data = await self._load_data_from_source(viz_config.data_source)
+            
+            if data is not None:
                 if isinstance(data, list):
                     df = pd.DataFrame(data)
                 else:
@@ -458,12 +474,14 @@ class SupremeVisualizationEngine(BaseSupremeEngine):
             data = parameters.get("data")
             max_suggestions = parameters.get("max_suggestions", 10)
             
-            if not data_source and not data:
+            if not data_source and data is None:
                 return {"error": "data_source or data is required", "operation": "suggest_visualizations"}
             
             # Load data if needed
-            if data_source and not data:
-                data = await self._load_data_from_source(data_source)
+            if data_source and data is None:
+                data = await self._load_data_from_source(
+                    data_source, columns=parameters.get("columns"), filters=parameters.get("filters")
+                )
             
             # Convert to DataFrame
             if isinstance(data, list):
@@ -567,7 +585,8 @@ class SupremeVisualizationEngine(BaseSupremeEngine):
                 "visualizations_by_type": viz_by_type,
                 "recent_visualizations": recent_viz,
                 "supported_chart_types": [chart_type.value for chart_type in ChartType],
-                "supported_themes": [theme.value for theme in VisualizationTheme]
+                "supported_themes": [theme.value for theme in VisualizationTheme],
+                "data_source_cache": self.data_loader.get_statistics()
             }
             
             return result
@@ -690,17 +709,10 @@ class SupremeVisualizationEngine(BaseSupremeEngine):
         timestamp = datetime.now().isoformat()
         return hashlib.md5(f"{name}_{timestamp}".encode()).hexdigest()[:16]
     
-    async def _load_data_from_source(self, data_source: str) -> pd.DataFrame:
-        """Load data from various sources"""
-        # This would implement actual data loading logic
-        # For now, return mock data
-        return pd.DataFrame([
-            {"x": 1, "y": 10, "category": "A", "timestamp": "2024-01-01"},
-            {"x": 2, "y": 15, "category": "B", "timestamp": "2024-01-02"},
-            {"x": 3, "y": 12, "category": "A", "timestamp": "2024-01-03"},
-            {"x": 4, "y": 18, "category": "B", "timestamp": "2024-01-04"},
-            {"x": 5, "y": 14, "category": "A", "timestamp": "2024-01-05"}
-        ])
+    async def _load_data_from_source(self, data_source: str, columns: Optional[List[str]] = None,
+                                     filters: Optional[List[Tuple[str, str, Any]]] = None) -> pd.DataFrame:
+        """Load a CSV, Parquet or JSONL data source through the shared frame cache"""
+        return await self.data_loader.load_async(data_source, columns=columns, filters=filters)
     
     async def _auto_select_chart_type(self, df: pd.DataFrame, x_axis: str = None, y_axis: str = None) -> str:
         """Automatically select the best chart type for the data"""
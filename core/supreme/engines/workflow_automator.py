@@ -13,9 +13,11 @@ from enum import Enum
 from datetime import datetime, timedelta
 import os
 import re
+import functools
 from urllib.parse import urlparse
 
 from ..base_supreme_engine import BaseSupremeEngine, SupremeRequest, SupremeResponse
+from .job_scheduler import JobScheduler
 
 class WorkflowTriggerType(Enum):
     MANUAL = "manual"
@@ -173,6 +175,7 @@ class SupremeWorkflowAutomator(BaseSupremeEngine):
         # Execution scheduler
         self.scheduler_running = False
         self.scheduled_workflows: Dict[str, Dict[str, Any]] = {}
+        self.workflow_scheduler = JobScheduler(logger=self.logger)
     
     async def _initialize_engine(self) -> bool:
         """Initialize the supreme workflow automator"""
@@ -183,8 +186,10 @@ class SupremeWorkflowAutomator(BaseSupremeEngine):
             await self._load_workflow_data()
             
             # Start workflow scheduler
+            for schedule in self.scheduled_workflows.values():
+                self._register_workflow_schedule(schedule)
             if self.config.auto_scaling:
-                asyncio.create_task(self._run_workflow_scheduler())
+                asyncio.create_task(self.workflow_scheduler.run())
                 self.scheduler_running = True
             
             # Start opportunity discovery
@@ -425,6 +430,7 @@ class SupremeWorkflowAutomator(BaseSupremeEngine):
             
             # Store schedule
             self.scheduled_workflows[schedule_id] = schedule_info
+            self._register_workflow_schedule(schedule_info)
             
             result = {
                 "operation": "schedule_workflow",
@@ -445,6 +451,36 @@ class SupremeWorkflowAutomator(BaseSupremeEngine):
             self.logger.error(f"Error scheduling workflow: {e}")
             return {"error": str(e), "operation": "schedule_workflow"}
     
+    def _register_workflow_schedule(self, schedule: Dict[str, Any]):
+        """Add a schedule to the job scheduler"""
+        if not schedule["enabled"]:
+            self.workflow_scheduler.remove_job(schedule["schedule_id"])
+            return
+        
+        try:
+            self.workflow_scheduler.add_job(
+                schedule["schedule_id"],
+                functools.partial(self._run_scheduled_workflow, schedule["schedule_id"]),
+                schedule["schedule_type"],
+                schedule["schedule_config"],
+                last_executed=schedule["last_executed"]
+            )
+        except ValueError as e:
+            self.logger.error(f"Invalid schedule {schedule['schedule_id']}: {e}")
+    
+    async def _run_scheduled_workflow(self, schedule_id: str):
+        """Execute the workflow behind a due schedule"""
+        schedule = self.scheduled_workflows.get(schedule_id)
+        if not schedule or not schedule["enabled"] or schedule["workflow_id"] not in self.workflow_definitions:
+            return
+        
+        schedule["last_executed"] = datetime.now()
+        schedule["execution_count"] += 1
+        await self._execute_workflow({
+            "workflow_id": schedule["workflow_id"],
+            "trigger_data": {"scheduled": True, "schedule_id": schedule_id}
+        })
+    
     async def _monitor_workflows(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
         """Monitor workflow executions and performance"""
         try:
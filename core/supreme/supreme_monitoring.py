@@ -6,7 +6,7 @@ Continuous monitoring, analytics, and optimization for all supreme capabilities
 import logging
 import asyncio
 import time
-from typing import Dict, List, Any, Optional, Union, Callable
+from typing import Dict, List, Any, Optional, Union, Callable, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
@@ -14,6 +14,8 @@ import json
 import statistics
 from collections import deque
 
+import numpy as np
+
 from .supreme_control_interface import SupremeControlInterface, CommandType, SupremeCommand
 from .supreme_orchestrator import EngineType
 
@@ -84,15 +86,215 @@ class HealthCheck:
     error_message: Optional[str] = None
 
 
+# Rollup resolutions in seconds, finest first
+ROLLUP_RESOLUTIONS = {"1m": 60.0, "1h": 3600.0}
+
+DEFAULT_RETENTION = {
+    "raw": timedelta(hours=6),
+    "1m": timedelta(days=7),
+    "1h": timedelta(days=90)
+}
+
+# Rollup row layout: bucket start, count, mean, sum of squared deviations, min, max
+ROLLUP_COLUMNS = 6
+
+
+class TimeSeriesBuffer:
+    """
+    Time-ordered rows of float64 columns in a growable NumPy array.
+
+    Column 0 is the epoch timestamp. Rows older than the retention window
+    (relative to the newest row) are dropped when the buffer fills up, and
+    max_rows bounds the buffer regardless of age. At max_rows the oldest
+    eighth is evicted in one shift, so appends stay O(1) amortized.
+    """
+
+    EVICTION_FRACTION = 0.125
+
+    def __init__(self, columns: int, retention: timedelta, max_rows: Optional[int] = None,
+                 initial_capacity: int = 64):
+        self.retention = retention.total_seconds()
+        self.max_rows = max_rows
+        self._data = np.empty((initial_capacity, columns), dtype=np.float64)
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def rows(self) -> np.ndarray:
+        return self._data[:self._size]
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        return self._data[:self._size, 0]
+
+    def _drop_oldest(self, count: int):
+        """Shift out the first count rows"""
+        if count <= 0:
+            return
+        self._data[:self._size - count] = self._data[count:self._size]
+        self._size -= count
+
+    def _reserve(self):
+        """Make room for one more row: expire, then evict, then grow"""
+        if self._size < len(self._data):
+            return
+        newest = self._data[self._size - 1, 0]
+        self._drop_oldest(int(np.searchsorted(self.timestamps, newest - self.retention, side="left")))
+        if self.max_rows is not None and self._size >= self.max_rows:
+            batch = max(1, int(self.max_rows * self.EVICTION_FRACTION))
+            self._drop_oldest(self._size - self.max_rows + batch)
+        if self._size == len(self._data):
+            capacity = len(self._data) * 2
+            if self.max_rows is not None:
+                capacity = min(capacity, self.max_rows)
+            grown = np.empty((capacity, self._data.shape[1]), dtype=np.float64)
+            grown[:self._size] = self._data[:self._size]
+            self._data = grown
+
+    def insert(self, row) -> int:
+        """Insert a row in timestamp order and return its index"""
+        self._reserve()
+        if self._size == 0 or row[0] >= self._data[self._size - 1, 0]:
+            index = self._size
+        else:
+            # Late sample: shift newer rows up by one
+            index = int(np.searchsorted(self.timestamps, row[0], side="right"))
+            self._data[index + 1:self._size + 1] = self._data[index:self._size]
+        self._data[index] = row
+        self._size += 1
+        return index
+
+    def find(self, timestamp: float) -> int:
+        """Index of the row with exactly this timestamp, or -1"""
+        if self._size and self._data[self._size - 1, 0] == timestamp:
+            return self._size - 1
+        index = int(np.searchsorted(self.timestamps, timestamp, side="left"))
+        if index < self._size and self._data[index, 0] == timestamp:
+            return index
+        return -1
+
+    def range(self, start: Optional[float] = None, end: Optional[float] = None) -> np.ndarray:
+        """Rows with start <= timestamp <= end, found by binary search"""
+        timestamps = self.timestamps
+        low = 0 if start is None else int(np.searchsorted(timestamps, start, side="left"))
+        high = self._size if end is None else int(np.searchsorted(timestamps, end, side="right"))
+        return self._data[low:high]
+
+
+class MetricTimeSeries:
+    """Raw (timestamp, value) samples for one metric plus 1-minute and 1-hour rollups"""
+
+    def __init__(self, retention: Dict[str, timedelta], max_raw_points: int):
+        self.raw = TimeSeriesBuffer(2, retention["raw"], max_raw_points)
+        self.rollups = {
+            name: TimeSeriesBuffer(ROLLUP_COLUMNS, retention[name]) for name in ROLLUP_RESOLUTIONS
+        }
+        self.first_timestamp: Optional[float] = None
+
+    def append(self, timestamp: float, value: float):
+        """Record a sample in the raw series and fold it into every rollup"""
+        self.raw.insert((timestamp, value))
+        if self.first_timestamp is None or timestamp < self.first_timestamp:
+            self.first_timestamp = timestamp
+
+        for name, resolution in ROLLUP_RESOLUTIONS.items():
+            buffer = self.rollups[name]
+            bucket = timestamp - timestamp % resolution
+            index = buffer.find(bucket)
+            if index < 0:
+                buffer.insert((bucket, 1.0, value, 0.0, value, value))
+                continue
+            # Welford update keeps mean and variance stable for large values
+            row = buffer.rows[index]
+            count = row[1] + 1.0
+            delta = value - row[2]
+            row[2] += delta / count
+            row[3] += delta * (value - row[2])
+            row[1] = count
+            row[4] = min(row[4], value)
+            row[5] = max(row[5], value)
+
+    def select(self, start: Optional[float] = None, resolution: str = "auto") -> Tuple[str, TimeSeriesBuffer]:
+        """Pick the finest resolution that still holds data back to start"""
+        if resolution == "raw":
+            return "raw", self.raw
+        if resolution in self.rollups:
+            return resolution, self.rollups[resolution]
+
+        if start is None or self.first_timestamp is None:
+            return "raw", self.raw
+        needed = max(start, self.first_timestamp)
+        if len(self.raw) and self.raw.timestamps[0] <= needed:
+            return "raw", self.raw
+        for name, bucket_size in ROLLUP_RESOLUTIONS.items():
+            buffer = self.rollups[name]
+            if len(buffer) and buffer.timestamps[0] <= needed - needed % bucket_size:
+                return name, buffer
+        coarsest = list(ROLLUP_RESOLUTIONS)[-1]
+        return coarsest, self.rollups[coarsest]
+
+    def statistics(self, start: Optional[float] = None, end: Optional[float] = None,
+                   resolution: str = "auto") -> Dict[str, Any]:
+        """
+        Summary statistics over a time range. Rollup resolutions count whole
+        buckets, so the bucket containing start is included in full.
+        """
+        name, buffer = self.select(start, resolution)
+        if name != "raw" and start is not None:
+            start -= start % ROLLUP_RESOLUTIONS[name]
+        rows = buffer.range(start, end)
+        if not len(rows):
+            return {}
+
+        if name == "raw":
+            values = rows[:, 1]
+            return {
+                "count": int(len(values)),
+                "mean": float(values.mean()),
+                "median": float(np.median(values)),
+                "min": float(values.min()),
+                "max": float(values.max()),
+                "std_dev": float(values.std(ddof=1)) if len(values) > 1 else 0.0,
+                "latest": float(values[-1]),
+                "resolution": name
+            }
+
+        # Merge per-bucket moments (Chan et al.); the median is the count-weighted median of bucket means
+        counts, means = rows[:, 1], rows[:, 2]
+        total = counts.sum()
+        mean = float((counts * means).sum() / total)
+        m2 = rows[:, 3].sum() + (counts * (means - mean) ** 2).sum()
+        order = np.argsort(means)
+        median_index = order[np.searchsorted(np.cumsum(counts[order]), total / 2.0)]
+        latest = means[-1]
+        if len(self.raw) and (end is None or self.raw.timestamps[-1] <= end):
+            latest = self.raw.rows[-1, 1]
+        return {
+            "count": int(total),
+            "mean": mean,
+            "median": float(means[median_index]),
+            "min": float(rows[:, 4].min()),
+            "max": float(rows[:, 5].max()),
+            "std_dev": float(np.sqrt(m2 / (total - 1))) if total > 1 else 0.0,
+            "latest": float(latest),
+            "resolution": name
+        }
+
+
 class MetricsCollector:
     """Collects and manages metrics from all supreme engines"""
-    
+
     def __init__(self):
-        self.metrics: Dict[str, deque] = {}  # Metric ID -> deque of recent values
+        self.metrics: Dict[str, deque] = {}  # Metric ID -> deque of recent Metric objects (with tags/metadata)
+        self.series: Dict[str, MetricTimeSeries] = {}  # Metric ID -> NumPy time series with rollups
         self.metric_definitions: Dict[str, Dict[str, Any]] = {}
         self.collection_intervals: Dict[str, float] = {}
-        self.max_metric_history = 1000  # Keep last 1000 values per metric
-    
+        self.max_metric_history = 1000  # Keep last 1000 Metric objects per metric
+        self.retention_policy: Dict[str, timedelta] = dict(DEFAULT_RETENTION)
+        self.max_raw_points = 100_000  # Raw samples per metric before the oldest are evicted
+
     def register_metric(self, metric_id: str, metric_type: MetricType, 
                        name: str, unit: str, collection_interval: float = 60.0):
         """Register a new metric for collection"""
@@ -104,6 +306,7 @@ class MetricsCollector:
         }
         self.collection_intervals[metric_id] = collection_interval
         self.metrics[metric_id] = deque(maxlen=self.max_metric_history)
+        self.series[metric_id] = MetricTimeSeries(self.retention_policy, self.max_raw_points)
         
         logger.info(f"Registered metric: {name} ({metric_id})")
     
@@ -119,10 +322,11 @@ class MetricsCollector:
             )
         
         self.metrics[metric.metric_id].append(metric)
+        self.series[metric.metric_id].append(metric.timestamp.timestamp(), float(metric.value))
     
     def get_metric_history(self, metric_id: str, 
                           time_range: Optional[timedelta] = None) -> List[Metric]:
-        """Get metric history for a specific metric"""
+        """Get the most recent Metric objects (with tags and metadata) for a specific metric"""
         if metric_id not in self.metrics:
             return []
         
@@ -134,25 +338,43 @@ class MetricsCollector:
         
         return metrics
     
+    def get_metric_series(self, metric_id: str, time_range: Optional[timedelta] = None,
+                          resolution: str = "auto") -> Dict[str, Any]:
+        """
+        Get (timestamp, value) arrays for a metric.
+
+        resolution is "raw", "1m", "1h" or "auto" (the finest one that still
+        covers time_range). Rollup values are bucket means, with per-bucket
+        count, min and max alongside.
+        """
+        series = self.series.get(metric_id)
+        if series is None:
+            return {"resolution": resolution, "timestamps": np.empty(0), "values": np.empty(0)}
+
+        start = time.time() - time_range.total_seconds() if time_range else None
+        name, buffer = series.select(start, resolution)
+        rows = buffer.range(start)
+        if name == "raw":
+            return {"resolution": name, "timestamps": rows[:, 0].copy(), "values": rows[:, 1].copy()}
+        return {
+            "resolution": name,
+            "timestamps": rows[:, 0].copy(),
+            "values": rows[:, 2].copy(),
+            "count": rows[:, 1].astype(np.int64),
+            "min": rows[:, 4].copy(),
+            "max": rows[:, 5].copy()
+        }
+
     def get_metric_statistics(self, metric_id: str, 
-                            time_range: Optional[timedelta] = None) -> Dict[str, float]:
+                            time_range: Optional[timedelta] = None,
+                            resolution: str = "auto") -> Dict[str, float]:
         """Get statistical summary of a metric"""
-        history = self.get_metric_history(metric_id, time_range)
-        
-        if not history:
+        series = self.series.get(metric_id)
+        if series is None:
             return {}
-        
-        values = [m.value for m in history]
-        
-        return {
-            "count": len(values),
-            "mean": statistics.mean(values),
-            "median": statistics.median(values),
-            "min": min(values),
-            "max": max(values),
-            "std_dev": statistics.stdev(values) if len(values) > 1 else 0.0,
-            "latest": values[-1] if values else 0.0
-        }
+
+        start = time.time() - time_range.total_seconds() if time_range else None
+        return series.statistics(start, resolution=resolution)
     
     def get_all_metrics_summary(self) -> Dict[str, Any]:
         """Get summary of all registered metrics"""
@@ -163,7 +385,7 @@ class MetricsCollector:
             summary[metric_id] = {
                 "definition": definition,
                 "recent_stats": stats,
-                "data_points": len(self.metrics.get(metric_id, []))
+                "data_points": len(self.series[metric_id].raw) if metric_id in self.series else 0
             }
         
         return summary
@@ -453,27 +675,18 @@ class PerformanceAnalyzer:
     def _analyze_metric_trend(self, metric_id: str) -> Dict[str, Any]:
         """Analyze trend for a specific metric"""
         try:
-            # Get recent data (last 24 hours)
-            recent_data = self.metrics_collector.get_metric_history(
-                metric_id, timedelta(hours=24)
-            )
+            # Get recent data (last 24 hours), downsampled when raw samples no longer cover it
+            series = self.metrics_collector.get_metric_series(metric_id, timedelta(hours=24))
+            values = series["values"]
+            timestamps = series["timestamps"]
             
-            if len(recent_data) < 2:
+            if len(values) < 2:
                 return {"trend": "insufficient_data", "confidence": 0.0}
             
-            # Calculate trend
-            values = [m.value for m in recent_data]
-            timestamps = [m.timestamp.timestamp() for m in recent_data]
-            
-            # Simple linear trend calculation
-            n = len(values)
-            sum_x = sum(timestamps)
-            sum_y = sum(values)
-            sum_xy = sum(x * y for x, y in zip(timestamps, values))
-            sum_x2 = sum(x * x for x in timestamps)
-            
-            # Calculate slope (trend direction)
-            slope = (n * sum_xy - sum_x * sum_y) / (n * sum_x2 - sum_x * sum_x)
+            # Least-squares slope (trend direction); centering avoids cancellation on epoch timestamps
+            x = timestamps - timestamps.mean()
+            denominator = float((x * x).sum())
+            slope = float((x * (values - values.mean())).sum()) / denominator if denominator else 0.0
             
             # Determine trend direction
             if abs(slope) < 0.001:
@@ -484,8 +697,8 @@ class PerformanceAnalyzer:
                 trend = "decreasing"
             
             # Calculate confidence based on data consistency
-            mean_value = statistics.mean(values)
-            std_dev = statistics.stdev(values) if len(values) > 1 else 0
+            mean_value = float(values.mean())
+            std_dev = float(values.std(ddof=1))
             confidence = max(0.0, min(1.0, 1.0 - (std_dev / mean_value) if mean_value != 0 else 0))
             
             return {
@@ -493,9 +706,10 @@ class PerformanceAnalyzer:
                 "slope": slope,
                 "confidence": confidence,
                 "data_points": len(values),
+                "resolution": series["resolution"],
                 "mean": mean_value,
                 "std_dev": std_dev,
-                "latest_value": values[-1] if values else 0
+                "latest_value": float(values[-1])
             }
             
         except Exception as e:
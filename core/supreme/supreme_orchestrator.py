@@ -5,13 +5,19 @@ Master coordination and communication system for all supreme engines
 
 import logging
 import asyncio
-from typing import Dict, List, Any, Optional, Union
+import functools
+import heapq
+import itertools
+import time
+from collections import OrderedDict, deque
+from typing import Dict, List, Any, Optional, Union, Callable, Tuple, Set
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
 import json
 
 from .base_supreme_engine import BaseSupremeEngine, SupremeRequest, SupremeResponse
+from .engines.dag_executor import DAGExecutor, DAGTask
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +41,7 @@ class OrchestrationStrategy(Enum):
     CONDITIONAL = "conditional"
     PRIORITY_BASED = "priority_based"
     ADAPTIVE = "adaptive"
+    DAG = "dag"
 
 
 class EngineStatus(Enum):
@@ -67,6 +74,8 @@ class OrchestrationRequest:
     priority: int
     timeout: Optional[timedelta] = None
     dependencies: List[str] = field(default_factory=list)
+    # For the DAG strategy: engine -> engines whose outputs it consumes
+    engine_dependencies: Dict[EngineType, List[EngineType]] = field(default_factory=dict)
     created_at: datetime = field(default_factory=datetime.now)
 
 
@@ -82,14 +91,263 @@ class OrchestrationResult:
     completed_at: datetime = field(default_factory=datetime.now)
 
 
+class ResultStore:
+    """Completed results kept for a limited time and up to a maximum count"""
+
+    def __init__(self, max_entries: int = 10000, ttl: float = 3600.0):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, OrchestrationResult]]" = OrderedDict()
+        self.expired = 0
+        self.evicted = 0
+
+    def _prune(self):
+        """Drop expired entries; insertion order is expiry order"""
+        cutoff = time.monotonic() - self.ttl
+        while self._entries:
+            stored_at = next(iter(self._entries.values()))[0]
+            if stored_at > cutoff:
+                break
+            self._entries.popitem(last=False)
+            self.expired += 1
+
+    def __setitem__(self, request_id: str, result: OrchestrationResult):
+        self._entries.pop(request_id, None)
+        self._entries[request_id] = (time.monotonic(), result)
+        self._prune()
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evicted += 1
+
+    def __getitem__(self, request_id: str) -> OrchestrationResult:
+        result = self.get(request_id)
+        if result is None:
+            raise KeyError(request_id)
+        return result
+
+    def __contains__(self, request_id: str) -> bool:
+        return self.get(request_id) is not None
+
+    def __len__(self) -> int:
+        self._prune()
+        return len(self._entries)
+
+    def get(self, request_id: str, default: Optional[OrchestrationResult] = None) -> Optional[OrchestrationResult]:
+        """Get a result unless it has expired"""
+        self._prune()
+        entry = self._entries.get(request_id)
+        return entry[1] if entry else default
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Size and pruning counters"""
+        return {
+            "stored": len(self),
+            "max_entries": self.max_entries,
+            "ttl": self.ttl,
+            "expired": self.expired,
+            "evicted": self.evicted
+        }
+
+
+class CoordinationEvent:
+    """One message or data-share event in the coordination history"""
+    __slots__ = ("event_type", "source", "target", "key", "timestamp")
+
+    def __init__(self, event_type: str, source: str, target: Optional[str] = None,
+                 key: Optional[str] = None, timestamp: Optional[float] = None):
+        self.event_type = event_type
+        self.source = source
+        self.target = target
+        self.key = key
+        self.timestamp = time.time() if timestamp is None else timestamp
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the dict form used in status reports"""
+        event = {"type": self.event_type, "source": self.source, "timestamp": self.timestamp}
+        if self.target is not None:
+            event["target"] = self.target
+        if self.key is not None:
+            event["key"] = self.key
+        return event
+
+
+class SharedDataEntry:
+    """A shared value with its source, version and expiry (epoch seconds)"""
+    __slots__ = ("data", "source", "version", "timestamp", "expires_at")
+
+    def __init__(self, data: Any, source: str, version: int, timestamp: float, expires_at: Optional[float]):
+        self.data = data
+        self.source = source
+        self.version = version
+        self.timestamp = timestamp
+        self.expires_at = expires_at
+
+
+class SharedDataStore:
+    """
+    Key-value store for data shared between engines.
+
+    Entries may expire after a TTL, and the store holds at most max_entries
+    keys, evicting the least recently written. Every write bumps the key's
+    version, notifies subscribers and wakes tasks waiting on the key.
+    """
+
+    def __init__(self, max_entries: int = 10000, default_ttl: Optional[float] = None):
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self._entries: "OrderedDict[str, SharedDataEntry]" = OrderedDict()
+        self._expiry_heap: List[Tuple[float, str, int]] = []
+        self._subscribers: Dict[str, List[Callable[[str, Any, int], Any]]] = {}
+        self._waiters: Dict[str, List[Tuple[int, asyncio.Future]]] = {}
+        self._subscriber_tasks: Set[asyncio.Future] = set()  # async callbacks, referenced until done
+        self.expired = 0
+        self.evicted = 0
+
+    def _purge_expired(self):
+        """Drop entries whose TTL has passed"""
+        now = time.time()
+        while self._expiry_heap and self._expiry_heap[0][0] <= now:
+            expires_at, key, version = heapq.heappop(self._expiry_heap)
+            entry = self._entries.get(key)
+            # Heap entries for overwritten or deleted values are stale and ignored
+            if entry is not None and entry.version == version and entry.expires_at == expires_at:
+                del self._entries[key]
+                self.expired += 1
+
+    def set(self, key: str, data: Any, source: str, ttl: Optional[float] = None) -> int:
+        """Store a value and return its new version"""
+        self._purge_expired()
+        now = time.time()
+        ttl = self.default_ttl if ttl is None else ttl
+        previous = self._entries.pop(key, None)
+        version = previous.version + 1 if previous else 1
+
+        entry = SharedDataEntry(data, source, version, now, now + ttl if ttl else None)
+        self._entries[key] = entry
+        if entry.expires_at is not None:
+            heapq.heappush(self._expiry_heap, (entry.expires_at, key, version))
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evicted += 1
+        if len(self._expiry_heap) > 2 * len(self._entries) + 64:
+            self._expiry_heap = [
+                item for item in self._expiry_heap
+                if item[1] in self._entries and self._entries[item[1]].expires_at == item[0]
+            ]
+            heapq.heapify(self._expiry_heap)
+
+        self._notify(key, entry)
+        return version
+
+    def _notify(self, key: str, entry: SharedDataEntry):
+        """Wake waiters and call subscribers for a new version"""
+        waiters = self._waiters.get(key)
+        if waiters:
+            remaining = []
+            for min_version, future in waiters:
+                if future.done():
+                    continue
+                if entry.version >= min_version:
+                    future.set_result(entry.data)
+                else:
+                    remaining.append((min_version, future))
+            if remaining:
+                self._waiters[key] = remaining
+            else:
+                del self._waiters[key]
+
+        for callback in list(self._subscribers.get(key, [])):
+            try:
+                outcome = callback(key, entry.data, entry.version)
+                if asyncio.iscoroutine(outcome):
+                    task = asyncio.ensure_future(outcome)
+                    self._subscriber_tasks.add(task)
+                    task.add_done_callback(functools.partial(self._subscriber_done, key))
+            except Exception as e:
+                logger.error(f"Error in shared data subscriber for key {key}: {e}")
+
+    def _subscriber_done(self, key: str, task: asyncio.Future):
+        """Release a finished async subscriber and log its failure"""
+        self._subscriber_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"Error in shared data subscriber for key {key}: {task.exception()}")
+
+    def get_entry(self, key: str) -> Optional[SharedDataEntry]:
+        """Get the current entry for a key unless it has expired"""
+        self._purge_expired()
+        return self._entries.get(key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get the current value for a key"""
+        entry = self.get_entry(key)
+        return entry.data if entry is not None else default
+
+    def delete(self, key: str) -> bool:
+        """Remove a key; returns whether it was present"""
+        return self._entries.pop(key, None) is not None
+
+    def subscribe(self, key: str, callback: Callable[[str, Any, int], Any]):
+        """Call callback(key, data, version) on every write to key"""
+        self._subscribers.setdefault(key, []).append(callback)
+
+    def unsubscribe(self, key: str, callback: Callable[[str, Any, int], Any]) -> bool:
+        """Stop notifying a subscriber"""
+        callbacks = self._subscribers.get(key, [])
+        if callback not in callbacks:
+            return False
+        callbacks.remove(callback)
+        if not callbacks:
+            del self._subscribers[key]
+        return True
+
+    async def wait_for(self, key: str, timeout: Optional[float] = None, min_version: int = 1) -> Any:
+        """Wait until key holds at least min_version; returns None on timeout"""
+        entry = self.get_entry(key)
+        if entry is not None and entry.version >= min_version:
+            return entry.data
+
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.setdefault(key, []).append((min_version, future))
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            return None
+        finally:
+            waiters = self._waiters.get(key)
+            if waiters is not None:
+                waiters[:] = [waiter for waiter in waiters if waiter[1] is not future]
+                if not waiters:
+                    del self._waiters[key]
+
+    def __contains__(self, key: str) -> bool:
+        return self.get_entry(key) is not None
+
+    def __len__(self) -> int:
+        self._purge_expired()
+        return len(self._entries)
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Size, expiry and subscription counters"""
+        return {
+            "keys": len(self),
+            "max_entries": self.max_entries,
+            "expired": self.expired,
+            "evicted": self.evicted,
+            "subscriptions": sum(len(callbacks) for callbacks in self._subscribers.values()),
+            "waiters": sum(len(waiters) for waiters in self._waiters.values())
+        }
+
+
 class EngineCoordinator:
     """Coordinates communication and data sharing between engines"""
     
-    def __init__(self):
+    def __init__(self, history_size: int = 10000, max_shared_entries: int = 10000,
+                 shared_data_ttl: Optional[float] = None):
         self.engines: Dict[EngineType, EngineInfo] = {}
         self.communication_channels: Dict[str, asyncio.Queue] = {}
-        self.shared_data_store: Dict[str, Any] = {}
-        self.coordination_history: List[Dict[str, Any]] = []
+        self.shared_data_store = SharedDataStore(max_entries=max_shared_entries, default_ttl=shared_data_ttl)
+        self.coordination_history: deque = deque(maxlen=history_size)
     
     def register_engine(self, engine_type: EngineType, engine: BaseSupremeEngine, 
                        capabilities: List[str], priority: int = 5) -> bool:
@@ -152,12 +410,9 @@ class EngineCoordinator:
                 await self.communication_channels[channel_name].put(message_envelope)
                 
                 # Update coordination history
-                self.coordination_history.append({
-                    "type": "message",
-                    "from": from_engine.value,
-                    "to": to_engine.value,
-                    "timestamp": datetime.now().isoformat()
-                })
+                self.coordination_history.append(
+                    CoordinationEvent("message", from_engine.value, target=to_engine.value)
+                )
                 
                 return True
             return False
@@ -185,22 +440,13 @@ class EngineCoordinator:
             logger.error(f"Error receiving message for {engine_type.value}: {e}")
             return None
     
-    def share_data(self, key: str, data: Any, source_engine: EngineType) -> bool:
-        """Share data between engines"""
+    def share_data(self, key: str, data: Any, source_engine: EngineType, ttl: Optional[float] = None) -> bool:
+        """Share data between engines, optionally expiring after ttl seconds"""
         try:
-            self.shared_data_store[key] = {
-                "data": data,
-                "source": source_engine.value,
-                "timestamp": datetime.now().isoformat()
-            }
+            self.shared_data_store.set(key, data, source_engine.value, ttl)
             
             # Update coordination history
-            self.coordination_history.append({
-                "type": "data_share",
-                "key": key,
-                "source": source_engine.value,
-                "timestamp": datetime.now().isoformat()
-            })
+            self.coordination_history.append(CoordinationEvent("data_share", source_engine.value, key=key))
             
             return True
             
@@ -211,14 +457,48 @@ class EngineCoordinator:
     def get_shared_data(self, key: str) -> Optional[Any]:
         """Get shared data"""
         try:
-            if key in self.shared_data_store:
-                return self.shared_data_store[key]["data"]
-            return None
+            return self.shared_data_store.get(key)
             
         except Exception as e:
             logger.error(f"Error getting shared data for key {key}: {e}")
             return None
     
+    def remove_shared_data(self, key: str) -> bool:
+        """Remove shared data"""
+        return self.shared_data_store.delete(key)
+
+    def get_shared_version(self, key: str) -> int:
+        """Current version of a shared key, 0 if absent"""
+        entry = self.shared_data_store.get_entry(key)
+        return entry.version if entry is not None else 0
+
+    async def wait_for_shared_data(self, key: str, timeout: Optional[float] = None,
+                                   min_version: int = 1) -> Optional[Any]:
+        """Wait for shared data to be published instead of polling get_shared_data"""
+        return await self.shared_data_store.wait_for(key, timeout, min_version)
+
+    def subscribe_shared_data(self, key: str, callback: Callable[[str, Any, int], Any]):
+        """Call callback(key, data, version) whenever key is shared"""
+        self.shared_data_store.subscribe(key, callback)
+
+    def unsubscribe_shared_data(self, key: str, callback: Callable[[str, Any, int], Any]) -> bool:
+        """Remove a shared data subscription"""
+        return self.shared_data_store.unsubscribe(key, callback)
+
+    def get_coordination_history(self, limit: int = 100, event_type: Optional[str] = None,
+                                 since: Optional[float] = None) -> List[Dict[str, Any]]:
+        """Most recent coordination events, newest last"""
+        events = []
+        for event in reversed(self.coordination_history):
+            if since is not None and event.timestamp < since:
+                break
+            if event_type is None or event.event_type == event_type:
+                events.append(event.to_dict())
+                if len(events) >= limit:
+                    break
+        events.reverse()
+        return events
+
     def get_engine_status(self, engine_type: EngineType) -> Optional[EngineStatus]:
         """Get the status of an engine"""
         if engine_type in self.engines:
@@ -258,19 +538,36 @@ class SupremeOrchestrator:
     def __init__(self, config=None):
         self.config = config
         self.coordinator = EngineCoordinator()
-        self.orchestration_queue: asyncio.Queue = asyncio.Queue()
+        self.orchestration_queue: asyncio.PriorityQueue = asyncio.PriorityQueue()
         self.active_requests: Dict[str, OrchestrationRequest] = {}
-        self.completed_requests: Dict[str, OrchestrationResult] = {}
+        self.completed_requests = ResultStore()
+        self.result_futures: Dict[str, asyncio.Future] = {}
+        self.result_streams: Dict[str, Callable[[str, Any], Any]] = {}
         self.orchestration_strategies = {
             OrchestrationStrategy.SEQUENTIAL: self._execute_sequential,
             OrchestrationStrategy.PARALLEL: self._execute_parallel,
             OrchestrationStrategy.CONDITIONAL: self._execute_conditional,
             OrchestrationStrategy.PRIORITY_BASED: self._execute_priority_based,
-            OrchestrationStrategy.ADAPTIVE: self._execute_adaptive
+            OrchestrationStrategy.ADAPTIVE: self._execute_adaptive,
+            OrchestrationStrategy.DAG: self._execute_dag
         }
         self.is_running = False
         self.orchestration_task: Optional[asyncio.Task] = None
-    
+
+        # Scheduling: worker pool, priority aging, per-engine limits and admission control
+        self.max_workers = 8
+        self.max_queue_size = getattr(config, "max_concurrent_operations", 1000)
+        self.aging_interval = 10.0  # seconds of waiting worth one priority level
+        self.default_engine_concurrency = 4
+        self.engine_concurrency_limits: Dict[EngineType, int] = {}
+        self.engine_semaphores: Dict[EngineType, asyncio.Semaphore] = {}
+        self.engine_in_flight: Dict[EngineType, int] = {}
+        self.running_requests = 0
+        self.rejected_requests = 0
+        self.peak_queue_size = 0
+        self.wait_times: deque = deque(maxlen=1000)
+        self._queue_sequence = itertools.count()
+
     async def initialize(self) -> bool:
         """Initialize the supreme orchestrator"""
         try:
@@ -299,6 +596,16 @@ class SupremeOrchestrator:
                     await self.orchestration_task
                 except asyncio.CancelledError:
                     pass
+
+            # Release anyone still waiting on a request that will never run
+            for request_id in list(self.result_futures):
+                self._complete_request(request_id, OrchestrationResult(
+                    request_id=request_id,
+                    overall_status="cancelled",
+                    engine_results={},
+                    execution_time=0.0,
+                    errors=["Orchestrator shut down"]
+                ))
             
             logger.info("Supreme Orchestrator shutdown complete")
             return True
@@ -311,16 +618,47 @@ class SupremeOrchestrator:
                        capabilities: List[str], priority: int = 5) -> bool:
         """Register an engine with the orchestrator"""
         return self.coordinator.register_engine(engine_type, engine, capabilities, priority)
-    
-    async def orchestrate_request(self, request: OrchestrationRequest) -> str:
-        """Submit a request for orchestration"""
+
+    def set_engine_concurrency(self, engine_type: EngineType, limit: int):
+        """Cap how many calls may run on one engine at a time"""
+        self.engine_concurrency_limits[engine_type] = limit
+        self.engine_semaphores[engine_type] = asyncio.Semaphore(limit)
+
+    def _queue_key(self, request: OrchestrationRequest) -> float:
+        """Heap key: higher priority first, aged by time spent waiting"""
+        # Effective priority is priority + waited / aging_interval. Every queued request ages
+        # at the same rate, so ordering only depends on the enqueue time and never needs a re-heap.
+        if not self.aging_interval:
+            return -request.priority
+        return time.monotonic() / self.aging_interval - request.priority
+
+    async def orchestrate_request(self, request: OrchestrationRequest,
+                                  on_engine_result: Optional[Callable[[str, Any], Any]] = None) -> str:
+        """
+        Submit a request for orchestration.
+
+        on_engine_result, if given, is called (or awaited) with each engine's
+        name and result as soon as that engine finishes.
+        """
         try:
+            # Admission control: shed load instead of letting the backlog grow without bound
+            if self.orchestration_queue.qsize() >= self.max_queue_size:
+                self.rejected_requests += 1
+                logger.warning(f"Orchestration request rejected, backlog full: {request.request_id}")
+                return ""
+
             # Add to active requests
             self.active_requests[request.request_id] = request
-            
+            self.result_futures[request.request_id] = asyncio.get_running_loop().create_future()
+            if on_engine_result:
+                self.result_streams[request.request_id] = on_engine_result
+
             # Add to orchestration queue
-            await self.orchestration_queue.put(request)
-            
+            await self.orchestration_queue.put(
+                (self._queue_key(request), next(self._queue_sequence), time.monotonic(), request)
+            )
+            self.peak_queue_size = max(self.peak_queue_size, self.orchestration_queue.qsize())
+
             logger.info(f"Orchestration request submitted: {request.request_id}")
             return request.request_id
             
@@ -329,43 +667,99 @@ class SupremeOrchestrator:
             return ""
     
     async def get_orchestration_result(self, request_id: str, timeout: float = 30.0) -> Optional[OrchestrationResult]:
-        """Get the result of an orchestration request"""
+        """Get the result of an orchestration request, waiting up to timeout seconds for it"""
         try:
-            start_time = datetime.now()
-            
-            while (datetime.now() - start_time).total_seconds() < timeout:
-                if request_id in self.completed_requests:
-                    return self.completed_requests[request_id]
-                
-                await asyncio.sleep(0.1)
-            
+            result = self.completed_requests.get(request_id)
+            if result is not None:
+                return result
+
+            future = self.result_futures.get(request_id)
+            if future is None:
+                return None
+
+            # Shield so a caller timing out doesn't cancel the future for other waiters
+            return await asyncio.wait_for(asyncio.shield(future), timeout)
+
+        except asyncio.TimeoutError:
             return None
-            
         except Exception as e:
             logger.error(f"Error getting orchestration result: {e}")
             return None
     
     async def _orchestration_loop(self):
-        """Main orchestration loop"""
+        """Main orchestration loop: runs the worker pool until cancelled"""
+        workers = [
+            asyncio.create_task(self._orchestration_worker(worker_id))
+            for worker_id in range(self.max_workers)
+        ]
+        try:
+            await asyncio.gather(*workers)
+        finally:
+            for worker in workers:
+                worker.cancel()
+
+    async def _orchestration_worker(self, worker_id: int):
+        """Take the highest-priority request off the queue and execute it"""
         while self.is_running:
+            _, _, enqueued_at, request = await self.orchestration_queue.get()
+            self.wait_times.append(time.monotonic() - enqueued_at)
+            self.running_requests += 1
+
             try:
-                # Get next request from queue
-                try:
-                    request = await asyncio.wait_for(self.orchestration_queue.get(), timeout=1.0)
-                except asyncio.TimeoutError:
-                    continue
-                
                 # Execute the request
                 result = await self._execute_orchestration_request(request)
-                
-                # Store result and clean up
-                self.completed_requests[request.request_id] = result
-                if request.request_id in self.active_requests:
-                    del self.active_requests[request.request_id]
-                
+
+                self._complete_request(request.request_id, result)
+
+            except asyncio.CancelledError:
+                raise
             except Exception as e:
-                logger.error(f"Error in orchestration loop: {e}")
-                await asyncio.sleep(1.0)
+                logger.error(f"Error in orchestration worker {worker_id}: {e}")
+            finally:
+                self.running_requests -= 1
+                self.orchestration_queue.task_done()
+
+    def _complete_request(self, request_id: str, result: OrchestrationResult):
+        """Store a result and wake everyone waiting on it"""
+        self.completed_requests[request_id] = result
+        self.active_requests.pop(request_id, None)
+        self.result_streams.pop(request_id, None)
+
+        future = self.result_futures.pop(request_id, None)
+        if future is not None and not future.done():
+            future.set_result(result)
+
+    async def _stream_engine_result(self, request_id: str, engine_name: str, engine_result: Any):
+        """Hand one engine's result to the request's streaming callback"""
+        callback = self.result_streams.get(request_id)
+        if callback is None:
+            return
+        try:
+            outcome = callback(engine_name, engine_result)
+            if asyncio.iscoroutine(outcome):
+                await outcome
+        except Exception as e:
+            logger.error(f"Error in result callback for {request_id}: {e}")
+
+    async def _call_engine(self, request: OrchestrationRequest, engine_type: EngineType,
+                           engine_request: SupremeRequest) -> Optional[SupremeResponse]:
+        """Execute a request on an engine within its concurrency limit"""
+        semaphore = self.engine_semaphores.get(engine_type)
+        if semaphore is None:
+            limit = self.engine_concurrency_limits.get(engine_type, self.default_engine_concurrency)
+            semaphore = self.engine_semaphores[engine_type] = asyncio.Semaphore(limit)
+
+        async with semaphore:
+            self.engine_in_flight[engine_type] = self.engine_in_flight.get(engine_type, 0) + 1
+            try:
+                response = await self.coordinator.engines[engine_type].engine_instance.execute(engine_request)
+            finally:
+                self.engine_in_flight[engine_type] -= 1
+
+        await self._stream_engine_result(
+            request.request_id, engine_type.value, response.result if response else {"error": "No result"}
+        )
+        return response
     
     async def _execute_orchestration_request(self, request: OrchestrationRequest) -> OrchestrationResult:
         """Execute an orchestration request"""
@@ -443,7 +837,7 @@ class SupremeOrchestrator:
                         )
                         
                         # Execute on engine
-                        result = await engine_info.engine_instance.execute_request(engine_request)
+                        result = await self._call_engine(request, engine_type, engine_request)
                         results[engine_type.value] = result.result if result else {"error": "No result"}
                         
                     except Exception as e:
@@ -474,7 +868,7 @@ class SupremeOrchestrator:
                     
                     # Create task
                     task = asyncio.create_task(
-                        engine_info.engine_instance.execute_request(engine_request)
+                        self._call_engine(request, engine_type, engine_request)
                     )
                     tasks.append(task)
                     engine_types.append(engine_type)
@@ -510,24 +904,116 @@ class SupremeOrchestrator:
     
     async def _execute_adaptive(self, request: OrchestrationRequest) -> Dict[str, Any]:
         """Execute engines using adaptive strategy"""
-        # Start with parallel execution, fall back to sequential if needed
+        # Declared data dependencies need the DAG; otherwise start with parallel
+        # execution and fall back to sequential if needed
+        if request.engine_dependencies:
+            return await self._execute_dag(request)
         try:
             return await self._execute_parallel(request)
         except Exception:
             logger.warning("Parallel execution failed, falling back to sequential")
             return await self._execute_sequential(request)
     
+    async def _execute_dag(self, request: OrchestrationRequest) -> Dict[str, Any]:
+        """Execute engines as a dependency graph, each starting as soon as its inputs are shared"""
+        engine_types = list(dict.fromkeys(request.required_engines))
+        shared_keys = {
+            engine_type: f"{request.request_id}:{engine_type.value}" for engine_type in engine_types
+        }
+
+        def engine_step(engine_type: EngineType, upstream: List[EngineType]):
+            async def run(outputs: Dict[str, Any]) -> Any:
+                engine_info = self.coordinator.engines.get(engine_type)
+                if engine_info is None:
+                    raise RuntimeError("Engine not registered")
+                if engine_info.status != EngineStatus.ACTIVE:
+                    raise RuntimeError(f"Engine not active: {engine_info.status.value}")
+
+                parameters = request.parameters
+                if upstream:
+                    # The shared store may have evicted or expired an input; the executor's copy is kept
+                    store = self.coordinator.shared_data_store
+                    parameters = {
+                        **request.parameters,
+                        "upstream_results": {
+                            dependency.value: store.get(shared_keys[dependency], outputs[dependency.value])
+                            for dependency in upstream
+                        }
+                    }
+
+                engine_request = SupremeRequest(
+                    request_id=f"{request.request_id}_{engine_type.value}",
+                    operation=request.operation,
+                    parameters=parameters
+                )
+                response = await self._call_engine(request, engine_type, engine_request)
+                if not response or not response.success:
+                    raise RuntimeError(response.error if response else "No result")
+
+                self.coordinator.share_data(shared_keys[engine_type], response.result, engine_type)
+                return response.result
+            return run
+
+        tasks = []
+        for engine_type in engine_types:
+            upstream = list(dict.fromkeys(request.engine_dependencies.get(engine_type, [])))
+            tasks.append(DAGTask(
+                task_id=engine_type.value,
+                run=engine_step(engine_type, upstream),
+                depends_on=[dependency.value for dependency in upstream]
+            ))
+
+        try:
+            dag_results = await DAGExecutor(logger=logger).run(tasks)
+        finally:
+            for key in shared_keys.values():
+                self.coordinator.remove_shared_data(key)
+
+        return {
+            engine_name: result.result if result.success else {"error": result.error}
+            for engine_name, result in dag_results.items()
+        }
+
     def get_orchestration_status(self) -> Dict[str, Any]:
         """Get current orchestration status"""
         return {
             "is_running": self.is_running,
             "active_requests": len(self.active_requests),
             "completed_requests": len(self.completed_requests),
+            "result_store": self.completed_requests.get_statistics(),
+            "pending_results": len(self.result_futures),
+            "shared_data": self.coordinator.shared_data_store.get_statistics(),
+            "coordination_events": len(self.coordinator.coordination_history),
             "registered_engines": len(self.coordinator.engines),
             "available_engines": len(self.coordinator.get_available_engines()),
-            "queue_size": self.orchestration_queue.qsize()
+            "queue_size": self.orchestration_queue.qsize(),
+            "scheduler": self.get_scheduler_metrics()
         }
-    
+
+    def get_scheduler_metrics(self) -> Dict[str, Any]:
+        """Queue depth, wait times and per-engine concurrency"""
+        waits = sorted(self.wait_times)
+        return {
+            "workers": self.max_workers,
+            "running_requests": self.running_requests,
+            "queue_depth": self.orchestration_queue.qsize(),
+            "peak_queue_depth": self.peak_queue_size,
+            "max_queue_size": self.max_queue_size,
+            "rejected_requests": self.rejected_requests,
+            "wait_time": {
+                "average": sum(waits) / len(waits) if waits else 0.0,
+                "p95": waits[int(0.95 * (len(waits) - 1))] if waits else 0.0,
+                "max": waits[-1] if waits else 0.0
+            },
+            "engines": {
+                engine_type.value: {
+                    "limit": self.engine_concurrency_limits.get(engine_type, self.default_engine_concurrency),
+                    "in_flight": self.engine_in_flight.get(engine_type, 0)
+                }
+                for engine_type in self.coordinator.engines
+            }
+        }
+
     def get_engine_status_summary(self) -> Dict[str, Any]:
         """Get summary of all engine statuses"""
         summary = {}
@@ -0,0 +1,104 @@
+"""
+Tests for Supreme DAG Executor
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from core.supreme.engines.dag_executor import DAGExecutor, DAGTask
+
+
+def sleeper(delay, value=None, log=None, name=None):
+    async def run(outputs):
+        if log is not None:
+            log.append(("start", name, set(outputs)))
+        await asyncio.sleep(delay)
+        return value
+    return run
+
+
+class TestDAGExecutor:
+    """Test cases for DAGExecutor"""
+
+    @pytest.mark.asyncio
+    async def test_fan_out_takes_critical_path(self):
+        log = []
+        tasks = [DAGTask("root", sleeper(0.05, 1, log, "root"))]
+        tasks += [DAGTask(f"api{i}", sleeper(0.2, i, log, f"api{i}"), depends_on=["root"]) for i in range(5)]
+        tasks.append(DAGTask("join", sleeper(0.05, "done", log, "join"), depends_on=[f"api{i}" for i in range(5)]))
+
+        started = time.perf_counter()
+        results = await DAGExecutor().run(tasks)
+        elapsed = time.perf_counter() - started
+
+        assert all(result.success for result in results.values())
+        assert results["join"].result == "done"
+        assert 0.3 <= elapsed < 0.6
+        assert log[-1] == ("start", "join", {"root", "api0", "api1", "api2", "api3", "api4"})
+
+    @pytest.mark.asyncio
+    async def test_concurrency_cap(self):
+        active, peak = 0, 0
+
+        async def work(outputs):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+        await DAGExecutor(max_concurrency=3).run([DAGTask(str(i), work) for i in range(10)])
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_timeout_and_retry_with_backoff(self):
+        attempts = []
+
+        async def flaky(outputs):
+            attempts.append(time.perf_counter())
+            if len(attempts) < 3:
+                raise RuntimeError("temporary")
+            return "ok"
+
+        executor = DAGExecutor(max_retries=2, retry_backoff=0.02, backoff_multiplier=2)
+        results = await executor.run([
+            DAGTask("flaky", flaky),
+            DAGTask("slow", sleeper(1.0), timeout=0.05, max_retries=0)
+        ])
+
+        assert results["flaky"].success and results["flaky"].attempts == 3
+        assert attempts[2] - attempts[1] >= attempts[1] - attempts[0] >= 0.02
+        assert results["slow"].status == "failed" and "Timed out" in results["slow"].error
+
+    @pytest.mark.asyncio
+    async def test_failure_skips_only_downstream_branch(self):
+        async def fail(outputs):
+            raise RuntimeError("boom")
+
+        results = await DAGExecutor().run([
+            DAGTask("a", sleeper(0, "a")),
+            DAGTask("bad", fail, depends_on=["a"]),
+            DAGTask("after_bad", sleeper(0), depends_on=["bad"]),
+            DAGTask("after_both", sleeper(0), depends_on=["after_bad", "good"]),
+            DAGTask("good", sleeper(0.05, "good"), depends_on=["a"]),
+            DAGTask("after_good", sleeper(0, "fine"), depends_on=["good"]),
+        ])
+
+        assert {task_id: result.status for task_id, result in results.items()} == {
+            "a": "completed", "bad": "failed", "good": "completed", "after_bad": "skipped",
+            "after_good": "completed", "after_both": "skipped"
+        }
+        assert results["bad"].error == "boom"
+
+    def test_topological_order_rejects_invalid_graphs(self):
+        noop = sleeper(0)
+        order = DAGExecutor.topological_order([DAGTask("c", noop, ["a", "b"]), DAGTask("a", noop),
+                                               DAGTask("b", noop, ["a"])])
+        assert [task.task_id for task in order] == ["a", "b", "c"]
+
+        with pytest.raises(ValueError, match="circular"):
+            DAGExecutor.topological_order([DAGTask("a", noop, ["b"]), DAGTask("b", noop, ["a"])])
+        with pytest.raises(ValueError, match="unknown"):
+            DAGExecutor.topological_order([DAGTask("a", noop, ["missing"])])
@@ -0,0 +1,151 @@
+"""
+Tests for Supreme Data Source Loader
+"""
+
+import json
+import os
+
+import pandas as pd
+import pytest
+
+from core.supreme.engines.data_source_loader import DataSourceLoader, get_shared_loader
+from core.supreme.engines.insight_generator import SupremeInsightGenerator
+from core.supreme.engines.visualization_engine import SupremeVisualizationEngine
+from core.supreme.supreme_config import EngineConfig
+
+
+@pytest.fixture
+def table():
+    return pd.DataFrame({
+        "region": ["north", "south", "east", "west"] * 25,
+        "sales": [float(i) for i in range(100)],
+        "units": list(range(100, 200)),
+        "notes": ["x"] * 100
+    })
+
+
+class TestDataSourceLoader:
+    """Test cases for DataSourceLoader"""
+
+    def test_csv_projection_and_filters(self, tmp_path, table):
+        path = tmp_path / "sales.csv"
+        table.to_csv(path, index=False)
+        loader = DataSourceLoader(chunk_size=7)
+
+        frame = loader.load(str(path), columns=["sales"], filters=[("region", "in", ["north", "east"]),
+                                                                   ("units", ">=", 150)])
+        expected = table[table.region.isin(["north", "east"]) & (table.units >= 150)]
+        assert list(frame.columns) == ["sales"]
+        assert frame["sales"].tolist() == expected["sales"].tolist()
+
+    def test_parquet_projection_and_filters(self, tmp_path, table):
+        pytest.importorskip("pyarrow")
+        path = tmp_path / "sales.parquet"
+        table.to_parquet(path, index=False)
+        loader = DataSourceLoader()
+
+        frame = loader.load(str(path), columns=["sales"], filters=[("region", "in", ["north", "east"]),
+                                                                   ("units", ">=", 150)])
+        expected = table[table.region.isin(["north", "east"]) & (table.units >= 150)]
+        assert list(frame.columns) == ["sales"]
+        assert frame["sales"].tolist() == expected["sales"].tolist()
+
+        excluded = loader.load(str(path), columns=["region"], filters=[("region", "not in", ["north", "south"])])
+        assert sorted(set(excluded["region"])) == ["east", "west"]
+        assert len(excluded) == 50
+
+    def test_parquet_without_engine_is_rejected(self, tmp_path, monkeypatch):
+        path = tmp_path / "sales.parquet"
+        path.write_bytes(b"PAR1")
+        monkeypatch.setattr("importlib.util.find_spec", lambda name, *args: None)
+
+        with pytest.raises(ImportError, match="pyarrow or fastparquet"):
+            DataSourceLoader().load(str(path))
+
+    def test_jsonl_matches_csv(self, tmp_path, table):
+        path = tmp_path / "sales.jsonl"
+        path.write_text("\n".join(json.dumps(row) for row in table.to_dict("records")))
+        loader = DataSourceLoader(chunk_size=10)
+
+        frame = loader.load(f"file://{path}", columns=["region", "units"], filters=[("sales", "<", 5)])
+        assert frame.to_dict("records") == table.loc[:4, ["region", "units"]].to_dict("records")
+
+    def test_cache_hits_and_invalidation_on_change(self, tmp_path, table):
+        path = tmp_path / "sales.csv"
+        table.to_csv(path, index=False)
+        loader = DataSourceLoader()
+
+        full = loader.load(str(path))
+        assert loader.load(str(path)).equals(full)
+        projected = loader.load(str(path), columns=["units"], filters=[("region", "==", "west")])
+        assert len(projected) == 25
+        assert loader.get_statistics()["misses"] == 1
+        assert loader.get_statistics()["hits"] == 2
+
+        table.assign(units=0).to_csv(path, index=False)
+        os.utime(path, ns=(os.stat(path).st_atime_ns, os.stat(path).st_mtime_ns + 10 ** 9))
+        assert loader.load(str(path))["units"].sum() == 0
+        assert loader.get_statistics()["cached_frames"] == 1
+
+    def test_callers_cannot_mutate_cached_frames(self, tmp_path, table):
+        path = tmp_path / "sales.csv"
+        table.to_csv(path, index=False)
+        loader = DataSourceLoader()
+
+        first = loader.load(str(path))
+        first["sales"] = 0.0
+        first["derived"] = 1
+        projected = loader.load(str(path), columns=["sales"])
+        projected["sales"] = -1.0
+
+        again = loader.load(str(path))
+        assert "derived" not in again.columns
+        assert again["sales"].tolist() == table["sales"].tolist()
+        assert loader.get_statistics()["misses"] == 1
+
+    def test_memory_budget_evicts_least_recent(self, tmp_path, table):
+        paths = []
+        for i in range(3):
+            paths.append(tmp_path / f"part{i}.csv")
+            table.to_csv(paths[-1], index=False)
+        size = int(pd.read_csv(paths[0]).memory_usage(deep=True).sum())
+        loader = DataSourceLoader(memory_budget=int(size * 2.5))
+
+        for path in paths:
+            loader.load(str(path))
+        stats = loader.get_statistics()
+        assert stats["evictions"] == 1
+        assert stats["memory_used"] <= loader.memory_budget
+
+    def test_rejects_unknown_sources(self, tmp_path):
+        loader = DataSourceLoader()
+        with pytest.raises(ValueError):
+            loader.load(str(tmp_path / "data.xlsx"))
+        with pytest.raises(FileNotFoundError):
+            loader.load(str(tmp_path / "missing.csv"))
+        with pytest.raises(ValueError):
+            (tmp_path / "data.csv").write_text("a\n1\n")
+            loader.load(str(tmp_path / "data.csv"), filters=[("a", "~", 1)])
+
+
+class TestSharedLoader:
+    """Test cases for sharing loaded frames between engines"""
+
+    @pytest.mark.asyncio
+    async def test_engines_share_cached_frames(self, tmp_path, monkeypatch, table):
+        monkeypatch.chdir(tmp_path)
+        table.to_csv("metrics.csv", index=False)
+        insights = SupremeInsightGenerator("insight_generator", EngineConfig(auto_scaling=False))
+        visualizations = SupremeVisualizationEngine("visualization_engine", EngineConfig(auto_scaling=False))
+        assert insights.data_loader is visualizations.data_loader is get_shared_loader()
+
+        before = get_shared_loader().get_statistics()
+        trends = await insights._analyze_trends({"data_source": "metrics.csv"})
+        chart = await visualizations._create_visualization({
+            "data_source": "metrics.csv", "chart_type": "bar", "x_axis": "region", "y_axis": "sales"
+        })
+        after = get_shared_loader().get_statistics()
+
+        assert "error" not in trends and "error" not in chart
+        assert after["misses"] - before["misses"] == 1
+        assert after["hits"] - before["hits"] == 1
@@ -2,6 +2,9 @@
 Tests for Supreme Data Synchronizer
 """
 
+import json
+import os
+import time
 import pytest
 import asyncio
 from unittest.mock import Mock, AsyncMock, patch
@@ -535,6 +538,30 @@ class TestSupremeDataSynchronizer:
         assert result["valid"] is False
         assert "must have 5 parts" in result["error"]
     
+    @pytest.mark.asyncio
+    async def test_schedule_registers_cron_job(self, data_synchronizer, sample_sync_configuration):
+        """Test that schedules are handed to the job scheduler"""
+        data_synchronizer.sync_configurations["test_sync"] = sample_sync_configuration
+        
+        with patch.object(data_synchronizer, '_save_sync_data', new_callable=AsyncMock), \
+             patch.object(data_synchronizer, '_execute_synchronization', new_callable=AsyncMock) as mock_execute:
+            result = await data_synchronizer._schedule_synchronization({
+                "sync_id": "test_sync",
+                "schedule_type": "cron",
+                "schedule_config": {"cron": "*/5 * * * *", "overlap_policy": "skip"}
+            })
+            
+            next_execution = datetime.fromisoformat(result["next_execution"])
+            assert next_execution.minute % 5 == 0 and next_execution > datetime.now()
+            assert result["schedule_id"] in data_synchronizer.sync_scheduler
+            
+            data_synchronizer.sync_scheduler.run_pending(next_execution)
+            await data_synchronizer.sync_scheduler.drain()
+            
+            mock_execute.assert_awaited_once()
+            assert mock_execute.call_args[0][0]["schedule_id"] == result["schedule_id"]
+            assert data_synchronizer.scheduled_syncs[result["schedule_id"]]["execution_count"] == 1
+    
     @pytest.mark.asyncio
     async def test_auto_resolve_conflict_source_wins(self, data_synchronizer):
         """Test auto-resolving conflict with source wins strategy"""
@@ -598,24 +625,340 @@ class TestSupremeDataSynchronizer:
                 parameters={"name": "test"}
             )
             
-           )file__]main([__pytest.:
-    ain__" == "__m __name__ce()
+            result = await data_synchronizer._execute_operation(request)
+            assert result["sync_id"] == "test"
+            mock_create.assert_called_once()
+        
+        # Test execute sync operation
+        with patch.object(data_synchronizer, '_execute_synchronization', new_callable=AsyncMock) as mock_execute:
+            mock_execute.return_value = {"success": True}
+            
+            request = SupremeRequest(
+                request_id="test_req",
+                operation="execute_sync",
+                parameters={"sync_id": "test"}
+            )
+            
+            result = await data_synchronizer._execute_operation(request)
+            assert result["success"] is True
+            mock_execute.assert_called_once()
+
 
 
-ifrt_called_onssexecute.a  mock_e       ue
-   is Tress"] cct["susul reert   ass)
-         uestration(reqopeer._execute_roniz data_synch = await result           
+class TestChunkedSynchronization:
+    
+    @pytest.fixture
+    def synchronizer(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        return SupremeDataSynchronizer("test_data_synchronizer", Mock(auto_scaling=False))
+    
+    async def create_sync(self, synchronizer, source_connection, target_connection, mappings=None, **source_options):
+        result = await synchronizer._create_sync_configuration({
+            "name": "etl",
+            "sources": [
+                {"source_id": "origin", "connection": source_connection, **source_options},
+                {"source_id": "replica", "connection": target_connection}
+            ],
+            "rules": [{"field_mappings": mappings}] if mappings else []
+        })
+        return result["sync_id"]
+    
+    @pytest.mark.asyncio
+    async def test_chunks_are_mapped_and_loaded(self, synchronizer):
+        records = [{"user_id": i, "user_name": f"  user {i} "} for i in range(2500)]
+        records[10]["user_id"] = None
+        target = {"records": [{"id": 5, "name": "stale"}], "key": "id"}
+        mappings = [
+            {"source_field": "user_id", "target_field": "id", "required": True},
+            {"source_field": "user_name", "target_field": "name", "transformation": "trim"}
+        ]
+        sync_id = await self.create_sync(synchronizer, {"records": records}, target, mappings)
         
+        result = await synchronizer._execute_synchronization({"sync_id": sync_id, "chunk_size": 300})
+        
+        assert result["records_processed"] == 2500
+        assert result["records_synced"] == 2499
+        assert result["records_failed"] == 1
+        assert result["checkpoint_offset"] == 2500
+        assert len(target["records"]) == 2499
+        assert target["records"][0] == {"id": 5, "name": "user 5"}
+    
+    @pytest.mark.asyncio
+    async def test_file_source_to_file_target(self, synchronizer, tmp_path):
+        source_path = tmp_path / "source.csv"
+        source_path.write_text("id,name\n" + "".join(f"{i},name {i}\n" for i in range(50)))
+        target_path = tmp_path / "target.jsonl"
+        sync_id = await self.create_sync(
+            synchronizer, {"path": str(source_path)}, {"path": str(target_path)}, type="file"
+        )
+        synchronizer.sync_configurations[sync_id].sources[1].source_type = "file"
+        
+        result = await synchronizer._execute_synchronization({"sync_id": sync_id, "chunk_size": 7})
+        
+        assert result["success"]
+        lines = target_path.read_text().splitlines()
+        assert len(lines) == 50
+        assert lines[-1] == '{"id": "49", "name": "name 49"}'
+    
+    @pytest.mark.asyncio
+    async def test_resume_after_failure_continues_from_checkpoint(self, synchronizer):
+        records = [{"id": i} for i in range(1000)]
+        target = {"records": []}
+        sync_id = await self.create_sync(synchronizer, {"records": records}, target)
+        
+        original_write = synchronizer._write_inline_records
+        writes = []
+        
+        def failing_write(*args):
+            writes.append(len(args[1]))
+            if len(writes) == 4:
+                raise IOError("target unavailable")
+            original_write(*args)
+        
+        synchronizer._write_inline_records = failing_write
+        failed = await synchronizer._execute_synchronization({"sync_id": sync_id, "chunk_size": 100, "max_in_flight": 2})
+        assert not failed["success"]
+        assert failed["checkpoint_offset"] == 300
+        
+        # A restarted engine picks up the persisted checkpoint
+        restarted = SupremeDataSynchronizer("test_data_synchronizer", Mock(auto_scaling=False))
+        await restarted._load_sync_data()
+        assert restarted.interrupted_executions[failed["execution_id"]].checkpoint_offset == 300
+        
+        synchronizer._write_inline_records = original_write
+        resumed = await synchronizer._execute_synchronization({"resume_execution_id": failed["execution_id"]})
+        
+        assert resumed["success"]
+        assert resumed["resumed"]
+        assert resumed["checkpoint_offset"] == 1000
+        assert [record["id"] for record in target["records"]] == list(range(1000))
+    
+    @pytest.mark.asyncio
+    async def test_resume_skips_rows_a_faster_target_committed(self, synchronizer):
+        records = [{"id": i} for i in range(1000)]
+        fast = {"records": [{"id": i} for i in range(600)]}
+        slow = {"records": [{"id": i} for i in range(300)]}
+        created = await synchronizer._create_sync_configuration({
+            "name": "fan out",
+            "sources": [
+                {"source_id": "origin", "connection": {"records": records}},
+                {"source_id": "fast", "connection": fast},
+                {"source_id": "slow", "connection": slow}
+            ]
+        })
+        interrupted = SyncExecution(
+            execution_id="exec_interrupted", sync_id=created["sync_id"], status=SyncStatus.FAILED,
+            started_at=datetime.now(), checkpoint_offset=300, target_offsets={"fast": 600, "slow": 300}
         )
-         "test"}d":c_i{"synrameters=        pa       ,
- nc"te_sytion="execupera      o
-          est_req","tuest_id=     req        
-   Request(upreme = S     request     
-          
-    ue}uccess": Trlue = {"svaeturn__execute.r      mock   xecute:
-   k_e mocyncMock) asable=As new_call',hronizationxecute_syncnizer, '_e_synchrodatat(patch.objec     with tion
-   operaxecute sync  # Test e
-             
-  lled_once()_cae.assert  mock_creat
-          t"tes= "c_id"] =synt["rt resul        asse)
-    questeration(rete_opnizer._execudata_synchrowait = a result 
\ No newline at end of file
+        synchronizer.interrupted_executions[interrupted.execution_id] = interrupted
+        synchronizer._save_checkpoints(force=True)
+        
+        restarted = SupremeDataSynchronizer("test_data_synchronizer", Mock(auto_scaling=False))
+        await restarted._load_sync_data()
+        assert restarted.interrupted_executions["exec_interrupted"].target_offsets == {"fast": 600, "slow": 300}
+        
+        resumed = await synchronizer._execute_synchronization({
+            "resume_execution_id": "exec_interrupted", "chunk_size": 250
+        })
+        
+        assert resumed["success"]
+        assert resumed["details"]["source_fast"]["records_synced"] == 400
+        assert resumed["details"]["source_slow"]["records_synced"] == 700
+        assert [record["id"] for record in fast["records"]] == list(range(1000))
+        assert [record["id"] for record in slow["records"]] == list(range(1000))
+    
+    @pytest.mark.asyncio
+    async def test_checkpoint_writes_are_throttled_and_atomic(self, synchronizer, monkeypatch):
+        records = [{"id": i} for i in range(1000)]
+        sync_id = await self.create_sync(synchronizer, {"records": records}, {"records": []})
+        replaced = []
+        original_replace = os.replace
+        
+        def counting_replace(source, destination):
+            replaced.append(destination)
+            original_replace(source, destination)
+        
+        monkeypatch.setattr(os, "replace", counting_replace)
+        synchronizer.checkpoint_interval = 60.0
+        synchronizer._checkpoints_saved_at = time.monotonic()
+        
+        result = await synchronizer._execute_synchronization({"sync_id": sync_id, "chunk_size": 10})
+        
+        assert result["success"]
+        assert len(replaced) == 1
+        assert not [name for name in os.listdir(synchronizer.data_dir) if name.endswith(".tmp")]
+        with open(replaced[0]) as f:
+            assert json.load(f) == {}
+    
+    @pytest.mark.asyncio
+    async def test_interrupted_executions_are_pruned(self, synchronizer):
+        sync_id = await self.create_sync(synchronizer, {"records": [{"id": 1}]}, {"records": []})
+        started = datetime.now()
+        for i, execution_sync_id in enumerate([sync_id, "other", "other", "other"]):
+            synchronizer.interrupted_executions[f"exec_{i}"] = SyncExecution(
+                execution_id=f"exec_{i}", sync_id=execution_sync_id, status=SyncStatus.FAILED,
+                started_at=started + timedelta(seconds=i)
+            )
+        synchronizer.max_interrupted_executions = 2
+        
+        result = await synchronizer._execute_synchronization({"sync_id": sync_id})
+        
+        assert result["success"]
+        assert sorted(synchronizer.interrupted_executions) == ["exec_2", "exec_3"]
+    
+    @pytest.mark.asyncio
+    async def test_unknown_source_type_fails_without_connector(self, synchronizer):
+        sync_id = await self.create_sync(synchronizer, {"host": "db.example.com"}, {"records": []})
+        
+        result = await synchronizer._execute_synchronization({"sync_id": sync_id})
+        
+        assert not result["success"]
+        assert "No connector" in result["error"]
+
+
+class TestIncrementalSynchronization:
+    
+    @pytest.fixture
+    def synchronizer(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        return SupremeDataSynchronizer("test_data_synchronizer", Mock(auto_scaling=False))
+    
+    async def create_sync(self, synchronizer, records, target, **options):
+        result = await synchronizer._create_sync_configuration({
+            "name": "cdc",
+            "sources": [
+                {"source_id": "origin", "connection": {"records": records}},
+                {"source_id": "replica", "connection": target}
+            ],
+            "incremental": True,
+            **options
+        })
+        return result["sync_id"]
+    
+    @pytest.mark.asyncio
+    async def test_only_changed_rows_are_written(self, synchronizer):
+        records = [{"id": i, "value": i, "updated_at": i} for i in range(100)]
+        target = {"records": [], "key": "id"}
+        sync_id = await self.create_sync(synchronizer, records, target, watermark_field="updated_at", key_field="id")
+        
+        first = await synchronizer._execute_synchronization({"sync_id": sync_id, "chunk_size": 30})
+        assert first["records_synced"] == 100
+        assert first["details"]["watermark"] == 99
+        
+        records[5].update(value=-5, updated_at=100)
+        records[6]["updated_at"] = 101  # touched without a content change besides the watermark
+        records.append({"id": 100, "value": 100, "updated_at": 102})
+        
+        second = await synchronizer._execute_synchronization({"sync_id": sync_id, "chunk_size": 30})
+        assert second["records_synced"] == 3
+        assert second["details"]["records_unchanged"] == 98
+        assert second["details"]["watermark"] == 102
+        assert target["records"][5]["value"] == -5
+        assert len(target["records"]) == 101
+        
+        third = await synchronizer._execute_synchronization({"sync_id": sync_id})
+        assert third["records_synced"] == 0
+    
+    @pytest.mark.asyncio
+    async def test_hash_index_without_watermark_and_validation(self, synchronizer):
+        records = [{"id": i, "value": i} for i in range(20)]
+        target = {"records": [], "key": "id"}
+        sync_id = await self.create_sync(synchronizer, records, target, key_field="id")
+        await synchronizer._execute_synchronization({"sync_id": sync_id})
+        
+        validation = await synchronizer._validate_data_consistency({"sync_id": sync_id})
+        assert validation["validation_passed"]
+        
+        records[3]["value"] = "changed"
+        records.append({"id": 20, "value": 20})
+        validation = await synchronizer._validate_data_consistency({"sync_id": sync_id})
+        assert validation["inconsistencies_found"] == 2
+        assert {item["change"] for item in validation["inconsistencies"]} == {"updated", "inserted"}
+        
+        result = await synchronizer._execute_synchronization({"sync_id": sync_id})
+        assert result["records_synced"] == 2
+        
+        validation = await synchronizer._validate_data_consistency({"sync_id": sync_id})
+        assert validation["validation_passed"]
+        assert validation["total_records_checked"] == 21
+        
+        # The hash index survives a restart
+        restarted = SupremeDataSynchronizer("test_data_synchronizer", Mock(auto_scaling=False))
+        await restarted._load_sync_data()
+        state = restarted._get_sync_state(restarted.sync_configurations[sync_id])
+        assert state.row_hashes == synchronizer.sync_states[sync_id].row_hashes
+
+    @pytest.mark.asyncio
+    async def test_rows_at_the_watermark_are_not_skipped(self, synchronizer):
+        records = [{"id": i, "updated_at": i // 2} for i in range(10)]
+        target = {"records": [], "key": "id"}
+        sync_id = await self.create_sync(synchronizer, records, target, watermark_field="updated_at", key_field="id")
+        await synchronizer._execute_synchronization({"sync_id": sync_id})
+        
+        records.append({"id": 10, "updated_at": 4})  # shares the watermark of the last run
+        result = await synchronizer._execute_synchronization({"sync_id": sync_id})
+        assert result["records_synced"] == 1
+        assert len(target["records"]) == 11
+    
+    @pytest.mark.asyncio
+    async def test_failed_rows_do_not_advance_watermark(self, synchronizer):
+        records = [{"id": i, "name": f"row {i}", "updated_at": i} for i in range(10)]
+        records[3]["name"] = None
+        target = {"records": [], "key": "id"}
+        mappings = [
+            {"source_field": "id", "target_field": "id"},
+            {"source_field": "name", "target_field": "name", "required": True}
+        ]
+        sync_id = await self.create_sync(synchronizer, records, target, watermark_field="updated_at",
+                                         key_field="id", rules=[{"field_mappings": mappings}])
+        
+        first = await synchronizer._execute_synchronization({"sync_id": sync_id})
+        assert first["records_failed"] == 1
+        assert first["details"]["watermark"] is None
+        assert "3" not in synchronizer.sync_states[sync_id].row_hashes
+        
+        records[3]["name"] = "row 3"
+        second = await synchronizer._execute_synchronization({"sync_id": sync_id})
+        assert second["success"]
+        assert second["records_synced"] == 1
+        assert second["details"]["watermark"] == 9
+        assert [record["id"] for record in target["records"]] == [0, 1, 2, 4, 5, 6, 7, 8, 9, 3]
+    
+    @pytest.mark.asyncio
+    async def test_datetime_watermark_survives_restart(self, synchronizer):
+        start = datetime(2024, 1, 1)
+        records = [{"id": i, "updated_at": start + timedelta(hours=i)} for i in range(5)]
+        sync_id = await self.create_sync(synchronizer, records, {"records": []}, watermark_field="updated_at")
+        await synchronizer._execute_synchronization({"sync_id": sync_id})
+        
+        restarted = SupremeDataSynchronizer("test_data_synchronizer", Mock(auto_scaling=False))
+        state = restarted._get_sync_state(synchronizer.sync_configurations[sync_id])
+        assert state.watermark == start + timedelta(hours=4)
+    
+    @pytest.mark.asyncio
+    async def test_validation_skips_unchanged_file_source(self, synchronizer, tmp_path):
+        source_path = tmp_path / "source.jsonl"
+        source_path.write_text("".join(json.dumps({"id": i, "value": i}) + "\n" for i in range(30)))
+        result = await synchronizer._create_sync_configuration({
+            "name": "cdc",
+            "sources": [
+                {"source_id": "origin", "type": "file", "connection": {"path": str(source_path)}},
+                {"source_id": "replica", "connection": {"records": [], "key": "id"}}
+            ],
+            "incremental": True,
+            "key_field": "id"
+        })
+        sync_id = result["sync_id"]
+        await synchronizer._execute_synchronization({"sync_id": sync_id})
+        
+        validation = await synchronizer._validate_data_consistency({"sync_id": sync_id})
+        assert validation["validation_passed"]
+        assert validation["validation_details"]["source_rows_scanned"] == 0
+        
+        with open(source_path, "a") as f:
+            f.write(json.dumps({"id": 30, "value": 30}) + "\n")
+        validation = await synchronizer._validate_data_consistency({"sync_id": sync_id})
+        assert validation["inconsistencies_found"] == 1
+
+if __name__ == "__main__":
+    pytest.main([__file__])
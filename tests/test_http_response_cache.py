@@ -0,0 +1,112 @@
+"""
+Tests for Supreme HTTP Response Cache
+"""
+
+import asyncio
+
+import pytest
+
+from core.supreme.engines.http_response_cache import HTTPResponseCache
+
+
+class Origin:
+    """Fake origin server that counts requests"""
+
+    def __init__(self, status=200, headers=None, delay=0.0):
+        self.status = status
+        self.headers = headers or {}
+        self.delay = delay
+        self.requests = []
+
+    async def send(self, conditional_headers):
+        self.requests.append(conditional_headers)
+        await asyncio.sleep(self.delay)
+        if conditional_headers.get("If-None-Match") == self.headers.get("ETag") and "ETag" in self.headers:
+            return 304, dict(self.headers), None
+        return self.status, dict(self.headers), {"items": [1, 2, 3]}
+
+
+class TestHTTPResponseCache:
+    """Test cases for HTTPResponseCache"""
+
+    @pytest.mark.asyncio
+    async def test_hits_and_coalescing(self):
+        cache = HTTPResponseCache()
+        origin = Origin(delay=0.01)
+        key = cache.key_for("svc", "https://api.example.com/items")
+
+        first, second = await asyncio.gather(cache.fetch(key, 30, origin.send), cache.fetch(key, 30, origin.send))
+        third = await cache.fetch(key, 30, origin.send)
+
+        assert len(origin.requests) == 1
+        assert [first[3], second[3], third[3]] == ["miss", "coalesced", "hit"]
+        assert third[2] == {"items": [1, 2, 3]}
+
+    @pytest.mark.asyncio
+    async def test_callers_get_private_copies(self):
+        cache = HTTPResponseCache()
+        origin = Origin()
+        key = cache.key_for("svc", "https://api.example.com/items")
+
+        _, _, data, _ = await cache.fetch(key, 30, origin.send)
+        data["items"].append(4)
+        _, headers, data, _ = await cache.fetch(key, 30, origin.send)
+        data["items"].clear()
+        headers["X-Mutated"] = "1"
+
+        _, headers, data, status = await cache.fetch(key, 30, origin.send)
+        assert status == "hit"
+        assert data == {"items": [1, 2, 3]}
+        assert "X-Mutated" not in headers
+
+    @pytest.mark.asyncio
+    async def test_request_headers_are_part_of_the_key(self):
+        cache = HTTPResponseCache()
+        origin = Origin()
+        url = "https://api.example.com/items"
+
+        await cache.fetch(cache.key_for("svc", url, {"Authorization": "Bearer a"}), 30, origin.send)
+        await cache.fetch(cache.key_for("svc", url, {"Authorization": "Bearer b"}), 30, origin.send)
+        await cache.fetch(cache.key_for("svc", url, {"authorization": "Bearer a"}), 30, origin.send)
+
+        assert len(origin.requests) == 2
+
+    @pytest.mark.asyncio
+    async def test_invalidate_service_drops_only_that_service(self):
+        cache = HTTPResponseCache()
+        origin = Origin()
+        for service_id in ["svc", "svc2"]:
+            for path in ["a", "b"]:
+                await cache.fetch(cache.key_for(service_id, f"https://{service_id}/{path}", {"X": path}), 30,
+                                  origin.send)
+
+        assert cache.invalidate_service("svc") == 2
+        assert len(cache.entries) == 2
+        assert all(key.startswith("svc2 ") for key in cache.entries)
+
+    @pytest.mark.asyncio
+    async def test_expired_entries_revalidate_with_etag(self):
+        cache = HTTPResponseCache()
+        origin = Origin(headers={"ETag": '"v1"', "Cache-Control": "no-cache"})
+        key = cache.key_for("svc", "https://api.example.com/items")
+
+        await cache.fetch(key, 30, origin.send)
+        _, _, data, status = await cache.fetch(key, 30, origin.send)
+
+        assert status == "revalidated"
+        assert data == {"items": [1, 2, 3]}
+        assert origin.requests[1] == {"If-None-Match": '"v1"'}
+
+    @pytest.mark.asyncio
+    async def test_uncacheable_responses_and_ttls(self):
+        cache = HTTPResponseCache(endpoint_ttls={"svc": 5.0, "svc:/reports": 60.0})
+        assert cache.ttl_for("svc", "/reports/daily") == 60.0
+        assert cache.ttl_for("svc", "/items") == 5.0
+        assert cache.ttl_for("other", "/items") == cache.default_ttl
+
+        origin = Origin(headers={"Cache-Control": "no-store"})
+        key = cache.key_for("svc", "https://api.example.com/items")
+        await cache.fetch(key, 30, origin.send)
+        await cache.fetch(key, 30, origin.send)
+        assert len(origin.requests) == 2
+        assert cache.get_statistics()["uncacheable"] == 2
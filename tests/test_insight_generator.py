@@ -0,0 +1,118 @@
+"""
+Tests for Supreme Insight Generator
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from core.supreme.engines.insight_generator import SupremeInsightGenerator, IncrementalCorrelation
+from core.supreme.supreme_config import EngineConfig
+
+
+@pytest.fixture
+def generator(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    return SupremeInsightGenerator("insight_generator", EngineConfig(auto_scaling=False))
+
+
+def make_table(rows, columns=6, seed=0, offset=0.0):
+    rng = np.random.default_rng(seed)
+    base = rng.normal(size=(rows, 1))
+    values = base * rng.uniform(-1, 1, size=(1, columns)) + rng.normal(size=(rows, columns)) + offset
+    values[rng.random(size=values.shape) < 0.1] = np.nan
+    return pd.DataFrame(values, columns=[f"m{i}" for i in range(columns)])
+
+
+class TestIncrementalCorrelation:
+    """Test cases for IncrementalCorrelation"""
+
+    def test_batches_match_full_recomputation(self):
+        table = make_table(600, offset=1e6)
+        state = IncrementalCorrelation()
+        for chunk in np.array_split(np.arange(len(table)), 7):
+            state.update(table.iloc[chunk])
+
+        expected = table.corr().to_numpy()
+        assert state.rows == 600
+        assert np.allclose(state.matrix(), expected, atol=1e-8, equal_nan=True)
+
+    def test_new_columns_and_constant_columns(self):
+        first = pd.DataFrame({"a": [1.0, 2.0, 3.0, 4.0], "flat": [5.0] * 4})
+        second = pd.DataFrame({"a": [5.0, 6.0, 8.0], "b": [1.0, 3.0, 2.0], "flat": [5.0] * 3})
+        state = IncrementalCorrelation()
+        state.update(first)
+        state.update(second)
+
+        expected = pd.concat([first, second], ignore_index=True)[state.columns].corr().to_numpy()
+        assert state.columns == ["a", "flat", "b"]
+        assert np.allclose(state.matrix(), expected, equal_nan=True)
+
+    def test_significant_pairs_top_k(self):
+        correlation = np.array([
+            [1.0, 0.9, -0.95, 0.1],
+            [0.9, 1.0, 0.6, np.nan],
+            [-0.95, 0.6, 1.0, 0.55],
+            [0.1, np.nan, 0.55, 1.0],
+        ])
+        columns = ["w", "x", "y", "z"]
+
+        pairs = IncrementalCorrelation.significant_pairs(columns, correlation, 0.5)
+        assert pairs == [("w", "y", -0.95), ("w", "x", 0.9), ("x", "y", 0.6), ("y", "z", 0.55)]
+        assert IncrementalCorrelation.significant_pairs(columns, correlation, 0.5, top_k=2) == pairs[:2]
+
+
+class TestSupremeInsightGenerator:
+    """Test cases for SupremeInsightGenerator correlations"""
+
+    @pytest.mark.asyncio
+    async def test_find_correlations_matches_pandas(self, generator):
+        table = make_table(200)
+        result = await generator._find_correlations({"data": table, "min_correlation": 0.3})
+
+        expected = table.corr()
+        assert result["variables_analyzed"] == 6
+        for pair in result["correlations"]:
+            assert pair["correlation"] == pytest.approx(expected.loc[pair["variable1"], pair["variable2"]])
+        assert np.allclose(pd.DataFrame(result["correlation_matrix"]).to_numpy(), expected.to_numpy())
+
+    @pytest.mark.asyncio
+    async def test_incremental_updates_and_top_k(self, generator):
+        table = make_table(300, columns=8, seed=3)
+        for chunk in np.array_split(np.arange(len(table)), 3):
+            result = await generator._find_correlations({
+                "data": table.iloc[chunk].to_dict("records"),
+                "data_source": "metrics",
+                "incremental": True,
+                "min_correlation": 0.0,
+                "top_k": 5
+            })
+
+        assert result["rows_analyzed"] == 300
+        assert "correlation_matrix" not in result
+        assert len(result["correlations"]) == 5
+
+        expected = table.corr().to_numpy()
+        upper = np.abs(expected[np.triu_indices(8, k=1)])
+        assert [abs(pair["correlation"]) for pair in result["correlations"]] == pytest.approx(
+            sorted(upper, reverse=True)[:5]
+        )
+
+        reset = await generator._find_correlations({
+            "data": table.iloc[:50], "data_source": "metrics", "incremental": True, "reset": True
+        })
+        assert reset["rows_analyzed"] == 50
+
+        reloaded = await generator._find_correlations({"data_source": "metrics", "incremental": True})
+        assert "error" in reloaded
+        assert generator.correlation_states["metrics"].rows == 50
+
+    @pytest.mark.asyncio
+    async def test_undefined_pairs_are_not_reported(self, generator):
+        table = make_table(50, columns=3, seed=4)
+        table["constant"] = 1.0
+        result = await generator._find_correlations({"data": table, "min_correlation": 0.0})
+
+        pairs = [{pair["variable1"], pair["variable2"]} for pair in result["correlations"]]
+        assert len(pairs) == 3
+        assert not any("constant" in pair for pair in pairs)
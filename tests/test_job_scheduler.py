@@ -0,0 +1,168 @@
+"""
+Tests for Supreme Job Scheduler
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+from core.supreme.engines.job_scheduler import CronExpression, JobScheduler, validate_schedule
+
+
+def brute_force_next(expression, after, limit_minutes=60 * 24 * 800):
+    """Reference implementation: test every minute with plain field matching"""
+    fields = expression.split()
+
+    def allowed(field, minimum, maximum):
+        values = set()
+        for item in field.split(","):
+            base, _, step = item.partition("/")
+            start, end = (minimum, maximum) if base == "*" else (
+                map(int, base.split("-")) if "-" in base else (int(base), maximum if step else int(base))
+            )
+            values.update(range(start, end + 1, int(step or 1)))
+        return values
+
+    minutes, hours, days, months, weekdays = (
+        allowed(field, *bounds) for field, bounds in zip(fields, [(0, 59), (0, 23), (1, 31), (1, 12), (0, 6)])
+    )
+    either_day = fields[2] != "*" and fields[4] != "*"
+
+    moment = after.replace(second=0, microsecond=0) + timedelta(minutes=1)
+    for _ in range(limit_minutes):
+        day_ok, weekday_ok = moment.day in days, moment.isoweekday() % 7 in weekdays
+        if ((day_ok or weekday_ok) if either_day else (day_ok and weekday_ok)) and moment.month in months \
+                and moment.hour in hours and moment.minute in minutes:
+            return moment
+        moment += timedelta(minutes=1)
+    return None
+
+
+class TestCronExpression:
+    """Test cases for CronExpression"""
+
+    @pytest.mark.parametrize("expression", [
+        "*/15 * * * *",
+        "5 4 * * *",
+        "0 9-17/2 * * 1-5",
+        "30 2 1,15 * *",
+        "0 0 13 * 5",
+        "45 23 31 1-12/2 *",
+    ])
+    def test_matches_brute_force(self, expression):
+        cron = CronExpression(expression)
+        moment = datetime(2023, 12, 30, 22, 7, 13)
+        for _ in range(10):
+            expected = brute_force_next(expression, moment)
+            assert cron.next_after(moment) == expected
+            moment = expected + timedelta(seconds=7)
+
+    def test_seconds_names_and_macros(self):
+        after = datetime(2024, 3, 4, 10, 0, 0)
+        assert CronExpression("*/20 * * * * *").next_after(after) == datetime(2024, 3, 4, 10, 0, 20)
+        assert CronExpression("0 0 * jun sun").next_after(after) == datetime(2024, 6, 2, 0, 0)
+        assert CronExpression("@hourly").next_after(after) == datetime(2024, 3, 4, 11, 0)
+        assert CronExpression("0 0 * * 7").next_after(after) == datetime(2024, 3, 10, 0, 0)
+        assert CronExpression("0 12 29 2 *").next_after(after) == datetime(2028, 2, 29, 12, 0)
+
+    def test_question_mark_leaves_day_unrestricted(self):
+        after = datetime(2024, 3, 4, 10, 0, 0)  # a Monday
+        assert CronExpression("0 0 ? * MON").next_after(after) == datetime(2024, 3, 11, 0, 0)
+        assert CronExpression("0 0 15 * ?").next_after(after) == datetime(2024, 3, 15, 0, 0)
+        assert CronExpression("0 0 0 ? * mon").next_after(after) == datetime(2024, 3, 11, 0, 0)
+
+    @pytest.mark.parametrize("expression", ["invalid", "61 * * * *", "* * * * * * *", "5-1 * * * *",
+                                            "*/0 * * * *", "0 0 30 2 *"])
+    def test_rejects_invalid_expressions(self, expression):
+        with pytest.raises(ValueError):
+            CronExpression(expression)
+        assert validate_schedule("cron", {"cron": expression})
+
+
+class Clock:
+    def __init__(self, now):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class TestJobScheduler:
+    """Test cases for JobScheduler"""
+
+    @pytest.mark.asyncio
+    async def test_jobs_fire_in_time_order(self):
+        clock = Clock(datetime(2024, 1, 1, 0, 0, 0))
+        scheduler = JobScheduler(clock=clock)
+        fired = []
+
+        def job(name):
+            async def callback():
+                fired.append(name)
+            return callback
+
+        scheduler.add_job("every_90s", job("every_90s"), "interval", {"interval": 90},
+                          last_executed=clock.now)
+        scheduler.add_job("cron", job("cron"), "cron", {"cron": "*/2 * * * *"})
+        scheduler.add_job("once", job("once"), "once", {"run_at": "2024-01-01T00:03:30"})
+        scheduler.add_job("removed", job("removed"), "interval", {"interval": 1})
+        scheduler.remove_job("removed")
+
+        timeline = []
+        while scheduler.next_fire_time() <= datetime(2024, 1, 1, 0, 6):
+            clock.now = scheduler.next_fire_time()
+            timeline.append((clock.now.strftime("%M:%S"), sorted(scheduler.run_pending())))
+        await scheduler.drain()
+
+        assert timeline == [
+            ("01:30", ["every_90s"]), ("02:00", ["cron"]), ("03:00", ["every_90s"]),
+            ("03:30", ["once"]), ("04:00", ["cron"]), ("04:30", ["every_90s"]),
+            ("06:00", ["cron", "every_90s"]),
+        ]
+        assert "removed" not in fired
+        assert scheduler.next_fire_time("once") is None
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("policy,expected_runs", [("skip", 1), ("queue", 2), ("allow", 3)])
+    async def test_overlap_policies(self, policy, expected_runs):
+        clock = Clock(datetime(2024, 1, 1))
+        scheduler = JobScheduler(clock=clock)
+        release = asyncio.Event()
+        runs = []
+
+        async def slow_job():
+            runs.append(clock.now)
+            await release.wait()
+
+        scheduler.add_job("slow", slow_job, "interval", {"interval": 1, "overlap_policy": policy})
+        for second in range(3):
+            clock.now = datetime(2024, 1, 1, 0, 0, second)
+            scheduler.run_pending()
+            await asyncio.sleep(0)
+
+        release.set()
+        await scheduler.drain()
+        assert len(runs) == expected_runs
+        stats = scheduler.get_statistics()
+        assert stats["dispatched_runs"] == expected_runs
+        assert stats["skipped_runs"] == {"skip": 2, "queue": 1, "allow": 0}[policy]
+
+    @pytest.mark.asyncio
+    async def test_run_loop_wakes_for_new_jobs(self):
+        scheduler = JobScheduler()
+        fired = asyncio.Event()
+
+        async def callback():
+            fired.set()
+
+        loop_task = asyncio.create_task(scheduler.run())
+        await asyncio.sleep(0.05)
+        started = datetime.now()
+        scheduler.add_job("soon", callback, "once", {"run_at": (started + timedelta(seconds=0.2)).isoformat()})
+
+        await asyncio.wait_for(fired.wait(), timeout=2)
+        elapsed = (datetime.now() - started).total_seconds()
+        scheduler.stop()
+        await loop_task
+        assert 0.15 <= elapsed < 1.0
@@ -4,6 +4,8 @@ Tests for Supreme Knowledge Engine
 
 import pytest
 import asyncio
+import pickle
+import time
 from datetime import datetime, timedelta
 from unittest.mock import Mock
 
@@ -11,6 +13,7 @@ from core.supreme.engines.knowledge_engine import (
     SupremeKnowledgeEngine,
     KnowledgeOracle,
     UniversalSearcher,
+    SearchResultCache,
     KnowledgeSynthesizer,
     KnowledgeSource,
     InformationType,
@@ -143,6 +146,164 @@ class TestUniversalSearcher:
         assert key1 == key2  # Same query and sources should generate same key
         assert key1 != key3  # Different query should generate different key
         assert len(key1) == 32  # MD5 hash length
+    
+    @pytest.mark.asyncio
+    async def test_search_fans_out_concurrently(self, searcher):
+        """Test sources are searched in parallel rather than back to back"""
+        original = searcher._search_source
+        
+        async def slow_source(source, query, max_results):
+            await asyncio.sleep(0.2)
+            return await original(source, query, max_results)
+        
+        searcher._search_source = slow_source
+        start = asyncio.get_running_loop().time()
+        results = await searcher.search("parallel search", max_results=20)
+        elapsed = asyncio.get_running_loop().time() - start
+        
+        assert elapsed < 0.2 * 2
+        assert len({item.source for item in results}) == len(KnowledgeSource)
+        assert results == await searcher._rank_results(results, "parallel search")
+    
+    @pytest.mark.asyncio
+    async def test_slow_source_returns_partial_results(self, searcher):
+        """Test a source missing its deadline does not block the search"""
+        original = searcher._search_source
+        searcher.source_timeouts = {KnowledgeSource.ACADEMIC.value: 0.05}
+        
+        async def stalled_academic(source, query, max_results):
+            if source == KnowledgeSource.ACADEMIC:
+                await asyncio.sleep(10)
+            return await original(source, query, max_results)
+        
+        searcher._search_source = stalled_academic
+        sources = [KnowledgeSource.ACADEMIC, KnowledgeSource.WIKIPEDIA]
+        results = await asyncio.wait_for(searcher.search("deadline", sources=sources), timeout=1)
+        
+        assert results and all(item.source == KnowledgeSource.WIKIPEDIA for item in results)
+        assert searcher.metrics["source_timeouts"] == 1
+        assert searcher.metrics["partial_searches"] == 1
+        assert not searcher.search_cache
+        
+        histograms = searcher.get_latency_histograms()
+        assert histograms["academic"]["timeouts"] == 1
+        assert histograms["wikipedia"]["count"] == 1
+
+class TestSearchResultCache:
+    """Test cases for SearchResultCache"""
+    
+    def make_items(self, count, source=KnowledgeSource.WEB_SEARCH):
+        return [
+            KnowledgeItem(
+                item_id=f"item_{i}",
+                content="x" * 200,
+                source=source,
+                information_type=InformationType.FACTUAL,
+                confidence_level=ConfidenceLevel.MEDIUM,
+                relevance_score=0.5
+            )
+            for i in range(count)
+        ]
+    
+    def test_query_normalization(self):
+        """Test equivalent queries share a cache key"""
+        searcher = UniversalSearcher({})
+        sources = [KnowledgeSource.NEWS, KnowledgeSource.WEB_SEARCH]
+        key = searcher._generate_cache_key(" Machine \t Learning", sources)
+        
+        assert key == searcher._generate_cache_key("machine learning", list(reversed(sources)))
+        assert key != searcher._generate_cache_key("machine learning basics", sources)
+        keys = {searcher._generate_cache_key(query, sources) for query in ["C++", "C#", "c", ".NET", "NET"]}
+        assert len(keys) == 5
+    
+    def test_source_ttls(self, monkeypatch):
+        """Test entries expire after the shortest TTL of their sources"""
+        cache = SearchResultCache()
+        now = time.time()
+        cache.put("news", self.make_items(2, KnowledgeSource.NEWS), [KnowledgeSource.NEWS], 10)
+        cache.put("academic", self.make_items(2, KnowledgeSource.ACADEMIC), [KnowledgeSource.ACADEMIC], 10)
+        cache.put("empty", [], [KnowledgeSource.ACADEMIC], 10)
+        assert cache.get("empty", 10) == []
+        
+        monkeypatch.setattr(time, "time", lambda: now + 3600)
+        assert cache.get("news", 10) is None
+        assert cache.get("empty", 10) is None
+        assert len(cache.get("academic", 10)) == 2
+        assert cache.get_statistics()["cache_expirations"] == 2
+    
+    def test_byte_bound_evicts_and_spills(self, tmp_path):
+        """Test the byte bound evicts least recently used entries to disk"""
+        entry_size = len(pickle.dumps(self.make_items(5), protocol=pickle.HIGHEST_PROTOCOL))
+        cache = SearchResultCache(max_bytes=int(entry_size * 2.5), spill_dir=str(tmp_path))
+        
+        for key in ["a", "b", "c"]:
+            cache.put(key, self.make_items(5), [KnowledgeSource.WEB_SEARCH], 10)
+        
+        stats = cache.get_statistics()
+        assert stats["cache_entries"] == 2
+        assert stats["cache_bytes"] <= cache.max_bytes
+        assert stats["cache_evictions"] == 1
+        assert stats["cache_spilled_entries"] == 1
+        
+        assert len(cache.get("a", 10)) == 5
+        assert cache.get_statistics()["cache_spilled_entries"] == 1
+        assert len(cache) == 3
+    
+    def test_truncated_entry_does_not_serve_larger_request(self):
+        """Test results cut to max_results are not reused for a larger request"""
+        cache = SearchResultCache()
+        cache.put("key", self.make_items(3), [KnowledgeSource.WEB_SEARCH], 3)
+        
+        assert len(cache.get("key", 2)) == 3
+        assert cache.get("key", 10) is None
+    
+    @pytest.mark.asyncio
+    async def test_identical_inflight_searches_are_coalesced(self):
+        """Test concurrent identical searches hit the sources once"""
+        searcher = UniversalSearcher({})
+        original = searcher._search_source
+        calls = []
+        
+        async def counted_source(source, query, max_results):
+            calls.append(source)
+            await asyncio.sleep(0.05)
+            return await original(source, query, max_results)
+        
+        searcher._search_source = counted_source
+        sources = [KnowledgeSource.WIKIPEDIA]
+        results = await asyncio.gather(*[
+            searcher.search(query, sources=sources) for query in ["Deep learning", " deep  learning", "DEEP LEARNING"]
+        ])
+        
+        assert len(calls) == 1
+        assert results[0] == results[1] == results[2]
+        assert searcher.metrics["coalesced_searches"] == 2
+        assert searcher.metrics["cache_entries"] == 1
+    
+    @pytest.mark.asyncio
+    async def test_smaller_inflight_search_is_not_shared(self):
+        """Test a search for more results does not reuse a smaller one in flight"""
+        searcher = UniversalSearcher({})
+        original = searcher._search_source
+        calls = []
+        
+        async def counted_source(source, query, max_results):
+            calls.append(max_results)
+            await asyncio.sleep(0.05)
+            return await original(source, query, max_results)
+        
+        searcher._search_source = counted_source
+        sources = [KnowledgeSource.WIKIPEDIA]
+        small, large, smaller = await asyncio.gather(
+            searcher.search("graphs", sources=sources, max_results=1),
+            searcher.search("graphs", sources=sources, max_results=5),
+            searcher.search("graphs", sources=sources, max_results=2)
+        )
+        
+        assert calls == [1, 5]
+        assert len(small) <= 1 and len(smaller) <= 2
+        assert searcher.metrics["coalesced_searches"] == 1
+        assert searcher._inflight_searches == {}
 
 class TestKnowledgeSynthesizer:
     """Test cases for KnowledgeSynthesizer"""
@@ -306,6 +467,7 @@ class TestKnowledgeOracle:
         assert "knowledge_base_stats" in analytics
         assert "recent_queries" in analytics
         assert "synthesis_history" in analytics
+        assert analytics["source_latency"]["web_search"]["count"] >= 1
         
         # Check knowledge base stats structure
         kb_stats = analytics["knowledge_base_stats"]
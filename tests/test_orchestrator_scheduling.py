@@ -0,0 +1,405 @@
+"""
+Tests for Supreme Orchestrator scheduling, result delivery, strategies and coordination
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from core.supreme.supreme_orchestrator import (
+    SupremeOrchestrator,
+    EngineCoordinator,
+    EngineType,
+    OrchestrationRequest,
+    OrchestrationResult,
+    OrchestrationStrategy,
+    ResultStore,
+    SharedDataStore
+)
+from core.supreme.base_supreme_engine import BaseSupremeEngine, SupremeRequest
+from core.supreme.supreme_config import EngineConfig
+
+
+class RecordingEngine(BaseSupremeEngine):
+    """Engine that records the order and concurrency of its calls"""
+
+    def __init__(self, engine_name: str, delay: float = 0.0):
+        super().__init__(engine_name, EngineConfig(auto_scaling=False))
+        self.delay = delay
+        self.calls = []
+        self.active = 0
+        self.peak = 0
+
+    async def _initialize_engine(self) -> bool:
+        return True
+
+    async def _execute_operation(self, request: SupremeRequest) -> dict:
+        self.calls.append(request.parameters.get("name"))
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(request.parameters.get("delay", self.delay))
+        finally:
+            self.active -= 1
+        result = {"name": request.parameters.get("name"), "engine": self.engine_name}
+        if "upstream_results" in request.parameters:
+            result["upstream"] = request.parameters["upstream_results"]
+        return result
+
+    async def get_supported_operations(self) -> list:
+        return ["run"]
+
+
+def make_request(name: str, priority: int = 5, engines=(EngineType.ANALYTICS,), **parameters) -> OrchestrationRequest:
+    return OrchestrationRequest(
+        request_id=name,
+        operation="run",
+        parameters={"name": name, **parameters},
+        required_engines=list(engines),
+        strategy=OrchestrationStrategy.PARALLEL,
+        priority=priority
+    )
+
+
+class TestOrchestratorScheduling:
+    """Test cases for the orchestrator worker pool"""
+
+    @pytest.mark.asyncio
+    async def test_priority_order_with_single_worker(self):
+        orchestrator = SupremeOrchestrator()
+        orchestrator.max_workers = 1
+        orchestrator.aging_interval = None
+        engine = RecordingEngine("analytics")
+        orchestrator.register_engine(EngineType.ANALYTICS, engine, ["run"])
+
+        for name, priority in [("low", 1), ("normal", 5), ("urgent", 9), ("normal2", 5)]:
+            await orchestrator.orchestrate_request(make_request(name, priority))
+        await orchestrator.initialize()
+        await asyncio.wait_for(orchestrator.orchestration_queue.join(), 2)
+        await orchestrator.shutdown()
+
+        assert engine.calls == ["urgent", "normal", "normal2", "low"]
+        assert orchestrator.completed_requests["low"].overall_status == "completed"
+
+    @pytest.mark.asyncio
+    async def test_aging_prevents_starvation(self):
+        orchestrator = SupremeOrchestrator()
+        orchestrator.max_workers = 1
+        orchestrator.aging_interval = 0.01
+        engine = RecordingEngine("analytics")
+        orchestrator.register_engine(EngineType.ANALYTICS, engine, ["run"])
+
+        await orchestrator.orchestrate_request(make_request("old", 1))
+        await asyncio.sleep(0.1)
+        await orchestrator.orchestrate_request(make_request("new", 4))
+        await orchestrator.initialize()
+        await asyncio.wait_for(orchestrator.orchestration_queue.join(), 2)
+        await orchestrator.shutdown()
+
+        assert engine.calls == ["old", "new"]
+
+    @pytest.mark.asyncio
+    async def test_slow_request_does_not_block_others(self):
+        orchestrator = SupremeOrchestrator()
+        orchestrator.max_workers = 4
+        slow, fast = RecordingEngine("reasoning"), RecordingEngine("analytics")
+        orchestrator.register_engine(EngineType.REASONING, slow, ["run"])
+        orchestrator.register_engine(EngineType.ANALYTICS, fast, ["run"])
+        await orchestrator.initialize()
+
+        await orchestrator.orchestrate_request(make_request("slow", engines=[EngineType.REASONING], delay=0.5))
+        await asyncio.sleep(0.01)
+        await orchestrator.orchestrate_request(make_request("fast", delay=0.0))
+        await asyncio.sleep(0.1)
+
+        assert "fast" in orchestrator.completed_requests
+        assert "slow" not in orchestrator.completed_requests
+        assert orchestrator.get_scheduler_metrics()["running_requests"] == 1
+        await orchestrator.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_engine_concurrency_limit(self):
+        orchestrator = SupremeOrchestrator()
+        orchestrator.max_workers = 6
+        engine = RecordingEngine("analytics", delay=0.05)
+        orchestrator.register_engine(EngineType.ANALYTICS, engine, ["run"])
+        orchestrator.set_engine_concurrency(EngineType.ANALYTICS, 2)
+        await orchestrator.initialize()
+
+        for i in range(6):
+            await orchestrator.orchestrate_request(make_request(f"r{i}"))
+        await asyncio.wait_for(orchestrator.orchestration_queue.join(), 2)
+        metrics = orchestrator.get_scheduler_metrics()
+        await orchestrator.shutdown()
+
+        assert engine.peak == 2
+        assert len(orchestrator.completed_requests) == 6
+        assert metrics["engines"]["analytics"] == {"limit": 2, "in_flight": 0}
+        assert metrics["wait_time"]["max"] >= 0.0
+
+    @pytest.mark.asyncio
+    async def test_admission_control_rejects_when_backlog_full(self):
+        orchestrator = SupremeOrchestrator()
+        orchestrator.max_queue_size = 2
+
+        assert await orchestrator.orchestrate_request(make_request("a")) == "a"
+        assert await orchestrator.orchestrate_request(make_request("b")) == "b"
+        assert await orchestrator.orchestrate_request(make_request("c")) == ""
+
+        metrics = orchestrator.get_orchestration_status()["scheduler"]
+        assert metrics["rejected_requests"] == 1
+        assert metrics["queue_depth"] == metrics["peak_queue_depth"] == 2
+        assert "c" not in orchestrator.active_requests
+
+
+class TestResultDelivery:
+    """Test cases for future-based result delivery"""
+
+    @pytest.mark.asyncio
+    async def test_result_delivered_without_polling_delay(self):
+        orchestrator = SupremeOrchestrator()
+        orchestrator.register_engine(EngineType.ANALYTICS, RecordingEngine("analytics"), ["run"])
+        await orchestrator.initialize()
+
+        request_id = await orchestrator.orchestrate_request(make_request("quick", delay=0.01))
+        started = time.perf_counter()
+        result = await orchestrator.get_orchestration_result(request_id, timeout=2)
+        elapsed = time.perf_counter() - started
+        await orchestrator.shutdown()
+
+        assert result.overall_status == "completed"
+        assert result.engine_results == {"analytics": {"name": "quick", "engine": "analytics"}}
+        assert elapsed < 0.05
+        assert orchestrator.result_futures == {}
+        assert await orchestrator.get_orchestration_result(request_id, timeout=0) is result
+
+    @pytest.mark.asyncio
+    async def test_streaming_callback_receives_engine_results_as_they_finish(self):
+        orchestrator = SupremeOrchestrator()
+        orchestrator.register_engine(EngineType.REASONING, RecordingEngine("reasoning", delay=0.1), ["run"])
+        orchestrator.register_engine(EngineType.ANALYTICS, RecordingEngine("analytics", delay=0.01), ["run"])
+        await orchestrator.initialize()
+
+        streamed = []
+
+        async def on_engine_result(engine_name, engine_result):
+            streamed.append((engine_name, engine_result))
+
+        request_id = await orchestrator.orchestrate_request(
+            make_request("both", engines=[EngineType.REASONING, EngineType.ANALYTICS]), on_engine_result
+        )
+        await asyncio.sleep(0.05)
+        assert streamed == [("analytics", {"name": "both", "engine": "analytics"})]
+
+        result = await orchestrator.get_orchestration_result(request_id, timeout=2)
+        await orchestrator.shutdown()
+        assert [name for name, _ in streamed] == ["analytics", "reasoning"]
+        assert set(result.engine_results) == {"analytics", "reasoning"}
+        assert request_id not in orchestrator.result_streams
+
+    @pytest.mark.asyncio
+    async def test_timeout_and_shutdown_release_waiters(self):
+        orchestrator = SupremeOrchestrator()
+        request_id = await orchestrator.orchestrate_request(make_request("never"))
+
+        assert await orchestrator.get_orchestration_result(request_id, timeout=0.01) is None
+        assert await orchestrator.get_orchestration_result("unknown", timeout=1) is None
+
+        waiter = asyncio.create_task(orchestrator.get_orchestration_result(request_id, timeout=5))
+        await asyncio.sleep(0)
+        await orchestrator.shutdown()
+        result = await asyncio.wait_for(waiter, 1)
+        assert result.overall_status == "cancelled"
+        assert "never" not in orchestrator.active_requests
+
+    def test_result_store_ttl_and_size(self, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr(time, "monotonic", lambda: now[0])
+        store = ResultStore(max_entries=2, ttl=10)
+
+        for name in ["a", "b", "c"]:
+            store[name] = OrchestrationResult(name, "completed", {}, 0.0)
+            now[0] += 4
+        assert "a" not in store and store["b"].request_id == "b"
+        assert store.get_statistics()["evicted"] == 1
+
+        now[0] += 3
+        assert len(store) == 1 and "c" in store
+        assert store.get_statistics()["expired"] == 1
+
+
+class TestDAGStrategy:
+    """Test cases for dependency-aware orchestration"""
+
+    @staticmethod
+    def dag_orchestrator(delays):
+        orchestrator = SupremeOrchestrator()
+        for engine_type, delay in delays.items():
+            orchestrator.register_engine(engine_type, RecordingEngine(engine_type.value, delay), ["run"])
+        return orchestrator
+
+    @pytest.mark.asyncio
+    async def test_runs_on_critical_path_and_passes_upstream_outputs(self):
+        orchestrator = self.dag_orchestrator({
+            EngineType.ANALYTICS: 0.1, EngineType.KNOWLEDGE: 0.15, EngineType.REASONING: 0.1
+        })
+        request = make_request("composite", engines=[
+            EngineType.REASONING, EngineType.ANALYTICS, EngineType.KNOWLEDGE
+        ])
+        request.strategy = OrchestrationStrategy.DAG
+        request.engine_dependencies = {EngineType.REASONING: [EngineType.ANALYTICS]}
+
+        started = time.perf_counter()
+        result = await orchestrator._execute_orchestration_request(request)
+        elapsed = time.perf_counter() - started
+
+        assert result.overall_status == "completed"
+        assert 0.2 <= elapsed < 0.3
+        assert result.engine_results["reasoning"]["upstream"] == {
+            "analytics": {"name": "composite", "engine": "analytics"}
+        }
+        assert "upstream" not in result.engine_results["knowledge"]
+        assert len(orchestrator.coordinator.shared_data_store) == 0
+
+    @pytest.mark.asyncio
+    async def test_upstream_output_survives_shared_data_eviction(self):
+        orchestrator = self.dag_orchestrator({EngineType.ANALYTICS: 0.0, EngineType.REASONING: 0.0})
+        store = orchestrator.coordinator.shared_data_store
+        store.max_entries = 1
+        request = make_request("evicted", engines=[EngineType.ANALYTICS, EngineType.REASONING])
+        request.strategy = OrchestrationStrategy.DAG
+        request.engine_dependencies = {EngineType.REASONING: [EngineType.ANALYTICS]}
+
+        original_set = store.set
+
+        def set_and_evict(key, data, source, ttl=None):
+            version = original_set(key, data, source, ttl)
+            original_set("unrelated", "pressure", "reasoning")
+            return version
+
+        store.set = set_and_evict
+        result = await orchestrator._execute_orchestration_request(request)
+
+        assert result.overall_status == "completed"
+        assert result.engine_results["reasoning"]["upstream"] == {
+            "analytics": {"name": "evicted", "engine": "analytics"}
+        }
+
+    @pytest.mark.asyncio
+    async def test_failed_step_skips_only_its_dependents(self):
+        orchestrator = self.dag_orchestrator({EngineType.ANALYTICS: 0.0, EngineType.REASONING: 0.0})
+        request = make_request("partial", engines=[
+            EngineType.SECURITY, EngineType.REASONING, EngineType.ANALYTICS
+        ])
+        request.strategy = OrchestrationStrategy.ADAPTIVE
+        request.engine_dependencies = {EngineType.REASONING: [EngineType.SECURITY]}
+
+        result = await orchestrator._execute_orchestration_request(request)
+
+        assert result.overall_status == "partial_failure"
+        assert result.engine_results["security"] == {"error": "Engine not registered"}
+        assert "security did not complete" in result.engine_results["reasoning"]["error"]
+        assert result.engine_results["analytics"]["engine"] == "analytics"
+
+    @pytest.mark.asyncio
+    async def test_invalid_graph_fails_request(self):
+        orchestrator = self.dag_orchestrator({EngineType.ANALYTICS: 0.0, EngineType.REASONING: 0.0})
+        request = make_request("cyclic", engines=[EngineType.ANALYTICS, EngineType.REASONING])
+        request.strategy = OrchestrationStrategy.DAG
+        request.engine_dependencies = {
+            EngineType.ANALYTICS: [EngineType.REASONING], EngineType.REASONING: [EngineType.ANALYTICS]
+        }
+
+        result = await orchestrator._execute_orchestration_request(request)
+        assert result.overall_status == "failed"
+        assert "circular" in result.errors[0]
+
+
+class TestEngineCoordinator:
+    """Test cases for coordination history and the shared data store"""
+
+    @pytest.mark.asyncio
+    async def test_history_is_bounded_and_queryable(self):
+        coordinator = EngineCoordinator(history_size=5)
+        coordinator.register_engine(EngineType.ANALYTICS, RecordingEngine("analytics"), ["run"])
+
+        for i in range(8):
+            coordinator.share_data(f"key{i}", i, EngineType.REASONING)
+        await coordinator.send_message(EngineType.REASONING, EngineType.ANALYTICS, {"hello": True})
+
+        assert len(coordinator.coordination_history) == 5
+        assert coordinator.get_coordination_history(event_type="message") == [{
+            "type": "message", "source": "reasoning", "target": "analytics",
+            "timestamp": coordinator.coordination_history[-1].timestamp
+        }]
+        assert [event["key"] for event in coordinator.get_coordination_history(limit=2, event_type="data_share")] == [
+            "key6", "key7"
+        ]
+        assert not hasattr(coordinator.coordination_history[0], "__dict__")
+
+    def test_shared_data_versions_ttl_and_size_limit(self, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr(time, "time", lambda: now[0])
+        store = SharedDataStore(max_entries=2)
+
+        assert store.set("a", 1, "reasoning", ttl=5) == 1
+        assert store.set("a", 2, "reasoning", ttl=5) == 2
+        now[0] += 3
+        store.delete("a")
+        store.set("a", 3, "reasoning")
+        now[0] += 3
+        assert store.get("a") == 3 and store.get_entry("a").version == 1
+
+        store.set("b", 1, "analytics", ttl=1)
+        now[0] += 2
+        assert "b" not in store and store.expired == 1
+
+        store.set("c", 1, "analytics")
+        store.set("d", 1, "analytics")
+        assert "a" not in store and len(store) == 2 and store.evicted == 1
+
+    @pytest.mark.asyncio
+    async def test_subscribers_and_waiters(self):
+        coordinator = EngineCoordinator()
+        seen = []
+        coordinator.subscribe_shared_data("plan", lambda key, data, version: seen.append((data, version)))
+
+        waiter = asyncio.create_task(coordinator.wait_for_shared_data("plan", timeout=1))
+        second = asyncio.create_task(coordinator.wait_for_shared_data("plan", timeout=1, min_version=2))
+        await asyncio.sleep(0)
+        coordinator.share_data("plan", "draft", EngineType.REASONING)
+        assert await waiter == "draft"
+        assert not second.done()
+
+        coordinator.share_data("plan", "final", EngineType.REASONING)
+        assert await second == "final"
+        assert seen == [("draft", 1), ("final", 2)]
+        assert coordinator.get_shared_version("plan") == 2
+
+        assert await coordinator.wait_for_shared_data("missing", timeout=0.01) is None
+        assert coordinator.shared_data_store.get_statistics()["waiters"] == 0
+
+    @pytest.mark.asyncio
+    async def test_async_subscribers_are_referenced_until_done(self, caplog):
+        store = SharedDataStore()
+        release = asyncio.Event()
+        seen = []
+
+        async def subscriber(key, data, version):
+            await release.wait()
+            seen.append(data)
+
+        async def failing_subscriber(key, data, version):
+            raise ValueError("subscriber failed")
+
+        store.subscribe("plan", subscriber)
+        store.subscribe("plan", failing_subscriber)
+        store.set("plan", "draft", "reasoning")
+        assert len(store._subscriber_tasks) == 2
+
+        release.set()
+        while store._subscriber_tasks:
+            await asyncio.sleep(0)
+        assert seen == ["draft"]
+        assert "subscriber failed" in caplog.text
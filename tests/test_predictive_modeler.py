@@ -0,0 +1,282 @@
+"""
+Tests for Supreme Predictive Modeler
+"""
+
+import asyncio
+import os
+
+import numpy as np
+import pytest
+
+from core.supreme.engines.predictive_modeler import (
+    SupremePredictiveModeler, ModelStatus, FeaturePipeline, PredictionBatcher
+)
+from core.supreme.supreme_config import EngineConfig
+
+
+def make_training_data(rows=200):
+    rng = np.random.default_rng(0)
+    return [
+        {"a": float(a), "b": float(b), "color": ["red", "blue"][i % 2], "target": float(2 * a + b)}
+        for i, (a, b) in enumerate(rng.normal(size=(rows, 2)))
+    ]
+
+
+@pytest.fixture
+def modeler(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    modeler = SupremePredictiveModeler("predictive_modeler", EngineConfig(auto_scaling=False, max_resources=1))
+    yield modeler
+    if modeler._training_executor is not None:
+        modeler._training_executor.shutdown(wait=True)
+
+
+async def create_model(modeler, **parameters):
+    parameters.setdefault("model_name", "test model")
+    parameters.setdefault("target_column", "target")
+    result = await modeler._create_model(parameters)
+    return result["model_id"]
+
+
+class TestTrainingScheduler:
+    """Test cases for the training job queue"""
+
+    @pytest.mark.asyncio
+    async def test_train_returns_job_immediately(self, modeler):
+        model_id = await create_model(modeler)
+
+        result = await modeler._train_model({"model_id": model_id, "training_data": make_training_data()})
+        assert result["status"] in ("queued", "training")
+        assert result["job_id"] in modeler.training_jobs
+
+        await asyncio.gather(*modeler._running_training.values())
+        info = await modeler._get_model_info({"model_id": model_id})
+        assert info["is_trained"]
+        assert info["training_job"]["status"] == "trained"
+        assert info["training_job"]["progress"] == 1.0
+
+    @pytest.mark.asyncio
+    async def test_wait_returns_metrics(self, modeler):
+        model_id = await create_model(modeler)
+
+        result = await modeler._train_model({
+            "model_id": model_id, "training_data": make_training_data(), "wait": True
+        })
+        assert result["status"] == "completed"
+        assert result["validation_metrics"]["r2"] > 0.9
+
+    @pytest.mark.asyncio
+    async def test_priority_and_cancellation(self, modeler):
+        model_id = await create_model(modeler)
+        data = make_training_data()
+
+        first = await modeler._train_model({"model_id": model_id, "training_data": data})
+        low = await modeler._train_model({"model_id": model_id, "training_data": data, "priority": 1})
+        high = await modeler._train_model({"model_id": model_id, "training_data": data, "priority": 9})
+        assert first["status"] == "training"
+        assert high["queue_position"] == 1
+        assert modeler._queue_position(low["job_id"]) == 2
+
+        cancelled = await modeler._cancel_training_job({"job_id": low["job_id"]})
+        assert cancelled["status"] == "cancelled"
+
+        while modeler._running_training:
+            await asyncio.gather(*list(modeler._running_training.values()))
+
+        assert modeler.training_jobs[high["job_id"]].status == ModelStatus.TRAINED
+        assert modeler.training_jobs[low["job_id"]].status == ModelStatus.CANCELLED
+
+    @pytest.mark.asyncio
+    async def test_cancelled_running_job_keeps_previous_artifact(self, modeler):
+        model_id = await create_model(modeler)
+        data = make_training_data()
+        await modeler._train_model({"model_id": model_id, "training_data": data, "wait": True})
+        model_path = modeler._model_path(model_id)
+        published = os.stat(model_path).st_mtime_ns
+
+        running = await modeler._train_model({"model_id": model_id, "training_data": data})
+        assert running["status"] == "training"
+        await modeler._cancel_training_job({"job_id": running["job_id"]})
+        await asyncio.gather(*modeler._running_training.values())
+
+        assert os.stat(model_path).st_mtime_ns == published
+        assert sorted(os.listdir(modeler.models_dir)) == sorted([
+            os.path.basename(model_path), os.path.basename(model_path)[:-len(".joblib")] + ".pipeline.joblib"
+        ])
+
+    @pytest.mark.asyncio
+    async def test_jobs_for_one_model_run_one_at_a_time(self, modeler):
+        modeler.max_concurrent_training = 2
+        first_model = await create_model(modeler)
+        second_model = await create_model(modeler)
+        data = make_training_data()
+
+        first = await modeler._train_model({"model_id": first_model, "training_data": data})
+        repeat = await modeler._train_model({"model_id": first_model, "training_data": data})
+        other = await modeler._train_model({"model_id": second_model, "training_data": data})
+        assert first["status"] == "training"
+        assert repeat["status"] == "queued"
+        assert other["status"] == "training"
+
+        while modeler._running_training:
+            await asyncio.gather(*list(modeler._running_training.values()))
+        assert modeler.training_jobs[repeat["job_id"]].status == ModelStatus.TRAINED
+
+    @pytest.mark.asyncio
+    async def test_failed_job_reports_error(self, modeler):
+        model_id = await create_model(modeler, target_column="missing")
+
+        result = await modeler._train_model({
+            "model_id": model_id, "training_data": make_training_data(), "wait": True
+        })
+        assert result["status"] == "failed"
+        assert modeler.training_jobs[result["job_id"]].error_message
+
+
+class TestPredictionBatcher:
+    """Test cases for predict micro-batching"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_predictions_are_coalesced(self, modeler):
+        model_id = await create_model(modeler, algorithm="random_forest_regressor",
+                                      hyperparameters={"n_estimators": 10})
+        await modeler._train_model({"model_id": model_id, "training_data": make_training_data(), "wait": True})
+
+        rows = [{"a": float(i) / 10, "b": 0.5, "color": "red"} for i in range(100)]
+        results = await asyncio.gather(*[
+            modeler._make_prediction({"model_id": model_id, "input_data": row}) for row in rows
+        ])
+        unbatched = await modeler._make_prediction({"model_id": model_id, "input_data": rows, "batching": False})
+
+        assert [r["predictions"][0] for r in results] == unbatched["predictions"]
+        assert max(r["batch_rows"] for r in results) > 1
+
+        status = await modeler._get_modeler_status({})
+        server = status["prediction_server"]
+        assert server["total_requests"] == 100
+        assert server["total_batches"] < 100
+        assert server["p99_latency_ms"] >= server["p50_latency_ms"]
+
+    @pytest.mark.asyncio
+    async def test_bad_row_only_fails_its_request(self, modeler):
+        model_id = await create_model(modeler, feature_columns=["a", "b"])
+        await modeler._train_model({"model_id": model_id, "training_data": make_training_data(), "wait": True})
+
+        good, bad = await asyncio.gather(
+            modeler._make_prediction({"model_id": model_id, "input_data": {"a": 1.0, "b": 2.0}}),
+            modeler._make_prediction({"model_id": model_id, "input_data": {"a": "not a number", "b": 2.0}})
+        )
+        assert "predictions" in good
+        assert "error" in bad
+
+    @pytest.mark.asyncio
+    async def test_batch_tasks_are_referenced_until_done(self):
+        release = asyncio.Event()
+
+        async def run_batch(model_id, rows):
+            await release.wait()
+            return {"predictions": [row["x"] * 2 for row in rows]}
+
+        batcher = PredictionBatcher(run_batch, max_batch_rows=2)
+        requests = [asyncio.ensure_future(batcher.submit("model", [{"x": x}])) for x in (1, 2)]
+        await asyncio.sleep(0)
+        assert len(batcher._tasks) == 1
+
+        release.set()
+        results = await asyncio.gather(*requests)
+        await asyncio.sleep(0)
+        assert [result["predictions"] for result in results] == [[2], [4]]
+        assert not batcher._tasks
+
+
+class TestFeaturePipeline:
+    """Test cases for compiled preprocessing pipelines"""
+
+    @pytest.mark.asyncio
+    async def test_matches_fitted_preprocessing(self, modeler):
+        model_id = await create_model(modeler, feature_columns=["a", "b", "color"])
+        await modeler._train_model({"model_id": model_id, "training_data": make_training_data(), "wait": True})
+
+        pipeline = modeler.model_pipelines[model_id]
+        encoder = modeler.model_encoders[model_id]["color"]
+        scaler = modeler.model_scalers[model_id]
+        rows = [{"a": 0.5, "b": -1.0, "color": "blue"}, {"a": 2.0, "b": 0.0, "color": "red"}]
+
+        expected = scaler.transform(np.array([
+            [row["a"], row["b"], encoder.transform([row["color"]])[0]] for row in rows
+        ]))
+        assert np.allclose(pipeline.transform(rows), expected)
+        assert np.allclose(pipeline.transform(np.array([[0.5, -1.0, "blue"], [2.0, 0.0, "red"]], dtype=object)), expected)
+
+    @pytest.mark.asyncio
+    async def test_missing_values_use_training_means(self, modeler):
+        model_id = await create_model(modeler, feature_columns=["a", "b"])
+        data = make_training_data()
+        await modeler._train_model({"model_id": model_id, "training_data": data, "wait": True})
+
+        pipeline = modeler.model_pipelines[model_id]
+        filled = pipeline.transform([{"b": 1.0}, {"a": 100.0, "b": 1.0}])
+        imputed = pipeline.transform([{"a": np.mean([row["a"] for row in data]), "b": 1.0}])
+        assert np.allclose(filled[0], imputed[0])
+
+        with pytest.raises(ValueError):
+            modeler.model_pipelines[model_id].transform([{"a": 1.0, "b": "x"}])
+
+    @pytest.mark.asyncio
+    async def test_unseen_category_is_rejected(self, modeler):
+        model_id = await create_model(modeler)
+        await modeler._train_model({"model_id": model_id, "training_data": make_training_data(), "wait": True})
+
+        with pytest.raises(ValueError, match="unseen"):
+            modeler.model_pipelines[model_id].transform([{"a": 1.0, "b": 1.0, "color": "green"}])
+
+    @pytest.mark.asyncio
+    async def test_pipeline_is_persisted_with_model(self, modeler):
+        model_id = await create_model(modeler)
+        await modeler._train_model({"model_id": model_id, "training_data": make_training_data(), "wait": True})
+        row = {"a": 1.0, "b": 1.0, "color": "red"}
+        before = await modeler._make_prediction({"model_id": model_id, "input_data": row, "batching": False})
+
+        restarted = SupremePredictiveModeler("predictive_modeler", EngineConfig(auto_scaling=False))
+        await restarted._load_model_data()
+        await restarted._load_trained_models()
+
+        assert isinstance(restarted.model_pipelines[model_id], FeaturePipeline)
+        after = await restarted._make_prediction({"model_id": model_id, "input_data": row, "batching": False})
+        assert after["predictions"] == before["predictions"]
+
+
+class TestModelStore:
+    """Test cases for lazy model loading"""
+
+    @pytest.mark.asyncio
+    async def test_models_load_on_first_use_and_evict(self, modeler):
+        data = make_training_data()
+        model_ids = []
+        for _ in range(3):
+            model_id = await create_model(modeler, algorithm="random_forest_regressor",
+                                          hyperparameters={"n_estimators": 5})
+            await modeler._train_model({"model_id": model_id, "training_data": data, "wait": True})
+            model_ids.append(model_id)
+
+        restarted = SupremePredictiveModeler("predictive_modeler", EngineConfig(auto_scaling=False))
+        await restarted._load_model_data()
+        await restarted._load_trained_models()
+        store = restarted.trained_models
+        assert len(store) == 3
+        assert store.get_statistics()["resident_models"] == 0
+
+        artifact_size = os.path.getsize(restarted._model_path(model_ids[0]))
+        store.memory_budget = int(artifact_size * 1.5)
+
+        row = {"a": 1.0, "b": 1.0, "color": "red"}
+        for model_id in model_ids + model_ids[-1:]:
+            result = await restarted._make_prediction({"model_id": model_id, "input_data": row, "batching": False})
+            assert "predictions" in result
+
+        stats = store.get_statistics()
+        assert stats["misses"] == 3
+        assert stats["hits"] == 1
+        assert stats["evictions"] == 2
+        assert stats["resident_models"] == 1
+        assert model_ids[0] in store
@@ -0,0 +1,417 @@
+"""
+Tests for Supreme Real-Time Processor
+"""
+
+import math
+import random
+import time
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+
+from core.supreme.engines.real_time_processor import (
+    SupremeRealTimeProcessor,
+    StreamRingBuffer,
+    SlidingWindowAggregator,
+    StreamSegmentStore
+)
+from core.supreme.supreme_config import EngineConfig
+
+
+@pytest.fixture
+def processor(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    return SupremeRealTimeProcessor("real_time_processor", EngineConfig(auto_scaling=False))
+
+
+async def create_stream(processor, **parameters):
+    parameters.setdefault("stream_name", "sensor")
+    result = await processor._create_data_stream(parameters)
+    return result["stream_id"]
+
+
+class TestStreamRingBuffer:
+    """Test cases for StreamRingBuffer"""
+
+    def test_wraps_and_keeps_order(self):
+        buffer = StreamRingBuffer(capacity=5)
+        for i in range(7):
+            buffer.append(float(i), float(i * 10))
+
+        assert len(buffer) == 5
+        assert buffer.timestamps().tolist() == [2, 3, 4, 5, 6]
+        assert buffer.values().tolist() == [20, 30, 40, 50, 60]
+
+    def test_extend_larger_than_capacity(self):
+        buffer = StreamRingBuffer(capacity=4)
+        buffer.append(0.0, 0.0)
+        buffer.extend(np.arange(1, 11, dtype=float), np.arange(1, 11, dtype=float))
+
+        assert buffer.timestamps().tolist() == [7, 8, 9, 10]
+
+    def test_since_and_tail(self):
+        buffer = StreamRingBuffer(capacity=10)
+        buffer.extend(np.arange(10, dtype=float), np.arange(10, dtype=float) * 2)
+
+        timestamps, values = buffer.since(7.5)
+        assert timestamps.tolist() == [8, 9]
+        assert values.tolist() == [16, 18]
+
+        timestamps, values = buffer.tail(3)
+        assert timestamps.tolist() == [7, 8, 9]
+
+    def test_late_points_are_merged_in_order(self):
+        buffer = StreamRingBuffer(capacity=4)
+        buffer.append(10.0, 5.0)
+        buffer.append(2.0, 1.0)
+        buffer.append(6.0, 2.0)
+
+        timestamps, values = buffer.since(5.0)
+        assert timestamps.tolist() == [6, 10]
+        assert values.sum() == 7.0
+
+        buffer.extend(np.array([12.0, 4.0, 11.0]), np.array([7.0, 3.0, 6.0]))
+        assert buffer.timestamps().tolist() == [6, 10, 11, 12]
+        buffer.append(1.0, 0.0)  # older than everything in a full buffer
+        assert buffer.values().tolist() == [2, 5, 6, 7]
+
+
+    def test_missing_values_are_nan_and_reads_are_clamped(self):
+        buffer = StreamRingBuffer(capacity=3)
+        buffer.append(1.0)
+        buffer.append(2.0, 4.0)
+
+        timestamps, values = buffer.tail(10)
+        assert timestamps.tolist() == [1, 2]
+        assert np.isnan(values[0]) and values[1] == 4.0
+        assert buffer.since(5.0)[0].size == 0
+
+        buffer.clear()
+        assert len(buffer) == 0
+        assert buffer.tail(2)[0].size == 0
+
+
+class TestSlidingWindowAggregator:
+    """Test cases for SlidingWindowAggregator"""
+
+    @pytest.mark.parametrize("max_points,max_age", [(7, None), (None, 5.0), (50, 3.0)])
+    def test_matches_full_recomputation(self, max_points, max_age):
+        random.seed(0)
+        aggregator = SlidingWindowAggregator(max_points=max_points, max_age=max_age)
+        history = []
+
+        for step in range(1500):
+            timestamp = step * 0.1
+            value = random.choice([float(random.randint(0, 5)), random.gauss(0, 100), float("nan")])
+            aggregator.push(timestamp, value)
+            history.append((timestamp, value))
+
+            window = [h for h in history if max_age is None or h[0] >= timestamp - max_age]
+            if max_points:
+                window = window[-max_points:]
+            values = np.array([v for _, v in window if not math.isnan(v)])
+
+            snapshot = aggregator.snapshot()
+            assert len(aggregator) == len(window)
+            if not len(values):
+                assert snapshot == {}
+                continue
+
+            tolerance = 1e-6 * (1 + np.abs(values).max())
+            assert snapshot["count"] == len(values)
+            assert snapshot["average"] == pytest.approx(values.mean(), abs=tolerance)
+            assert snapshot["min"] == values.min()
+            assert snapshot["max"] == values.max()
+            assert snapshot["median"] == pytest.approx(np.median(values))
+            if len(values) > 1:
+                assert snapshot["std_dev"] == pytest.approx(values.std(ddof=1), abs=tolerance)
+
+    @pytest.mark.parametrize("max_points,max_age", [(7, None), (None, 5.0)])
+    def test_late_points_match_full_recomputation(self, max_points, max_age):
+        random.seed(1)
+        aggregator = SlidingWindowAggregator(max_points=max_points, max_age=max_age)
+        history = []
+
+        for step in range(400):
+            timestamp = step * 0.1 - random.choice([0.0, 0.0, 0.35, 1.2, 6.0])
+            value = float(random.randint(0, 20))
+            aggregator.push(timestamp, value)
+            history.append((timestamp, value))
+
+            ordered = sorted(history, key=lambda h: h[0])
+            newest = ordered[-1][0]
+            window = [h for h in ordered if max_age is None or h[0] >= newest - max_age]
+            if max_points:
+                window = window[-max_points:]
+            values = np.array([v for _, v in window])
+
+            snapshot = aggregator.snapshot()
+            assert len(aggregator) == len(window)
+            assert snapshot["count"] == len(values)
+            assert snapshot["sum"] == pytest.approx(values.sum())
+            assert snapshot["min"] == values.min()
+            assert snapshot["max"] == values.max()
+            assert snapshot["median"] == pytest.approx(np.median(values))
+
+
+    def test_evict_before_and_extend(self):
+        aggregator = SlidingWindowAggregator(max_points=100)
+        aggregator.extend(np.arange(10, dtype=float), np.array([5.0, 1.0, 9.0, 3.0, 7.0, 2.0, 8.0, 4.0, 6.0, 0.0]))
+
+        aggregator.evict_before(6.0)
+        assert len(aggregator) == 4
+        assert aggregator.snapshot() == pytest.approx({
+            "count": 4, "sum": 18.0, "average": 4.5, "min": 0.0, "max": 8.0, "median": 5.0,
+            "std_dev": np.std([8.0, 4.0, 6.0, 0.0], ddof=1)
+        })
+
+        aggregator.evict_before(100.0)
+        assert len(aggregator) == 0
+        assert aggregator.snapshot() == {}
+
+
+class TestSupremeRealTimeProcessor:
+    """Test cases for SupremeRealTimeProcessor"""
+
+    @pytest.mark.asyncio
+    async def test_process_and_aggregate(self, processor):
+        stream_id = await create_stream(processor)
+        data_points = [{"value": float(v)} for v in range(1, 11)] + [{"label": "no value"}]
+
+        result = await processor._process_streaming_data({"stream_id": stream_id, "data_points": data_points})
+        assert result["processed_count"] == 11
+        assert result["current_stats"]["average"] == 5.5
+        assert result["current_stats"]["latest_value"] == 10.0
+
+        result = await processor._aggregate_window_data({
+            "stream_id": stream_id,
+            "aggregations": ["sum", "count", "median", "min", "max"]
+        })
+        assert result["data_points"] == 11
+        assert result["aggregations"] == {"sum": 55.0, "count": 10, "median": 5.5, "min": 1.0, "max": 10.0}
+
+    @pytest.mark.asyncio
+    async def test_iso_timestamps_are_stored_as_epoch_seconds(self, processor):
+        stream_id = await create_stream(processor)
+        now = datetime.now()
+        old = now - timedelta(seconds=120)
+
+        await processor._process_streaming_data({"stream_id": stream_id, "data_points": [
+            {"value": 1.0, "timestamp": old.isoformat()},
+            {"value": 2.0, "timestamp": now.isoformat()}
+        ]})
+
+        buffer = processor.stream_buffers[stream_id]
+        assert buffer.timestamps().dtype == np.float64
+        assert buffer.timestamps().tolist() == [old.timestamp(), now.timestamp()]
+        result = await processor._aggregate_window_data({
+            "stream_id": stream_id, "window_size": 60, "aggregations": ["count", "sum"]
+        })
+        assert result["aggregations"] == {"count": 1, "sum": 2.0}
+
+    @pytest.mark.asyncio
+    async def test_aggregators_are_backfilled_once_and_updated_in_place(self, processor):
+        processor.current_stats_points = 20
+        stream_id = await create_stream(processor)
+        values = np.random.default_rng(3).normal(10, 3, 50)
+
+        await processor._process_streaming_data({"stream_id": stream_id, "values": values[:30]})
+        aggregator = processor.stream_aggregators[stream_id][(20, None)]
+        result = await processor._process_streaming_data({
+            "stream_id": stream_id, "data_points": [{"value": float(v)} for v in values[30:]]
+        })
+
+        assert processor.stream_aggregators[stream_id][(20, None)] is aggregator
+        stats = result["current_stats"]
+        assert stats["data_points"] == 20
+        assert stats["latest_value"] == values[-1]
+        assert stats["average"] == pytest.approx(values[-20:].mean())
+        assert stats["std_dev"] == pytest.approx(values[-20:].std(ddof=1))
+        assert (stats["min"], stats["max"]) == (values[-20:].min(), values[-20:].max())
+
+    @pytest.mark.asyncio
+    async def test_least_recently_used_aggregators_are_dropped(self, processor):
+        processor.max_aggregators_per_stream = 3
+        stream_id = await create_stream(processor)
+        await processor._process_streaming_data({"stream_id": stream_id, "values": [1.0, 2.0, 3.0]})
+
+        for window_size in (10, 20, 10, 30, 40):
+            await processor._aggregate_window_data({"stream_id": stream_id, "window_size": window_size})
+
+        capacity = processor.buffer_capacity
+        assert list(processor.stream_aggregators[stream_id]) == [(capacity, 10), (capacity, 30), (capacity, 40)]
+
+    @pytest.mark.asyncio
+    async def test_batch_ingest_matches_point_ingest(self, processor):
+        values = np.random.default_rng(1).normal(50, 20, 2000)
+        values[::97] = 300
+        thresholds = {"max": 250, "spike": 0.8}
+
+        point_stream = await create_stream(processor, stream_name="points", alert_thresholds=thresholds)
+        batch_stream = await create_stream(processor, stream_name="batch", alert_thresholds=thresholds)
+
+        now = time.time()
+        for chunk in np.array_split(values, 4):
+            await processor._process_streaming_data({
+                "stream_id": point_stream,
+                "data_points": [{"value": float(v), "timestamp": now} for v in chunk]
+            })
+            result = await processor._process_streaming_data({
+                "stream_id": batch_stream,
+                "values": chunk,
+                "timestamps": np.full(len(chunk), now)
+            })
+            assert result["processed_count"] == len(chunk)
+
+        def alerts_for(stream_id):
+            return [(a.alert_type, a.value) for a in processor.stream_alerts if a.stream_id == stream_id]
+
+        assert alerts_for(batch_stream) == alerts_for(point_stream)
+        assert len(alerts_for(batch_stream)) > 0
+        assert np.array_equal(processor.stream_buffers[batch_stream].values(),
+                              processor.stream_buffers[point_stream].values())
+
+    @pytest.mark.asyncio
+    async def test_batch_timestamp_formats_and_validation(self, processor):
+        stream_id = await create_stream(processor)
+        start = datetime(2026, 1, 1, 12, 0, 0)
+        iso = [(start + timedelta(seconds=i)).isoformat() for i in range(3)]
+        datetimes = np.array(["2026-01-02T12:00:00", "2026-01-02T12:00:01"], dtype="datetime64[s]")
+
+        await processor._process_streaming_data({"stream_id": stream_id, "values": [1.0, 2.0, 3.0], "timestamps": iso})
+        await processor._process_streaming_data({"stream_id": stream_id, "values": [4.0, 5.0], "timestamps": datetimes})
+
+        timestamps = processor.stream_buffers[stream_id].timestamps()
+        assert timestamps[:3].tolist() == [start.timestamp() + i for i in range(3)]
+        utc = datetime(2026, 1, 2, 12, 0, 0, tzinfo=timezone.utc).timestamp()
+        assert timestamps[3:].tolist() == [utc, utc + 1]
+
+        mismatched = await processor._process_streaming_data({
+            "stream_id": stream_id, "values": [1.0, 2.0], "timestamps": [0.0]
+        })
+        assert "same length" in mismatched["error"]
+        missing = await processor._process_streaming_data({"stream_id": "unknown", "values": [1.0]})
+        assert "not found" in missing["error"]
+
+    @pytest.mark.asyncio
+    async def test_windowed_batch_updates_window_once(self, processor):
+        stream_id = await create_stream(processor, processing_mode="windowed", window_size=60)
+
+        result = await processor._process_streaming_data({"stream_id": stream_id, "values": np.arange(500.0)})
+        await processor._process_streaming_data({"stream_id": stream_id, "values": np.arange(250.0)})
+
+        assert result["processed_count"] == 500
+        windows = processor.active_windows[stream_id]
+        assert len(windows) == 1
+        assert windows[0].point_count == 750
+        assert windows[0].data_points == []
+
+    @pytest.mark.asyncio
+    async def test_late_batch_matches_point_ingest(self, processor):
+        rng = np.random.default_rng(2)
+        thresholds = {"spike": 0.8}
+        point_stream = await create_stream(processor, stream_name="points", alert_thresholds=thresholds)
+        batch_stream = await create_stream(processor, stream_name="batch", alert_thresholds=thresholds)
+
+        now = time.time()
+        timestamps = now - 100 + np.arange(100, dtype=float)
+        values = rng.normal(50, 5, 100)
+        late_timestamps = timestamps[40:60] + 0.5
+        late_values = rng.normal(50, 5, 20)
+        late_values[[3, 11]] = 400.0
+        shuffle = rng.permutation(20)
+
+        window = {"window_size": now - timestamps[50] + 0.25, "aggregations": ["count"]}
+        for stream_id in (point_stream, batch_stream):
+            await processor._process_streaming_data({"stream_id": stream_id, "values": values,
+                                                     "timestamps": timestamps})
+            await processor._aggregate_window_data({"stream_id": stream_id, **window})
+        await processor._process_streaming_data({
+            "stream_id": point_stream,
+            "data_points": [{"value": float(v), "timestamp": float(t)}
+                            for t, v in zip(late_timestamps, late_values)]
+        })
+        await processor._process_streaming_data({
+            "stream_id": batch_stream, "values": late_values[shuffle], "timestamps": late_timestamps[shuffle]
+        })
+
+        def alerts_for(stream_id):
+            return [(a.alert_type, a.value) for a in processor.stream_alerts if a.stream_id == stream_id]
+
+        assert alerts_for(batch_stream) == alerts_for(point_stream) == [("spike", 400.0), ("spike", 400.0)]
+        for stream_id in (point_stream, batch_stream):
+            buffer = processor.stream_buffers[stream_id]
+            assert (np.diff(buffer.timestamps()) >= 0).all()
+            result = await processor._aggregate_window_data({"stream_id": stream_id, **window})
+            assert result["aggregations"]["count"] == 60
+
+    @pytest.mark.asyncio
+    async def test_time_windows_are_bounded_by_buffer_capacity(self, processor):
+        processor.buffer_capacity = 50
+        stream_id = await create_stream(processor)
+        await processor._process_streaming_data({"stream_id": stream_id, "values": [1.0] * 20})
+        await processor._aggregate_window_data({"stream_id": stream_id, "window_size": 60})
+
+        await processor._process_streaming_data({"stream_id": stream_id, "values": np.arange(200, dtype=float)})
+        result = await processor._aggregate_window_data({
+            "stream_id": stream_id, "window_size": 60, "aggregations": ["count", "min"]
+        })
+
+        assert result["aggregations"] == {"count": 50, "min": 150.0}
+        assert len(processor.stream_aggregators[stream_id][(50, 60)]) == 50
+
+    @pytest.mark.asyncio
+    async def test_restart_replays_segments(self, processor):
+        stream_id = await create_stream(processor, processing_mode="windowed", window_size=10)
+        await processor._process_streaming_data({"stream_id": stream_id, "values": [1.0, 2.0, 3.0]})
+        old_timestamp = time.time() - processor.replay_window - 60
+        await processor._process_streaming_data({
+            "stream_id": stream_id, "values": [99.0], "timestamps": [old_timestamp]
+        })
+        processor.segment_store.close()
+
+        restarted = SupremeRealTimeProcessor("real_time_processor", EngineConfig(auto_scaling=False))
+        await restarted._load_stream_data()
+
+        assert restarted.stream_configs[stream_id].window_size == 10
+        assert restarted.stream_buffers[stream_id].values().tolist() == [1.0, 2.0, 3.0]
+
+
+class TestStreamSegmentStore:
+    """Test cases for StreamSegmentStore"""
+
+    def replay(self, store):
+        configs, points = {}, []
+        store.replay(
+            lambda stream_id, data: configs.__setitem__(stream_id, data),
+            lambda stream_id, timestamps, values: points.append((stream_id, values.tolist()))
+        )
+        return configs, points
+
+    def test_compaction_keeps_only_checkpoint(self, tmp_path):
+        store = StreamSegmentStore(str(tmp_path), segment_max_bytes=64, max_segments=2)
+        store.append_config("a" * 16, {"name": "first"})
+        for i in range(5):
+            store.append_points("a" * 16, np.array([float(i)]), np.array([float(i)]))
+        assert store.needs_compaction()
+
+        store.compact({"a" * 16: {"name": "compacted"}}, {"a" * 16: (np.array([9.0]), np.array([9.0]))})
+        store.append_points("a" * 16, np.array([10.0]), np.array([10.0]))
+        store.close()
+
+        configs, points = self.replay(StreamSegmentStore(str(tmp_path)))
+        assert configs == {"a" * 16: {"name": "compacted"}}
+        assert points == [("a" * 16, [9.0]), ("a" * 16, [10.0])]
+
+    def test_replay_stops_at_torn_tail(self, tmp_path):
+        store = StreamSegmentStore(str(tmp_path))
+        store.append_points("b" * 16, np.array([1.0]), np.array([1.0]))
+        store.append_points("b" * 16, np.array([2.0]), np.array([2.0]))
+        store.close()
+
+        segment = next(tmp_path.glob("segment_*.log"))
+        segment.write_bytes(segment.read_bytes()[:-4])
+
+        _, points = self.replay(StreamSegmentStore(str(tmp_path)))
+        assert points == [("b" * 16, [1.0])]
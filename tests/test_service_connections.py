@@ -0,0 +1,151 @@
+"""
+Tests for Supreme Service Connections
+"""
+
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from enum import Enum
+from types import SimpleNamespace
+
+import pytest
+
+from core.supreme.engines.service_connections import TokenBucket, ServiceConnectionPool
+
+
+class AuthKind(Enum):
+    BEARER_TOKEN = "bearer_token"
+
+
+def make_connection(auth_type="bearer_token", auth_config=None, headers=None, connection_id="conn_1"):
+    config = SimpleNamespace(
+        service_id="svc", auth_type=auth_type, auth_config=auth_config or {"token": "a"},
+        headers=headers or {"Accept": "application/json"}, timeout=5, rate_limit=None
+    )
+    return SimpleNamespace(connection_id=connection_id, config=config)
+
+
+class FakeResponse:
+    """Minimal aiohttp response for a canned status"""
+
+    def __init__(self, status, headers):
+        self.status = status
+        self.headers = headers
+
+    async def text(self):
+        return '{"ok": true}' if self.status == 200 else ""
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+class FakeSession:
+    """Session that answers with queued (status, headers) pairs"""
+
+    closed = False
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.calls = 0
+
+    def request(self, method, url, **kwargs):
+        self.calls += 1
+        return FakeResponse(*self.responses.pop(0))
+
+
+class TestTokenBucket:
+    """Test cases for TokenBucket"""
+
+    @pytest.mark.asyncio
+    async def test_waits_for_refill_when_empty(self):
+        bucket = TokenBucket(rate=20.0, capacity=1)
+
+        assert await bucket.acquire() == 0.0
+        waited = await bucket.acquire()
+        assert 0.0 < waited <= 0.05
+
+    @pytest.mark.asyncio
+    async def test_refill_is_capped_at_capacity(self):
+        bucket = TokenBucket(rate=10.0, capacity=2)
+        await bucket.acquire()
+        await bucket.acquire()
+
+        bucket.updated -= 60
+        assert await bucket.acquire() == 0.0
+        assert bucket.tokens == pytest.approx(1.0)
+
+    @pytest.mark.asyncio
+    async def test_block_for_holds_back_unlimited_callers(self):
+        bucket = TokenBucket()
+        assert await bucket.acquire() == 0.0
+
+        bucket.block_for(0.05)
+        waited = await bucket.acquire()
+        assert 0.0 < waited <= 0.05
+
+
+class TestServiceConnectionPool:
+    """Test cases for ServiceConnectionPool"""
+
+    def test_retry_after_seconds_and_http_date(self):
+        pool = ServiceConnectionPool(max_retry_after=60.0)
+        retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+
+        assert pool._retry_delay({"Retry-After": "7"}, 0) == 7.0
+        assert 25.0 < pool._retry_delay({"Retry-After": format_datetime(retry_at, usegmt=True)}, 0) <= 30.0
+        past = datetime.now(timezone.utc) - timedelta(seconds=30)
+        assert pool._retry_delay({"Retry-After": format_datetime(past, usegmt=True)}, 0) == 0.0
+
+    def test_retry_after_is_capped_and_falls_back_to_backoff(self):
+        pool = ServiceConnectionPool(retry_backoff=0.5, max_retry_after=60.0)
+
+        assert pool._retry_delay({"Retry-After": "3600"}, 0) == 60.0
+        assert pool._retry_delay({"Retry-After": "soon"}, 2) == 2.0
+        assert pool._retry_delay({}, 1) == 1.0
+
+    @pytest.mark.asyncio
+    async def test_throttled_requests_retry_up_to_max_retries(self):
+        pool = ServiceConnectionPool(max_retries=2)
+        session = FakeSession([(429, {"Retry-After": "0"})] * 3)
+        pool.sessions["svc"] = session
+
+        status, _, _ = await pool.request(make_connection(), "GET", "https://svc/items")
+
+        assert status == 429
+        assert session.calls == 3
+        assert pool.counters["svc"]["retries"] == 2
+        assert pool.counters["svc"]["throttled"] == 2
+
+    @pytest.mark.asyncio
+    async def test_retry_succeeds_after_service_unavailable(self):
+        pool = ServiceConnectionPool()
+        pool.sessions["svc"] = FakeSession([(503, {"Retry-After": "0"}), (200, {})])
+
+        status, _, data = await pool.request(make_connection(), "GET", "https://svc/items")
+
+        assert status == 200
+        assert data == {"ok": True}
+
+    def test_auth_headers_follow_auth_config_changes(self):
+        pool = ServiceConnectionPool()
+        connection = make_connection(auth_type=AuthKind.BEARER_TOKEN)
+
+        headers = pool.headers_for(connection)
+        assert headers == {"Accept": "application/json", "Authorization": "Bearer a"}
+        assert pool.headers_for(connection) is headers
+
+        connection.config.auth_config["token"] = "b"
+        assert pool.headers_for(connection)["Authorization"] == "Bearer b"
+
+    def test_api_key_and_basic_auth_headers(self):
+        pool = ServiceConnectionPool()
+
+        api_key = pool.headers_for(make_connection(auth_type="api_key", auth_config={"api_key": "k"}))
+        assert api_key["X-API-Key"] == "k"
+
+        basic = pool.headers_for(make_connection(
+            auth_type="basic_auth", auth_config={"username": "user", "password": "pass"}, connection_id="conn_2"
+        ))
+        assert basic["Authorization"] == "Basic dXNlcjpwYXNz"
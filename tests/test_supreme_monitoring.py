@@ -4,9 +4,12 @@ Tests for Supreme Monitoring System
 
 import pytest
 import asyncio
+import statistics
 from datetime import datetime, timedelta
 from unittest.mock import Mock, AsyncMock
 
+import numpy as np
+
 from core.supreme.supreme_monitoring import (
     SupremeMonitoringSystem,
     MetricsCollector,
@@ -19,7 +22,8 @@ from core.supreme.supreme_monitoring import (
     HealthCheck,
     MetricType,
     AlertLevel,
-    MonitoringStatus
+    MonitoringStatus,
+    TimeSeriesBuffer
 )
 
 from core.supreme.supreme_control_interface import SupremeControlInterface
@@ -138,6 +142,111 @@ class TestMetricsCollector:
         assert "data_points" in summary["test_metric"]
 
 
+class TestMetricTimeSeries:
+    """Test NumPy time-series storage and rollups"""
+
+    @staticmethod
+    def record(collector, samples):
+        for timestamp, value in samples:
+            collector.record_metric(Metric(
+                metric_id="latency",
+                metric_type=MetricType.PERFORMANCE,
+                name="Latency",
+                value=value,
+                unit="ms",
+                timestamp=timestamp,
+                source="test"
+            ))
+
+    def test_raw_range_statistics(self):
+        """Test statistics over a raw time range"""
+        collector = MetricsCollector()
+        now = datetime.now()
+        rng = np.random.default_rng(1)
+        values = rng.normal(100, 5, size=120)
+        self.record(collector, [(now - timedelta(minutes=119 - i), v) for i, v in enumerate(values)])
+
+        stats = collector.get_metric_statistics("latency", timedelta(minutes=30, seconds=30))
+        recent = values[-31:]
+        assert stats["resolution"] == "raw"
+        assert stats["count"] == 31
+        assert stats["mean"] == pytest.approx(statistics.mean(recent))
+        assert stats["median"] == pytest.approx(statistics.median(recent))
+        assert stats["std_dev"] == pytest.approx(statistics.stdev(recent))
+        assert stats["latest"] == pytest.approx(values[-1])
+
+    def test_rollups_answer_ranges_beyond_raw_retention(self):
+        """Test that downsampled tiers serve long ranges exactly for count, mean, std, min and max"""
+        collector = MetricsCollector()
+        collector.retention_policy["raw"] = timedelta(minutes=30)
+        collector.max_raw_points = 256
+        now = datetime.now()
+        rng = np.random.default_rng(2)
+        values = 1e6 + rng.normal(0, 3, size=3 * 360)
+        self.record(collector, [(now - timedelta(seconds=10 * (len(values) - 1 - i)), v)
+                                for i, v in enumerate(values)])
+
+        assert len(collector.series["latency"].raw) <= 256
+        stats = collector.get_metric_statistics("latency", timedelta(hours=24))
+        assert stats["resolution"] == "1m"
+        assert stats["count"] == len(values)
+        assert stats["mean"] == pytest.approx(values.mean(), rel=1e-12)
+        assert stats["std_dev"] == pytest.approx(values.std(ddof=1), rel=1e-6)
+        assert stats["min"] == values.min() and stats["max"] == values.max()
+        assert stats["latest"] == pytest.approx(values[-1])
+
+        hourly = collector.get_metric_series("latency", timedelta(hours=24), resolution="1h")
+        assert hourly["count"].sum() == len(values)
+        assert collector.get_metric_series("latency", timedelta(minutes=5))["resolution"] == "raw"
+
+    def test_rollup_statistics_include_the_partial_first_bucket(self):
+        """Test that a range starting mid-bucket still counts that bucket"""
+        collector = MetricsCollector()
+        base = datetime(2026, 1, 1, 12, 0, 0)
+        self.record(collector, [(base + timedelta(seconds=10 * i), float(i)) for i in range(60)])
+
+        start = (base + timedelta(minutes=3, seconds=30)).timestamp()
+        stats = collector.series["latency"].statistics(start, resolution="1m")
+        assert stats["count"] == 42
+        assert stats["min"] == 18.0
+
+    def test_raw_buffer_evicts_in_batches(self):
+        """Test that a full raw buffer evicts a batch of the oldest rows at once"""
+        buffer = TimeSeriesBuffer(2, timedelta(days=1), max_rows=64)
+        for i in range(64):
+            buffer.insert((float(i), float(i)))
+        assert len(buffer) == 64
+
+        buffer.insert((64.0, 64.0))
+        assert len(buffer) == 57
+        assert buffer.timestamps[0] == 8.0
+        for i in range(65, 72):
+            buffer.insert((float(i), float(i)))
+        assert len(buffer) == 64 and buffer.timestamps[0] == 8.0
+
+    def test_late_samples_keep_series_ordered(self):
+        """Test that out-of-order samples are inserted in time order"""
+        collector = MetricsCollector()
+        base = datetime(2026, 1, 1, 12, 0, 30)
+        self.record(collector, [(base, 1.0), (base + timedelta(minutes=2), 3.0), (base + timedelta(minutes=1), 2.0)])
+
+        series = collector.get_metric_series("latency", resolution="raw")
+        assert series["values"].tolist() == [1.0, 2.0, 3.0]
+        minutes = collector.get_metric_series("latency", resolution="1m")
+        assert np.all(np.diff(minutes["timestamps"]) == 60.0)
+
+    def test_trend_analysis_uses_series(self):
+        """Test trend detection over the stored series"""
+        collector = MetricsCollector()
+        now = datetime.now()
+        self.record(collector, [(now - timedelta(minutes=60 - i), 10.0 + i) for i in range(60)])
+
+        trend = PerformanceAnalyzer(collector)._analyze_metric_trend("latency")
+        assert trend["trend"] == "increasing"
+        assert trend["slope"] == pytest.approx(1 / 60)
+        assert trend["data_points"] == 60
+
+
 class TestAlertManager:
     """Test AlertManager functionality"""
     
@@ -4,6 +4,7 @@ Tests for Supreme Orchestrator and Control Interface
 
 import pytest
 import asyncio
+from collections import deque
 from datetime import datetime, timedelta
 from unittest.mock import Mock, AsyncMock
 
@@ -14,7 +15,8 @@ from core.supreme.supreme_orchestrator import (
     EngineStatus,
     OrchestrationRequest,
     OrchestrationStrategy,
-    OrchestrationResult
+    OrchestrationResult,
+    SharedDataStore
 )
 
 from core.supreme.supreme_control_interface import (
@@ -62,8 +64,8 @@ class TestEngineCoordin
         """Test EngineCoordinator initialization"""
         assert isinstance(coordinator.engines, dict)
         assert isinstance(coordinator.communication_channels, dict)
-        assert isinstance(coordinator.shared_data_store, dict)
-        assert isinstance(coordinator.coordination_history, list)
+        assert isinstance(coordinator.shared_data_store, SharedDataStore)
+        assert isinstance(coordinator.coordination_history, deque)
         assert len(coordinator.engines) == 0
     
     def test_register_engine(self, coordinator, mock_engine):
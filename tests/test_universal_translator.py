@@ -0,0 +1,171 @@
+"""
+Tests for Supreme Universal Translator
+"""
+
+import asyncio
+import logging
+import random
+from datetime import datetime
+
+import pytest
+
+from core.supreme.engines.universal_translator import (
+    SupremeUniversalTranslator,
+    TranslationMemoryIndex,
+    TranslationMemory,
+    TranslationDomain
+)
+
+
+def make_entry(source_text, target_text="translated", source_language="en", target_language="es",
+               domain=TranslationDomain.GENERAL):
+    return TranslationMemory(
+        source_text=source_text,
+        target_text=target_text,
+        source_language=source_language,
+        target_language=target_language,
+        domain=domain,
+        quality_score=0.9,
+        created_at=datetime.now()
+    )
+
+
+def jaccard(text1, text2):
+    words1, words2 = set(text1.lower().split()), set(text2.lower().split())
+    return len(words1 & words2) / len(words1 | words2)
+
+
+class StubTranslator:
+    """Batch engine built without __init__, with detection, memory and translation stubbed"""
+
+    def __init__(self, languages, memory=None, max_concurrency=32):
+        self.languages = languages
+        self.memory = memory or {}
+        self.translated = []
+        self.running = 0
+        self.peak = 0
+        engine = SupremeUniversalTranslator.__new__(SupremeUniversalTranslator)
+        engine.logger = logging.getLogger("test_universal_translator")
+        engine.batch_max_concurrency = max_concurrency
+        engine.batch_detection_confidence = 0.5
+        engine._detect_language = self.detect_language
+        engine._check_translation_memory = self.check_translation_memory
+        engine._translate_text = self.translate_text
+        self.engine = engine
+
+    async def detect_language(self, parameters):
+        language = self.languages.get(parameters["text"])
+        return {"detected_language": language or "en", "confidence": 0.9 if language else 0.1}
+
+    async def check_translation_memory(self, text, source_language, target_language, domain):
+        if (text, source_language) in self.memory:
+            return {"translation": self.memory[(text, source_language)], "quality_score": 1.0}
+        return None
+
+    async def translate_text(self, parameters):
+        self.translated.append((parameters["text"], parameters["source_language"]))
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        await asyncio.sleep(0.01)
+        self.running -= 1
+        return {
+            "translated_text": parameters["text"].upper(),
+            "quality_score": 0.8,
+            "source_language": parameters["source_language"]
+        }
+
+
+class TestBatchTranslate:
+    """Test cases for batch_translate"""
+
+    @pytest.mark.asyncio
+    async def test_duplicates_are_translated_once_and_order_is_kept(self):
+        stub = StubTranslator({"hello": "en", "world": "en"}, memory={("world", "en"): "mundo"})
+        texts = ["hello", "world", "", "hello", "world", "hello"]
+
+        result = await stub.engine._batch_translate({"texts": texts, "target_language": "es"})
+
+        assert stub.translated == [("hello", "en")]
+        assert result["unique_texts"] == 2
+        assert result["translation_memory_hits"] == 1
+        assert [r["index"] for r in result["translations"]] == list(range(6))
+        assert [r["translated_text"] for r in result["translations"]] == [
+            "HELLO", "mundo", "", "HELLO", "mundo", "HELLO"
+        ]
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_capped(self):
+        stub = StubTranslator({}, max_concurrency=3)
+        texts = [f"text {i}" for i in range(12)]
+
+        result = await stub.engine._batch_translate({"texts": texts, "target_language": "es"})
+
+        assert result["successful_translations"] == 12
+        assert stub.peak == 3
+
+        stub.peak = 0
+        await stub.engine._batch_translate({"texts": texts, "target_language": "es", "max_concurrency": 5})
+        assert stub.peak == 5
+
+    @pytest.mark.asyncio
+    async def test_mixed_language_batch_keeps_each_source_language(self):
+        stub = StubTranslator({"guten Tag": "de", "bonjour": "fr"})
+        texts = ["guten Tag", "bonjour", "ok"]
+
+        result = await stub.engine._batch_translate({"texts": texts, "target_language": "es"})
+
+        assert sorted(stub.translated) == [("bonjour", "fr"), ("guten Tag", "de"), ("ok", "auto")]
+        assert [r["source_language"] for r in result["translations"]] == ["de", "fr", "auto"]
+        assert result["detected_languages"] == ["auto", "de", "fr"]
+
+        stub.translated.clear()
+        await stub.engine._batch_translate({"texts": texts, "target_language": "es", "source_language": "de"})
+        assert {language for _, language in stub.translated} == {"de"}
+
+
+class TestTranslationMemoryIndex:
+    """Test cases for TranslationMemoryIndex"""
+
+    def test_exact_match_is_scoped_by_language_pair_and_domain(self):
+        memory = TranslationMemoryIndex()
+        memory.append(make_entry("Save changes", "Guardar cambios"))
+        memory.append(make_entry("Save changes", "Enregistrer", target_language="fr"))
+
+        assert memory.find_exact("Save changes", "en", "es", "general").target_text == "Guardar cambios"
+        assert memory.find_exact("Save changes", "en", "fr", "general").target_text == "Enregistrer"
+        assert memory.find_exact("Save changes", "en", "es", "technical") is None
+        assert memory.find_exact("save changes", "en", "es", "general") is None
+
+    def test_fuzzy_match_agrees_with_full_scan(self):
+        random.seed(0)
+        vocabulary = [f"word{i}" for i in range(60)]
+        memory = TranslationMemoryIndex()
+        texts = []
+        for i in range(2000):
+            words = random.sample(vocabulary, random.randint(8, 14))
+            texts.append(" ".join(words))
+            memory.append(make_entry(texts[-1], f"target {i}"))
+
+        for _ in range(200):
+            base = random.choice(texts).split()
+            query = " ".join(base[:-1] if random.random() < 0.5 else base + ["extra"])
+            expected = max(jaccard(query, text) for text in texts)
+
+            match = memory.find_similar(query, "en", "es", "general")
+            if expected > memory.fuzzy_threshold:
+                assert match is not None
+                assert match[1] == pytest.approx(expected)
+                assert jaccard(query, match[0].source_text) == pytest.approx(expected)
+            else:
+                assert match is None
+
+    def test_bounded_list_behaviour(self):
+        memory = TranslationMemoryIndex(max_entries=3)
+        for i in range(5):
+            memory.append(make_entry(f"text number {i}"))
+
+        assert len(memory) == 3
+        assert [entry.source_text for entry in memory] == ["text number 2", "text number 3", "text number 4"]
+        assert memory[-1].source_text == "text number 4"
+        assert memory.find_exact("text number 0", "en", "es", "general") is None
+        assert memory.find_similar("text number 1", "en", "es", "general") is None